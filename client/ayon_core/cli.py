@@ -113,13 +113,20 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
               multiple=True)
 @click.option("-g", "--gui", is_flag=True,
               help="Show Publish UI", default=False)
-def publish(path, targets, gui):
+@click.option("-w", "--workers", type=int, default=None,
+              help="Process extractors of instances in parallel threads")
+@click.option("--profile", "profile_path", default=None,
+              help=(
+                  "Store publish profile to path (Chrome trace, or"
+                  " speedscope if ends with '.speedscope.json')"
+              ))
+def publish(path, targets, gui, workers, profile_path):
     """Start CLI publishing.
 
     Publish collects json from path provided as an argument.
 S
     """
-    Commands.publish(path, targets, gui)
+    Commands.publish(path, targets, gui, workers, profile_path)
 
 
 @main_cli.command(context_settings={"ignore_unknown_options": True})
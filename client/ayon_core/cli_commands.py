@@ -5,6 +5,24 @@ import sys
 import warnings
 
 
+def _export_publish_profile(profiler, profile_path, log):
+    """Store publish profile and log plugins which took most time."""
+    profiler.export(profile_path)
+    lines = ["Publish profile stored to {}".format(profile_path)]
+    for name, item in list(profiler.get_summary().items())[:10]:
+        lines.append(
+            "{:>10.1f}ms wall {:>10.1f}ms cpu {:>10.1f}ms subprocess"
+            " {:>5} server calls  {}".format(
+                item["wall_time"],
+                item["cpu_time"],
+                item.get("subprocess_time", 0.0),
+                int(item.get("server_calls", 0)),
+                name,
+            )
+        )
+    log.info("\n".join(lines))
+
+
 class Commands:
     """Class implementing commands used by AYON.
 
@@ -41,7 +59,13 @@ class Commands:
         return click_func
 
     @staticmethod
-    def publish(path: str, targets: list=None, gui:bool=False) -> None:
+    def publish(
+        path: str,
+        targets: list=None,
+        gui:bool=False,
+        workers: int=None,
+        profile_path: str=None,
+    ) -> None:
         """Start headless publishing.
 
         Publish use json from passed path argument.
@@ -50,13 +74,23 @@ class Commands:
             path (str): Path to JSON.
             targets (list of str): List of pyblish targets.
             gui (bool): Show publish UI.
+            workers (int): Number of threads used to process extractors
+                of instances in parallel. Plugins are processed
+                sequentially if not passed.
+            profile_path (str): Path where publish profile is stored.
+                Value of 'AYON_PUBLISH_PROFILE' environment variable is
+                used if not passed.
 
         Raises:
             RuntimeError: When there is no path to process.
             RuntimeError: When executed with list of JSON paths.
 
         """
-        from ayon_core.lib import Logger
+        from ayon_core.lib import (
+            Logger,
+            entity_cache_scope,
+            directory_scan_scope,
+        )
 
         from ayon_core.addon import AddonsManager
         from ayon_core.pipeline import (
@@ -134,11 +168,38 @@ class Commands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            if not profile_path:
+                profile_path = os.getenv("AYON_PUBLISH_PROFILE")
+
+            profiler = None
+            if profile_path:
+                from ayon_core.lib.profiling import PublishProfiler
+
+                profiler = PublishProfiler()
+
+            if workers or profiler is not None:
+                from ayon_core.pipeline.publish import publish_iter_parallel
+
+                if workers:
+                    log.info(
+                        "Processing extractors in {} threads".format(workers)
+                    )
+                publish_iter = publish_iter_parallel(
+                    max_workers=workers or 1, profiler=profiler
+                )
+            else:
+                publish_iter = pyblish.util.publish_iter()
+
+            try:
+                with entity_cache_scope(), directory_scan_scope():
+                    for result in publish_iter:
+                        if result["error"]:
+                            log.error(error_format.format(**result))
+                            # uninstall()
+                            sys.exit(1)
+            finally:
+                if profiler is not None:
+                    _export_publish_profile(profiler, profile_path, log)
 
         log.info("Publish finished.")
 
@@ -12,6 +12,8 @@ from ayon_core.pipeline import Anatomy
 class GlobalHostDataHook(PreLaunchHook):
     order = -100
     launch_types = set()
+    # Workdir is created again when cached environment is used
+    environment_only = True
 
     def execute(self):
         """Prepare global objects to `data` that will be used for sure."""
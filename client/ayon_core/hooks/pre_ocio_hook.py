@@ -22,6 +22,7 @@ class OCIOEnvHook(PreLaunchHook):
         "openrv"
     }
     launch_types = set()
+    environment_only = True
 
     def execute(self):
         """Hook entry method."""
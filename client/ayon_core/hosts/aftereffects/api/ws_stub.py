@@ -9,6 +9,7 @@ import attr
 
 from wsrpc_aiohttp import WebSocketAsync
 from ayon_core.tools.adobe_webserver.app import WebServerTool
+from ayon_core.tools.adobe_webserver.metadata_mirror import MetadataMirror
 
 
 class ConnectionNotEstablishedYet(Exception):
@@ -57,6 +58,12 @@ class AfterEffectsServerStub():
         self.client = self.get_client()
         self.log = logging.getLogger(self.__class__.__name__)
 
+        # Client side mirror of metadata, used only inside
+        #   'imprint_transaction'
+        self._meta_mirror = MetadataMirror(
+            self._read_metadata, self._write_metadata
+        )
+
     @staticmethod
     def get_client():
         """
@@ -95,6 +102,11 @@ class AfterEffectsServerStub():
         Returns:
             (list)
         """
+        if self._meta_mirror.is_active:
+            return self._meta_mirror.get_items()
+        return self._read_metadata()
+
+    def _read_metadata(self):
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.get_metadata'))
         metadata = self._handle_return(res)
@@ -136,6 +148,10 @@ class AfterEffectsServerStub():
                            loop - value should be same)
         Returns: None
         """
+        if self._meta_mirror.is_active:
+            self._meta_mirror.imprint(item_id, data)
+            return
+
         if not items_meta:
             items_meta = self.get_metadata()
 
@@ -157,28 +173,24 @@ class AfterEffectsServerStub():
         if is_new:
             result_meta.append(data)
 
-        # Ensure only valid ids are stored.
-        if not all_items:
-            # loaders create FootageItem now
-            all_items = self.get_items(comps=True,
-                                       folders=True,
-                                       footages=True)
-        item_ids = [int(item.id) for item in all_items]
-        cleaned_data = []
-        for meta in result_meta:
-            # do not added instance with nonexistend item id
-            if meta.get("members"):
-                if int(meta["members"][0]) not in item_ids:
-                    continue
+        return self._write_metadata(result_meta, all_items)
 
-            cleaned_data.append(meta)
+    def imprint_transaction(self):
+        """Collect metadata changes and write them to document at once.
 
-        payload = json.dumps(cleaned_data, indent=4)
+        Metadata are read once on first access and mirrored on stub side,
+        indexed by item and instance id. Calls of 'imprint',
+        'remove_instance' and 'get_metadata' made inside of the context
+        work with the mirror. Collected changes are sent to AfterEffects
+        with single call when the outermost context ends.
 
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
-        return self._handle_return(res)
+        Example:
+            >>> stub = get_stub()
+            >>> with stub.imprint_transaction():
+            ...     for instance in instances:
+            ...         stub.imprint(instance.id, instance.data_to_store())
+        """
+        return self._meta_mirror.transaction()
 
     def get_active_document_full_name(self):
         """
@@ -356,6 +368,10 @@ class AfterEffectsServerStub():
             Args:
                 instance_id(string): instance id
         """
+        if self._meta_mirror.is_active:
+            self._meta_mirror.remove_instance(instance_id)
+            return
+
         cleaned_data = []
 
         if metadata is None:
@@ -646,6 +662,36 @@ class AfterEffectsServerStub():
                                   ('AfterEffects.print_msg',
                                    msg=msg))
 
+    def _write_metadata(self, items_meta, all_items=None):
+        """Store metadata to document, skipping items of removed items.
+
+        Args:
+            items_meta (list[dict]): Metadata items to store.
+            all_items (Optional[list[AEItem]]): All items in project.
+        """
+        # Ensure only valid ids are stored.
+        if not all_items:
+            # loaders create FootageItem now
+            all_items = self.get_items(comps=True,
+                                       folders=True,
+                                       footages=True)
+        item_ids = {int(item.id) for item in all_items}
+        cleaned_data = []
+        for meta in items_meta:
+            # do not added instance with nonexistend item id
+            if meta.get("members"):
+                if int(meta["members"][0]) not in item_ids:
+                    continue
+
+            cleaned_data.append(meta)
+
+        payload = json.dumps(cleaned_data, indent=4)
+
+        res = self.websocketserver.call(self.client.call
+                                        ('AfterEffects.imprint',
+                                         payload=payload))
+        return self._handle_return(res)
+
     def _handle_return(self, res):
         """Wraps return, throws ValueError if 'error' key is present."""
         if res and isinstance(res, str) and res != "undefined":
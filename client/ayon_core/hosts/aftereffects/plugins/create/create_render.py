@@ -153,13 +153,15 @@ class RenderCreator(Creator):
                 self._add_instance_to_context(instance)
 
     def update_instances(self, update_list):
-        for created_inst, _changes in update_list:
-            api.get_stub().imprint(created_inst.get("instance_id"),
-                                   created_inst.data_to_store())
-            name_change = _changes.get("productName")
-            if name_change:
-                api.get_stub().rename_item(created_inst.data["members"][0],
-                                           name_change.new_value)
+        stub = api.get_stub()
+        with stub.imprint_transaction():
+            for created_inst, _changes in update_list:
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
+                name_change = _changes.get("productName")
+                if name_change:
+                    stub.rename_item(created_inst.data["members"][0],
+                                     name_change.new_value)
 
     def remove_instances(self, instances):
         """Removes metadata and renames to original comp name if available."""
@@ -19,6 +19,8 @@ from maya import cmds  # noqa
 from ayon_core.lib import (
     find_executable,
     source_hash,
+    is_source_content_hash_enabled,
+    get_files_fingerprints,
     run_subprocess,
     get_oiio_tool_args,
     ToolNotFoundError,
@@ -199,7 +201,9 @@ class MakeRSTexBin(TextureProcessor):
 
         self.log.debug(" ".join(subprocess_args))
         try:
-            run_subprocess(subprocess_args, logger=self.log)
+            run_subprocess(
+                subprocess_args, logger=self.log, keep_output=False
+            )
         except Exception:
             self.log.error("Texture .rstexbin conversion failed",
                            exc_info=True)
@@ -384,7 +388,7 @@ class MakeTX(TextureProcessor):
 
         self.log.debug(" ".join(subprocess_args))
         try:
-            run_subprocess(subprocess_args, env=env)
+            run_subprocess(subprocess_args, env=env, keep_output=False)
         except Exception:
             self.log.error("Texture maketx conversion failed",
                            exc_info=True)
@@ -623,6 +627,15 @@ class ExtractLook(publish.Extractor):
             )
             force_copy = True
 
+        if is_source_content_hash_enabled():
+            # Compute content fingerprints used by source hash in parallel
+            get_files_fingerprints(
+                os.path.normpath(filepath)
+                for resource in resources
+                for filepath in resource["files"]
+                if os.path.isfile(filepath)
+            )
+
         destinations_cache = {}
 
         def get_resource_destination_cached(path):
@@ -7,6 +7,7 @@ class PrelaunchNukeAssistHook(PreLaunchHook):
     """
     app_groups = {"nukeassist"}
     launch_types = set()
+    environment_only = True
 
     def execute(self):
         self.launch_context.env["NUKEASSIST"] = "1"
@@ -3,10 +3,12 @@
     Used anywhere solution is calling client methods.
 """
 import json
+
 import attr
 from wsrpc_aiohttp import WebSocketAsync
 
 from ayon_core.tools.adobe_webserver.app import WebServerTool
+from ayon_core.tools.adobe_webserver.metadata_mirror import MetadataMirror
 
 
 @attr.s
@@ -54,6 +56,12 @@ class PhotoshopServerStub:
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
 
+        # Client side mirror of Headline metadata, used only inside
+        #   'imprint_transaction'
+        self._meta_mirror = MetadataMirror(
+            self._read_layers_metadata, self._write_layers_metadata
+        )
+
     @staticmethod
     def get_client():
         """
@@ -101,6 +109,10 @@ class PhotoshopServerStub:
             }
         """
         if layers_meta is None:
+            if self._meta_mirror.is_active:
+                layer_meta = self._meta_mirror.find_member_item(layer.id)
+                if layer_meta is not None:
+                    return layer_meta
             layers_meta = self.get_layers_metadata()
 
         for layer_meta in layers_meta:
@@ -147,12 +159,16 @@ class PhotoshopServerStub:
                            loop - value should be same)
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_layers_metadata()
-
         # json.dumps writes integer values in a dictionary to string, so
         # anticipating it here.
         item_id = str(item_id)
+        if self._meta_mirror.is_active:
+            self._meta_mirror.imprint(item_id, data)
+            return
+
+        if not items_meta:
+            items_meta = self.get_layers_metadata()
+
         is_new = True
         result_meta = []
         for item_meta in items_meta:
@@ -169,23 +185,24 @@ class PhotoshopServerStub:
         if is_new:
             result_meta.append(data)
 
-        # Ensure only valid ids are stored.
-        if not all_layers:
-            all_layers = self.get_layers()
-        layer_ids = [layer.id for layer in all_layers]
-        cleaned_data = []
+        self._write_layers_metadata(result_meta, all_layers)
 
-        for item in result_meta:
-            if item.get("members"):
-                if int(item["members"][0]) not in layer_ids:
-                    continue
+    def imprint_transaction(self):
+        """Collect metadata changes and write them to document at once.
 
-            cleaned_data.append(item)
+        Headline metadata are read once on first access and mirrored on
+        stub side, indexed by layer and instance id. Calls of 'imprint',
+        'remove_instance', 'read' and 'get_layers_metadata' made inside
+        of the context work with the mirror. Collected changes are sent
+        to Photoshop with single call when the outermost context ends.
 
-        payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        Example:
+            >>> stub = PhotoshopServerStub()
+            >>> with stub.imprint_transaction():
+            ...     for instance in instances:
+            ...         stub.imprint(instance.id, instance.data_to_store())
+        """
+        return self._meta_mirror.transaction()
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -424,6 +441,11 @@ class PhotoshopServerStub:
                       "folderPath":"/Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
+        if self._meta_mirror.is_active:
+            return self._meta_mirror.get_items()
+        return self._read_layers_metadata()
+
+    def _read_layers_metadata(self):
         res = self.websocketserver.call(self.client.call('Photoshop.read'))
         layers_data = []
         try:
@@ -508,6 +530,10 @@ class PhotoshopServerStub:
         )
 
     def remove_instance(self, instance_id):
+        if self._meta_mirror.is_active:
+            self._meta_mirror.remove_instance(instance_id)
+            return
+
         cleaned_data = []
 
         for item in self.get_layers_metadata():
@@ -535,6 +561,31 @@ class PhotoshopServerStub:
         # TODO change client.call to method with checks for client
         self.websocketserver.call(self.client.call('Photoshop.close'))
 
+    def _write_layers_metadata(self, items_meta, all_layers=None):
+        """Store metadata to Headline, skipping items of removed layers.
+
+        Args:
+            items_meta (list[dict]): Metadata items to store.
+            all_layers (Optional[list[PSItem]]): All layers in document.
+        """
+        # Ensure only valid ids are stored.
+        if not all_layers:
+            all_layers = self.get_layers()
+        layer_ids = {layer.id for layer in all_layers}
+        cleaned_data = []
+
+        for item in items_meta:
+            if item.get("members"):
+                if int(item["members"][0]) not in layer_ids:
+                    continue
+
+            cleaned_data.append(item)
+
+        payload = json.dumps(cleaned_data, indent=4)
+        self.websocketserver.call(
+            self.client.call('Photoshop.imprint', payload=payload)
+        )
+
     def _to_records(self, res):
         """Converts string json representation into list of PSItem for
         dot notation access to work.
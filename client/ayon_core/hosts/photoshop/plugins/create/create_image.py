@@ -78,56 +78,58 @@ class ImageCreator(Creator):
         # to differentiate them
         use_layer_name = (pre_create_data.get("use_layer_name") or
                           len(groups_to_create) > 1)
-        for group in groups_to_create:
-            product_name = product_name_from_ui  # reset to name from creator UI
-            layer_names_in_hierarchy = []
-            created_group_name = self._clean_highlights(stub, group.name)
-
-            if use_layer_name:
-                layer_name = re.sub(
-                    "[^{}]+".format(PRODUCT_NAME_ALLOWED_SYMBOLS),
-                    "",
-                    group.name
+        with stub.imprint_transaction():
+            for group in groups_to_create:
+                # reset to name from creator UI
+                product_name = product_name_from_ui
+                layer_names_in_hierarchy = []
+                created_group_name = self._clean_highlights(stub, group.name)
+
+                if use_layer_name:
+                    layer_name = re.sub(
+                        "[^{}]+".format(PRODUCT_NAME_ALLOWED_SYMBOLS),
+                        "",
+                        group.name
+                    )
+                    if "{layer}" not in product_name.lower():
+                        product_name += "{Layer}"
+
+                layer_fill = prepare_template_data({"layer": layer_name})
+                product_name = product_name.format(**layer_fill)
+                product_name = clean_product_name(product_name)
+
+                if group.long_name:
+                    for directory in group.long_name[::-1]:
+                        name = self._clean_highlights(stub, directory)
+                        layer_names_in_hierarchy.append(name)
+
+                data_update = {
+                    "productName": product_name,
+                    "members": [str(group.id)],
+                    "layer_name": layer_name,
+                    "long_name": "_".join(layer_names_in_hierarchy)
+                }
+                data.update(data_update)
+
+                mark_for_review = (pre_create_data.get("mark_for_review") or
+                                   self.mark_for_review)
+                creator_attributes = {"mark_for_review": mark_for_review}
+                data.update({"creator_attributes": creator_attributes})
+
+                if not self.active_on_create:
+                    data["active"] = False
+
+                new_instance = CreatedInstance(
+                    self.product_type, product_name, data, self
                 )
-                if "{layer}" not in product_name.lower():
-                    product_name += "{Layer}"
-
-            layer_fill = prepare_template_data({"layer": layer_name})
-            product_name = product_name.format(**layer_fill)
-            product_name = clean_product_name(product_name)
-
-            if group.long_name:
-                for directory in group.long_name[::-1]:
-                    name = self._clean_highlights(stub, directory)
-                    layer_names_in_hierarchy.append(name)
-
-            data_update = {
-                "productName": product_name,
-                "members": [str(group.id)],
-                "layer_name": layer_name,
-                "long_name": "_".join(layer_names_in_hierarchy)
-            }
-            data.update(data_update)
-
-            mark_for_review = (pre_create_data.get("mark_for_review") or
-                               self.mark_for_review)
-            creator_attributes = {"mark_for_review": mark_for_review}
-            data.update({"creator_attributes": creator_attributes})
-
-            if not self.active_on_create:
-                data["active"] = False
-
-            new_instance = CreatedInstance(
-                self.product_type, product_name, data, self
-            )
 
-            stub.imprint(new_instance.get("instance_id"),
-                         new_instance.data_to_store())
-            self._add_instance_to_context(new_instance)
-            # reusing existing group, need to rename afterwards
-            if not create_empty_group:
-                stub.rename_layer(group.id,
-                                  stub.PUBLISH_ICON + created_group_name)
+                stub.imprint(new_instance.get("instance_id"),
+                             new_instance.data_to_store())
+                self._add_instance_to_context(new_instance)
+                # reusing existing group, need to rename afterwards
+                if not create_empty_group:
+                    stub.rename_layer(group.id,
+                                      stub.PUBLISH_ICON + created_group_name)
 
     def collect_instances(self):
         for instance_data in cache_and_get_instances(self):
@@ -144,12 +146,14 @@ class ImageCreator(Creator):
 
     def update_instances(self, update_list):
         self.log.debug("update_list:: {}".format(update_list))
-        for created_inst, _changes in update_list:
-            if created_inst.get("layer"):
-                # not storing PSItem layer to metadata
-                created_inst.pop("layer")
-            api.stub().imprint(created_inst.get("instance_id"),
-                               created_inst.data_to_store())
+        stub = api.stub()
+        with stub.imprint_transaction():
+            for created_inst, _changes in update_list:
+                if created_inst.get("layer"):
+                    # not storing PSItem layer to metadata
+                    created_inst.pop("layer")
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
 
     def remove_instances(self, instances):
         for instance in instances:
@@ -26,7 +26,12 @@ from .local_settings import (
     get_ayon_username,
     get_openpype_username,
 )
-from .ayon_connection import initialize_ayon_connection
+from .ayon_connection import (
+    initialize_ayon_connection,
+    AyonDataAccess,
+    get_data_access,
+    entity_cache_scope,
+)
 from .cache import (
     CacheItem,
     NestedCacheItem,
@@ -123,10 +128,27 @@ from .transcoding import (
     convert_ffprobe_fps_to_float,
     get_rescaled_command_arguments,
 )
+from .transcoding_scheduler import (
+    TranscodingJob,
+    TranscodingScheduler,
+    get_frame_batches,
+    get_oiio_sequence_path,
+)
+from .image_integrity import (
+    ImageIntegrityError,
+    check_exr_file,
+    check_image_file,
+    check_image_files,
+)
 
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    is_source_content_hash_enabled,
+)
+from .file_fingerprint import (
+    get_file_fingerprint,
+    get_files_fingerprints,
 )
 
 from .path_tools import (
@@ -138,6 +160,28 @@ from .path_tools import (
     get_last_version_from_path,
 )
 
+from .directory_scan import (
+    ScannedFile,
+    DirectoryScan,
+    get_directory_scan,
+    invalidate_directory_scan,
+    directory_scan_scope,
+    scanned_path_exists,
+)
+from .frame_ranges import (
+    FrameRanges,
+    get_frame_format,
+    format_frame_names,
+    format_collection_names,
+)
+
+from .file_transfer import (
+    FileTransferStats,
+    create_reflink,
+    link_or_clone_file,
+    link_or_clone_files,
+)
+
 from .ayon_info import (
     is_in_ayon_launcher_process,
     is_running_from_build,
@@ -161,6 +205,9 @@ __all__ = [
     "get_openpype_username",
 
     "initialize_ayon_connection",
+    "AyonDataAccess",
+    "get_data_access",
+    "entity_cache_scope",
 
     "CacheItem",
     "NestedCacheItem",
@@ -222,6 +269,14 @@ __all__ = [
     "convert_ffprobe_fps_value",
     "convert_ffprobe_fps_to_float",
     "get_rescaled_command_arguments",
+    "TranscodingJob",
+    "TranscodingScheduler",
+    "get_frame_batches",
+    "get_oiio_sequence_path",
+    "ImageIntegrityError",
+    "check_exr_file",
+    "check_image_file",
+    "check_image_files",
 
     "compile_list_of_regexes",
 
@@ -229,6 +284,9 @@ __all__ = [
 
     "prepare_template_data",
     "source_hash",
+    "is_source_content_hash_enabled",
+    "get_file_fingerprint",
+    "get_files_fingerprints",
 
     "format_file_size",
     "collect_frames",
@@ -237,6 +295,23 @@ __all__ = [
     "get_version_from_path",
     "get_last_version_from_path",
 
+    "ScannedFile",
+    "DirectoryScan",
+    "get_directory_scan",
+    "invalidate_directory_scan",
+    "directory_scan_scope",
+    "scanned_path_exists",
+
+    "FrameRanges",
+    "get_frame_format",
+    "format_frame_names",
+    "format_collection_names",
+
+    "FileTransferStats",
+    "create_reflink",
+    "link_or_clone_file",
+    "link_or_clone_files",
+
     "TemplateUnsolved",
     "StringTemplate",
     "FormatObject",
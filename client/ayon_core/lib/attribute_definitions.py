@@ -14,6 +14,35 @@ import clique
 _attr_defs_by_type = {}
 
 
+def _freeze_value(value):
+    """Convert value to hashable structure.
+
+    Args:
+        value (Any): Value to convert.
+
+    Returns:
+        Hashable: Hashable representation of value.
+    """
+
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset(
+                (key, _freeze_value(item))
+                for key, item in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_value(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 def register_attr_def_class(cls):
     """Register attribute definition.
 
@@ -151,19 +180,38 @@ class AbstractAttrDef(object):
     def id(self):
         return self._id
 
+    def _get_compare_values(self):
+        """Values used to compare definitions and to calculate hash.
+
+        Subclasses should extend the values with their type specific
+        attributes. Values are always received using method of compared
+        class, so subclass object can be equal to object of its parent
+        class.
+
+        Returns:
+            Tuple[Any, ...]: Values to compare.
+        """
+
+        return (self.key, self.hidden, self.default, self.disabled)
+
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
         return (
-            self.key == other.key
-            and self.hidden == other.hidden
-            and self.default == other.default
-            and self.disabled == other.disabled
+            self._get_compare_values()
+            == self.__class__._get_compare_values(other)
         )
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # Only values shared by all classes are used because object can be
+        #   equal to object of subclass
+        return hash(
+            _freeze_value(AbstractAttrDef._get_compare_values(self))
+        )
+
     @abstractproperty
     def type(self):
         """Attribute definition type also used as identifier of class.
@@ -240,10 +288,10 @@ class UILabelDef(UIDef):
     def __init__(self, label, key=None):
         super(UILabelDef, self).__init__(label=label, key=key)
 
-    def __eq__(self, other):
-        if not super(UILabelDef, self).__eq__(other):
-            return False
-        return self.label == other.label
+    def _get_compare_values(self):
+        return super(UILabelDef, self)._get_compare_values() + (
+            self.label,
+        )
 
 
 # ---------------------------------------
@@ -338,14 +386,11 @@ class NumberDef(AbstractAttrDef):
         self.maximum = maximum
         self.decimals = 0 if decimals is None else decimals
 
-    def __eq__(self, other):
-        if not super(NumberDef, self).__eq__(other):
-            return False
-
-        return (
-            self.decimals == other.decimals
-            and self.maximum == other.maximum
-            and self.maximum == other.maximum
+    def _get_compare_values(self):
+        return super(NumberDef, self)._get_compare_values() + (
+            self.minimum,
+            self.maximum,
+            self.decimals,
         )
 
     def convert_value(self, value):
@@ -408,13 +453,10 @@ class TextDef(AbstractAttrDef):
         self.placeholder = placeholder
         self.regex = regex
 
-    def __eq__(self, other):
-        if not super(TextDef, self).__eq__(other):
-            return False
-
-        return (
-            self.multiline == other.multiline
-            and self.regex == other.regex
+    def _get_compare_values(self):
+        return super(TextDef, self)._get_compare_values() + (
+            self.multiline,
+            self.regex,
         )
 
     def convert_value(self, value):
@@ -424,7 +466,10 @@ class TextDef(AbstractAttrDef):
 
     def serialize(self):
         data = super(TextDef, self).serialize()
-        data["regex"] = self.regex.pattern
+        regex = None
+        if self.regex is not None:
+            regex = self.regex.pattern
+        data["regex"] = regex
         return data
 
 
@@ -471,13 +516,10 @@ class EnumDef(AbstractAttrDef):
         self._item_values = item_values_set
         self.multiselection = multiselection
 
-    def __eq__(self, other):
-        if not super(EnumDef, self).__eq__(other):
-            return False
-
-        return (
-            self.items == other.items
-            and self.multiselection == other.multiselection
+    def _get_compare_values(self):
+        return super(EnumDef, self)._get_compare_values() + (
+            self.items,
+            self.multiselection,
         )
 
     def convert_value(self, value):
@@ -871,15 +913,12 @@ class FileDef(AbstractAttrDef):
         self.extensions_label = extensions_label
         super(FileDef, self).__init__(key, default=default, **kwargs)
 
-    def __eq__(self, other):
-        if not super(FileDef, self).__eq__(other):
-            return False
-
-        return (
-            self.single_item == other.single_item
-            and self.folders == other.folders
-            and self.extensions == other.extensions
-            and self.allow_sequences == other.allow_sequences
+    def _get_compare_values(self):
+        return super(FileDef, self)._get_compare_values() + (
+            self.single_item,
+            self.folders,
+            self.extensions,
+            self.allow_sequences,
         )
 
     def convert_value(self, value):
@@ -952,8 +991,12 @@ def deserialize_attr_def(attr_def_data):
 
     Args:
         attr_def (Dict[str, Any]): Attribute definition data to deserialize.
+
+    Returns:
+        AbstractAttrDef: Attribute definition.
     """
 
+    attr_def_data = dict(attr_def_data)
     attr_type = attr_def_data.pop("type")
     cls = _attr_defs_by_type[attr_type]
     return cls.deserialize(attr_def_data)
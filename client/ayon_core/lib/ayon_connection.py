@@ -1,9 +1,23 @@
 import os
+import sys
+import copy
+import time
+import threading
+import functools
+import contextlib
+import collections
+from concurrent.futures import Future
 
 import semver
 import ayon_api
 
 from .local_settings import get_local_site_id
+from .profiling import (
+    COUNTER_SERVER_CALLS,
+    COUNTER_SERVER_TIME,
+    is_profiling_active,
+    add_profiling_counter,
+)
 
 
 class _Cache:
@@ -134,6 +148,34 @@ def _new_get_last_version_by_product_name(
     )
 
 
+def _profile_rest_requests():
+    """Count server requests and their time in profiling spans.
+
+    All REST and GraphQl requests of 'ServerAPI' go through
+    '_do_rest_request'.
+    """
+    func = getattr(ayon_api.ServerAPI, "_do_rest_request", None)
+    if func is None or getattr(func, "_ayon_profiled", False):
+        return
+
+    @functools.wraps(func)
+    def _do_rest_request(self, *args, **kwargs):
+        if not is_profiling_active():
+            return func(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            add_profiling_counter(COUNTER_SERVER_CALLS)
+            add_profiling_counter(
+                COUNTER_SERVER_TIME, (time.perf_counter() - start) * 1000
+            )
+
+    _do_rest_request._ayon_profiled = True
+    ayon_api.ServerAPI._do_rest_request = _do_rest_request
+
+
 def initialize_ayon_connection(force=False):
     """Initialize global AYON api connection.
 
@@ -150,6 +192,7 @@ def initialize_ayon_connection(force=False):
         return
 
     _Cache.initialized = True
+    _profile_rest_requests()
     ayon_api_version = (
         semver.VersionInfo.parse(ayon_api.__version__).to_tuple()
     )
@@ -192,3 +235,404 @@ def initialize_ayon_connection(force=False):
         con.set_client_version(version)
     else:
         ayon_api.create_connection(site_id, version)
+
+
+class _AccessStats:
+    """Counters of data access by one caller."""
+
+    def __init__(self):
+        self.calls = 0
+        self.requests = 0
+        self.request_time = 0.0
+        self.cache_hits = 0
+        self.coalesced = 0
+
+    def to_data(self):
+        return {
+            "calls": self.calls,
+            "requests": self.requests,
+            "request_time": self.request_time,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+        }
+
+
+def _get_fields_key(fields, required_field):
+    if fields is None:
+        return None
+    fields = set(fields)
+    fields.add(required_field)
+    return tuple(sorted(fields))
+
+
+class AyonDataAccess:
+    """Access to entities on AYON server shared by client code.
+
+    Wrapper of 'ayon_api' connection for commonly repeated queries.
+    - Identical queries running at the same time in multiple threads are
+        coalesced into one request.
+    - Queries of entities by ids are batched, ids requested while
+        a request of the same entity type is running are queried together
+        in one following request.
+    - Entities are cached while a cache scope is open, e.g. during
+        publishing. Only project, folder and task entities are cached
+        because they are not changed by publishing.
+    - Counters of calls, requests, request time and cache hits are
+        collected per caller module.
+
+    Connection can be any object implementing 'get_project',
+        'get_folders' and 'get_tasks' of 'ayon_api.ServerAPI', which makes
+        it possible to use fake server in tests.
+
+    Args:
+        con (Optional[ayon_api.ServerAPI]): Server connection. Global
+            connection of 'ayon_api' is used if not passed.
+    """
+
+    def __init__(self, con=None):
+        self._con = con
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._pending_ids = {}
+        self._running_batches = set()
+        self._cache = {}
+        self._cache_scopes = 0
+        self._stats = collections.defaultdict(_AccessStats)
+
+    def get_project(self, project_name, fields=None):
+        """Project entity by name.
+
+        Args:
+            project_name (str): Project name.
+            fields (Optional[Iterable[str]]): Fields of project entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Project entity or None.
+        """
+        fields_key = _get_fields_key(fields, "name")
+        return self._get_single(
+            (project_name, "project", fields_key),
+            lambda: self._get_con().get_project(
+                project_name, fields=fields_key
+            )
+        )
+
+    def get_folder_by_path(self, project_name, folder_path, fields=None):
+        """Folder entity by path.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (str): Folder path.
+            fields (Optional[Iterable[str]]): Fields of folder entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Folder entity or None.
+        """
+        fields_key = _get_fields_key(fields, "path")
+        return self._get_single(
+            (project_name, "folder_path", folder_path, fields_key),
+            lambda: self._get_con().get_folder_by_path(
+                project_name, folder_path, fields=fields_key
+            )
+        )
+
+    def get_task_by_name(
+        self, project_name, folder_id, task_name, fields=None
+    ):
+        """Task entity by folder id and task name.
+
+        Args:
+            project_name (str): Project name.
+            folder_id (str): Folder id.
+            task_name (str): Task name.
+            fields (Optional[Iterable[str]]): Fields of task entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Task entity or None.
+        """
+        fields_key = _get_fields_key(fields, "name")
+        return self._get_single(
+            (project_name, "task_name", folder_id, task_name, fields_key),
+            lambda: self._get_con().get_task_by_name(
+                project_name, folder_id, task_name, fields=fields_key
+            )
+        )
+
+    def get_folder_by_id(self, project_name, folder_id, fields=None):
+        """Folder entity by id.
+
+        Args:
+            project_name (str): Project name.
+            folder_id (str): Folder id.
+            fields (Optional[Iterable[str]]): Fields of folder entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Folder entity or None.
+        """
+        return self.get_folders_by_ids(
+            project_name, [folder_id], fields
+        ).get(folder_id)
+
+    def get_folders_by_ids(self, project_name, folder_ids, fields=None):
+        """Folder entities by ids.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            fields (Optional[Iterable[str]]): Fields of folder entities.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Folder entities by id.
+                Value is None if folder was not found.
+        """
+        return self._get_by_ids(project_name, "folder", folder_ids, fields)
+
+    def get_task_by_id(self, project_name, task_id, fields=None):
+        """Task entity by id.
+
+        Args:
+            project_name (str): Project name.
+            task_id (str): Task id.
+            fields (Optional[Iterable[str]]): Fields of task entity.
+
+        Returns:
+            Union[dict[str, Any], None]: Task entity or None.
+        """
+        return self.get_tasks_by_ids(
+            project_name, [task_id], fields
+        ).get(task_id)
+
+    def get_tasks_by_ids(self, project_name, task_ids, fields=None):
+        """Task entities by ids.
+
+        Args:
+            project_name (str): Project name.
+            task_ids (Iterable[str]): Task ids.
+            fields (Optional[Iterable[str]]): Fields of task entities.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Task entities by id.
+                Value is None if task was not found.
+        """
+        return self._get_by_ids(project_name, "task", task_ids, fields)
+
+    @contextlib.contextmanager
+    def cache_scope(self):
+        """Cache entities while in context.
+
+        Scopes can be nested, cache is cleared when last scope is closed.
+        """
+        self.open_cache_scope()
+        try:
+            yield
+        finally:
+            self.close_cache_scope()
+
+    def open_cache_scope(self):
+        with self._lock:
+            self._cache_scopes += 1
+
+    def close_cache_scope(self):
+        with self._lock:
+            self._cache_scopes = max(0, self._cache_scopes - 1)
+            if not self._cache_scopes:
+                self._cache = {}
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache = {}
+
+    def get_stats(self):
+        """Access counters by caller module.
+
+        Returns:
+            dict[str, dict[str, Union[int, float]]]: Counters with
+                'calls', 'requests', 'request_time' in milliseconds,
+                'cache_hits' and 'coalesced' by caller module name.
+        """
+        with self._lock:
+            return {
+                caller: stats.to_data()
+                for caller, stats in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = collections.defaultdict(_AccessStats)
+
+    def _get_con(self):
+        if self._con is not None:
+            return self._con
+        return ayon_api.get_server_api_connection()
+
+    def _get_caller_stats(self):
+        # First frame outside of this module is the caller
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get("__name__") == (
+            __name__
+        ):
+            frame = frame.f_back
+        caller = "<unknown>"
+        if frame is not None:
+            caller = frame.f_globals.get("__name__") or caller
+        return self._stats[caller]
+
+    def _request(self, stats, func):
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            with self._lock:
+                stats.requests += 1
+                stats.request_time += (time.perf_counter() - start) * 1000
+
+    def _get_single(self, key, func):
+        with self._lock:
+            stats = self._get_caller_stats()
+            stats.calls += 1
+            if self._cache_scopes and key in self._cache:
+                stats.cache_hits += 1
+                return copy.deepcopy(self._cache[key])
+
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+            else:
+                stats.coalesced += 1
+
+        if owner:
+            try:
+                result = self._request(stats, func)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._futures.pop(key, None)
+                    if (
+                        self._cache_scopes
+                        and future.exception() is None
+                        and future.result() is not None
+                    ):
+                        self._cache[key] = future.result()
+
+        return copy.deepcopy(future.result())
+
+    def _get_by_ids(self, project_name, entity_type, entity_ids, fields):
+        fields_key = _get_fields_key(fields, "id")
+        batch_key = (project_name, entity_type, fields_key)
+        output = {}
+        futures = {}
+        with self._lock:
+            stats = self._get_caller_stats()
+            stats.calls += 1
+            pending_ids = self._pending_ids.setdefault(batch_key, {})
+            for entity_id in set(entity_ids):
+                key = (batch_key, entity_id)
+                if self._cache_scopes and key in self._cache:
+                    stats.cache_hits += 1
+                    output[entity_id] = self._cache[key]
+                    continue
+
+                future = self._futures.get(key)
+                if future is None:
+                    future = Future()
+                    self._futures[key] = future
+                    pending_ids[entity_id] = future
+                else:
+                    stats.coalesced += 1
+                futures[entity_id] = future
+
+            if not pending_ids:
+                self._pending_ids.pop(batch_key)
+
+            leader = (
+                batch_key in self._pending_ids
+                and batch_key not in self._running_batches
+            )
+            if leader:
+                self._running_batches.add(batch_key)
+
+        if leader:
+            self._process_batches(stats, batch_key)
+
+        for entity_id, future in futures.items():
+            output[entity_id] = future.result()
+        return copy.deepcopy(output)
+
+    def _process_batches(self, stats, batch_key):
+        # Process ids added by other threads while request is running
+        project_name, entity_type, fields_key = batch_key
+        while True:
+            with self._lock:
+                pending_ids = self._pending_ids.pop(batch_key, None)
+                if not pending_ids:
+                    self._running_batches.discard(batch_key)
+                    return
+
+            entities_by_id = {}
+            try:
+                if entity_type == "folder":
+                    entities = self._request(
+                        stats,
+                        lambda: list(self._get_con().get_folders(
+                            project_name,
+                            folder_ids=pending_ids,
+                            active=None,
+                            fields=fields_key,
+                        ))
+                    )
+                else:
+                    entities = self._request(
+                        stats,
+                        lambda: list(self._get_con().get_tasks(
+                            project_name,
+                            task_ids=pending_ids,
+                            active=None,
+                            fields=fields_key,
+                        ))
+                    )
+                for entity in entities:
+                    entities_by_id[entity["id"]] = entity
+
+            except BaseException as exc:
+                for future in pending_ids.values():
+                    future.set_exception(exc)
+
+            else:
+                for entity_id, future in pending_ids.items():
+                    future.set_result(entities_by_id.get(entity_id))
+
+            finally:
+                with self._lock:
+                    for entity_id in pending_ids:
+                        key = (batch_key, entity_id)
+                        self._futures.pop(key, None)
+                        entity = entities_by_id.get(entity_id)
+                        if self._cache_scopes and entity is not None:
+                            self._cache[key] = entity
+
+
+_default_data_access = AyonDataAccess()
+
+
+def get_data_access():
+    """Data access shared in process using global server connection.
+
+    Returns:
+        AyonDataAccess: Shared data access.
+    """
+    return _default_data_access
+
+
+def entity_cache_scope():
+    """Cache entities of shared data access while in context.
+
+    Example:
+        >>> with entity_cache_scope():
+        ...     pyblish.util.publish()
+    """
+    return _default_data_access.cache_scope()
@@ -0,0 +1,270 @@
+"""Cached scans of directories with parsed file sequences.
+
+Publish plugins check content of the same staging and render directories
+many times, which can be slow on network storage. Directory is listed
+with one 'os.scandir' call and the result is reused while cache scope is
+open, e.g. during publishing. Outside of cache scope a directory is
+scanned on each request.
+
+Code writing files into a scanned directory must invalidate its scan
+with 'invalidate_directory_scan'. File copies and hardlinks made by
+'ayon_core.lib' functions invalidate destination directory automatically.
+
+Example:
+    >>> scan = get_directory_scan(staging_dir)
+    >>> collections, remainders = scan.get_collections()
+    >>> scan.get_file("render.1001.exr").size
+    3145728
+"""
+import os
+import fnmatch
+import threading
+import contextlib
+
+import clique
+
+
+class ScannedFile:
+    """File found in directory.
+
+    Size and modification time are queried on first access and are
+    reused afterwards.
+
+    Args:
+        entry (os.DirEntry): Scanned directory entry.
+    """
+
+    def __init__(self, entry):
+        self._entry = entry
+
+    @property
+    def name(self):
+        return self._entry.name
+
+    @property
+    def path(self):
+        return self._entry.path
+
+    @property
+    def size(self):
+        return self._entry.stat().st_size
+
+    @property
+    def mtime(self):
+        return self._entry.stat().st_mtime
+
+
+class DirectoryScan:
+    """Content of directory at the time of scan.
+
+    Args:
+        dirpath (str): Path to directory.
+    """
+
+    def __init__(self, dirpath):
+        files = {}
+        exists = True
+        try:
+            with os.scandir(dirpath or ".") as entries:
+                for entry in entries:
+                    try:
+                        is_file = entry.is_file()
+                    except OSError:
+                        continue
+                    if is_file:
+                        files[entry.name] = ScannedFile(entry)
+        except (FileNotFoundError, NotADirectoryError):
+            exists = False
+
+        self._dirpath = dirpath
+        self._exists = exists
+        self._files = files
+        self._collections = None
+
+    @property
+    def dirpath(self):
+        return self._dirpath
+
+    @property
+    def exists(self):
+        """Directory existed at the time of scan."""
+        return self._exists
+
+    @property
+    def file_names(self):
+        """Names of files in directory.
+
+        Returns:
+            set[str]: File names.
+        """
+        return set(self._files)
+
+    def has_file(self, file_name):
+        return file_name in self._files
+
+    def get_file(self, file_name):
+        """Scanned file by name.
+
+        Args:
+            file_name (str): File name.
+
+        Returns:
+            Union[ScannedFile, None]: File or None if does not exist.
+        """
+        return self._files.get(file_name)
+
+    def get_files(self, file_names=None):
+        """Scanned files.
+
+        Args:
+            file_names (Optional[Iterable[str]]): File names. All files
+                are returned if not passed.
+
+        Returns:
+            list[ScannedFile]: Files which exist.
+        """
+        if file_names is None:
+            return list(self._files.values())
+        return [
+            self._files[file_name]
+            for file_name in file_names
+            if file_name in self._files
+        ]
+
+    def glob(self, pattern):
+        """File names matching glob pattern.
+
+        Args:
+            pattern (str): Pattern of file name, e.g. 'render.*.exr'.
+
+        Returns:
+            list[str]: Matching file names.
+        """
+        return fnmatch.filter(self._files, pattern)
+
+    def get_collections(self):
+        """File sequences in directory.
+
+        Result of 'clique.assemble' with frame pattern, single files are
+        collected as collections too. Result is parsed only once.
+
+        Returns:
+            tuple[list[clique.Collection], list[str]]: Collections and
+                remainders.
+        """
+        if self._collections is None:
+            self._collections = clique.assemble(
+                self._files,
+                patterns=[clique.PATTERNS["frames"]],
+                minimum_items=1
+            )
+        collections, remainders = self._collections
+        return list(collections), list(remainders)
+
+    def get_collection_files(self, collection):
+        """Scanned files of collection with size and modification time.
+
+        Args:
+            collection (clique.Collection): Collection of file names.
+
+        Returns:
+            list[ScannedFile]: Files of collection which exist.
+        """
+        return self.get_files(iter(collection))
+
+
+class _DirectoryScanCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scans = {}
+        self._scopes = 0
+
+    def get_scan(self, dirpath):
+        key = os.path.normcase(os.path.abspath(dirpath))
+        with self._lock:
+            scan = self._scans.get(key)
+            if scan is not None:
+                return scan
+
+        scan = DirectoryScan(dirpath)
+        with self._lock:
+            if self._scopes:
+                self._scans[key] = scan
+        return scan
+
+    def invalidate(self, dirpath=None):
+        with self._lock:
+            if dirpath is None:
+                self._scans = {}
+            elif self._scans:
+                key = os.path.normcase(os.path.abspath(dirpath))
+                self._scans.pop(key, None)
+
+    def open_scope(self):
+        with self._lock:
+            self._scopes += 1
+
+    def close_scope(self):
+        with self._lock:
+            self._scopes = max(0, self._scopes - 1)
+            if not self._scopes:
+                self._scans = {}
+
+
+_cache = _DirectoryScanCache()
+
+
+def get_directory_scan(dirpath):
+    """Scan of directory, cached while cache scope is open.
+
+    Args:
+        dirpath (str): Path to directory.
+
+    Returns:
+        DirectoryScan: Content of directory.
+    """
+    return _cache.get_scan(dirpath)
+
+
+def invalidate_directory_scan(dirpath=None):
+    """Invalidate cached scan after files were written into directory.
+
+    Args:
+        dirpath (Optional[str]): Path to directory. All scans are
+            invalidated if not passed.
+    """
+    _cache.invalidate(dirpath)
+
+
+def open_directory_scan_scope():
+    _cache.open_scope()
+
+
+def close_directory_scan_scope():
+    _cache.close_scope()
+
+
+@contextlib.contextmanager
+def directory_scan_scope():
+    """Cache directory scans while in context.
+
+    Scopes can be nested, cache is cleared when last scope is closed.
+    """
+    _cache.open_scope()
+    try:
+        yield
+    finally:
+        _cache.close_scope()
+
+
+def scanned_path_exists(path):
+    """Check if file exists using scan of its directory.
+
+    Args:
+        path (str): Path to file.
+
+    Returns:
+        bool: File exists.
+    """
+    dirpath, file_name = os.path.split(path)
+    return get_directory_scan(dirpath or ".").has_file(file_name)
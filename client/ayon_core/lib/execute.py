@@ -1,12 +1,23 @@
 import os
 import sys
+import time
+import codecs
+import threading
 import subprocess
 import platform
 import json
 import tempfile
+import collections
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
+from .profiling import (
+    COUNTER_SUBPROCESS_TIME,
+    COUNTER_SUBPROCESS_CPU,
+    COUNTER_SUBPROCESS_CALLS,
+    is_profiling_active,
+    add_profiling_counter,
+)
 
 # MSDN process creation flag (Windows only)
 CREATE_NO_WINDOW = 0x08000000
@@ -69,10 +80,94 @@ def execute(args, silent=False, cwd=None, env=None, shell=None):
     return popen.returncode
 
 
+class _OutputReader(threading.Thread):
+    """Read output pipe of process and log it line by line.
+
+    Output is logged while the process is running. The last lines are
+    kept for error message and full output is kept only if is requested,
+    so memory usage does not grow with verbose output.
+
+    Args:
+        stream (io.BufferedReader): Output pipe of process.
+        log_func (Callable[[str], None]): Function logging output lines.
+        keep_output (bool): Keep full output.
+        tail_size (int): Number of last lines to keep.
+    """
+    _chunk_size = 65536
+    # Line is logged even without line break when pending text is longer
+    _max_line_length = 65536
+
+    def __init__(self, stream, log_func, keep_output, tail_size):
+        super(_OutputReader, self).__init__()
+        self.daemon = True
+        self._stream = stream
+        self._log_func = log_func
+        self._keep_output = keep_output
+        self._chunks = []
+        self._tail = collections.deque(maxlen=tail_size)
+        self._pending = ""
+
+    def run(self):
+        decoder = codecs.getincrementaldecoder("utf-8")(
+            errors="backslashreplace"
+        )
+        try:
+            while True:
+                data = self._stream.read1(self._chunk_size)
+                if not data:
+                    break
+                self._add_text(decoder.decode(data))
+            self._add_text(decoder.decode(b"", final=True))
+            self._flush_lines(final=True)
+        except (OSError, ValueError):
+            # Pipe was closed, e.g. when process was killed
+            pass
+        finally:
+            self._stream.close()
+
+    def _add_text(self, text):
+        if not text:
+            return
+        if self._keep_output:
+            self._chunks.append(text)
+        self._pending += text
+        self._flush_lines()
+
+    def _flush_lines(self, final=False):
+        # Progress of some tools (ffmpeg) is separated by carriage return
+        idx = max(self._pending.rfind("\n"), self._pending.rfind("\r"))
+        if final or len(self._pending) > self._max_line_length:
+            idx = len(self._pending)
+        if idx < 0:
+            return
+
+        lines = self._pending[:idx].splitlines()
+        self._pending = self._pending[idx + 1:]
+        for line in lines:
+            if line:
+                self._tail.append(line)
+                self._log_func(line)
+
+    def get_output(self):
+        """Full output, or the last lines if full output is not kept."""
+        if self._keep_output:
+            return "".join(self._chunks)
+        return "\n".join(self._tail)
+
+
+def _stop_process(proc):
+    proc.terminate()
+    try:
+        proc.wait(5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
 def run_subprocess(*args, **kwargs):
     """Convenience method for getting output errors for subprocess.
 
-    Output logged when process finish.
+    Output is logged line by line while process is running.
 
     Entered arguments and keyword arguments are passed to subprocess Popen.
 
@@ -83,14 +178,18 @@ def run_subprocess(*args, **kwargs):
         *args: Variable length argument list passed to Popen.
         **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
             pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+            for output. Arguments "timeout" (seconds) and "cancel_event"
+            (threading.Event) stop the process when time runs out or the
+            event is set. With "keep_output" set to False the full output
+            is not kept in memory and only last lines of output are
+            returned, number of lines is defined by "output_tail_size".
 
     Returns:
         str: Full output of subprocess concatenated stdout and stderr.
 
     Raises:
         RuntimeError: Exception is raised if process finished with nonzero
-            return code.
+            return code, took longer than timeout or was cancelled.
 
     """
     # Modify creation flags on windows to hide console window if in UI mode
@@ -119,31 +218,107 @@ def run_subprocess(*args, **kwargs):
     if logger is None:
         logger = Logger.get_logger("run_subprocess")
 
+    timeout = kwargs.pop("timeout", None)
+    cancel_event = kwargs.pop("cancel_event", None)
+    keep_output = kwargs.pop("keep_output", True)
+    tail_size = kwargs.pop("output_tail_size", 100)
+
     # set overrides
     kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
     kwargs["stdin"] = kwargs.get("stdin", subprocess.PIPE)
     kwargs["env"] = filtered_env
 
+    start = time.perf_counter()
+    times_start = os.times()
     proc = subprocess.Popen(*args, **kwargs)
+    # Process does not get any input
+    if proc.stdin is not None:
+        proc.stdin.close()
+
+    readers = []
+    stdout_reader = stderr_reader = None
+    if proc.stdout is not None:
+        stdout_reader = _OutputReader(
+            proc.stdout, logger.debug, keep_output, tail_size
+        )
+        readers.append(stdout_reader)
+    if proc.stderr is not None:
+        stderr_reader = _OutputReader(
+            proc.stderr, logger.info, keep_output, tail_size
+        )
+        readers.append(stderr_reader)
+
+    for reader in readers:
+        reader.start()
+
+    stop_reason = None
+    try:
+        while proc.poll() is None:
+            if cancel_event is not None and cancel_event.is_set():
+                stop_reason = "was cancelled"
+            elif (
+                timeout is not None
+                and time.perf_counter() - start > timeout
+            ):
+                stop_reason = "timed out after {}s".format(timeout)
+
+            if stop_reason:
+                _stop_process(proc)
+                break
+
+            if cancel_event is not None:
+                cancel_event.wait(0.1)
+            else:
+                try:
+                    proc.wait(0.1)
+                except subprocess.TimeoutExpired:
+                    pass
+
+    except BaseException:
+        # e.g. KeyboardInterrupt, don't leave process running
+        _stop_process(proc)
+        raise
+
+    finally:
+        for reader in readers:
+            reader.join()
+
+    if is_profiling_active():
+        # CPU time of children is approximate if more subprocesses are
+        #   running at the same time
+        times_end = os.times()
+        add_profiling_counter(COUNTER_SUBPROCESS_CALLS)
+        add_profiling_counter(
+            COUNTER_SUBPROCESS_TIME, (time.perf_counter() - start) * 1000
+        )
+        add_profiling_counter(
+            COUNTER_SUBPROCESS_CPU,
+            (
+                times_end.children_user - times_start.children_user
+                + times_end.children_system - times_start.children_system
+            ) * 1000
+        )
 
-    full_output = ""
-    _stdout, _stderr = proc.communicate()
-    if _stdout:
-        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
-        full_output += _stdout
-        logger.debug(_stdout)
+    _stdout = _stderr = ""
+    if stdout_reader is not None:
+        _stdout = stdout_reader.get_output()
+    if stderr_reader is not None:
+        _stderr = stderr_reader.get_output()
 
+    full_output = _stdout
     if _stderr:
-        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
         # Add additional line break if output already contains stdout
         if full_output:
             full_output += "\n"
         full_output += _stderr
-        logger.info(_stderr)
 
-    if proc.returncode != 0:
+    if stop_reason or proc.returncode != 0:
         exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
+        if stop_reason:
+            exc_msg = "Execution of arguments {}: \"{}\"".format(
+                stop_reason, args
+            )
         if _stdout:
             exc_msg += "\n\nOutput:\n{}".format(_stdout)
 
@@ -0,0 +1,174 @@
+"""Cached content fingerprints of files.
+
+Fingerprint identifies file by its content, not by its path or
+modification time, so copies of the same file have the same fingerprint.
+Whole content of file is hashed, so fingerprint can be used to decide if
+file has to be processed again.
+
+Computed fingerprints are stored in index in local AYON data keyed by
+device, inode, modification time and size of file, so fingerprint of
+unchanged file is received with a single 'stat' call and content is read
+only once.
+
+Example:
+    >>> get_file_fingerprint("/textures/wood_diffuse.exr")
+    '52428800-9f2c1d0b6b7e4a1f83c5a6f1d2e4b7c9'
+"""
+import os
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .local_settings import get_ayon_appdirs
+
+_BLOCK_SIZE = 1024 * 1024
+# Change when fingerprint computation changes to ignore stored fingerprints
+_FINGERPRINT_VERSION = 2
+
+
+class _FingerprintIndex:
+    """Fingerprints by file stat stored in sqlite database."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fingerprints = {}
+        self._connection = None
+        self._connection_failed = False
+
+    def _get_connection(self):
+        if self._connection is None and not self._connection_failed:
+            try:
+                filepath = get_ayon_appdirs("file_fingerprints.db")
+                dirpath = os.path.dirname(filepath)
+                os.makedirs(dirpath, exist_ok=True)
+                connection = sqlite3.connect(
+                    filepath, timeout=10, check_same_thread=False
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS fingerprints"
+                    " (key TEXT PRIMARY KEY, fingerprint TEXT)"
+                )
+                connection.commit()
+                self._connection = connection
+            except (OSError, sqlite3.Error):
+                # Fingerprints are only kept in memory
+                self._connection_failed = True
+        return self._connection
+
+    def get(self, key):
+        with self._lock:
+            fingerprint = self._fingerprints.get(key)
+            if fingerprint is not None:
+                return fingerprint
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT fingerprint FROM fingerprints WHERE key = ?",
+                    (key, )
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            self._fingerprints[key] = row[0]
+            return row[0]
+
+    def set(self, key, fingerprint, commit=True):
+        with self._lock:
+            self._fingerprints[key] = fingerprint
+            connection = self._get_connection()
+            if connection is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO fingerprints"
+                    " (key, fingerprint) VALUES (?, ?)",
+                    (key, fingerprint)
+                )
+                if commit:
+                    connection.commit()
+            except sqlite3.Error:
+                pass
+
+    def commit(self):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.commit()
+            except sqlite3.Error:
+                pass
+
+
+_index = _FingerprintIndex()
+
+
+def _get_stat_key(filepath, stat):
+    # Some network filesystems don't have inodes, use path instead
+    if stat.st_ino:
+        file_id = "{}:{}".format(stat.st_dev, stat.st_ino)
+    else:
+        file_id = os.path.normcase(os.path.abspath(filepath))
+    return "{}|{}|{}|{}".format(
+        _FINGERPRINT_VERSION, file_id, stat.st_mtime_ns, stat.st_size
+    )
+
+
+def _compute_fingerprint(filepath, size):
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(_BLOCK_SIZE), b""):
+            hasher.update(chunk)
+    return "{}-{}".format(size, hasher.hexdigest())
+
+
+def _get_file_fingerprint(filepath, commit):
+    stat = os.stat(filepath)
+    key = _get_stat_key(filepath, stat)
+    fingerprint = _index.get(key)
+    if fingerprint is None:
+        fingerprint = _compute_fingerprint(filepath, stat.st_size)
+        _index.set(key, fingerprint, commit)
+    return fingerprint
+
+
+def get_file_fingerprint(filepath):
+    """Content fingerprint of file.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        str: Fingerprint of file content.
+    """
+    return _get_file_fingerprint(filepath, True)
+
+
+def get_files_fingerprints(filepaths, max_workers=None):
+    """Content fingerprints of multiple files computed in threads.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        max_workers (Optional[int]): Maximum number of threads.
+
+    Returns:
+        dict[str, str]: Fingerprint by filepath.
+    """
+    filepaths = list(dict.fromkeys(filepaths))
+    if not filepaths:
+        return {}
+
+    if max_workers is None:
+        max_workers = min(8, len(filepaths))
+    try:
+        with ThreadPoolExecutor(max_workers) as executor:
+            fingerprints = executor.map(
+                _get_file_fingerprint, filepaths, [False] * len(filepaths)
+            )
+            return dict(zip(filepaths, fingerprints))
+    finally:
+        # New fingerprints are stored in one transaction
+        _index.commit()
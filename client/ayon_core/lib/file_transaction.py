@@ -5,6 +5,12 @@ import errno
 import six
 
 from ayon_core.lib import create_hard_link
+from ayon_core.lib.directory_scan import invalidate_directory_scan
+from ayon_core.lib.profiling import (
+    COUNTER_BYTES_COPIED,
+    is_profiling_active,
+    add_profiling_counter,
+)
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -139,11 +145,16 @@ class FileTransaction(object):
             if opts["mode"] == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
                 copyfile(src, dst)
+                if is_profiling_active():
+                    add_profiling_counter(
+                        COUNTER_BYTES_COPIED, os.path.getsize(dst)
+                    )
             elif opts["mode"] == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
 
+            invalidate_directory_scan(os.path.dirname(dst))
             self._transferred.append(dst)
 
     def finalize(self):
@@ -158,6 +169,7 @@ class FileTransaction(object):
 
     def rollback(self):
         errors = 0
+        invalidate_directory_scan()
         # Rollback any transferred files
         for path in self._transferred:
             try:
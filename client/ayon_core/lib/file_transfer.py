@@ -0,0 +1,327 @@
+"""Transfer files without copying their content when possible.
+
+Files are transferred using the cheapest available method. Hardlink is
+tried first, then copy-on-write clone (reflink) on filesystems supporting
+it and full copy is used as last resort. Full copies of multiple files are
+processed in parallel threads.
+"""
+import os
+import sys
+import errno
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .path_tools import create_hard_link, format_file_size
+from .directory_scan import invalidate_directory_scan
+from .profiling import (
+    COUNTER_BYTES_COPIED,
+    is_profiling_active,
+    add_profiling_counter,
+    get_profiling_span,
+    use_profiling_span,
+)
+
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
+log = logging.getLogger(__name__)
+
+# 'FICLONE' ioctl request code from 'linux/fs.h'
+_FICLONE = 0x40049409
+
+TRANSFER_HARDLINK = "hardlink"
+TRANSFER_REFLINK = "reflink"
+TRANSFER_COPY = "copy"
+
+# Hardlink errors on which other transfer methods are used
+#   EXDEV - cross drive path
+#   EINVAL - wrong format, must be NTFS
+_HARDLINK_FALLBACK_ERRNOS = (errno.EXDEV, errno.EINVAL)
+
+
+class FileTransferStats(object):
+    """Statistics of transferred files.
+
+    Counts files and bytes per transfer method. Content of hardlinked and
+    cloned files is not copied so their size is counted as bytes avoided.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_by_method = {
+            TRANSFER_HARDLINK: 0,
+            TRANSFER_REFLINK: 0,
+            TRANSFER_COPY: 0,
+        }
+        self.bytes_by_method = {
+            TRANSFER_HARDLINK: 0,
+            TRANSFER_REFLINK: 0,
+            TRANSFER_COPY: 0,
+        }
+
+    def add(self, method, size):
+        """Add transferred file.
+
+        Args:
+            method (str): Used transfer method.
+            size (int): Size of transferred file in bytes.
+        """
+        with self._lock:
+            self.files_by_method[method] += 1
+            self.bytes_by_method[method] += size
+
+    @property
+    def files_count(self):
+        return sum(self.files_by_method.values())
+
+    @property
+    def bytes_copied(self):
+        return self.bytes_by_method[TRANSFER_COPY]
+
+    @property
+    def bytes_avoided(self):
+        return (
+            self.bytes_by_method[TRANSFER_HARDLINK]
+            + self.bytes_by_method[TRANSFER_REFLINK]
+        )
+
+    def to_data(self):
+        return {
+            "files": dict(self.files_by_method),
+            "bytes": dict(self.bytes_by_method),
+            "bytes_avoided": self.bytes_avoided,
+        }
+
+    def format_summary(self):
+        """Human readable summary of transfers.
+
+        Returns:
+            str: Summary message.
+        """
+        return (
+            "Transferred {} files (hardlinked: {}, cloned: {}, copied: {})."
+            " Copied {}, avoided copying {}."
+        ).format(
+            self.files_count,
+            self.files_by_method[TRANSFER_HARDLINK],
+            self.files_by_method[TRANSFER_REFLINK],
+            self.files_by_method[TRANSFER_COPY],
+            format_file_size(self.bytes_copied),
+            format_file_size(self.bytes_avoided),
+        )
+
+
+def create_reflink(src_path, dst_path):
+    """Create copy-on-write clone of file.
+
+    Clone shares data blocks with source file until one of them is
+    modified. Supported only on Linux filesystems that implement 'FICLONE'
+    (e.g. Btrfs, XFS, OCFS2 or NFS 4.2 with server side support).
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path where clone is created.
+
+    Raises:
+        OSError: When clone is not supported for the paths.
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(
+            errno.ENOTSUP,
+            "Reflink is not supported on current platform",
+            dst_path
+        )
+
+    import fcntl
+
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            try:
+                fcntl.ioctl(
+                    dst_stream.fileno(), _FICLONE, src_stream.fileno()
+                )
+            except OSError:
+                dst_stream.close()
+                os.remove(dst_path)
+                raise
+    shutil.copymode(src_path, dst_path)
+
+
+def copy_file(src_path, dst_path):
+    """Copy file content and permission bits.
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path to destination file.
+    """
+    copyfile(src_path, dst_path)
+    shutil.copymode(src_path, dst_path)
+    invalidate_directory_scan(os.path.dirname(dst_path))
+    if is_profiling_active():
+        add_profiling_counter(
+            COUNTER_BYTES_COPIED, os.path.getsize(dst_path)
+        )
+
+
+def link_or_clone_file(
+    src_path, dst_path, allow_hardlink=True, allow_copy=True, stats=None
+):
+    """Transfer file using cheapest available method.
+
+    Tries hardlink, then reflink and then full copy. Destination directory
+    must exist. Existing destination file is removed first so content of
+    a file it might be linked to is never modified.
+
+    Other methods are used only if hardlink is not possible between
+    the paths (cross drive, unsupported filesystem), other errors, e.g.
+    permission errors, are raised.
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path to destination file.
+        allow_hardlink (Optional[bool]): Hardlink can be used. Do not use
+            hardlinks if destination file might be modified in place.
+        allow_copy (Optional[bool]): Fallback to full copy if file could
+            not be linked or cloned.
+        stats (Optional[FileTransferStats]): Stats to add the transfer to.
+
+    Returns:
+        Union[str, None]: Used transfer method or None if file was not
+            transferred because full copy was not allowed.
+    """
+    size = os.path.getsize(src_path)
+    if os.path.lexists(dst_path):
+        os.remove(dst_path)
+    invalidate_directory_scan(os.path.dirname(dst_path))
+
+    if allow_hardlink:
+        try:
+            create_hard_link(src_path, dst_path)
+            method = TRANSFER_HARDLINK
+
+        except NotImplementedError as exc:
+            method = None
+            log.debug("Hardlink failed for '{}': {}".format(dst_path, exc))
+
+        except OSError as exc:
+            if exc.errno not in _HARDLINK_FALLBACK_ERRNOS:
+                raise
+            method = None
+            log.debug("Hardlink failed for '{}': {}".format(dst_path, exc))
+
+        if method:
+            if stats is not None:
+                stats.add(method, size)
+            return method
+
+    try:
+        create_reflink(src_path, dst_path)
+        method = TRANSFER_REFLINK
+
+    except OSError as exc:
+        method = None
+        log.debug("Reflink failed for '{}': {}".format(dst_path, exc))
+
+    if method is None:
+        if not allow_copy:
+            return None
+        copy_file(src_path, dst_path)
+        method = TRANSFER_COPY
+
+    if stats is not None:
+        stats.add(method, size)
+    return method
+
+
+def link_or_clone_files(
+    transfers,
+    allow_hardlink=True,
+    max_workers=None,
+    skip_existing=False,
+    stats=None,
+):
+    """Transfer files in bulk using cheapest available method.
+
+    Hardlinks and clones are created first, files that have to be fully
+    copied are copied in parallel threads afterwards. Destination
+    directories are created if they don't exist.
+
+    Args:
+        transfers (Iterable[tuple[str, str]]): Source and destination
+            paths.
+        allow_hardlink (Optional[bool]): Hardlinks can be used.
+        max_workers (Optional[int]): Maximum number of copy threads.
+        skip_existing (Optional[bool]): Skip transfers of which destination
+            already exists. Existing destination is replaced otherwise.
+        stats (Optional[FileTransferStats]): Stats to add transfers to.
+
+    Returns:
+        FileTransferStats: Statistics of the transfers.
+    """
+    if stats is None:
+        stats = FileTransferStats()
+
+    created_dirs = set()
+    # Pairs of source and destination directories where linking and
+    #   cloning failed, files of sequence are usually in the same directory
+    copy_only_dirs = set()
+    to_copy = []
+    for src_path, dst_path in transfers:
+        if skip_existing and os.path.exists(dst_path):
+            continue
+
+        dirpath = os.path.dirname(dst_path)
+        if dirpath not in created_dirs:
+            os.makedirs(dirpath, exist_ok=True)
+            created_dirs.add(dirpath)
+
+        dirs_key = (os.path.dirname(src_path), dirpath)
+        if dirs_key in copy_only_dirs:
+            to_copy.append((src_path, dst_path))
+            continue
+
+        method = link_or_clone_file(
+            src_path,
+            dst_path,
+            allow_hardlink=allow_hardlink,
+            allow_copy=False,
+            stats=stats,
+        )
+        if method is None:
+            copy_only_dirs.add(dirs_key)
+            to_copy.append((src_path, dst_path))
+
+    if not to_copy:
+        return stats
+
+    def _copy(paths):
+        src_path, dst_path = paths
+        if os.path.lexists(dst_path):
+            os.remove(dst_path)
+        copy_file(src_path, dst_path)
+        stats.add(TRANSFER_COPY, os.path.getsize(dst_path))
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    if max_workers < 2 or len(to_copy) == 1:
+        for paths in to_copy:
+            _copy(paths)
+        return stats
+
+    span = get_profiling_span()
+
+    def _copy_in_thread(paths):
+        with use_profiling_span(span):
+            _copy(paths)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Iterate results to re-raise possible exceptions
+        for _ in executor.map(_copy_in_thread, to_copy):
+            pass
+    return stats
@@ -0,0 +1,380 @@
+"""Frame sets stored as ranges and helpers for image sequences.
+
+Frames of image sequences are mostly continuous, so set of frames is stored
+as sorted list of inclusive '(start, end)' ranges. Operations like gap
+detection, union, intersection or difference then work with number of
+ranges instead of number of frames, and frames are generated only when
+they're really needed (e.g. to create file names).
+
+Example:
+    >>> rendered = FrameRanges.from_frames([1, 2, 3, 7, 8, 9])
+    >>> rendered.get_gaps(1, 10)
+    FrameRanges('4-6,10')
+    >>> format_frame_names("beauty.", ".exr", 4, rendered.get_gaps(1, 10))
+    ['beauty.0004.exr', 'beauty.0005.exr', 'beauty.0006.exr', ...]
+"""
+import bisect
+import itertools
+
+import clique
+
+
+def _merge_ranges(ranges):
+    """Sort ranges and merge overlapping or adjacent ranges.
+
+    Args:
+        ranges (Iterable[tuple[int, int]]): Inclusive ranges.
+
+    Returns:
+        list[tuple[int, int]]: Sorted non-overlapping ranges.
+    """
+    output = []
+    for start, end in sorted(ranges):
+        if output and start <= output[-1][1] + 1:
+            if end > output[-1][1]:
+                output[-1] = (output[-1][0], end)
+        else:
+            output.append((start, end))
+    return output
+
+
+class FrameRanges:
+    """Immutable set of frames stored as inclusive ranges.
+
+    Object behaves as set of integers: supports 'in', 'len', iteration
+    in ascending order, comparison and '|', '&', '-' operators.
+
+    Args:
+        ranges (Optional[Iterable[tuple[int, int]]]): Inclusive frame
+            ranges. Ranges can overlap and don't have to be sorted.
+    """
+
+    def __init__(self, ranges=None):
+        ranges = [
+            (int(start), int(end))
+            for start, end in (ranges or [])
+            if start <= end
+        ]
+        self._ranges = _merge_ranges(ranges)
+        self._starts = [start for start, _ in self._ranges]
+
+    @classmethod
+    def from_range(cls, start, end):
+        """Create frames from inclusive frame range.
+
+        Args:
+            start (int): First frame.
+            end (int): Last frame.
+
+        Returns:
+            FrameRanges: Frames.
+        """
+        return cls([(start, end)])
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Create from frame numbers.
+
+        Args:
+            frames (Iterable[int]): Frame numbers in any order.
+
+        Returns:
+            FrameRanges: Frames.
+        """
+        frames = sorted(set(frames))
+        if not frames:
+            return cls()
+
+        # Indexes where frames are not consecutive split ranges
+        ranges = []
+        start = prev = frames[0]
+        for frame in itertools.islice(frames, 1, None):
+            if frame != prev + 1:
+                ranges.append((start, prev))
+                start = frame
+            prev = frame
+        ranges.append((start, prev))
+        return cls._from_merged(ranges)
+
+    @classmethod
+    def _from_merged(cls, ranges):
+        # Skip validation of ranges which are already sorted and merged
+        obj = cls.__new__(cls)
+        obj._ranges = ranges
+        obj._starts = [start for start, _ in ranges]
+        return obj
+
+    @classmethod
+    def from_string(cls, frames_str):
+        """Create from frame list string.
+
+        Format matches frame list of Deadline jobs, e.g. '1-10,15,20-30'.
+
+        Args:
+            frames_str (str): Comma separated frames or frame ranges.
+
+        Returns:
+            FrameRanges: Frames.
+        """
+        ranges = []
+        for part in frames_str.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            # Negative frame may start with '-'
+            start, sep, end = part[1:].partition("-")
+            start = part[0] + start
+            if not sep:
+                end = start
+            ranges.append((int(start), int(end)))
+        return cls(ranges)
+
+    @classmethod
+    def from_collection(cls, collection):
+        """Create from frames of clique collection.
+
+        Args:
+            collection (clique.Collection): Collection.
+
+        Returns:
+            FrameRanges: Frames.
+        """
+        return cls.from_frames(collection.indexes)
+
+    @property
+    def ranges(self):
+        """Sorted inclusive ranges.
+
+        Returns:
+            list[tuple[int, int]]: Copy of ranges.
+        """
+        return list(self._ranges)
+
+    @property
+    def first(self):
+        if self._ranges:
+            return self._ranges[0][0]
+        return None
+
+    @property
+    def last(self):
+        if self._ranges:
+            return self._ranges[-1][1]
+        return None
+
+    def to_string(self):
+        """Frames as frame list string, e.g. '1-10,15,20-30'.
+
+        Returns:
+            str: Frame list string.
+        """
+        return ",".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in self._ranges
+        )
+
+    def union(self, other):
+        return FrameRanges(self._ranges + other.ranges)
+
+    def intersection(self, other):
+        output = []
+        other_ranges = other.ranges
+        idx = other_idx = 0
+        while idx < len(self._ranges) and other_idx < len(other_ranges):
+            start, end = self._ranges[idx]
+            other_start, other_end = other_ranges[other_idx]
+            new_start = max(start, other_start)
+            new_end = min(end, other_end)
+            if new_start <= new_end:
+                output.append((new_start, new_end))
+            if end < other_end:
+                idx += 1
+            else:
+                other_idx += 1
+        return FrameRanges(output)
+
+    def difference(self, other):
+        output = []
+        other_ranges = other.ranges
+        other_idx = 0
+        for start, end in self._ranges:
+            # Skip other ranges that end before current range
+            while (
+                other_idx < len(other_ranges)
+                and other_ranges[other_idx][1] < start
+            ):
+                other_idx += 1
+
+            idx = other_idx
+            while idx < len(other_ranges) and other_ranges[idx][0] <= end:
+                other_start, other_end = other_ranges[idx]
+                if other_start > start:
+                    output.append((start, other_start - 1))
+                start = other_end + 1
+                if start > end:
+                    break
+                idx += 1
+
+            if start <= end:
+                output.append((start, end))
+        return FrameRanges(output)
+
+    def shifted(self, offset):
+        """Frames moved by offset, e.g. for renumbering of sequence.
+
+        Args:
+            offset (int): Value added to all frames.
+
+        Returns:
+            FrameRanges: Shifted frames.
+        """
+        return FrameRanges(
+            (start + offset, end + offset)
+            for start, end in self._ranges
+        )
+
+    def get_gaps(self, start=None, end=None):
+        """Missing frames in frame range.
+
+        Args:
+            start (Optional[int]): Start of frame range. First frame is
+                used if not passed.
+            end (Optional[int]): End of frame range. Last frame is used if
+                not passed.
+
+        Returns:
+            FrameRanges: Frames which are not in frames.
+        """
+        if start is None:
+            start = self.first
+        if end is None:
+            end = self.last
+        if start is None or end is None:
+            return FrameRanges()
+        return FrameRanges.from_range(start, end) - self
+
+    def get_previous_frames_for_gaps(self, start=None, end=None):
+        """Nearest previous existing frame for each missing frame.
+
+        Missing frames before first frame use first frame.
+
+        Args:
+            start (Optional[int]): Start of frame range.
+            end (Optional[int]): End of frame range.
+
+        Returns:
+            dict[int, int]: Existing frame by missing frame.
+        """
+        output = {}
+        if not self._ranges:
+            return output
+
+        for gap_start, gap_end in self.get_gaps(start, end).ranges:
+            idx = bisect.bisect_right(self._starts, gap_start) - 1
+            if idx < 0:
+                src_frame = self._ranges[0][0]
+            else:
+                src_frame = self._ranges[idx][1]
+            output.update(
+                dict.fromkeys(range(gap_start, gap_end + 1), src_frame)
+            )
+        return output
+
+    def to_collection(self, head, tail, padding):
+        """Create clique collection with frames.
+
+        Args:
+            head (str): Collection head.
+            tail (str): Collection tail.
+            padding (int): Frame padding.
+
+        Returns:
+            clique.Collection: Collection.
+        """
+        return clique.Collection(
+            head=head, tail=tail, padding=padding, indexes=set(self)
+        )
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_right(self._starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __iter__(self):
+        for start, end in self._ranges:
+            yield from range(start, end + 1)
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self._ranges)
+
+    def __bool__(self):
+        return bool(self._ranges)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrameRanges):
+            return NotImplemented
+        return self._ranges == other.ranges
+
+    def __hash__(self):
+        return hash(tuple(self._ranges))
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.to_string())
+
+
+def get_frame_format(head, tail, padding):
+    """Printf-style format of frame file name.
+
+    Args:
+        head (str): Part of name before frame.
+        tail (str): Part of name after frame.
+        padding (int): Frame padding.
+
+    Returns:
+        str: Format which can be filled with frame, e.g. 'head.%04d.exr'.
+    """
+    return "{}%0{}d{}".format(
+        head.replace("%", "%%"), padding, tail.replace("%", "%%")
+    )
+
+
+def format_frame_names(head, tail, padding, frames):
+    """Create padded file names for frames.
+
+    Args:
+        head (str): Part of name before frame.
+        tail (str): Part of name after frame.
+        padding (int): Frame padding.
+        frames (Iterable[int]): Frames, e.g. 'FrameRanges'.
+
+    Returns:
+        list[str]: File names.
+    """
+    frame_format = get_frame_format(head, tail, padding)
+    return [frame_format % frame for frame in frames]
+
+
+def format_collection_names(collection, frames=None):
+    """Create file names of clique collection for frames.
+
+    Args:
+        collection (clique.Collection): Collection.
+        frames (Optional[Iterable[int]]): Frames. Indexes of collection
+            are used if not passed.
+
+    Returns:
+        list[str]: File names.
+    """
+    if frames is None:
+        frames = sorted(collection.indexes)
+    return format_frame_names(
+        collection.head, collection.tail, collection.padding, frames
+    )
@@ -0,0 +1,376 @@
+"""Integrity checks of rendered image files.
+
+Truncated or partially written frames (e.g. from crashed render nodes)
+are detected without decoding of pixels.
+
+OpenEXR files are checked by pure python parser of header and chunk
+offset table. OpenEXR writes zeros to offset table when file is created
+and fills offsets when file is closed, so file which was not closed has
+invalid offsets, and file which was truncated has chunks outside of file.
+
+Other image formats, and OpenEXR files which parser does not support, are
+checked by reading their header with oiiotool if is available.
+"""
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .transcoding import get_oiio_info_for_input
+from .vendor_bin_utils import is_oiio_supported
+from .profiling import get_profiling_span, use_profiling_span
+
+EXR_MAGIC = 20000630
+# Flags in version field of OpenEXR file
+_EXR_TILED_FLAG = 0x200
+_EXR_NON_IMAGE_FLAG = 0x800
+_EXR_MULTIPART_FLAG = 0x1000
+# Number of scanlines stored in one chunk by compression
+_EXR_LINES_PER_CHUNK = {
+    0: 1,  # NO_COMPRESSION
+    1: 1,  # RLE_COMPRESSION
+    2: 1,  # ZIPS_COMPRESSION
+    3: 16,  # ZIP_COMPRESSION
+    4: 32,  # PIZ_COMPRESSION
+    5: 16,  # PXR24_COMPRESSION
+    6: 32,  # B44_COMPRESSION
+    7: 32,  # B44A_COMPRESSION
+    8: 32,  # DWAA_COMPRESSION
+    9: 256,  # DWAB_COMPRESSION
+}
+# Attributes of header used to calculate chunk offset table size
+_EXR_HEADER_ATTRIBUTES = {
+    "chunkCount", "compression", "dataWindow", "tiles", "type"
+}
+# Max length of attribute name or type name
+_EXR_MAX_NAME_LENGTH = 256
+
+
+class ImageIntegrityError(Exception):
+    """Image file is not complete or is corrupted."""
+
+
+class _UnsupportedExrError(Exception):
+    """OpenEXR file can't be checked by parser."""
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ImageIntegrityError("File is truncated")
+    return data
+
+
+def _read_name(stream):
+    chars = []
+    while True:
+        char = _read_exact(stream, 1)
+        if char == b"\0":
+            return b"".join(chars).decode("utf-8", errors="replace")
+        chars.append(char)
+        if len(chars) > _EXR_MAX_NAME_LENGTH:
+            raise ImageIntegrityError("Invalid attribute name in header")
+
+
+def _read_exr_header(stream):
+    """Read attributes of one part header.
+
+    Returns:
+        Union[dict[str, bytes], None]: Values of attributes used for
+            checks or None if header is empty (end of headers of
+            multipart file).
+    """
+    attributes = {}
+    first = True
+    while True:
+        name = _read_name(stream)
+        if not name:
+            if first:
+                return None
+            return attributes
+        first = False
+        _read_name(stream)
+        size, = struct.unpack("<i", _read_exact(stream, 4))
+        if size < 0:
+            raise ImageIntegrityError(
+                "Invalid size of attribute '{}'".format(name)
+            )
+        if name in _EXR_HEADER_ATTRIBUTES:
+            attributes[name] = _read_exact(stream, size)
+        else:
+            stream.seek(size, os.SEEK_CUR)
+
+
+def _round_log2(value, round_up):
+    # Floor or ceil of log2 of positive integer
+    result = value.bit_length() - 1
+    if round_up and value != (1 << result):
+        result += 1
+    return result
+
+
+def _get_level_size(size, level, round_up):
+    if round_up:
+        size = (size + (1 << level) - 1) >> level
+    else:
+        size = size >> level
+    return max(size, 1)
+
+
+def _get_exr_tiles_count(tiles_value, width, height):
+    x_size, y_size, mode = struct.unpack("<IIB", tiles_value[:9])
+    if not x_size or not y_size:
+        raise ImageIntegrityError("Invalid tile size")
+    level_mode = mode & 0x0f
+    round_up = bool(mode >> 4)
+
+    def tiles_count(level_x, level_y):
+        level_width = _get_level_size(width, level_x, round_up)
+        level_height = _get_level_size(height, level_y, round_up)
+        return (
+            ((level_width + x_size - 1) // x_size)
+            * ((level_height + y_size - 1) // y_size)
+        )
+
+    # ONE_LEVEL
+    if level_mode == 0:
+        return tiles_count(0, 0)
+
+    # MIPMAP_LEVELS
+    if level_mode == 1:
+        levels = _round_log2(max(width, height), round_up) + 1
+        return sum(tiles_count(level, level) for level in range(levels))
+
+    # RIPMAP_LEVELS
+    if level_mode == 2:
+        x_levels = _round_log2(width, round_up) + 1
+        y_levels = _round_log2(height, round_up) + 1
+        return sum(
+            tiles_count(level_x, level_y)
+            for level_x in range(x_levels)
+            for level_y in range(y_levels)
+        )
+    raise _UnsupportedExrError("Unknown level mode {}".format(level_mode))
+
+
+def _get_exr_chunks_count(header, tiled):
+    chunk_count = header.get("chunkCount")
+    if chunk_count is not None:
+        return struct.unpack("<i", chunk_count[:4])[0]
+
+    data_window = header.get("dataWindow")
+    if data_window is None or len(data_window) < 16:
+        raise ImageIntegrityError("Header does not contain data window")
+    x_min, y_min, x_max, y_max = struct.unpack("<4i", data_window[:16])
+    width = x_max - x_min + 1
+    height = y_max - y_min + 1
+    if width <= 0 or height <= 0:
+        raise ImageIntegrityError("Invalid data window")
+
+    if tiled:
+        tiles = header.get("tiles")
+        if tiles is None or len(tiles) < 9:
+            raise ImageIntegrityError("Header does not contain tiles")
+        return _get_exr_tiles_count(tiles, width, height)
+
+    compression = header.get("compression")
+    if not compression:
+        raise ImageIntegrityError("Header does not contain compression")
+    lines_per_chunk = _EXR_LINES_PER_CHUNK.get(compression[0])
+    if lines_per_chunk is None:
+        raise _UnsupportedExrError(
+            "Unknown compression {}".format(compression[0])
+        )
+    return (height + lines_per_chunk - 1) // lines_per_chunk
+
+
+def _get_exr_part_type(header, version):
+    part_type = header.get("type")
+    if part_type is not None:
+        return part_type.rstrip(b"\0").decode("utf-8", errors="replace")
+    if version & _EXR_NON_IMAGE_FLAG:
+        return "deep"
+    if version & _EXR_TILED_FLAG:
+        return "tiledimage"
+    return "scanlineimage"
+
+
+def check_exr_file(filepath):
+    """Check that OpenEXR file is complete.
+
+    Header and chunk offset table are parsed and last chunk of file is
+    validated to end inside of the file.
+
+    Args:
+        filepath (str): Path to OpenEXR file.
+
+    Raises:
+        ImageIntegrityError: File is not complete or is corrupted.
+    """
+    file_size = os.path.getsize(filepath)
+    with open(filepath, "rb") as stream:
+        magic, version = struct.unpack("<ii", _read_exact(stream, 8))
+        if magic != EXR_MAGIC:
+            raise ImageIntegrityError("File is not OpenEXR file")
+
+        multipart = bool(version & _EXR_MULTIPART_FLAG)
+        headers = []
+        while True:
+            header = _read_exr_header(stream)
+            if header is None:
+                break
+            headers.append(header)
+            if not multipart:
+                break
+
+        if not headers:
+            raise ImageIntegrityError("File does not contain any part")
+
+        part_types = []
+        tables = []
+        for header in headers:
+            part_type = _get_exr_part_type(header, version)
+            chunks_count = _get_exr_chunks_count(
+                header, part_type in ("tiledimage", "deeptile")
+            )
+            if chunks_count < 0:
+                raise ImageIntegrityError("Invalid chunk count")
+            part_types.append(part_type)
+            tables.append(chunks_count)
+
+        offsets = []
+        for part_idx, chunks_count in enumerate(tables):
+            data = _read_exact(stream, chunks_count * 8)
+            offsets.extend(
+                (offset, part_idx)
+                for offset in struct.unpack(
+                    "<{}Q".format(chunks_count), data
+                )
+            )
+
+        tables_end = stream.tell()
+        invalid_count = sum(
+            1
+            for offset, _ in offsets
+            if offset < tables_end or offset >= file_size
+        )
+        if invalid_count:
+            raise ImageIntegrityError(
+                "{} of {} chunks are missing or outside of file".format(
+                    invalid_count, len(offsets)
+                )
+            )
+
+        if not offsets:
+            return
+
+        # Last chunk in file must end inside of file
+        offset, part_idx = max(offsets)
+        part_type = part_types[part_idx]
+        if part_type.startswith("deep"):
+            return
+        stream.seek(offset)
+        if multipart:
+            _read_exact(stream, 4)
+        if part_type == "tiledimage":
+            _read_exact(stream, 16)
+        else:
+            _read_exact(stream, 4)
+        data_size, = struct.unpack("<i", _read_exact(stream, 4))
+        if data_size < 0 or stream.tell() + data_size > file_size:
+            raise ImageIntegrityError("File is truncated")
+
+
+def _check_image_with_oiio(filepath):
+    try:
+        get_oiio_info_for_input(filepath)
+    except Exception as exc:
+        raise ImageIntegrityError(
+            "Failed to read image header: {}".format(exc)
+        )
+
+
+def _check_image_file(filepath):
+    """Check image file without oiiotool.
+
+    Returns:
+        bool: File was fully checked, oiiotool check is not needed.
+    """
+    if not os.path.isfile(filepath):
+        raise ImageIntegrityError("File is missing")
+
+    if os.path.getsize(filepath) == 0:
+        raise ImageIntegrityError("File is empty")
+
+    if os.path.splitext(filepath)[-1].lower() == ".exr":
+        try:
+            check_exr_file(filepath)
+            return True
+        except _UnsupportedExrError:
+            pass
+    return False
+
+
+def check_image_file(filepath, use_oiio=True):
+    """Check that image file exists and is complete.
+
+    Args:
+        filepath (str): Path to image file.
+        use_oiio (bool): Check files which are not OpenEXR with oiiotool.
+
+    Raises:
+        ImageIntegrityError: File is missing, not complete or is corrupted.
+    """
+    if not _check_image_file(filepath) and use_oiio:
+        _check_image_with_oiio(filepath)
+
+
+def check_image_files(filepaths, max_workers=None):
+    """Check image files in threads.
+
+    Args:
+        filepaths (Iterable[str]): Paths to image files.
+        max_workers (Optional[int]): Maximum number of threads.
+
+    Returns:
+        dict[str, str]: Error message by path of invalid file.
+    """
+    filepaths = list(dict.fromkeys(filepaths))
+    if not filepaths:
+        return {}
+
+    # Validation of oiiotool launches subprocess, do it only if is needed
+    oiio_supported = []
+    lock = threading.Lock()
+
+    def _is_oiio_supported():
+        with lock:
+            if not oiio_supported:
+                oiio_supported.append(is_oiio_supported())
+            return oiio_supported[0]
+
+    def _check(filepath):
+        try:
+            if not _check_image_file(filepath) and _is_oiio_supported():
+                _check_image_with_oiio(filepath)
+        except ImageIntegrityError as exc:
+            return str(exc)
+        except OSError as exc:
+            return "Failed to read file: {}".format(exc)
+        return None
+
+    span = get_profiling_span()
+
+    def _check_in_thread(filepath):
+        with use_profiling_span(span):
+            return _check(filepath)
+
+    if max_workers is None:
+        max_workers = min(8, len(filepaths))
+    with ThreadPoolExecutor(max_workers) as executor:
+        messages = executor.map(_check_in_thread, filepaths)
+        return {
+            filepath: message
+            for filepath, message in zip(filepaths, messages)
+            if message is not None
+        }
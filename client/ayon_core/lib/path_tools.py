@@ -90,12 +90,12 @@ def collect_frames(files):
         for collection in collections:
             src_head = collection.head
             src_tail = collection.tail
-
+            padding_format = collection.format("{padding}")
             for index in collection.indexes:
-                src_frame = collection.format("{padding}") % index
-                src_file_name = "{}{}{}".format(
-                    src_head, src_frame, src_tail)
-                sources_and_frames[src_file_name] = src_frame
+                src_frame = padding_format % index
+                sources_and_frames[src_head + src_frame + src_tail] = (
+                    src_frame
+                )
     else:
         sources_and_frames[remainder.pop()] = None
 
@@ -5,6 +5,8 @@ import logging
 import re
 import collections
 
+from .file_fingerprint import get_file_fingerprint
+
 log = logging.getLogger(__name__)
 
 CAPITALIZE_REGEX = re.compile(r"[a-zA-Z0-9]")
@@ -132,7 +134,7 @@ def prepare_template_data(fill_pairs):
     return output
 
 
-def source_hash(filepath, *args):
+def source_hash(filepath, *args, use_content=None):
     """Generate simple identifier for a source file.
     This is used to identify whether a source file has previously been
     processe into the pipeline, e.g. a texture.
@@ -141,13 +143,37 @@ def source_hash(filepath, *args):
     published before from the same location with the same modification date.
     We opt to do it this way as opposed to Avalanch C4 hash as this is much
     faster and predictable enough for all our production use cases.
+
+    Optionally the hash can be based on content fingerprint of the file,
+    then copies of the file at different location or with different
+    modification time have the same hash. Content hash is used if
+    'AYON_SOURCE_HASH_CONTENT' environment variable is set to "1".
     Args:
         filepath (str): The source file path.
+        use_content (Optional[bool]): Use content fingerprint of file.
+            Value of 'AYON_SOURCE_HASH_CONTENT' is used if not passed.
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    if use_content is None:
+        use_content = is_source_content_hash_enabled()
+
+    if use_content:
+        items = ["content", get_file_fingerprint(filepath)]
+    else:
+        items = [
+            os.path.basename(filepath),
+            str(os.path.getmtime(filepath)),
+            str(os.path.getsize(filepath)),
+        ]
     # We replace dots with comma because . cannot be a key in a pymongo dict.
-    file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
-    return "|".join([file_name, time, size] + list(args)).replace(".", ",")
+    return "|".join(items + list(args)).replace(".", ",")
+
+
+def is_source_content_hash_enabled():
+    """Source hash is based on content of file.
+
+    Returns:
+        bool: 'AYON_SOURCE_HASH_CONTENT' environment variable is set to "1".
+    """
+    return os.getenv("AYON_SOURCE_HASH_CONTENT") == "1"
@@ -1,7 +1,39 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and lightweight profiler of publishing.
+
+'PublishProfiler' records spans with wall and CPU time of current thread.
+Code doing expensive operations (subprocesses, server requests, file
+copies) adds counters to span which is currently open in the same thread
+using 'add_profiling_counter'. Counters are added to nothing if there is
+not any open span, so instrumentation is cheap enough to be always enabled.
+
+Open spans are stored per thread, so spans of plugins processed at the same
+time in different threads don't mix. Thread pools doing work for a span
+have to pass it to worker threads using 'get_profiling_span' and
+'use_profiling_span'.
+
+Recorded spans can be exported to Chrome trace format (chrome://tracing,
+Perfetto) or to speedscope format (https://www.speedscope.app).
+"""
 import os
+import json
+import time
 import cProfile
+import threading
+import collections
+import contextlib
+
+COUNTER_SUBPROCESS_TIME = "subprocess_time"
+COUNTER_SUBPROCESS_CPU = "subprocess_cpu"
+COUNTER_SUBPROCESS_CALLS = "subprocess_calls"
+COUNTER_SERVER_CALLS = "server_calls"
+COUNTER_SERVER_TIME = "server_time"
+COUNTER_BYTES_COPIED = "bytes_copied"
+
+# Stack of open spans of each thread
+_local = threading.local()
+# Counters of span can be changed from multiple threads
+_lock = threading.Lock()
 
 
 def do_profile(fn, to_file=None):
@@ -27,3 +59,283 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+    return profiled
+
+
+def is_profiling_active():
+    """Any profiling span is open in current thread.
+
+    Can be used to skip preparation of expensive counter values.
+
+    Returns:
+        bool: Counters would be recorded.
+    """
+    return bool(getattr(_local, "spans", None))
+
+
+def add_profiling_counter(name, value=1):
+    """Add value to counter of profiling span open in current thread.
+
+    Args:
+        name (str): Counter name.
+        value (Union[int, float]): Value added to counter.
+    """
+    span = get_profiling_span()
+    if span is None:
+        return
+
+    with _lock:
+        span.counters[name] += value
+
+
+def get_profiling_span():
+    """Innermost profiling span open in current thread.
+
+    Returns:
+        Union[ProfilingSpan, None]: Open span or None.
+    """
+    spans = getattr(_local, "spans", None)
+    if spans:
+        return spans[-1]
+    return None
+
+
+def _get_thread_spans():
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        spans = []
+        _local.spans = spans
+    return spans
+
+
+@contextlib.contextmanager
+def use_profiling_span(span):
+    """Add counters of current thread to span open in other thread.
+
+    Used by thread pools, so counters of work done for a plugin are
+    added to span of the plugin.
+
+    Example:
+        >>> span = get_profiling_span()
+        >>> def _process(item):
+        ...     with use_profiling_span(span):
+        ...         run_subprocess(["process", item])
+        >>> with ThreadPoolExecutor() as executor:
+        ...     executor.map(_process, items)
+
+    Args:
+        span (Union[ProfilingSpan, None]): Span from
+            'get_profiling_span'. Nothing happens if is None.
+    """
+    if span is None:
+        yield
+        return
+
+    spans = _get_thread_spans()
+    spans.append(span)
+    try:
+        yield
+    finally:
+        spans.remove(span)
+
+
+class ProfilingSpan:
+    """Single measured block of code.
+
+    Args:
+        name (str): Span name, e.g. plugin name.
+        category (str): Span category.
+        args (Optional[dict[str, Any]]): Additional information.
+    """
+
+    def __init__(self, name, category, args=None):
+        self.name = name
+        self.category = category
+        self.args = args or {}
+        self.thread_id = threading.get_ident()
+        self.start = None
+        self.duration = None
+        self.cpu_time = None
+        self.counters = collections.defaultdict(float)
+
+    def to_data(self):
+        """Measured values of span.
+
+        Returns:
+            dict[str, Any]: Wall and CPU time in milliseconds and counters.
+        """
+        output = {
+            "wall_time": self.duration,
+            "cpu_time": self.cpu_time,
+        }
+        output.update(self.counters)
+        return output
+
+
+class PublishProfiler:
+    """Collect profiling spans of publishing."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._spans = []
+
+    def reset(self):
+        self._start = time.perf_counter()
+        self._spans = []
+
+    @contextlib.contextmanager
+    def span(self, name, category="plugin", args=None):
+        """Measure code in context.
+
+        Args:
+            name (str): Span name, e.g. plugin name.
+            category (str): Span category.
+            args (Optional[dict[str, Any]]): Additional information.
+
+        Yields:
+            ProfilingSpan: Span which is filled on exit.
+        """
+        span = ProfilingSpan(name, category, args)
+        spans = _get_thread_spans()
+        spans.append(span)
+
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield span
+        finally:
+            span.cpu_time = (time.thread_time() - cpu_start) * 1000
+            span.duration = (time.perf_counter() - start) * 1000
+            span.start = (start - self._start) * 1000
+            spans.remove(span)
+            with _lock:
+                # Propagate counters to parent span
+                if spans:
+                    parent_counters = spans[-1].counters
+                    for key, value in span.counters.items():
+                        parent_counters[key] += value
+                self._spans.append(span)
+
+    def get_spans(self):
+        return list(self._spans)
+
+    def get_summary(self):
+        """Sum of measured values by span name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Summary by span name sorted by
+                wall time.
+        """
+        summary = {}
+        for span in self._spans:
+            item = summary.get(span.name)
+            if item is None:
+                item = collections.defaultdict(float)
+                summary[span.name] = item
+            item["count"] += 1
+            for key, value in span.to_data().items():
+                item[key] += value
+
+        return dict(sorted(
+            ((name, dict(item)) for name, item in summary.items()),
+            key=lambda pair: pair[1]["wall_time"],
+            reverse=True
+        ))
+
+    def to_chrome_trace(self):
+        """Spans in Chrome trace event format.
+
+        Returns:
+            dict[str, Any]: Trace data.
+        """
+        pid = os.getpid()
+        events = []
+        for span in self._spans:
+            args = dict(span.args)
+            args.update(span.to_data())
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start * 1000,
+                "dur": span.duration * 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name="Publish"):
+        """Spans in speedscope evented format, one profile per thread.
+
+        Args:
+            name (str): Name of profile.
+
+        Returns:
+            dict[str, Any]: Speedscope data.
+        """
+        frames = []
+        frame_idx_by_name = {}
+        spans_by_thread = collections.defaultdict(list)
+        for span in self._spans:
+            if span.name not in frame_idx_by_name:
+                frame_idx_by_name[span.name] = len(frames)
+                frames.append({"name": span.name})
+            spans_by_thread[span.thread_id].append(span)
+
+        profiles = []
+        for thread_id, spans in spans_by_thread.items():
+            # Parents before children that start at the same time
+            spans.sort(key=lambda span: (span.start, -span.duration))
+            events = []
+            stack = []
+            for span in spans:
+                while stack and stack[-1][0] <= span.start:
+                    end, frame_idx = stack.pop()
+                    events.append({"type": "C", "frame": frame_idx, "at": end})
+                frame_idx = frame_idx_by_name[span.name]
+                events.append({
+                    "type": "O", "frame": frame_idx, "at": span.start
+                })
+                stack.append((span.start + span.duration, frame_idx))
+
+            while stack:
+                end, frame_idx = stack.pop()
+                events.append({"type": "C", "frame": frame_idx, "at": end})
+
+            profiles.append({
+                "type": "evented",
+                "name": "{} (thread {})".format(name, thread_id),
+                "unit": "milliseconds",
+                "startValue": events[0]["at"],
+                "endValue": events[-1]["at"],
+                "events": events,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def export(self, filepath):
+        """Export spans to file.
+
+        Speedscope format is used if filename ends with '.speedscope.json',
+        Chrome trace format is used otherwise.
+
+        Args:
+            filepath (str): Output path.
+        """
+        if filepath.endswith(".speedscope.json"):
+            data = self.to_speedscope()
+        else:
+            data = self.to_chrome_trace()
+
+        dirpath = os.path.dirname(filepath)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(filepath, "w") as stream:
+            json.dump(data, stream)
@@ -20,6 +20,9 @@ from .vendor_bin_utils import (
 MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
+# Timeout in seconds of oiiotool and ffprobe calls reading file information
+#   - reading of a file on unreachable storage can hang forever
+INFO_QUERY_TIMEOUT = 5 * 60
 
 # OIIO known xml tags
 STRING_TAGS = {
@@ -93,7 +96,9 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    output = run_subprocess(
+        args, logger=logger, timeout=INFO_QUERY_TIMEOUT
+    )
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -653,7 +658,7 @@ def convert_for_ffmpeg(
     ])
 
     logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    run_subprocess(oiio_cmd, logger=logger, keep_output=False)
 
 
 def convert_input_paths_for_ffmpeg(
@@ -764,7 +769,7 @@ def convert_input_paths_for_ffmpeg(
         ])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+        run_subprocess(oiio_cmd, logger=logger, keep_output=False)
 
 
 # FFMPEG functions
@@ -810,7 +815,18 @@ def get_ffprobe_data(path_to_file, logger=None):
 
     popen = subprocess.Popen(args, **kwargs)
 
-    popen_stdout, popen_stderr = popen.communicate()
+    try:
+        popen_stdout, popen_stderr = popen.communicate(
+            timeout=INFO_QUERY_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        popen.kill()
+        popen.communicate()
+        raise RuntimeError(
+            "FFprobe timed out after {}s: \"{}\"".format(
+                INFO_QUERY_TIMEOUT, path_to_file
+            )
+        )
     if popen_stdout:
         logger.debug("FFprobe stdout:\n{}".format(
             popen_stdout.decode("utf-8")
@@ -1134,7 +1150,64 @@ def convert_colorspace(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    input_info = get_oiio_info_for_input(input_path, logger=logger)
+    oiio_cmd = get_convert_colorspace_args(
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace,
+        view,
+        display,
+        additional_command_args,
+        logger=logger,
+    )
+
+    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+    run_subprocess(oiio_cmd, logger=logger, keep_output=False)
+
+
+def get_convert_colorspace_args(
+    input_path,
+    output_path,
+    config_path,
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None,
+    additional_command_args=None,
+    input_info=None,
+    logger=None,
+    threads=None,
+):
+    """Prepare oiiotool arguments to convert colorspace of input.
+
+    Arguments of 'convert_colorspace' without running the conversion, so
+    the command can be scheduled with other commands.
+
+    Args:
+        input_path (str): Path that should be converted.
+        output_path (str): Path to output filename.
+        config_path (str): path to OCIO config file
+        source_colorspace (str): ocio valid color space of source files
+        target_colorspace (str): ocio valid target color space
+        view (str): name for viewer space (ocio valid)
+        display (str): name for display-referred reference space (ocio valid)
+        additional_command_args (list): arguments for oiiotool
+        input_info (Optional[dict[str, Any]]): Result of
+            'get_oiio_info_for_input' for the input. Is queried if not
+            passed.
+        logger (logging.Logger): Logger used for logging.
+        threads (Optional[int]): Number of threads used by oiiotool.
+            oiiotool default is used if not passed.
+
+    Returns:
+        list[str]: oiiotool arguments.
+
+    Raises:
+        ValueError: if misconfigured
+    """
+    if input_info is None:
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
 
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
@@ -1146,6 +1219,8 @@ def convert_colorspace(
         "--nosoftwareattrib",
         "--colorconfig", config_path
     )
+    if threads:
+        oiio_cmd.extend(["--threads", str(threads)])
 
     oiio_cmd.extend([
         input_arg, input_path,
@@ -1175,9 +1250,7 @@ def convert_colorspace(
         oiio_cmd.extend(["--ociodisplay", display, view])
 
     oiio_cmd.extend(["-o", output_path])
-
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    return oiio_cmd
 
 
 def split_cmd_args(in_args):
@@ -0,0 +1,253 @@
+"""Parallel execution of image conversion commands.
+
+Conversion tools (e.g. oiiotool) are processing frames of a sequence one
+by one in single process. Scheduler splits sequences to batches of
+contiguous frames and runs the commands as parallel subprocesses, each
+started and waited for by a thread of a thread pool.
+
+Each oiiotool process is multithreaded too, so number of workers is
+limited and CPUs are split between workers with 'threads_per_job'.
+"""
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .execute import run_subprocess
+from .profiling import get_profiling_span, use_profiling_span
+
+# Default maximum number of conversions running at the same time
+DEFAULT_MAX_WORKERS = 4
+
+
+class TranscodingJob:
+    """Single command scheduled by 'TranscodingScheduler'.
+
+    Args:
+        args (list[str]): Command arguments.
+        label (Optional[str]): Label used in logs.
+    """
+
+    def __init__(self, args, label=None):
+        if label is None:
+            label = " ".join(args)
+        self.args = args
+        self.label = label
+        self.duration = None
+        self.error = None
+
+    @property
+    def finished(self):
+        return self.duration is not None
+
+    def to_data(self):
+        return {
+            "label": self.label,
+            "duration": self.duration,
+            "failed": self.error is not None,
+        }
+
+
+class TranscodingScheduler:
+    """Run conversion commands in parallel subprocesses.
+
+    Jobs of all representations of an instance should be added to single
+    scheduler so all CPU cores can be used.
+
+    Example:
+        >>> scheduler = TranscodingScheduler(logger=log)
+        >>> for start, end in get_frame_batches(collection.indexes):
+        ...     scheduler.add_job(oiio_args_for_batch(start, end))
+        >>> scheduler.run()
+
+    Args:
+        max_workers (Optional[int]): Maximum number of processes running
+            at the same time. Number of CPUs limited to
+            'DEFAULT_MAX_WORKERS' is used by default.
+        logger (Optional[logging.Logger]): Logger used for logging.
+        threads_per_job (Optional[int]): Number of threads each process
+            should use. CPUs are split between workers by default.
+        job_timeout (Optional[float]): Maximum duration of single job in
+            seconds. Jobs are not limited by default.
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        logger=None,
+        threads_per_job=None,
+        job_timeout=None,
+    ):
+        cpu_count = os.cpu_count() or 1
+        if not max_workers:
+            max_workers = min(cpu_count, DEFAULT_MAX_WORKERS)
+        max_workers = max(1, max_workers)
+        if not threads_per_job:
+            threads_per_job = cpu_count // max_workers
+        if logger is None:
+            logger = logging.getLogger(self.__class__.__name__)
+        self._max_workers = max_workers
+        self._threads_per_job = max(1, threads_per_job)
+        self._logger = logger
+        self._job_timeout = job_timeout
+        self._jobs = []
+
+    @property
+    def jobs(self):
+        return list(self._jobs)
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @property
+    def threads_per_job(self):
+        """Number of threads which should be used by each process.
+
+        Value should be passed to commands of jobs, e.g. as '--threads'
+        argument of oiiotool.
+
+        Returns:
+            int: Number of threads.
+        """
+        return self._threads_per_job
+
+    def add_job(self, args, label=None):
+        """Add command to run.
+
+        Args:
+            args (list[str]): Command arguments.
+            label (Optional[str]): Label used in logs.
+
+        Returns:
+            TranscodingJob: Added job.
+        """
+        job = TranscodingJob(args, label)
+        self._jobs.append(job)
+        return job
+
+    def run(self):
+        """Run all added jobs and wait until they are finished.
+
+        Pending jobs are cancelled and running processes are stopped when
+        any job fails.
+
+        Returns:
+            list[TranscodingJob]: Finished jobs.
+
+        Raises:
+            RuntimeError: When any of jobs failed. Error of first failed
+                job is re-raised.
+        """
+        jobs = [job for job in self._jobs if not job.finished]
+        if not jobs:
+            return []
+
+        start = time.time()
+        failed_job = None
+        workers = min(self._max_workers, len(jobs))
+        # Add subprocess counters to span of caller
+        span = get_profiling_span()
+        cancel_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._run_job, job, cancel_event, span): job
+                for job in jobs
+            }
+            for future in as_completed(futures):
+                job = futures[future]
+                if job.error is None or failed_job is not None:
+                    continue
+                failed_job = job
+                cancel_event.set()
+                for _future in futures:
+                    _future.cancel()
+
+        duration = time.time() - start
+        finished_jobs = [job for job in jobs if job.finished]
+        self._logger.debug(
+            "Finished {}/{} conversion jobs in {:.2f}s using {} workers"
+            " (sum of job times {:.2f}s)".format(
+                len(finished_jobs),
+                len(jobs),
+                duration,
+                workers,
+                sum(job.duration for job in finished_jobs),
+            )
+        )
+        if failed_job is not None:
+            raise failed_job.error
+        return finished_jobs
+
+    def _run_job(self, job, cancel_event, span=None):
+        start = time.time()
+        self._logger.debug("Running: {}".format(job.label))
+        try:
+            with use_profiling_span(span):
+                run_subprocess(
+                    job.args,
+                    logger=self._logger,
+                    timeout=self._job_timeout,
+                    cancel_event=cancel_event,
+                    keep_output=False,
+                )
+        except Exception as exc:
+            job.error = exc
+        job.duration = time.time() - start
+
+
+def get_frame_batches(frames, batch_size=None, max_batches=None):
+    """Split frames to batches of contiguous frames.
+
+    Args:
+        frames (Iterable[int]): Frame numbers.
+        batch_size (Optional[int]): Maximum number of frames in batch.
+        max_batches (Optional[int]): Batch size is calculated to create
+            approximately this number of batches if 'batch_size' is not
+            passed. Number of CPUs is used by default.
+
+    Returns:
+        list[tuple[int, int]]: First and last frame of each batch.
+    """
+    frames = sorted(set(frames))
+    if not frames:
+        return []
+
+    if batch_size is None:
+        if max_batches is None:
+            max_batches = os.cpu_count() or 1
+        batch_size = -(-len(frames) // max(1, max_batches))
+    batch_size = max(1, batch_size)
+
+    batches = []
+    batch_start = prev_frame = frames[0]
+    for frame in frames[1:]:
+        if (
+            frame != prev_frame + 1
+            or (frame - batch_start) >= batch_size
+        ):
+            batches.append((batch_start, prev_frame))
+            batch_start = frame
+        prev_frame = frame
+    batches.append((batch_start, prev_frame))
+    return batches
+
+
+def get_oiio_sequence_path(head, tail, padding, start, end):
+    """Path of frame range in format understood by oiiotool.
+
+    Args:
+        head (str): Part of path before frame number.
+        tail (str): Part of path after frame number.
+        padding (int): Frame padding.
+        start (int): First frame.
+        end (int): Last frame.
+
+    Returns:
+        str: Path e.g. 'render.1001-1010#.exr'.
+    """
+    if start == end:
+        return "{}{:0>{}}{}".format(head, start, padding, tail)
+    padding_str = "#" if padding == 4 else "@" * max(1, padding)
+    return "{}{}-{}{}{}".format(head, start, end, padding_str, tail)
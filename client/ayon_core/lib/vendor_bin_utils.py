@@ -1,6 +1,8 @@
 import os
+import stat
 import logging
 import platform
+import threading
 import subprocess
 
 log = logging.getLogger("Vendor utils")
@@ -51,6 +53,110 @@ def is_file_executable(filepath):
     return False
 
 
+class _PathExecutablesIndex:
+    """Index of files in directories from 'PATH' by executable name.
+
+    Each directory is listed only once and listed again only when its
+    modification time changes. Results of lookups are cached and are
+    revalidated by modification times of directories which were
+    searched, so a lookup does one 'stat' per directory instead of
+    listing all directories and checking all their files.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Directory path -> (mtime, filenames by name)
+        self._dir_indexes = {}
+        # Lookup key -> (filepath, [(directory path, mtime), ...])
+        self._results = {}
+
+    @staticmethod
+    def _get_dir_mtime(dirpath):
+        try:
+            dir_stat = os.stat(dirpath)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return None
+        return dir_stat.st_mtime_ns
+
+    def _get_dir_index(self, dirpath, mtime):
+        with self._lock:
+            item = self._dir_indexes.get(dirpath)
+        if item is not None and item[0] == mtime:
+            return item[1]
+
+        filenames_by_name = {}
+        try:
+            filenames = os.listdir(dirpath)
+        except OSError:
+            filenames = []
+
+        for filename in filenames:
+            filenames_by_name.setdefault(filename, []).append(filename)
+            basename, _ = os.path.splitext(filename)
+            if basename != filename:
+                filenames_by_name.setdefault(basename, []).append(filename)
+
+        with self._lock:
+            self._dir_indexes[dirpath] = (mtime, filenames_by_name)
+        return filenames_by_name
+
+    def _is_result_valid(self, filepath, dir_mtimes):
+        for dirpath, mtime in dir_mtimes:
+            if self._get_dir_mtime(dirpath) != mtime:
+                return False
+        return filepath is None or is_file_executable(filepath)
+
+    def find(self, path_str, executable, exts):
+        """Find executable in directories of 'PATH' string.
+
+        Args:
+            path_str (str): Directories separated by 'os.pathsep'.
+            executable (str): Executable name.
+            exts (set[str]): Allowed lowercase extensions of executable.
+
+        Returns:
+            Union[str, None]: Full path to executable.
+        """
+        key = (path_str, os.getcwd(), executable, tuple(sorted(exts)))
+        with self._lock:
+            cached = self._results.get(key)
+        if cached is not None and self._is_result_valid(*cached):
+            return cached[0]
+
+        output = None
+        dir_mtimes = []
+        for path in path_str.split(os.pathsep):
+            if not path:
+                continue
+            dirpath = os.path.abspath(path)
+            mtime = self._get_dir_mtime(dirpath)
+            dir_mtimes.append((dirpath, mtime))
+            if mtime is None:
+                continue
+
+            filenames_by_name = self._get_dir_index(dirpath, mtime)
+            for filename in filenames_by_name.get(executable, []):
+                _, ext = os.path.splitext(filename)
+                if filename != executable and ext.lower() not in exts:
+                    continue
+                filepath = os.path.join(dirpath, filename)
+                if is_file_executable(filepath):
+                    output = filepath
+                    break
+
+            if output is not None:
+                break
+
+        with self._lock:
+            self._results[key] = (output, dir_mtimes)
+        return output
+
+
+_path_executables_index = _PathExecutablesIndex()
+
+
 def find_executable(executable):
     """Find full path to executable.
 
@@ -117,25 +223,7 @@ def find_executable(executable):
     if not path_str:
         return None
 
-    paths = path_str.split(os.pathsep)
-    for path in paths:
-        if not os.path.isdir(path):
-            continue
-        for filename in os.listdir(path):
-            filepath = os.path.abspath(os.path.join(path, filename))
-            # Filename matches executable exactly
-            if filename == executable and is_file_executable(filepath):
-                return filepath
-
-            basename, ext = os.path.splitext(filename)
-            if (
-                basename == executable
-                and ext.lower() in exts
-                and is_file_executable(filepath)
-            ):
-                return filepath
-
-    return None
+    return _path_executables_index.find(path_str, executable, exts)
 
 
 def find_tool_in_custom_paths(paths, tool, validation_func=None):
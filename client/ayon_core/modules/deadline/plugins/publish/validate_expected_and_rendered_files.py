@@ -3,7 +3,12 @@ import requests
 
 import pyblish.api
 
-from ayon_core.lib import collect_frames
+from ayon_core.lib import (
+    collect_frames,
+    FrameRanges,
+    format_frame_names,
+    get_directory_scan,
+)
 from openpype_modules.deadline.abstract_submit_deadline import requests_get
 
 
@@ -151,19 +156,11 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         if not frame_placeholder:
             return {file_name_template}
 
-        real_expected_rendered = set()
-        src_padding_exp = "%0{}d".format(len(frame_placeholder))
-        for frames in frame_list:
-            if '-' not in frames:  # single frame
-                frames = "{}-{}".format(frames, frames)
-
-            start, end = frames.split('-')
-            for frame in range(int(start), int(end) + 1):
-                ren_name = file_name_template.replace(
-                    frame_placeholder, src_padding_exp % frame)
-                real_expected_rendered.add(ren_name)
-
-        return real_expected_rendered
+        frames = FrameRanges.from_string(",".join(frame_list))
+        head, _, tail = file_name_template.partition(frame_placeholder)
+        return set(
+            format_frame_names(head, tail, len(frame_placeholder), frames)
+        )
 
     def _get_file_name_template_and_placeholder(self, files):
         """Returns file name with frame replaced with # and this placeholder"""
@@ -227,10 +224,7 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
 
     def _get_existing_files(self, staging_dir):
         """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
+        return get_directory_scan(staging_dir).file_names
 
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
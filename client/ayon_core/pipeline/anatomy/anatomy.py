@@ -164,10 +164,20 @@ class BaseAnatomy(object):
         """Wrapper for AnatomyRoots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates_from_paths(self, *args, **kwargs):
+        """Wrapper for AnatomyRoots `find_root_templates_from_paths`."""
+        return self.roots_obj.find_root_templates_from_paths(
+            *args, **kwargs
+        )
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for AnatomyRoots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
 
+    def paths_remapper(self, *args, **kwargs):
+        """Wrapper for AnatomyRoots `paths_remapper`."""
+        return self.roots_obj.paths_remapper(*args, **kwargs)
+
     def all_root_paths(self):
         """Wrapper for AnatomyRoots `all_root_paths`."""
         return self.roots_obj.all_root_paths()
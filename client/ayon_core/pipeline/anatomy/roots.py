@@ -223,6 +223,180 @@ class RootItem(FormatObject):
         return (result, output)
 
 
+class RootPathsTrie:
+    """Prefix trie of cleaned root paths of all platforms.
+
+    Trie is used to find roots of a path with single walk through the path
+    instead of comparing the path with each root path of each platform.
+    Matching follows 'RootItem.find_root_template_from_path', windows root
+    paths are compared case insensitive and first root and platform in
+    order of roots data is used if multiple roots match.
+
+    Args:
+        roots (dict[str, RootItem]): Root items by name.
+    """
+
+    def __init__(self, roots):
+        self._root_items = list(roots.values())
+        # Case sensitive trie of all root paths and case insensitive trie
+        #   of windows root paths
+        trie = {}
+        lower_trie = {}
+        for root_idx, root_item in enumerate(self._root_items):
+            for platform_idx, (platform_name, root_path) in enumerate(
+                root_item.cleaned_data.items()
+            ):
+                if not root_path:
+                    continue
+                entry = (root_idx, platform_idx, platform_name)
+                self._add(trie, root_path, entry)
+                if platform_name == "windows":
+                    self._add(lower_trie, root_path.lower(), entry)
+
+        self._trie = self._compress(trie)
+        self._lower_trie = None
+        if lower_trie:
+            self._lower_trie = self._compress(lower_trie)
+
+    @staticmethod
+    def _add(trie, root_path, entry):
+        node = trie
+        for char in root_path:
+            node = node.setdefault(char, {})
+        # 'None' key holds entries of root paths ending in the node
+        node.setdefault(None, []).append(entry + (len(root_path), ))
+
+    @classmethod
+    def _compress(cls, node):
+        """Merge chains of nodes without entries to single edges.
+
+        Returns:
+            tuple[list, dict[str, tuple[str, tuple]]]: Entries of node and
+                children by first character of their edge label.
+        """
+        children = {}
+        for char, child in node.items():
+            if char is None:
+                continue
+            label = char
+            while None not in child and len(child) == 1:
+                next_char, child = next(iter(child.items()))
+                label += next_char
+            children[char] = (label, cls._compress(child))
+        return node.get(None, []), children
+
+    @staticmethod
+    def _walk(trie, path, entries):
+        """Add entries of root paths which are prefix of path."""
+        node_entries, children = trie
+        path_len = len(path)
+        pos = 0
+        while True:
+            if node_entries:
+                entries.extend(node_entries)
+            if pos >= path_len:
+                return
+            item = children.get(path[pos])
+            if item is None:
+                return
+            label, (node_entries, children) = item
+            if not path.startswith(label, pos):
+                return
+            pos += len(label)
+
+    def get_matches(self, cleaned_path):
+        """Root paths which are prefix of path.
+
+        Args:
+            cleaned_path (str): Path with forward slashes.
+
+        Returns:
+            tuple[list[tuple[int, int, str, int]], list[tuple[int, str]]]:
+                Template matches as root index, platform index, platform
+                name and length of root path, sorted by roots order. And
+                case sensitive matches as root index and platform name.
+        """
+        entries = []
+        self._walk(self._trie, cleaned_path, entries)
+        case_matches = [(entry[0], entry[2]) for entry in entries]
+        matches = [entry for entry in entries if entry[2] != "windows"]
+        if self._lower_trie is not None:
+            self._walk(self._lower_trie, cleaned_path.lower(), matches)
+        matches.sort()
+        return matches, case_matches
+
+    def find_root_template_from_path(self, path):
+        """Replace root value in path with formattable key.
+
+        Args:
+            path (str): Path where root value should be found.
+
+        Returns:
+            tuple[bool, str]: Success and path with replaced root.
+        """
+        mod_path = str(path).replace("\\", "/")
+        entries = []
+        self._walk(self._trie, mod_path, entries)
+        matches = [entry for entry in entries if entry[2] != "windows"]
+        if self._lower_trie is not None:
+            self._walk(self._lower_trie, mod_path.lower(), matches)
+        if not matches:
+            return False, str(path)
+        root_idx, _, _, length = min(matches)
+        root_item = self._root_items[root_idx]
+        return True, "{" + root_item.full_key + "}" + mod_path[length:]
+
+    def path_remapper(self, path, dst_platform=None):
+        """Remap path to destination or current platform.
+
+        Output matches 'AnatomyRoots.path_remapper' for path without
+        source platform.
+
+        Args:
+            path (str): Source path which need to be remapped.
+            dst_platform (Optional[str]): Destination platform.
+
+        Returns:
+            Union[str, None]: Remapped path or None if root was not found.
+        """
+        cleaned_path = RootItem._clean_path(path)
+        matches, case_matches = self.get_matches(cleaned_path)
+        if not matches and not dst_platform:
+            return None
+
+        match_by_root_idx = {}
+        for match in matches:
+            match_by_root_idx.setdefault(match[0], match)
+        case_matches = set(case_matches)
+        for root_idx, root_item in enumerate(self._root_items):
+            if dst_platform:
+                dst_root_clean = root_item.cleaned_data.get(dst_platform)
+                if not dst_root_clean:
+                    root_item.log.warning(
+                        "Root \"{}\" miss platform \"{}\" definition.".format(
+                            root_item.full_key, dst_platform
+                        )
+                    )
+                    continue
+
+                if (root_idx, dst_platform) in case_matches:
+                    return cleaned_path
+
+            match = match_by_root_idx.get(root_idx)
+            if match is None:
+                continue
+
+            template = (
+                "{" + root_item.full_key + "}" + cleaned_path[match[3]:]
+            )
+            if dst_platform:
+                fill_data = {root_item.name: dst_root_clean}
+            else:
+                fill_data = {root_item.name: root_item.value}
+            return template.format(**{"root": fill_data})
+        return None
+
+
 class AnatomyRoots:
     """Object which should be used for formatting "root" key in templates.
 
@@ -237,6 +411,7 @@ class AnatomyRoots:
         self._anatomy = anatomy
         self._loaded_project = None
         self._roots = None
+        self._roots_trie = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -263,6 +438,21 @@ class AnatomyRoots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._roots_trie = None
+
+    def get_roots_trie(self):
+        """Prefix trie of current roots.
+
+        Returns:
+            RootPathsTrie: Trie of root paths.
+        """
+        roots = self.roots
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if self._roots_trie is None or self._roots_trie[0] is not roots:
+            self._roots_trie = (roots, RootPathsTrie(roots))
+        return self._roots_trie[1]
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -286,6 +476,7 @@ class AnatomyRoots:
                 or "{root[<name>]}".
 
         """
+        use_trie = roots is None and not src_platform
         if roots is None:
             roots = self.roots
 
@@ -298,6 +489,9 @@ class AnatomyRoots:
             if not dst_platform:
                 return path
 
+        if use_trie:
+            return self.get_roots_trie().path_remapper(path, dst_platform)
+
         if isinstance(roots, RootItem):
             return roots.path_remapper(path, dst_platform, src_platform)
 
@@ -328,10 +522,14 @@ class AnatomyRoots:
             self.log.debug(
                 "Looking for matching root in path \"{}\".".format(path)
             )
-            roots = self.roots
-
-        if roots is None:
-            raise ValueError("Roots are not set. Can't find path.")
+            success, result = (
+                self.get_roots_trie().find_root_template_from_path(path)
+            )
+            if not success:
+                self.log.warning(
+                    "No matching root was found in current setting."
+                )
+            return success, result
 
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
@@ -347,6 +545,48 @@ class AnatomyRoots:
         self.log.warning("No matching root was found in current setting.")
         return (False, path)
 
+    def find_root_templates_from_paths(self, paths):
+        """Find root values in paths and replace them with formatting key.
+
+        Bulk variant of 'find_root_template_from_path' using current roots.
+
+        Args:
+            paths (Iterable[str]): Source paths where root will be searched.
+
+        Returns:
+            list[tuple[bool, str]]: Success and path with or without
+                replaced root for each path.
+        """
+        trie = self.get_roots_trie()
+        output = [trie.find_root_template_from_path(path) for path in paths]
+        missing = sum(1 for success, _ in output if not success)
+        if missing:
+            self.log.warning(
+                "No matching root was found for {} of {} paths.".format(
+                    missing, len(output)
+                )
+            )
+        return output
+
+    def paths_remapper(self, paths, dst_platform=None):
+        """Remap paths for specific platform.
+
+        Bulk variant of 'path_remapper' using current roots.
+
+        Args:
+            paths (Iterable[str]): Source paths which need to be remapped.
+            dst_platform (Optional[str]): Specify destination platform
+                for which remapping should happen.
+
+        Returns:
+            list[Union[str, None]]: Remapped paths, None for paths which
+                do not contain known root.
+        """
+        return [
+            self.path_remapper(path, dst_platform)
+            for path in paths
+        ]
+
     def set_root_environments(self):
         """Set root environments for current project."""
         for key, value in self.root_environments().items():
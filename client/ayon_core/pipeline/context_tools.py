@@ -11,7 +11,12 @@ from pyblish.lib import MessageHandler
 
 from ayon_core import AYON_CORE_ROOT
 from ayon_core.host import HostBase
-from ayon_core.lib import is_in_tests, initialize_ayon_connection, emit_event
+from ayon_core.lib import (
+    is_in_tests,
+    initialize_ayon_connection,
+    emit_event,
+    get_data_access,
+)
 from ayon_core.addon import load_addons, AddonsManager
 from ayon_core.settings import get_project_settings
 
@@ -379,7 +384,7 @@ def get_current_project_entity(fields=None):
 
     """
     project_name = get_current_project_name()
-    return ayon_api.get_project(project_name, fields=fields)
+    return get_data_access().get_project(project_name, fields=fields)
 
 
 def get_current_folder_entity(fields=None):
@@ -404,7 +409,7 @@ def get_current_folder_entity(fields=None):
     # Skip if is not set even on context
     if not project_name or not folder_path:
         return None
-    return ayon_api.get_folder_by_path(
+    return get_data_access().get_folder_by_path(
         project_name, folder_path, fields=fields
     )
 
@@ -433,12 +438,12 @@ def get_current_task_entity(fields=None):
     # Skip if is not set even on context
     if not project_name or not folder_path or not task_name:
         return None
-    folder_entity = ayon_api.get_folder_by_path(
+    folder_entity = get_data_access().get_folder_by_path(
         project_name, folder_path, fields={"id"}
     )
     if not folder_entity:
         return None
-    return ayon_api.get_task_by_name(
+    return get_data_access().get_task_by_name(
         project_name, folder_entity["id"], task_name, fields=fields
     )
 
@@ -1,16 +1,28 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
-import shutil
+import json
+import time
 import glob
-import clique
+import hashlib
+import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import clique
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import (
+    collect_frames,
+    format_file_size,
+    link_or_clone_file,
+    link_or_clone_files,
+    get_directory_scan,
+)
+from ayon_core.lib.local_settings import get_ayon_appdirs
 
 
 def _copy_file(src_path, dst_path):
-    """Hardlink file if possible(to save space), copy if not.
+    """Hardlink file if possible(to save space), clone or copy if not.
 
     Because of using hardlinks should not be function used in other parts
     of pipeline.
@@ -18,13 +30,7 @@ def _copy_file(src_path, dst_path):
 
     if os.path.exists(dst_path):
         return
-    try:
-        create_hard_link(
-            src_path,
-            dst_path
-        )
-    except OSError:
-        shutil.copyfile(src_path, dst_path)
+    link_or_clone_file(src_path, dst_path)
 
 
 def get_format_dict(anatomy, location_path):
@@ -213,10 +219,10 @@ def deliver_sequence(
 
     def hash_path_exist(myPath):
         res = myPath.replace('#', '*')
-        glob_search_results = glob.glob(res)
-        if len(glob_search_results) > 0:
-            return True
-        return False
+        dirpath, file_pattern = os.path.split(res)
+        if glob.has_magic(dirpath):
+            return len(glob.glob(res)) > 0
+        return len(get_directory_scan(dirpath).glob(file_pattern)) > 0
 
     if not hash_path_exist(src_path):
         msg = "{} doesn't exist for {}".format(
@@ -299,7 +305,7 @@ def deliver_sequence(
 
     src_head = src_collection.head
     src_tail = src_collection.tail
-    uploaded = 0
+    transfers = []
     first_frame = min(src_collection.indexes)
     for index in src_collection.indexes:
         src_padding = src_collection.format("{padding}") % index
@@ -322,8 +328,366 @@ def deliver_sequence(
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
         log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        transfers.append((src, dst))
 
-        uploaded += 1
+    stats = link_or_clone_files(transfers, skip_existing=True)
+    log.debug(stats.format_summary())
+
+    return report_items, len(transfers)
+
+
+class DeliveryTransfer(
+    collections.namedtuple(
+        "DeliveryTransfer",
+        ["src_path", "dst_path", "size", "representation_id"]
+    )
+):
+    """Single planned file transfer of delivery.
 
-    return report_items, uploaded
+    Args:
+        src_path (str): Source file path.
+        dst_path (str): Destination file path.
+        size (int): Expected size of file in bytes, '0' if unknown.
+        representation_id (str): Id of delivered representation.
+    """
+
+
+def get_representation_delivery_transfers(
+    repre,
+    anatomy,
+    template_name,
+    anatomy_data,
+    format_dict,
+    report_items,
+    log,
+    has_renumbered_frame=False,
+    new_frame_start=0
+):
+    """Plan transfers of representation files to delivery destination.
+
+    Transfers are planned from 'files' of representation without any
+    access to filesystem.
+
+    Args:
+        repre (dict): Representation entity with 'files'.
+        anatomy (Anatomy): Project anatomy.
+        template_name (str): User selected delivery template name.
+        anatomy_data (dict): Data from repre to fill anatomy with.
+        format_dict (dict): Root dictionary with names and values.
+        report_items (collections.defaultdict): To return error messages.
+        log (logging.Logger): For log printing.
+        has_renumbered_frame (Optional[bool]): Renumber frames of sequence.
+        new_frame_start (Optional[int]): First frame of renumbered sequence.
+
+    Returns:
+        list[DeliveryTransfer]: Planned transfers.
+    """
+    size_by_path = {}
+    for repre_file in repre["files"]:
+        src_path = anatomy.fill_root(repre_file["path"])
+        size_by_path[src_path] = repre_file.get("size") or 0
+
+    sources_and_frames = collect_frames(list(size_by_path))
+
+    frames = set(sources_and_frames.values())
+    frames.discard(None)
+    first_frame = None
+    if frames:
+        first_frame = min(frames)
+
+    anatomy_data = copy.deepcopy(anatomy_data)
+    if format_dict:
+        anatomy_data["root"] = format_dict["root"]
+    template_obj = anatomy.get_template_item(
+        "delivery", template_name, "path"
+    )
+
+    transfers = []
+    for src_path, frame in sources_and_frames.items():
+        # Renumber frames
+        if has_renumbered_frame and frame is not None:
+            # Calculate offset between first frame and current frame
+            # - '0' for first frame
+            offset = new_frame_start - int(first_frame)
+            # Add offset to new frame start
+            dst_frame = int(frame) + offset
+            if dst_frame < 0:
+                msg = "Renumber frame has a smaller number than original frame"     # noqa
+                report_items[msg].append(src_path)
+                log.warning("{} <{}>".format(msg, dst_frame))
+                continue
+            frame = dst_frame
+
+        if frame is not None:
+            anatomy_data["frame"] = frame
+
+        delivery_path = template_obj.format_strict(anatomy_data)
+        # Backwards compatibility when extension contained `.`
+        delivery_path = delivery_path.replace("..", ".")
+        # Make sure path is valid for all platforms
+        delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
+        # Remove newlines from the end of the string to avoid OSError
+        delivery_path = delivery_path.rstrip()
+
+        transfers.append(DeliveryTransfer(
+            os.path.normpath(src_path.replace("\\", "/")),
+            delivery_path,
+            size_by_path[src_path],
+            repre["id"],
+        ))
+    return transfers
+
+
+class DeliveryManifest:
+    """Record of finished delivery transfers used to resume delivery.
+
+    Each finished transfer is appended as one JSON line, so the record
+    survives crash of the process. Transfers recorded in manifest are
+    skipped when the same delivery is executed again.
+
+    Args:
+        filepath (str): Path to manifest file.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._done = self._read()
+
+    @classmethod
+    def for_transfers(cls, transfers):
+        """Manifest stored in local app data, based on planned transfers.
+
+        Same delivery (same sources and destinations) will always use
+        the same manifest.
+
+        Args:
+            transfers (Iterable[DeliveryTransfer]): Planned transfers.
+
+        Returns:
+            DeliveryManifest: Manifest for the transfers.
+        """
+        hasher = hashlib.sha1()
+        for transfer in sorted(transfers):
+            hasher.update(
+                "{}>{}\n".format(
+                    transfer.src_path, transfer.dst_path
+                ).encode("utf-8")
+            )
+        return cls(get_ayon_appdirs(
+            "delivery_manifests", "{}.jsonl".format(hasher.hexdigest())
+        ))
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def is_done(self, transfer):
+        """Transfer was already finished.
+
+        Args:
+            transfer (DeliveryTransfer): Transfer to check.
+
+        Returns:
+            bool: Transfer is recorded and destination file exists.
+        """
+        src_path = self._done.get(transfer.dst_path)
+        if src_path != transfer.src_path:
+            return False
+        return os.path.exists(transfer.dst_path)
+
+    def add(self, transfer):
+        """Record finished transfer.
+
+        Args:
+            transfer (DeliveryTransfer): Finished transfer.
+        """
+        line = json.dumps({
+            "src": transfer.src_path,
+            "dst": transfer.dst_path,
+            "size": transfer.size,
+        })
+        with self._lock:
+            dirpath = os.path.dirname(self._filepath)
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath, exist_ok=True)
+            with open(self._filepath, "a") as stream:
+                stream.write(line + "\n")
+            self._done[transfer.dst_path] = transfer.src_path
+
+    def remove(self):
+        """Remove manifest file once the delivery is finished."""
+        with self._lock:
+            if os.path.exists(self._filepath):
+                os.remove(self._filepath)
+            self._done = {}
+
+    def _read(self):
+        done = {}
+        if not os.path.exists(self._filepath):
+            return done
+
+        with open(self._filepath, "r") as stream:
+            for line in stream:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    # Last line might be incomplete after crash
+                    continue
+                done[data["dst"]] = data["src"]
+        return done
+
+
+class DeliveryResult:
+    """Result of executed delivery transfers."""
+
+    def __init__(self):
+        self.transferred = 0
+        self.skipped = 0
+        self.failed = 0
+        self.transferred_bytes = 0
+        self.duration = 0.0
+
+    @property
+    def processed(self):
+        return self.transferred + self.skipped + self.failed
+
+    @property
+    def throughput(self):
+        """Transferred bytes per second."""
+        if not self.duration:
+            return 0.0
+        return self.transferred_bytes / self.duration
+
+    def format_summary(self):
+        return (
+            "Delivered {} files ({} skipped, {} failed),"
+            " {} in {:.1f}s ({}/s)"
+        ).format(
+            self.transferred,
+            self.skipped,
+            self.failed,
+            format_file_size(self.transferred_bytes),
+            self.duration,
+            format_file_size(self.throughput),
+        )
+
+
+class _SourceNotFound(Exception):
+    pass
+
+
+def _deliver_transfer(transfer):
+    """Transfer single file if destination does not exist yet.
+
+    Existing files in delivery folder are never modified, same as
+    '_copy_file' does.
+
+    Returns:
+        bool: File was transferred.
+
+    Raises:
+        _SourceNotFound: Source file does not exist.
+    """
+    if not os.path.exists(transfer.src_path):
+        raise _SourceNotFound()
+
+    if os.path.exists(transfer.dst_path):
+        return False
+
+    dirpath = os.path.dirname(transfer.dst_path)
+    os.makedirs(dirpath, exist_ok=True)
+    link_or_clone_file(transfer.src_path, transfer.dst_path)
+    return True
+
+
+def execute_delivery_transfers(
+    transfers,
+    report_items,
+    log,
+    manifest=None,
+    max_workers=None,
+    progress_callback=None,
+):
+    """Execute planned delivery transfers with bounded worker pool.
+
+    Finished transfers are recorded to manifest, so if delivery is
+    interrupted, next execution skips them. Manifest is removed when all
+    transfers are finished without errors.
+
+    Args:
+        transfers (Iterable[DeliveryTransfer]): Planned transfers.
+        report_items (collections.defaultdict): To return error messages.
+        log (logging.Logger): For log printing.
+        manifest (Optional[DeliveryManifest]): Manifest of finished
+            transfers.
+        max_workers (Optional[int]): Maximum number of parallel transfers.
+        progress_callback (Optional[Callable[[DeliveryResult], None]]):
+            Called in caller's thread after each processed transfer.
+
+    Returns:
+        DeliveryResult: Result with counts and throughput.
+    """
+    result = DeliveryResult()
+    start = time.time()
+
+    to_transfer = []
+    for transfer in transfers:
+        if manifest is not None and manifest.is_done(transfer):
+            result.skipped += 1
+        else:
+            to_transfer.append(transfer)
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_deliver_transfer, transfer): transfer
+            for transfer in to_transfer
+        }
+        if result.skipped and progress_callback is not None:
+            progress_callback(result)
+
+        for future in as_completed(futures):
+            transfer = futures[future]
+            try:
+                transferred = future.result()
+
+            except _SourceNotFound:
+                result.failed += 1
+                msg = "{} doesn't exist for {}".format(
+                    transfer.src_path, transfer.representation_id
+                )
+                report_items["Source file was not found"].append(msg)
+                log.warning("Source file was not found <{}>".format(
+                    transfer.src_path
+                ))
+
+            except Exception as exc:
+                result.failed += 1
+                msg = "Failed to deliver file"
+                report_items[msg].append(
+                    "{} -> {}: {}".format(
+                        transfer.src_path, transfer.dst_path, exc
+                    )
+                )
+                log.warning("{} <{}>".format(msg, transfer.src_path))
+
+            else:
+                if transferred:
+                    result.transferred += 1
+                    result.transferred_bytes += transfer.size
+                else:
+                    result.skipped += 1
+                if manifest is not None:
+                    manifest.add(transfer)
+
+            if progress_callback is not None:
+                progress_callback(result)
+
+    result.duration = time.time() - start
+    if manifest is not None and not result.failed:
+        manifest.remove()
+    log.info(result.format_summary())
+    return result
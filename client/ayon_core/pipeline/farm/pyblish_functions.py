@@ -12,7 +12,7 @@ from ayon_core.pipeline import (
     get_current_project_name,
     get_representation_path,
 )
-from ayon_core.lib import Logger
+from ayon_core.lib import Logger, link_or_clone_files, get_data_access
 from ayon_core.pipeline.publish import KnownPublishError
 from ayon_core.pipeline.farm.patterning import match_aov_pattern
 
@@ -74,7 +74,7 @@ def extend_frames(folder_path, product_name, start, end):
     prev_end = None
 
     project_name = get_current_project_name()
-    folder_entity = ayon_api.get_folder_by_path(
+    folder_entity = get_data_access().get_folder_by_path(
         project_name, folder_path, fields={"id"}
     )
     version_entity = ayon_api.get_last_version_by_product_name(
@@ -1009,8 +1009,6 @@ def copy_extend_frames(instance, representation):
         representation (dict): presentation to operate on
 
     """
-    import speedcopy
-
     R_FRAME_NUMBER = re.compile(
         r".+\.(?P<frame>[0-9]+)\..+")
 
@@ -1021,7 +1019,7 @@ def copy_extend_frames(instance, representation):
     project_name = instance.context.data["project"]
     anatomy = instance.context.data["anatomy"]
 
-    folder_entity = ayon_api.get_folder_by_path(
+    folder_entity = get_data_access().get_folder_by_path(
         project_name, instance.data.get("folderPath")
     )
 
@@ -1076,12 +1074,15 @@ def copy_extend_frames(instance, representation):
     if not os.path.isdir(output_dir):
         os.makedirs(output_dir)
 
-    # copy files
+    # Hardlinks can be used only if frames which will be rendered are not
+    #   transferred, renderer could overwrite published files otherwise
+    allow_hardlink = bool(instance.data.get("overrideExistingFrame"))
     for source in resource_files:
-        speedcopy.copy(source[0], source[1])
         log.info("  > {}".format(source[1]))
+    stats = link_or_clone_files(resource_files, allow_hardlink=allow_hardlink)
 
     log.info("Finished copying %i files" % len(resource_files))
+    log.info(stats.format_summary())
 
 
 def attach_instances_to_product(attach_to, instances):
@@ -0,0 +1,443 @@
+"""Process-wide store of entities used to build load contexts.
+
+Loader, scene inventory and workfile template builder need the same chain
+of entities 'representation -> version -> product -> folder -> project'
+for every representation they work with. The store keeps queried
+entities by id, so only missing entities are queried and each missing
+entity type is queried with single request.
+"""
+import copy
+import time
+import threading
+import collections
+
+import ayon_api
+
+from ayon_core.lib import NestedCacheItem
+from ayon_core.lib.events import register_event_callback
+
+# Topic of event that can be emitted to invalidate cached entities
+#   - data can contain 'project_name', 'entity_type' and 'entity_ids'
+ENTITY_CONTEXTS_INVALIDATE_TOPIC = "entity_contexts.invalidate"
+
+_NOT_FOUND = object()
+
+
+class EntityContextsStore:
+    """Store of entities with bulk resolving of missing entities.
+
+    Entities are cached by project name, entity type and entity id. Each
+    cached entity has its own lifetime. Entities which were not found are
+    cached too, so repeated requests for invalid ids don't trigger new
+    queries. Expired entities are removed from memory on access, once per
+    lifetime.
+
+    Returned entities are copies, so callers can modify them.
+
+    Args:
+        lifetime (Optional[int]): Lifetime of cached entities in seconds.
+
+    """
+    lifetime = 60
+    entity_types = {
+        "folder",
+        "product",
+        "version",
+        "representation",
+    }
+
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.lifetime
+        self._lock = threading.RLock()
+        self._lifetime = lifetime
+        self._last_prune = time.time()
+        self._projects_cache = NestedCacheItem(levels=1, lifetime=lifetime)
+        self._entities_cache = NestedCacheItem(levels=3, lifetime=lifetime)
+        self._repre_ids_by_version_id = NestedCacheItem(
+            levels=2, lifetime=lifetime
+        )
+
+    def invalidate(self, project_name=None, entity_type=None, entity_ids=None):
+        """Invalidate cached entities.
+
+        Args:
+            project_name (Optional[str]): Project name. All projects are
+                invalidated if not passed.
+            entity_type (Optional[str]): Entity type. All entity types of
+                project are invalidated if not passed.
+            entity_ids (Optional[Iterable[str]]): Entity ids. All entities
+                of entity type are invalidated if not passed.
+
+        """
+        with self._lock:
+            if project_name is None:
+                self._projects_cache.reset()
+                self._entities_cache.reset()
+                self._repre_ids_by_version_id.reset()
+                return
+
+            if entity_type is None:
+                self._projects_cache.clear_key(project_name)
+                self._entities_cache.clear_key(project_name)
+                self._repre_ids_by_version_id.clear_key(project_name)
+                return
+
+            if entity_type == "project":
+                self._projects_cache.clear_key(project_name)
+                return
+
+            entities_cache = self._entities_cache[project_name][entity_type]
+            if entity_ids is None:
+                entities_cache.reset()
+                if entity_type == "version":
+                    self._repre_ids_by_version_id.clear_key(project_name)
+                return
+
+            repre_ids_cache = self._repre_ids_by_version_id[project_name]
+            for entity_id in entity_ids:
+                entities_cache.clear_key(entity_id)
+                if entity_type == "version":
+                    repre_ids_cache.clear_key(entity_id)
+
+    def _prune_expired(self):
+        """Remove expired entities from memory.
+
+        Lock must be acquired by caller.
+        """
+        now = time.time()
+        if now - self._last_prune < self._lifetime:
+            return
+        self._last_prune = now
+        self._projects_cache.clear_invalid()
+        self._entities_cache.clear_invalid()
+        self._repre_ids_by_version_id.clear_invalid()
+
+    def add_entities(self, project_name, entity_type, entities):
+        """Add already queried entities to the store.
+
+        Entities must be queried with all fields.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entities (Iterable[dict[str, Any]]): Entities to store.
+
+        """
+        self._validate_entity_type(entity_type)
+        with self._lock:
+            entities_cache = self._entities_cache[project_name][entity_type]
+            for entity in entities:
+                entities_cache[entity["id"]] = copy.deepcopy(entity)
+
+    def get_project_entity(self, project_name):
+        """Get project entity.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            Union[dict[str, Any], None]: Project entity or None if project
+                was not found.
+
+        """
+        with self._lock:
+            self._prune_expired()
+            project_cache = self._projects_cache[project_name]
+            if not project_cache.is_valid:
+                project_cache.update_data(
+                    ayon_api.get_project(project_name)
+                )
+            return copy.deepcopy(project_cache.get_data())
+
+    def get_entities(self, project_name, entity_type, entity_ids):
+        """Get entities by ids.
+
+        Missing entities are queried with single query.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entity_ids (Iterable[str]): Entity ids.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Entities by ids. Value
+                is None if entity was not found.
+
+        """
+        self._validate_entity_type(entity_type)
+        entity_ids = set(entity_ids)
+        entity_ids.discard(None)
+        output = {}
+        if not entity_ids:
+            return output
+
+        with self._lock:
+            self._prune_expired()
+            entities_cache = self._entities_cache[project_name][entity_type]
+            missing_ids = set()
+            for entity_id in entity_ids:
+                cache = entities_cache[entity_id]
+                if cache.is_valid:
+                    output[entity_id] = cache.get_data()
+                else:
+                    missing_ids.add(entity_id)
+
+            if missing_ids:
+                for entity in self._query_entities(
+                    project_name, entity_type, missing_ids
+                ):
+                    entity_id = entity["id"]
+                    entities_cache[entity_id] = entity
+                    output[entity_id] = entity
+
+                for entity_id in missing_ids - set(output):
+                    entities_cache[entity_id] = _NOT_FOUND
+                    output[entity_id] = _NOT_FOUND
+
+            # Cached entities are shared, return copies
+            return {
+                entity_id: (
+                    None if entity is _NOT_FOUND else copy.deepcopy(entity)
+                )
+                for entity_id, entity in output.items()
+            }
+
+    def get_representation_ids_by_version_ids(self, project_name, version_ids):
+        """Get ids of representations under versions.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, set[str]]: Representation ids by version id.
+
+        """
+        version_ids = set(version_ids)
+        version_ids.discard(None)
+        output = {}
+        if not version_ids:
+            return output
+
+        with self._lock:
+            self._prune_expired()
+            repre_ids_cache = self._repre_ids_by_version_id[project_name]
+            missing_ids = set()
+            for version_id in version_ids:
+                cache = repre_ids_cache[version_id]
+                if cache.is_valid:
+                    output[version_id] = set(cache.get_data())
+                else:
+                    missing_ids.add(version_id)
+
+            if missing_ids:
+                repre_entities = list(ayon_api.get_representations(
+                    project_name, version_ids=missing_ids
+                ))
+                self.add_entities(
+                    project_name, "representation", repre_entities
+                )
+                repre_ids_by_version_id = collections.defaultdict(set)
+                for repre_entity in repre_entities:
+                    version_id = repre_entity["versionId"]
+                    repre_ids_by_version_id[version_id].add(
+                        repre_entity["id"]
+                    )
+
+                for version_id in missing_ids:
+                    repre_ids = repre_ids_by_version_id[version_id]
+                    repre_ids_cache[version_id] = repre_ids
+                    output[version_id] = set(repre_ids)
+        return output
+
+    def get_product_contexts(self, project_name, product_ids):
+        """Get product contexts.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Product contexts by product id.
+                Only contexts with all entities found are returned.
+
+        """
+        project_entity = self.get_project_entity(project_name)
+        product_entities_by_id = self.get_existing_entities(
+            project_name, "product", product_ids
+        )
+        folder_entities_by_id = self.get_existing_entities(
+            project_name,
+            "folder",
+            {p["folderId"] for p in product_entities_by_id.values()}
+        )
+        output = {}
+        for product_id, product_entity in product_entities_by_id.items():
+            folder_entity = folder_entities_by_id.get(
+                product_entity["folderId"]
+            )
+            if folder_entity is None:
+                continue
+            output[product_id] = {
+                "project": project_entity,
+                "folder": folder_entity,
+                "product": product_entity,
+            }
+        return output
+
+    def get_version_contexts(self, project_name, version_ids):
+        """Get version contexts.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Version contexts by version id.
+                Only contexts with all entities found are returned.
+
+        """
+        version_entities_by_id = self.get_existing_entities(
+            project_name, "version", version_ids
+        )
+        product_contexts = self.get_product_contexts(
+            project_name,
+            {v["productId"] for v in version_entities_by_id.values()}
+        )
+        output = {}
+        for version_id, version_entity in version_entities_by_id.items():
+            product_context = product_contexts.get(
+                version_entity["productId"]
+            )
+            if product_context is None:
+                continue
+            context = dict(product_context)
+            context["version"] = version_entity
+            output[version_id] = context
+        return output
+
+    def get_representation_contexts(self, project_name, representation_ids):
+        """Get representation contexts.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Representation contexts by
+                representation id. Only contexts with all entities found
+                are returned.
+
+        """
+        repre_entities_by_id = self.get_existing_entities(
+            project_name, "representation", representation_ids
+        )
+        version_contexts = self.get_version_contexts(
+            project_name,
+            {r["versionId"] for r in repre_entities_by_id.values()}
+        )
+        output = {}
+        for repre_id, repre_entity in repre_entities_by_id.items():
+            version_context = version_contexts.get(repre_entity["versionId"])
+            if version_context is None:
+                continue
+            context = dict(version_context)
+            context["representation"] = repre_entity
+            output[repre_id] = context
+        return output
+
+    def get_representation_contexts_by_version_ids(
+        self, project_name, version_ids
+    ):
+        """Get contexts of all representations under versions.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Representation contexts by
+                representation id.
+
+        """
+        repre_ids = set()
+        for ids in self.get_representation_ids_by_version_ids(
+            project_name, version_ids
+        ).values():
+            repre_ids |= ids
+        return self.get_representation_contexts(project_name, repre_ids)
+
+    def get_existing_entities(self, project_name, entity_type, entity_ids):
+        """Get entities by ids skipping entities that were not found.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Entity type.
+            entity_ids (Iterable[str]): Entity ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Entities by ids.
+
+        """
+        return {
+            entity_id: entity
+            for entity_id, entity in self.get_entities(
+                project_name, entity_type, entity_ids
+            ).items()
+            if entity is not None
+        }
+
+    def _validate_entity_type(self, entity_type):
+        if entity_type not in self.entity_types:
+            raise ValueError(
+                "Unknown entity type \"{}\"".format(entity_type)
+            )
+
+    def _query_entities(self, project_name, entity_type, entity_ids):
+        if entity_type == "folder":
+            return ayon_api.get_folders(project_name, folder_ids=entity_ids)
+        if entity_type == "product":
+            return ayon_api.get_products(
+                project_name, product_ids=entity_ids
+            )
+        if entity_type == "version":
+            return ayon_api.get_versions(
+                project_name, version_ids=entity_ids
+            )
+        return ayon_api.get_representations(
+            project_name, representation_ids=entity_ids
+        )
+
+
+_STORE = {"instance": None}
+_STORE_LOCK = threading.Lock()
+
+
+def _on_invalidate_event(event):
+    store = _STORE["instance"]
+    if store is not None:
+        store.invalidate(
+            event.get("project_name"),
+            event.get("entity_type"),
+            event.get("entity_ids"),
+        )
+
+
+def get_entity_contexts_store():
+    """Process-wide entity contexts store.
+
+    Store is invalidated by event with topic
+    'ENTITY_CONTEXTS_INVALIDATE_TOPIC' emitted to global event system.
+
+    Returns:
+        EntityContextsStore: Shared store.
+
+    """
+    with _STORE_LOCK:
+        if _STORE["instance"] is None:
+            _STORE["instance"] = EntityContextsStore()
+            register_event_callback(
+                ENTITY_CONTEXTS_INVALIDATE_TOPIC, _on_invalidate_event
+            )
+        return _STORE["instance"]
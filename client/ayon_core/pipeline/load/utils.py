@@ -11,11 +11,15 @@ from ayon_core.host import ILoadHost
 from ayon_core.lib import (
     StringTemplate,
     TemplateUnsolved,
+    get_data_access,
+    get_directory_scan,
 )
 from ayon_core.pipeline import (
     Anatomy,
 )
 
+from .entity_contexts import get_entity_contexts_store
+
 log = logging.getLogger(__name__)
 
 ContainersFilterResult = collections.namedtuple(
@@ -93,12 +97,11 @@ def get_repres_contexts(representation_ids, project_name=None):
     if not project_name:
         project_name = get_current_project_name()
 
-    repre_entities = ayon_api.get_representations(
+    store = get_entity_contexts_store()
+    return store.get_representation_contexts(
         project_name, representation_ids
     )
 
-    return get_representation_contexts(project_name, repre_entities)
-
 
 def get_product_contexts(product_ids, project_name=None):
     """Return parenthood context for product.
@@ -119,34 +122,9 @@ def get_product_contexts(product_ids, project_name=None):
 
     if not project_name:
         project_name = get_current_project_name()
-    product_entities = ayon_api.get_products(
-        project_name, product_ids=product_ids
-    )
-    product_entities_by_id = {}
-    folder_ids = set()
-    for product_entity in product_entities:
-        product_entities_by_id[product_entity["id"]] = product_entity
-        folder_ids.add(product_entity["folderId"])
-
-    folder_entities_by_id = {
-        folder_entity["id"]: folder_entity
-        for folder_entity in ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
-        )
-    }
 
-    project_entity = ayon_api.get_project(project_name)
-
-    for product_id, product_entity in product_entities_by_id.items():
-        folder_entity = folder_entities_by_id[product_entity["folderId"]]
-        context = {
-            "project": project_entity,
-            "folder": folder_entity,
-            "product": product_entity
-        }
-        contexts[product_id] = context
-
-    return contexts
+    store = get_entity_contexts_store()
+    return store.get_product_contexts(project_name, product_ids)
 
 
 def get_representation_contexts(project_name, representation_entities):
@@ -216,16 +194,8 @@ def get_representation_contexts_by_ids(project_name, representation_ids):
     if not repre_ids:
         return {}
 
-    # Query representation entities by id
-    repre_entities_by_id = {
-        repre_entity["id"]: repre_entity
-        for repre_entity in ayon_api.get_representations(
-            project_name, repre_ids
-        )
-    }
-    output = get_representation_contexts(
-        project_name, repre_entities_by_id.values()
-    )
+    store = get_entity_contexts_store()
+    output = store.get_representation_contexts(project_name, repre_ids)
     for repre_id in repre_ids:
         if repre_id not in output:
             output[repre_id] = {
@@ -494,7 +464,7 @@ def update_container(container, version=-1):
     product_entity = ayon_api.get_product_by_id(
         project_name, current_version["productId"]
     )
-    folder_entity = ayon_api.get_folder_by_id(
+    folder_entity = get_data_access().get_folder_by_id(
         project_name, product_entity["folderId"]
     )
 
@@ -520,7 +490,7 @@ def update_container(container, version=-1):
             "Can't update container because loader '{}' was not found."
             .format(container.get("loader"))
         )
-    project_entity = ayon_api.get_project(project_name)
+    project_entity = get_data_access().get_project(project_name)
     context = {
         "project": project_entity,
         "folder": folder_entity,
@@ -708,7 +678,8 @@ def get_representation_path(representation, root=None):
             return os.path.normpath(path)
 
         dir_path, file_name = os.path.split(path)
-        if not os.path.exists(dir_path):
+        scan = get_directory_scan(dir_path)
+        if not scan.exists:
             return
 
         base_name, ext = os.path.splitext(file_name)
@@ -723,7 +694,7 @@ def get_representation_path(representation, root=None):
 
         filename_start = file_name_items[0]
 
-        for _file in os.listdir(dir_path):
+        for _file in scan.file_names:
             if _file.startswith(filename_start) and _file.endswith(ext):
                 return os.path.normpath(path)
 
@@ -859,29 +830,21 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_entities = ayon_api.get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields={"id", "versionId"}
+    store = get_entity_contexts_store()
+    repre_entities_by_id = store.get_existing_entities(
+        project_name, "representation", repre_ids
     )
-    # Store representations by stringified representation id
-    repre_entities_by_id = {}
-    repre_entities_by_version_id = collections.defaultdict(list)
-    for repre_entity in repre_entities:
-        repre_id = repre_entity["id"]
-        version_id = repre_entity["versionId"]
-        repre_entities_by_id[repre_id] = repre_entity
-        repre_entities_by_version_id[version_id].append(repre_entity)
+    version_ids = {
+        repre_entity["versionId"]
+        for repre_entity in repre_entities_by_id.values()
+    }
 
-    # Query version docs to get it's product ids
-    # - also query hero version to be able identify if representation
+    # Get version entities to get it's product ids
+    # - hero versions are included to be able identify if representation
     #   belongs to existing version
-    version_entities = ayon_api.get_versions(
-        project_name,
-        version_ids=repre_entities_by_version_id.keys(),
-        hero=True,
-        fields={"id", "productId", "version"}
-    )
+    version_entities = store.get_existing_entities(
+        project_name, "version", version_ids
+    ).values()
     verisons_by_id = {}
     versions_by_product_id = collections.defaultdict(list)
     hero_version_ids = set()
@@ -44,6 +44,11 @@ from .lib import (
     get_publish_instance_families,
 )
 
+from .parallel_publish import (
+    ParallelPublishRunner,
+    publish_iter_parallel,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -92,6 +97,9 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "ParallelPublishRunner",
+    "publish_iter_parallel",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -0,0 +1,412 @@
+"""Publishing with parallel processing of independent instance plugins.
+
+Plugins are processed in order as with 'pyblish.util.publish_iter', but
+consecutive instance plugins in extraction order are processed as one
+batch. Plugins of the batch are processed in order for each instance, but
+instances are independent and are processed in a thread pool.
+
+```
+Collect  ─ sequential
+Validate ─ sequential
+Extract  ─ <instance 1>: ExtractA -> ExtractB -> ExtractC   (thread 1)
+           <instance 2>: ExtractA -> ExtractC               (thread 2)
+           <instance 3>: ExtractB                           (thread 3)
+Integrate ─ sequential
+```
+
+Context plugins in extraction order are processed sequentially and split
+batches, so they always see results of all previous plugins.
+
+Threads are used instead of processes because instances and context are
+shared in-memory objects which can't be sent to other process, and
+extractors usually wait for subprocesses (ffmpeg, oiiotool) anyway.
+"""
+import time
+import queue
+import logging
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+import pyblish.api
+import pyblish.lib
+import pyblish.logic
+import pyblish.plugin
+
+from ayon_core.lib import Logger
+from ayon_core.lib.profiling import PublishProfiler
+
+
+class _ThreadRecordsHandler(logging.Handler):
+    """Collect pyblish log records to list of current thread.
+
+    Pyblish adds handler to root logger for each processed plugin, which
+    can't be used when plugins are processed at the same time.
+    """
+
+    def __init__(self):
+        super(_ThreadRecordsHandler, self).__init__()
+        self._local = threading.local()
+
+    def set_records(self, records):
+        self._local.records = records
+
+    def emit(self, record):
+        records = getattr(self._local, "records", None)
+        if records is not None and record.name.startswith("pyblish"):
+            records.append(record)
+
+
+def is_parallel_plugin(plugin):
+    """Plugin can be processed in parallel for different instances.
+
+    Args:
+        plugin (type[pyblish.api.Plugin]): Publish plugin.
+
+    Returns:
+        bool: Plugin is instance plugin in extraction order.
+    """
+    return (
+        issubclass(plugin, pyblish.api.InstancePlugin)
+        and pyblish.lib.inrange(plugin.order, pyblish.api.ExtractorOrder)
+    )
+
+
+def get_plugin_batches(plugins):
+    """Split plugins to batches.
+
+    Args:
+        plugins (list[type[pyblish.api.Plugin]]): Sorted publish plugins.
+
+    Returns:
+        list[tuple[bool, list[type[pyblish.api.Plugin]]]]: Batches of
+            plugins with information if batch can be processed in parallel.
+    """
+    batches = []
+    for plugin in plugins:
+        parallel = is_parallel_plugin(plugin)
+        if batches and parallel and batches[-1][0]:
+            batches[-1][1].append(plugin)
+        else:
+            batches.append((parallel, [plugin]))
+    return batches
+
+
+def _get_instance_name(instance):
+    if instance is None:
+        return "Context"
+    return instance.data.get("name")
+
+
+def _process_instance_plugin(
+    plugin, context, instance, records_handler, profiler
+):
+    """Process instance plugin in current thread.
+
+    Equivalent of 'pyblish.plugin.process' which can be called from
+    multiple threads at the same time. Log records are collected per
+    thread, result is not added to context and signals are not emitted.
+    Both are done by caller in main thread.
+    """
+    records = []
+    result = {
+        "success": False,
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": None,
+        "records": records,
+        "duration": None,
+        "progress": 0,
+        "context": context,
+    }
+    records_handler.set_records(records)
+    start = time.time()
+    with profiler.span(
+        plugin.__name__, args={"instance": _get_instance_name(instance)}
+    ) as span:
+        try:
+            plugin().process(instance)
+            result["success"] = True
+        except Exception as error:
+            pyblish.lib.extract_traceback(error, plugin.__module__)
+            result["error"] = error
+            pyblish.plugin.log.exception(error.formatted_traceback)
+        finally:
+            records_handler.set_records(None)
+
+    result["duration"] = (time.time() - start) * 1000
+    result["profile"] = span.to_data()
+    return result
+
+
+def _process_instance_chain(
+    plugins,
+    context,
+    instance,
+    records_handler,
+    profiler,
+    results_queue,
+    stop_event
+):
+    try:
+        for plugin in plugins:
+            if stop_event.is_set():
+                break
+            # Check compatibility right before processing, same as pyblish
+            #   does, previous plugins might have changed families
+            if (
+                instance.data.get("publish") is False
+                or not pyblish.logic.instances_by_plugin([instance], plugin)
+            ):
+                continue
+            results_queue.put((
+                _process_instance_plugin(
+                    plugin, context, instance, records_handler, profiler
+                ),
+                None
+            ))
+    except BaseException as exc:
+        results_queue.put((None, exc))
+    finally:
+        results_queue.put((None, None))
+
+
+class ParallelPublishRunner:
+    """Publish with parallel processing of extractors.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context.
+        plugins (Optional[list[type[pyblish.api.Plugin]]]): Plugins to
+            process. Discovered plugins are used if not passed.
+        targets (Optional[list[str]]): Publish targets.
+        max_workers (Optional[int]): Maximum number of threads. All
+            plugins are processed sequentially in current thread if is 1.
+        profiler (Optional[PublishProfiler]): Profiler measuring each
+            processed plugin. Profile data are added to results under
+            'profile' key.
+    """
+
+    def __init__(
+        self,
+        context=None,
+        plugins=None,
+        targets=None,
+        max_workers=None,
+        profiler=None,
+    ):
+        if context is None:
+            context = pyblish.api.Context()
+        if plugins is None:
+            plugins = pyblish.api.discover()
+        if not targets:
+            targets = ["default"] + pyblish.api.registered_targets()
+
+        plugins = pyblish.logic.plugins_by_targets(plugins, targets)
+        if profiler is None:
+            profiler = PublishProfiler()
+
+        self._context = context
+        self._plugins = [plugin for plugin in plugins if plugin.active]
+        self._targets = targets
+        self._max_workers = max_workers
+        self._profiler = profiler
+        self._state = {
+            "nextOrder": None,
+            "ordersWithError": set()
+        }
+        self._durations_by_plugin = collections.defaultdict(float)
+        self._log = Logger.get_logger(self.__class__.__name__)
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    def get_plugin_durations(self):
+        """Sum of process durations of plugins.
+
+        Returns:
+            dict[str, float]: Duration in milliseconds by plugin name.
+        """
+        return dict(self._durations_by_plugin)
+
+    def _process(self, plugin, instance):
+        with self._profiler.span(
+            plugin.__name__, args={"instance": _get_instance_name(instance)}
+        ) as span:
+            result = pyblish.plugin.process(plugin, self._context, instance)
+        result["profile"] = span.to_data()
+        return result
+
+    def publish_iter(self):
+        """Process plugins.
+
+        Yields:
+            dict[str, Any]: Result of each processed plugin and instance,
+                same as 'pyblish.util.publish_iter'.
+        """
+        for result in self._process_plugins():
+            yield result
+
+        pyblish.api.emit("published", context=self._context)
+
+    def _process_plugins(self):
+        collectors = [
+            plugin
+            for plugin in self._plugins
+            if pyblish.lib.inrange(plugin.order, pyblish.api.CollectorOrder)
+        ]
+        for plugin, instance in pyblish.logic.Iterator(
+            collectors, self._context, targets=self._targets
+        ):
+            result = self._process(plugin, instance)
+            self._on_result(result)
+            yield result
+
+        # Exclude plugins without compatible instances
+        plugins = [
+            plugin
+            for plugin in self._plugins
+            if plugin not in collectors and (
+                not plugin.__instanceEnabled__
+                or pyblish.logic.instances_by_plugin(self._context, plugin)
+            )
+        ]
+        test = pyblish.logic.registered_test()
+        for parallel, batch in get_plugin_batches(plugins):
+            if not parallel or self._max_workers == 1:
+                for plugin, instance in pyblish.logic.Iterator(
+                    batch, self._context, self._state, targets=self._targets
+                ):
+                    result = self._process(plugin, instance)
+                    self._on_result(result)
+                    yield result
+                continue
+
+            for plugin in batch:
+                self._state["nextOrder"] = plugin.order
+                message = test(**self._state)
+                if message:
+                    self._log.error("Stopped due to {}".format(message))
+                    return
+
+            for result in self._process_parallel_batch(batch):
+                yield result
+
+    def _on_result(self, result):
+        plugin = result["plugin"]
+        self._durations_by_plugin[plugin.__name__] += result["duration"]
+        if result["error"]:
+            self._state["ordersWithError"].add(plugin.order)
+
+        instance = result["instance"]
+        self._log.debug("{} [{}] {:.1f}ms".format(
+            plugin.__name__,
+            _get_instance_name(instance),
+            result["duration"]
+        ))
+
+    def _process_parallel_batch(self, plugins):
+        # All plugins of batch are considered for each instance, families
+        #   are checked in chain before each plugin is processed
+        instances = [
+            instance
+            for instance in self._context
+            if instance.data.get("publish") is not False
+        ]
+        if not instances:
+            return
+
+        records_handler = _ThreadRecordsHandler()
+        results_queue = queue.Queue()
+        stop_event = threading.Event()
+        root_logger = logging.getLogger()
+        old_level = root_logger.level
+        root_logger.addHandler(records_handler)
+        root_logger.setLevel(logging.DEBUG)
+
+        executor = ThreadPoolExecutor(self._max_workers)
+        start = time.time()
+        durations_sum = 0.0
+        try:
+            for instance in instances:
+                executor.submit(
+                    _process_instance_chain,
+                    plugins,
+                    self._context,
+                    instance,
+                    records_handler,
+                    self._profiler,
+                    results_queue,
+                    stop_event
+                )
+
+            # Results are merged into context in main thread
+            running_chains = len(instances)
+            while running_chains:
+                result, exc = results_queue.get()
+                if exc is not None:
+                    raise exc
+
+                if result is None:
+                    running_chains -= 1
+                    continue
+
+                durations_sum += result["duration"]
+                self._context.data.setdefault("results", []).append(result)
+                if result["error"]:
+                    pyblish.lib.emit(
+                        "pluginFailed",
+                        plugin=result["plugin"],
+                        context=self._context,
+                        instance=result["instance"],
+                        error=result["error"]
+                    )
+                pyblish.lib.emit("pluginProcessed", result=result)
+                self._on_result(result)
+                yield result
+
+        finally:
+            # Stop processing if iteration was stopped by caller
+            stop_event.set()
+            executor.shutdown(wait=True)
+            root_logger.removeHandler(records_handler)
+            root_logger.setLevel(old_level)
+
+        self._log.info((
+            "Processed {} plugins on {} instances in {:.2f}s"
+            " (sequential time {:.2f}s)"
+        ).format(
+            len(plugins),
+            len(instances),
+            time.time() - start,
+            durations_sum / 1000
+        ))
+
+
+def publish_iter_parallel(
+    context=None, plugins=None, targets=None, max_workers=None, profiler=None
+):
+    """Publish iterator with parallel processing of extractors.
+
+    Drop-in replacement of 'pyblish.util.publish_iter'. Same plugins are
+    processed on the same instances, but results of parallel batches are
+    yielded in order in which they finished.
+
+    Args:
+        context (Optional[pyblish.api.Context]): Publish context.
+        plugins (Optional[list[type[pyblish.api.Plugin]]]): Plugins to
+            process. Discovered plugins are used if not passed.
+        targets (Optional[list[str]]): Publish targets.
+        max_workers (Optional[int]): Maximum number of threads.
+        profiler (Optional[PublishProfiler]): Profiler measuring each
+            processed plugin.
+
+    Yields:
+        dict[str, Any]: Result of each processed plugin and instance.
+    """
+    runner = ParallelPublishRunner(
+        context, plugins, targets, max_workers, profiler
+    )
+    for result in runner.publish_iter():
+        yield result
@@ -1,7 +1,6 @@
-import ayon_api
-
 from ayon_core.settings import get_studio_settings
 from ayon_core.lib.local_settings import get_ayon_username
+from ayon_core.lib.ayon_connection import get_data_access
 
 
 def get_general_template_data(settings=None):
@@ -52,7 +51,9 @@ def get_project_template_data(project_entity=None, project_name=None):
         project_name = project_entity["name"]
 
     elif not project_entity:
-        project_entity = ayon_api.get_project(project_name, fields=["code"])
+        project_entity = get_data_access().get_project(
+            project_name, fields=["code"]
+        )
 
     project_code = project_entity["code"]
     return {
@@ -214,17 +215,17 @@ def get_template_data_with_names(
         Dict[str, Any]: Data prepared for filling workdir template.
     """
 
-    project_entity = ayon_api.get_project(project_name)
+    project_entity = get_data_access().get_project(project_name)
     folder_entity = None
     task_entity = None
     if folder_path:
-        folder_entity = ayon_api.get_folder_by_path(
+        folder_entity = get_data_access().get_folder_by_path(
             project_name,
             folder_path,
             fields={"id", "path", "folderType"}
         )
         if task_name and folder_entity:
-            task_entity = ayon_api.get_task_by_name(
+            task_entity = get_data_access().get_task_by_name(
                 project_name, folder_entity["id"], task_name
             )
     return get_template_data(
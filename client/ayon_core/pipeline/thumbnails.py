@@ -1,5 +1,8 @@
 import os
 import time
+import sqlite3
+import logging
+import threading
 import collections
 
 import ayon_api
@@ -12,6 +15,231 @@ FileInfo = collections.namedtuple(
     ("path", "size", "modification_time")
 )
 
+log = logging.getLogger(__name__)
+
+
+class _ThumbnailsIndex:
+    """Index of cached thumbnails stored in sqlite database.
+
+    Index contains path, size and time of last access of each thumbnail,
+    total size of thumbnails is kept up to date by triggers. Index is
+    rebuilt from content of thumbnails directory when database file is
+    missing.
+
+    Args:
+        thumbnails_dir (str): Root directory of thumbnails.
+    """
+
+    _schema = (
+        "CREATE TABLE IF NOT EXISTS thumbnails ("
+        " project_name TEXT NOT NULL,"
+        " thumbnail_id TEXT NOT NULL,"
+        " path TEXT NOT NULL,"
+        " size INTEGER NOT NULL,"
+        " last_access REAL NOT NULL,"
+        " PRIMARY KEY (project_name, thumbnail_id))",
+        "CREATE INDEX IF NOT EXISTS thumbnails_last_access"
+        " ON thumbnails (last_access)",
+        "CREATE TABLE IF NOT EXISTS stats (total_size INTEGER NOT NULL)",
+        "INSERT INTO stats (total_size)"
+        " SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM stats)",
+        "CREATE TRIGGER IF NOT EXISTS thumbnails_insert"
+        " AFTER INSERT ON thumbnails BEGIN"
+        " UPDATE stats SET total_size = total_size + NEW.size; END",
+        "CREATE TRIGGER IF NOT EXISTS thumbnails_delete"
+        " AFTER DELETE ON thumbnails BEGIN"
+        " UPDATE stats SET total_size = total_size - OLD.size; END",
+        "CREATE TRIGGER IF NOT EXISTS thumbnails_update"
+        " AFTER UPDATE OF size ON thumbnails BEGIN"
+        " UPDATE stats SET total_size ="
+        " total_size - OLD.size + NEW.size; END",
+    )
+
+    def __init__(self, thumbnails_dir):
+        self._thumbnails_dir = thumbnails_dir
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _get_connection(self):
+        if self._connection is not None:
+            return self._connection
+
+        if not os.path.exists(self._thumbnails_dir):
+            os.makedirs(self._thumbnails_dir)
+        db_path = os.path.join(self._thumbnails_dir, "index.db")
+        rebuild = not os.path.exists(db_path)
+        try:
+            connection = self._connect(db_path)
+        except sqlite3.DatabaseError as exc:
+            # Other errors, e.g. 'database is locked', are not a reason
+            #   to remove the index
+            if not self._is_corrupted_error(exc):
+                raise
+            log.warning("Rebuilding index of thumbnails cache", exc_info=True)
+            rebuild = True
+            try:
+                os.remove(db_path)
+            except OSError:
+                # File might be used by other process, keep index only
+                #   in memory until next start
+                log.warning(
+                    "Failed to remove corrupted index of thumbnails cache",
+                    exc_info=True
+                )
+                db_path = ":memory:"
+            connection = self._connect(db_path)
+        self._connection = connection
+        if rebuild:
+            self._rebuild()
+        return connection
+
+    @staticmethod
+    def _is_corrupted_error(exc):
+        message = str(exc).lower()
+        return "malformed" in message or "not a database" in message
+
+    def _connect(self, db_path):
+        connection = sqlite3.connect(
+            db_path, timeout=10, check_same_thread=False
+        )
+        try:
+            with connection:
+                for statement in self._schema:
+                    connection.execute(statement)
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def _rebuild(self):
+        rows = []
+        for project_name in os.listdir(self._thumbnails_dir):
+            project_dir = os.path.join(self._thumbnails_dir, project_name)
+            if not os.path.isdir(project_dir):
+                continue
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    thumbnail_id, _ = os.path.splitext(entry.name)
+                    rows.append((
+                        project_name,
+                        thumbnail_id,
+                        entry.path,
+                        stat.st_size,
+                        stat.st_mtime,
+                    ))
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO thumbnails"
+                " (project_name, thumbnail_id, path, size, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def get(self, project_name, thumbnail_id):
+        """Path and last access time of thumbnail.
+
+        Returns:
+            Union[tuple[str, float], None]: Path and last access time.
+        """
+        with self._lock:
+            return self._get_connection().execute(
+                "SELECT path, last_access FROM thumbnails"
+                " WHERE project_name = ? AND thumbnail_id = ?",
+                (project_name, thumbnail_id)
+            ).fetchone()
+
+    def add(self, project_name, thumbnail_id, path, size, last_access):
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails"
+                    " (project_name, thumbnail_id, path, size, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (project_name, thumbnail_id, path, size, last_access)
+                )
+
+    def touch(self, project_name, thumbnail_id, last_access):
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "UPDATE thumbnails SET last_access = ?"
+                    " WHERE project_name = ? AND thumbnail_id = ?",
+                    (last_access, project_name, thumbnail_id)
+                )
+
+    def remove(self, project_name, thumbnail_id):
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "DELETE FROM thumbnails"
+                    " WHERE project_name = ? AND thumbnail_id = ?",
+                    (project_name, thumbnail_id)
+                )
+
+    def get_total_size(self):
+        with self._lock:
+            return self._get_connection().execute(
+                "SELECT total_size FROM stats"
+            ).fetchone()[0]
+
+    def get_items(self):
+        with self._lock:
+            return self._get_connection().execute(
+                "SELECT path, size, last_access FROM thumbnails"
+            ).fetchall()
+
+    def pop_oldest(self, accessed_before=None, size_to_free=None):
+        """Remove least recently accessed thumbnails from index.
+
+        Args:
+            accessed_before (Optional[float]): Remove thumbnails which were
+                not accessed after the time.
+            size_to_free (Optional[int]): Remove thumbnails until their
+                size is at least the value.
+
+        Returns:
+            list[str]: Paths of removed thumbnails.
+        """
+        paths = []
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                cursor = connection.execute(
+                    "SELECT project_name, thumbnail_id, path, size,"
+                    " last_access FROM thumbnails ORDER BY last_access"
+                )
+                to_remove = []
+                freed_size = 0
+                for row in cursor:
+                    project_name, thumbnail_id, path, size, last_access = row
+                    expired = (
+                        accessed_before is not None
+                        and last_access < accessed_before
+                    )
+                    over_size = (
+                        size_to_free is not None
+                        and freed_size < size_to_free
+                    )
+                    if not expired and not over_size:
+                        break
+                    to_remove.append((project_name, thumbnail_id))
+                    paths.append(path)
+                    freed_size += size
+
+                connection.executemany(
+                    "DELETE FROM thumbnails"
+                    " WHERE project_name = ? AND thumbnail_id = ?",
+                    to_remove
+                )
+        return paths
+
 
 class ThumbnailsCache:
     """Cache of thumbnails on local storage.
@@ -21,13 +249,17 @@ class ThumbnailsCache:
     thumbnail id validation and file names are thumbnail ids with matching
     extension. Extensions are predefined (.png and .jpeg).
 
+    Cached thumbnails are tracked in sqlite index with their size and time
+    of last access, so cleanup does not have to walk the directory.
+
     Cache has cleanup mechanism which is triggered on initialized by default.
 
     The cleanup has 2 levels:
-    1. soft cleanup which remove all files that are older then 'days_alive'
-    2. max size cleanup which remove all files until the thumbnails folder
-        contains less then 'max_filesize'
-        - this is time consuming so it's not triggered automatically
+    1. soft cleanup which remove all files that were not accessed for
+        'days_alive'
+    2. max size cleanup which remove least recently accessed files until
+        the thumbnails folder contains less then 'max_filesize'
+        - triggered automatically when thumbnail is stored
 
     Args:
         cleanup (bool): Trigger soft cleanup (Cleanup expired thumbnails).
@@ -39,9 +271,13 @@ class ThumbnailsCache:
     # Max size of thumbnail directory (in bytes)
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
+    # Last access time in index is updated at most once per interval
+    #   (in seconds)
+    access_update_interval = 60
 
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
+        self._index = None
         self._days_alive_secs = self.days_alive * 24 * 60 * 60
         if cleanup:
             self.cleanup()
@@ -59,6 +295,11 @@ class ThumbnailsCache:
 
     thumbnails_dir = property(get_thumbnails_dir)
 
+    def _get_index(self):
+        if self._index is None:
+            self._index = _ThumbnailsIndex(self.thumbnails_dir)
+        return self._index
+
     def get_thumbnails_dir_file_info(self):
         """Get information about all files in thumbnails directory.
 
@@ -66,18 +307,13 @@ class ThumbnailsCache:
             List[FileInfo]: List of file information about all files.
         """
 
-        thumbnails_dir = self.thumbnails_dir
-        files_info = []
-        if not os.path.exists(thumbnails_dir):
-            return files_info
+        if not os.path.exists(self.thumbnails_dir):
+            return []
 
-        for root, _, filenames in os.walk(thumbnails_dir):
-            for filename in filenames:
-                path = os.path.join(root, filename)
-                files_info.append(FileInfo(
-                    path, os.path.getsize(path), os.path.getmtime(path)
-                ))
-        return files_info
+        return [
+            FileInfo(path, size, last_access)
+            for path, size, last_access in self._get_index().get_items()
+        ]
 
     def get_thumbnails_dir_size(self, files_info=None):
         """Got full size of thumbnail directory.
@@ -90,16 +326,15 @@ class ThumbnailsCache:
             int: File size of all files in thumbnail directory.
         """
 
-        if files_info is None:
-            files_info = self.get_thumbnails_dir_file_info()
+        if files_info is not None:
+            return sum(
+                file_info.size
+                for file_info in files_info
+            )
 
-        if not files_info:
+        if not os.path.exists(self.thumbnails_dir):
             return 0
-
-        return sum(
-            file_info.size
-            for file_info in files_info
-        )
+        return self._get_index().get_total_size()
 
     def cleanup(self, check_max_size=False):
         """Cleanup thumbnails directory.
@@ -118,32 +353,30 @@ class ThumbnailsCache:
         if check_max_size:
             self._max_size_cleanup(thumbnails_dir)
 
+    def _remove_files(self, paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                log.debug(
+                    "Failed to remove thumbnail \"{}\"".format(path),
+                    exc_info=True
+                )
+
     def _soft_cleanup(self, thumbnails_dir):
-        current_time = time.time()
-        for root, _, filenames in os.walk(thumbnails_dir):
-            for filename in filenames:
-                path = os.path.join(root, filename)
-                modification_time = os.path.getmtime(path)
-                if current_time - modification_time > self._days_alive_secs:
-                    os.remove(path)
+        paths = self._get_index().pop_oldest(
+            accessed_before=time.time() - self._days_alive_secs
+        )
+        self._remove_files(paths)
 
     def _max_size_cleanup(self, thumbnails_dir):
-        files_info = self.get_thumbnails_dir_file_info()
-        size = self.get_thumbnails_dir_size(files_info)
-        if size < self.max_filesize:
+        index = self._get_index()
+        diff = index.get_total_size() - self.max_filesize
+        if diff <= 0:
             return
-
-        sorted_file_info = collections.deque(
-            sorted(files_info, key=lambda item: item.modification_time)
-        )
-        diff = size - self.max_filesize
-        while diff > 0:
-            if not sorted_file_info:
-                break
-
-            file_info = sorted_file_info.popleft()
-            diff -= file_info.size
-            os.remove(file_info.path)
+        self._remove_files(index.pop_oldest(size_to_free=diff))
 
     def get_thumbnail_filepath(self, project_name, thumbnail_id):
         """Get thumbnail by thumbnail id.
@@ -160,16 +393,20 @@ class ThumbnailsCache:
         if not thumbnail_id:
             return None
 
-        for ext in (
-            ".png",
-            ".jpeg",
-        ):
-            filepath = os.path.join(
-                self.thumbnails_dir, project_name, thumbnail_id + ext
-            )
-            if os.path.exists(filepath):
-                return filepath
-        return None
+        index = self._get_index()
+        item = index.get(project_name, thumbnail_id)
+        if item is None:
+            return None
+
+        filepath, last_access = item
+        if not os.path.exists(filepath):
+            index.remove(project_name, thumbnail_id)
+            return None
+
+        current_time = time.time()
+        if current_time - last_access > self.access_update_interval:
+            index.touch(project_name, thumbnail_id, current_time)
+        return filepath
 
     def get_project_dir(self, project_name):
         """Path to root directory for specific project.
@@ -219,6 +456,15 @@ class ThumbnailsCache:
         current_time = time.time()
         os.utime(thumbnail_path, (current_time, current_time))
 
+        self._get_index().add(
+            project_name,
+            thumbnail_id,
+            thumbnail_path,
+            len(content),
+            current_time
+        )
+        self._max_size_cleanup(self.thumbnails_dir)
+
         return thumbnail_path
 
 
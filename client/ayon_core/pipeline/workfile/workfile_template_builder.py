@@ -41,9 +41,9 @@ from ayon_core.lib.attribute_definitions import get_attributes_keys
 from ayon_core.pipeline import Anatomy
 from ayon_core.pipeline.load import (
     get_loaders_by_name,
-    get_representation_contexts,
     load_with_repre_context,
 )
+from ayon_core.pipeline.load.entity_contexts import get_entity_contexts_store
 from ayon_core.pipeline.plugin_discover import (
     discover,
     register_plugin,
@@ -664,6 +664,9 @@ class AbstractTemplateBuilder(object):
         for identifier, placeholders in placeholders_by_plugin_id.items():
             plugin = plugins_by_identifier[identifier]
             plugin.prepare_placeholders(placeholders)
+            # Query representations of all load placeholders at once
+            if isinstance(plugin, PlaceholderLoadMixin):
+                plugin.prefetch_representations(placeholders)
 
     def populate_scene_placeholders(
         self, level_limit=None, keep_placeholders=None
@@ -1499,91 +1502,246 @@ class PlaceholderLoadMixin(object):
 
         return {}
 
-    def _get_representations(self, placeholder):
-        """Prepared query of representations based on load options.
-
-        This function is directly connected to options defined in
-        'get_load_plugin_options'.
-
-        Note:
-            This returns all representation documents from all versions of
-                matching product. To filter for last version use
-                '_reduce_last_version_repre_entities'.
+    def _get_representations_query(self, placeholder):
+        """Representation query criteria of placeholder.
 
         Args:
             placeholder (PlaceholderItem): Item which should be populated.
 
         Returns:
-            List[Dict[str, Any]]: Representation documents matching filters
-                from placeholder data.
+            Union[tuple[str, str, str, str, str], None]: Builder type,
+                folder path regex, product type, product name regex and
+                representation name. None if placeholder can't load
+                anything.
         """
 
         # An OpenPype placeholder loaded in AYON
         if "asset" in placeholder.data:
-            return []
+            return None
 
         representation_name = placeholder.data["representation"]
         if not representation_name:
-            return []
-
-        project_name = self.builder.project_name
-        current_folder_entity = self.builder.current_folder_entity
+            return None
 
-        folder_path_regex = placeholder.data["folder_path"]
-        product_name_regex_value = placeholder.data["product_name"]
-        product_name_regex = None
-        if product_name_regex_value:
-            product_name_regex = re.compile(product_name_regex_value)
         product_type = placeholder.data.get("product_type")
         if product_type is None:
             product_type = placeholder.data["family"]
 
-        builder_type = placeholder.data["builder_type"]
-        folder_ids = []
-        if builder_type == "context_folder":
-            folder_ids = [current_folder_entity["id"]]
-
-        elif builder_type == "all_folders":
-            folder_ids = {
-                folder_entity["id"]
-                for folder_entity in get_folders(
-                    project_name,
-                    folder_path_regex=folder_path_regex,
-                    fields={"id"}
-                )
-            }
+        return (
+            placeholder.data["builder_type"],
+            placeholder.data["folder_path"],
+            product_type,
+            placeholder.data["product_name"],
+            representation_name,
+        )
 
-        if not folder_ids:
-            return []
+    def _query_representations(self, queries):
+        """Query representations for multiple placeholder queries.
+
+        Products, last versions and representations of all queries are
+        received with one server request each. Folders are queried once
+        per folder path regex.
+
+        Args:
+            queries (Iterable[tuple[str, str, str, str, str]]): Queries
+                from '_get_representations_query'.
+
+        Returns:
+            dict[tuple, list[dict[str, Any]]]: Representation entities
+                by query.
+        """
+
+        project_name = self.builder.project_name
+        queries = set(queries)
+        output = {query: [] for query in queries}
+
+        # Folder ids of each query
+        folder_ids_by_regex = {}
+        folder_ids_by_query = {}
+        for query in queries:
+            builder_type, folder_path_regex = query[:2]
+            folder_ids = set()
+            if builder_type == "context_folder":
+                folder_ids = {self.builder.current_folder_entity["id"]}
+
+            elif builder_type == "all_folders":
+                folder_ids = folder_ids_by_regex.get(folder_path_regex)
+                if folder_ids is None:
+                    folder_ids = {
+                        folder_entity["id"]
+                        for folder_entity in get_folders(
+                            project_name,
+                            folder_path_regex=folder_path_regex,
+                            fields={"id"}
+                        )
+                    }
+                    folder_ids_by_regex[folder_path_regex] = folder_ids
+
+            if folder_ids:
+                folder_ids_by_query[query] = folder_ids
+
+        if not folder_ids_by_query:
+            return output
+
+        all_folder_ids = set()
+        product_types = set()
+        for query, folder_ids in folder_ids_by_query.items():
+            all_folder_ids |= folder_ids
+            product_types.add(query[2])
 
         products = list(get_products(
             project_name,
-            folder_ids=folder_ids,
-            product_types=[product_type],
-            fields={"id", "name"}
+            folder_ids=all_folder_ids,
+            product_types=product_types,
+            fields={"id", "name", "folderId", "productType"}
         ))
-        filtered_product_ids = set()
-        for product in products:
-            if (
-                product_name_regex is None
-                or product_name_regex.match(product["name"])
-            ):
-                filtered_product_ids.add(product["id"])
-
-        if not filtered_product_ids:
-            return []
 
-        version_ids = set(
-            version["id"]
-            for version in get_last_versions(
-                project_name, filtered_product_ids, fields={"id"}
-            ).values()
-        )
-        return list(get_representations(
+        product_ids_by_query = {}
+        for query, folder_ids in folder_ids_by_query.items():
+            _, _, product_type, product_name_regex_value, _ = query
+            product_name_regex = None
+            if product_name_regex_value:
+                product_name_regex = re.compile(product_name_regex_value)
+            product_ids = {
+                product["id"]
+                for product in products
+                if (
+                    product["folderId"] in folder_ids
+                    and product["productType"] == product_type
+                    and (
+                        product_name_regex is None
+                        or product_name_regex.match(product["name"])
+                    )
+                )
+            }
+            if product_ids:
+                product_ids_by_query[query] = product_ids
+
+        if not product_ids_by_query:
+            return output
+
+        all_product_ids = set()
+        for product_ids in product_ids_by_query.values():
+            all_product_ids |= product_ids
+
+        version_id_by_product_id = {
+            product_id: version["id"]
+            for product_id, version in get_last_versions(
+                project_name, all_product_ids, fields={"id"}
+            ).items()
+        }
+        repre_names = {query[4] for query in product_ids_by_query}
+        repre_entities_by_version_id = collections.defaultdict(list)
+        for repre_entity in get_representations(
             project_name,
-            representation_names={representation_name},
-            version_ids=version_ids
-        ))
+            representation_names=repre_names,
+            version_ids=set(version_id_by_product_id.values())
+        ):
+            repre_entities_by_version_id[repre_entity["versionId"]].append(
+                repre_entity
+            )
+
+        for query, product_ids in product_ids_by_query.items():
+            repre_name = query[4]
+            for product_id in product_ids:
+                version_id = version_id_by_product_id.get(product_id)
+                output[query].extend(
+                    repre_entity
+                    for repre_entity in repre_entities_by_version_id.get(
+                        version_id, []
+                    )
+                    if repre_entity["name"] == repre_name
+                )
+        return output
+
+    def prefetch_representations(self, placeholders):
+        """Query representations of placeholders in batch.
+
+        Result is stored to shared populate data of builder and used by
+        '_get_representations' of all load placeholders in current
+        populate loop. Placeholders with invalid data are skipped and if
+        batch query fails, each placeholder queries its representations
+        on its own, so error is related only to invalid placeholders.
+
+        Args:
+            placeholders (List[PlaceholderItem]): Placeholders which will
+                be populated.
+        """
+
+        repre_entities_by_query = self.builder.get_shared_populate_data(
+            "load_representations_by_query"
+        )
+        if repre_entities_by_query is None:
+            repre_entities_by_query = {}
+            self.builder.set_shared_populate_data(
+                "load_representations_by_query", repre_entities_by_query
+            )
+
+        queries = set()
+        for placeholder in placeholders:
+            try:
+                query = self._get_representations_query(placeholder)
+                if query is None or query in repre_entities_by_query:
+                    continue
+                # Validate product name regex before batch query
+                if query[3]:
+                    re.compile(query[3])
+            except Exception:
+                self.log.debug(
+                    "Skipped prefetch of invalid placeholder {}".format(
+                        placeholder.scene_identifier
+                    ),
+                    exc_info=True
+                )
+                continue
+            queries.add(query)
+
+        if not queries:
+            return
+
+        try:
+            repre_entities_by_query.update(
+                self._query_representations(queries)
+            )
+        except Exception:
+            self.log.warning(
+                "Batch query of representations failed, placeholders"
+                " will query representations one by one.",
+                exc_info=True
+            )
+
+    def _get_representations(self, placeholder):
+        """Prepared query of representations based on load options.
+
+        This function is directly connected to options defined in
+        'get_load_plugin_options'. Representations prefetched by
+        'prefetch_representations' are used if available.
+
+        Note:
+            This returns all representation documents from all versions of
+                matching product. To filter for last version use
+                '_reduce_last_version_repre_entities'.
+
+        Args:
+            placeholder (PlaceholderItem): Item which should be populated.
+
+        Returns:
+            List[Dict[str, Any]]: Representation documents matching filters
+                from placeholder data.
+        """
+
+        query = self._get_representations_query(placeholder)
+        if query is None:
+            return []
+
+        repre_entities_by_query = self.builder.get_shared_populate_data(
+            "load_representations_by_query"
+        ) or {}
+        repre_entities = repre_entities_by_query.get(query)
+        if repre_entities is None:
+            return self._query_representations([query])[query]
+        # Prefetched entities are shared with other placeholders
+        return copy.deepcopy(repre_entities)
 
     def _before_placeholder_load(self, placeholder):
         """Can be overridden. It's called before placeholder representations
@@ -1646,8 +1804,17 @@ class PlaceholderLoadMixin(object):
             if repre_entity["id"] not in ignore_repre_ids
         ]
 
-        repre_load_contexts = get_representation_contexts(
-            self.project_name, placeholder_representations
+        # Share parent entities with other placeholders and tools
+        store = get_entity_contexts_store()
+        store.add_entities(
+            self.project_name, "representation", placeholder_representations
+        )
+        repre_load_contexts = store.get_representation_contexts(
+            self.project_name,
+            {
+                repre_entity["id"]
+                for repre_entity in placeholder_representations
+            }
         )
         filtered_repre_contexts = self._reduce_last_version_repre_entities(
             repre_load_contexts.values()
@@ -10,15 +10,18 @@ from ayon_core import resources, style
 
 from ayon_core.lib import (
     format_file_size,
-    collect_frames,
     get_datetime_data,
 )
 from ayon_core.pipeline.load import get_representation_path_with_anatomy
+from ayon_core.tools.utils.lib import RefreshThread
 from ayon_core.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    get_representation_delivery_transfers,
+    execute_delivery_transfers,
+    DeliveryManifest,
 )
 
 
@@ -57,6 +60,9 @@ class Delivery(load.ProductLoaderPlugin):
 class DeliveryOptionsDialog(QtWidgets.QDialog):
     """Dialog to select template where to deliver selected representations."""
 
+    # Number of newly processed files, emitted from delivery thread
+    files_processed = QtCore.Signal(int)
+
     def __init__(self, contexts, log=None, parent=None):
         super(DeliveryOptionsDialog, self).__init__(parent=parent)
 
@@ -77,6 +83,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self._representations = None
         self.log = log
         self.currently_uploaded = 0
+        self._delivery_thread = None
 
         self._set_representations(project_name, contexts)
 
@@ -175,6 +182,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self._update_template_value()
 
         btn_delivery.clicked.connect(self.deliver)
+        self.files_processed.connect(self._update_progress)
         dropdown.currentIndexChanged.connect(self._update_template_value)
 
         if not self.dropdown.count():
@@ -187,20 +195,87 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.log.error(error_message.replace("\n", " "))
 
     def deliver(self):
-        """Main method to loop through all selected representations"""
+        """Start delivery of selected representations in a thread."""
+        if self._delivery_thread is not None:
+            return
+
         self.progress_bar.setVisible(True)
         self.btn_delivery.setEnabled(False)
-        QtWidgets.QApplication.processEvents()
-
-        report_items = defaultdict(list)
 
-        selected_repres = self._get_selected_repres()
+        thread = RefreshThread(
+            "delivery",
+            self._deliver,
+            self._get_selected_repres(),
+            self.dropdown.currentText(),
+            self.root_line_edit.text(),
+            self.renumber_frame.isChecked(),
+            self.first_frame_start.value(),
+        )
+        thread.refresh_finished.connect(self._on_delivery_finish)
+        self._delivery_thread = thread
+        thread.start()
+
+    def reject(self):
+        # Dialog can't be closed until delivery thread finishes
+        if self._delivery_thread is None:
+            super(DeliveryOptionsDialog, self).reject()
+
+    def closeEvent(self, event):
+        if self._delivery_thread is not None:
+            event.ignore()
+            return
+        super(DeliveryOptionsDialog, self).closeEvent(event)
+
+    def _on_delivery_finish(self):
+        thread = self._delivery_thread
+        self._delivery_thread = None
+        report_items = thread.get_result()
+        self.text_area.setText(self._format_report(report_items))
+        self.text_area.setVisible(True)
 
+    def _deliver(
+        self,
+        selected_repres,
+        template_name,
+        root,
+        renumber_frame,
+        frame_offset,
+    ):
+        """Main method to loop through all selected representations.
+
+        Called in delivery thread, widgets must not be accessed. Progress
+        is reported with 'files_processed' signal.
+
+        Returns:
+            dict[str, list[str]]: Report items.
+        """
+        report_items = defaultdict(list)
+        try:
+            self._deliver_representations(
+                selected_repres,
+                template_name,
+                root,
+                renumber_frame,
+                frame_offset,
+                report_items,
+            )
+        except Exception as exc:
+            self.log.error("Failed to deliver versions.", exc_info=True)
+            report_items["Delivery failed"].append(str(exc))
+        return report_items
+
+    def _deliver_representations(
+        self,
+        selected_repres,
+        template_name,
+        root,
+        renumber_frame,
+        frame_offset,
+        report_items,
+    ):
         datetime_data = get_datetime_data()
-        template_name = self.dropdown.currentText()
-        format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
-        renumber_frame = self.renumber_frame.isChecked()
-        frame_offset = self.first_frame_start.value()
+        format_dict = get_format_dict(self.anatomy, root)
+        transfers = []
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -232,41 +307,17 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             ]
 
             if repre.get("files"):
-                src_paths = []
-                for repre_file in repre["files"]:
-                    src_path = self.anatomy.fill_root(repre_file["path"])
-                    src_paths.append(src_path)
-                sources_and_frames = collect_frames(src_paths)
-
-                frames = set(sources_and_frames.values())
-                frames.discard(None)
-                first_frame = None
-                if frames:
-                    first_frame = min(frames)
-
-                for src_path, frame in sources_and_frames.items():
-                    args[0] = src_path
-                    # Renumber frames
-                    if renumber_frame and frame is not None:
-                        # Calculate offset between
-                        # first frame and current frame
-                        # - '0' for first frame
-                        offset = frame_offset - int(first_frame)
-                        # Add offset to new frame start
-                        dst_frame = int(frame) + offset
-                        if dst_frame < 0:
-                            msg = "Renumber frame has a smaller number than original frame"     # noqa
-                            report_items[msg].append(src_path)
-                            self.log.warning("{} <{}>".format(
-                                msg, dst_frame))
-                            continue
-                        frame = dst_frame
-
-                    if frame is not None:
-                        anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
-                    report_items.update(new_report_items)
-                    self._update_progress(uploaded)
+                transfers.extend(get_representation_delivery_transfers(
+                    repre,
+                    self.anatomy,
+                    template_name,
+                    anatomy_data,
+                    format_dict,
+                    report_items,
+                    self.log,
+                    renumber_frame,
+                    frame_offset,
+                ))
             else:  # fallback for Pype2 and representations without files
                 frame = repre["context"].get("frame")
                 if frame:
@@ -277,10 +328,24 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 else:
                     new_report_items, uploaded = deliver_sequence(*args)
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+                self.files_processed.emit(uploaded)
 
-        self.text_area.setText(self._format_report(report_items))
-        self.text_area.setVisible(True)
+        if not transfers:
+            return
+
+        processed = [0]
+
+        def _progress_callback(result):
+            self.files_processed.emit(result.processed - processed[0])
+            processed[0] = result.processed
+
+        execute_delivery_transfers(
+            transfers,
+            report_items,
+            self.log,
+            manifest=DeliveryManifest.for_transfers(transfers),
+            progress_callback=_progress_callback,
+        )
 
     def _get_representation_names(self):
         """Get set of representation names for checkbox filtering."""
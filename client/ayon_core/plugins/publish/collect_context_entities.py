@@ -14,8 +14,7 @@ Provides:
 """
 
 import pyblish.api
-import ayon_api
-
+from ayon_core.lib import get_data_access
 from ayon_core.pipeline import KnownPublishError
 
 
@@ -30,7 +29,7 @@ class CollectContextEntities(pyblish.api.ContextPlugin):
         folder_path = context.data["folderPath"]
         task_name = context.data["task"]
 
-        project_entity = ayon_api.get_project(project_name)
+        project_entity = get_data_access().get_project(project_name)
         if not project_entity:
             raise KnownPublishError(
                 "Project '{}' was not found.".format(project_name)
@@ -92,7 +91,9 @@ class CollectContextEntities(pyblish.api.ContextPlugin):
     def _get_folder_entity(self, project_name, folder_path):
         if not folder_path:
             return None
-        folder_entity = ayon_api.get_folder_by_path(project_name, folder_path)
+        folder_entity = get_data_access().get_folder_by_path(
+            project_name, folder_path
+        )
         if not folder_entity:
             raise KnownPublishError(
                 "Folder '{}' was not found in project '{}'.".format(
@@ -104,7 +105,7 @@ class CollectContextEntities(pyblish.api.ContextPlugin):
     def _get_task_entity(self, project_name, folder_entity, task_name):
         if not folder_entity or not task_name:
             return None
-        task_entity = ayon_api.get_task_by_name(
+        task_entity = get_data_access().get_task_by_name(
             project_name, folder_entity["id"], task_name
         )
         if not task_entity:
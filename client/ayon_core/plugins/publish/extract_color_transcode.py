@@ -5,12 +5,15 @@ import pyblish.api
 
 from ayon_core.pipeline import publish
 from ayon_core.lib import (
-
     is_oiio_supported,
+    TranscodingScheduler,
+    get_frame_batches,
+    get_oiio_sequence_path,
 )
 
 from ayon_core.lib.transcoding import (
-    convert_colorspace,
+    get_convert_colorspace_args,
+    get_oiio_info_for_input,
     get_transcode_temp_directory,
 )
 
@@ -63,6 +66,10 @@ class ExtractOIIOTranscode(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Parallel conversions and threads of each oiiotool process
+    #   - default of 'TranscodingScheduler' is used if not set
+    max_workers = 0
+    oiiotool_threads = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -83,6 +90,12 @@ class ExtractOIIOTranscode(publish.Extractor):
 
         profile_output_defs = profile["outputs"]
         new_representations = []
+        # Conversions of all representations are running in parallel
+        scheduler = TranscodingScheduler(
+            max_workers=self.max_workers,
+            logger=self.log,
+            threads_per_job=self.oiiotool_threads,
+        )
         repres = instance.data["representations"]
         for idx, repre in enumerate(list(repres)):
             self.log.debug("repre ({}): `{}`".format(idx + 1, repre["name"]))
@@ -99,6 +112,15 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self.log.warning("Config file doesn't exist, skipping")
                 continue
 
+            # Information about inputs is same for all outputs
+            input_info_by_path = {}
+            # All frames of a sequence have the same information, other
+            #   files can have different channels or layers
+            is_sequence = (
+                isinstance(repre["files"], list)
+                and self._get_sequence_collection(repre["files"]) is not None
+            )
+
             for output_def in profile_output_defs:
                 output_name = output_def["name"]
                 new_repre = copy.deepcopy(repre)
@@ -148,19 +170,31 @@ class ExtractOIIOTranscode(publish.Extractor):
                 for file_name in files_to_convert:
                     input_path = os.path.join(original_staging_dir,
                                               file_name)
+                    info_key = None if is_sequence else input_path
+                    input_info = input_info_by_path.get(info_key)
+                    if input_info is None:
+                        input_info = get_oiio_info_for_input(
+                            input_path, logger=self.log
+                        )
+                        input_info_by_path[info_key] = input_info
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
+                    scheduler.add_job(
+                        get_convert_colorspace_args(
+                            input_path,
+                            output_path,
+                            config_path,
+                            source_colorspace,
+                            target_colorspace,
+                            view,
+                            display,
+                            additional_command_args,
+                            input_info=input_info,
+                            logger=self.log,
+                            threads=scheduler.threads_per_job,
+                        ),
+                        label=os.path.basename(output_path)
                     )
 
                 # cleanup temporary transcoded files
@@ -205,6 +239,12 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self._mark_original_repre_for_deletion(repre, profile,
                                                        added_review)
 
+        scheduler.run()
+        for job in scheduler.jobs:
+            self.log.debug(
+                "Transcoded {} in {:.2f}s".format(job.label, job.duration)
+            )
+
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
             if "delete" in tags and "thumbnail" not in tags:
@@ -271,34 +311,54 @@ class ExtractOIIOTranscode(publish.Extractor):
         """Returns original list or list with filename formatted in single
         sequence format.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
+        Uses clique to find frame sequence, in this case it splits frames
+        to batches of contiguous frames in sequence format
+        (FRAMESTART-FRAMEEND#) and returns them, so each batch can be
+        converted by separate process.
         If sequence not found, it returns original list
 
         Args:
             files_to_convert (list): list of file names
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            (list) of [file.1001-1010#.exr, file.1011-1020#.exr]
+                or [fileA.exr, fileB.exr]
+        """
+        collection = self._get_sequence_collection(files_to_convert)
+        if collection is not None:
+            files_to_convert = [
+                get_oiio_sequence_path(
+                    collection.head,
+                    collection.tail,
+                    collection.padding,
+                    start,
+                    end,
+                )
+                for start, end in get_frame_batches(collection.indexes)
+            ]
+
+        return files_to_convert
+
+    def _get_sequence_collection(self, files_to_convert):
+        """Frame sequence of files.
+
+        Args:
+            files_to_convert (list): list of file names
+
+        Returns:
+            Union[clique.Collection, None]: Sequence or None if files are
+                not a sequence.
         """
         pattern = [clique.PATTERNS["frames"]]
         collections, remainder = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
-
-        return files_to_convert
+        if not collections:
+            return None
+        if len(collections) > 1:
+            raise ValueError(
+                "Too many collections {}".format(collections))
+        return collections[0]
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -16,6 +16,9 @@ from ayon_core.lib import (
     filter_profiles,
     path_to_subprocess_arg,
     run_subprocess,
+    FrameRanges,
+    get_directory_scan,
+    invalidate_directory_scan,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -459,13 +462,21 @@ class ExtractReview(pyblish.api.InstancePlugin):
             # run subprocess
             self.log.debug("Executing: {}".format(subprcs_cmd))
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            run_subprocess(
+                subprcs_cmd, shell=True, logger=self.log, keep_output=False
+            )
 
             # delete files added to fill gaps
             if files_to_clean:
                 for f in files_to_clean:
                     os.unlink(f)
 
+            # Output and removed files changed content of staging dirs
+            invalidate_directory_scan(new_repre["stagingDir"])
+            invalidate_directory_scan(
+                temp_data["origin_repre"]["stagingDir"]
+            )
+
             new_repre.update({
                 "fps": temp_data["fps"],
                 "name": "{}_{}".format(output_name, output_ext),
@@ -909,28 +920,26 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Prepare which hole is filled with what frame
         #   - the frame is filled only with already existing frames
-        prev_frame = next(iter(col.indexes))
-        hole_frame_to_nearest = {}
-        for frame in range(int(start_frame), int(end_frame) + 1):
-            if frame in col.indexes:
-                prev_frame = frame
-            else:
-                # Use previous frame as source for hole
-                hole_frame_to_nearest[frame] = prev_frame
+        hole_frame_to_nearest = FrameRanges.from_collection(
+            col
+        ).get_previous_frames_for_gaps(int(start_frame), int(end_frame))
 
         # Calculate paths
         added_files = []
         col_format = col.format("{head}{padding}{tail}")
+        scan = get_directory_scan(staging_dir)
         for hole_frame, src_frame in hole_frame_to_nearest.items():
             hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
             src_fpath = os.path.join(staging_dir, col_format % src_frame)
-            if not os.path.isfile(src_fpath):
+            if not scan.has_file(col_format % src_frame):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
             speedcopy.copyfile(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
+        if added_files:
+            invalidate_directory_scan(staging_dir)
         return added_files
 
     def input_output_paths(self, new_repre, output_def, temp_data):
@@ -3,23 +3,35 @@
 import os
 import shutil
 
+import clique
 import pyblish.api
 
 from ayon_core.lib import (
-    run_subprocess,
     get_oiio_tool_args,
     ToolNotFoundError,
+    TranscodingScheduler,
+    get_frame_batches,
+    get_oiio_sequence_path,
 )
 from ayon_core.pipeline import KnownPublishError
 
 
 class ExtractScanlineExr(pyblish.api.InstancePlugin):
-    """Convert tiled EXRs to scanline using OIIO tool."""
+    """Convert tiled EXRs to scanline using OIIO tool.
+
+    Conversion of all representations of instance is scheduled at once.
+    Contiguous frames are converted in batches by single oiiotool process
+    and the batches run in parallel.
+    """
 
     label = "Extract Scanline EXR"
     hosts = ["shell"]
     order = pyblish.api.ExtractorOrder
     families = ["imagesequence", "render", "render2d", "source"]
+    # Parallel conversions and threads of each oiiotool process
+    #   - default of 'TranscodingScheduler' is used if not set
+    max_workers = 0
+    oiiotool_threads = 0
 
     def process(self, instance):
         """Plugin entry point."""
@@ -27,6 +39,14 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
         representations = instance.data["representations"]
 
         representations_new = []
+        scheduler = TranscodingScheduler(
+            max_workers=self.max_workers,
+            logger=self.log,
+            threads_per_job=self.oiiotool_threads,
+        )
+        converted_repres = []
+        # Pairs of temp and output paths
+        converted_files = []
 
         for repre in representations:
             self.log.debug(
@@ -57,33 +77,45 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
                 raise KnownPublishError("OIIO tool not found")
 
             for file in input_files:
-
                 original_name = os.path.join(stagingdir, file)
                 temp_name = os.path.join(stagingdir, "__{}".format(file))
                 # move original render to temp location
                 shutil.move(original_name, temp_name)
-                oiio_cmd = oiio_tool_args + [
-                    os.path.join(stagingdir, temp_name), "--scanline", "-o",
-                    os.path.join(stagingdir, original_name)
-                ]
-
-                subprocess_exr = " ".join(oiio_cmd)
-                self.log.debug(f"running: {subprocess_exr}")
-                run_subprocess(subprocess_exr, logger=self.log)
-
-                # raise error if there is no ouptput
-                if not os.path.exists(os.path.join(stagingdir, original_name)):
-                    self.log.error(
-                        ("File {} was not converted "
-                         "by oiio tool!").format(original_name))
-                    raise AssertionError("OIIO tool conversion failed")
-                else:
-                    try:
-                        os.remove(temp_name)
-                    except OSError as e:
-                        self.log.warning("Unable to delete temp file")
-                        self.log.warning(e)
+                converted_files.append((temp_name, original_name))
+
+            for input_path, output_path in self._get_batch_paths(
+                stagingdir, input_files
+            ):
+                scheduler.add_job(
+                    oiio_tool_args + [
+                        "--threads", str(scheduler.threads_per_job),
+                        input_path, "--scanline", "-o", output_path
+                    ],
+                    label=os.path.basename(output_path)
+                )
+            converted_repres.append(repre)
+
+        scheduler.run()
+        for job in scheduler.jobs:
+            self.log.debug(
+                "Converted {} in {:.2f}s".format(job.label, job.duration)
+            )
+
+        for temp_name, original_name in converted_files:
+            # raise error if there is no ouptput
+            if not os.path.exists(original_name):
+                self.log.error(
+                    ("File {} was not converted "
+                     "by oiio tool!").format(original_name))
+                raise AssertionError("OIIO tool conversion failed")
 
+            try:
+                os.remove(temp_name)
+            except OSError as e:
+                self.log.warning("Unable to delete temp file")
+                self.log.warning(e)
+
+        for repre in converted_repres:
             repre['name'] = 'exr'
             try:
                 repre['tags'].remove('toScanline')
@@ -92,3 +124,49 @@ class ExtractScanlineExr(pyblish.api.InstancePlugin):
                 pass
 
         instance.data["representations"] += representations_new
+
+    def _get_batch_paths(self, stagingdir, input_files):
+        """Input and output paths for each conversion batch.
+
+        Frames of sequence are split to batches of contiguous frames,
+        other files are converted one by one.
+
+        Args:
+            stagingdir (str): Directory with files.
+            input_files (list[str]): Original filenames.
+
+        Returns:
+            list[tuple[str, str]]: Pairs of temp input and output paths.
+        """
+        collections, remainders = clique.assemble(
+            input_files,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=1,
+            assume_padded_when_ambiguous=True,
+        )
+        output = []
+        for collection in collections:
+            for start, end in get_frame_batches(collection.indexes):
+                output.append((
+                    os.path.join(stagingdir, get_oiio_sequence_path(
+                        "__{}".format(collection.head),
+                        collection.tail,
+                        collection.padding,
+                        start,
+                        end,
+                    )),
+                    os.path.join(stagingdir, get_oiio_sequence_path(
+                        collection.head,
+                        collection.tail,
+                        collection.padding,
+                        start,
+                        end,
+                    )),
+                ))
+
+        for filename in remainders:
+            output.append((
+                os.path.join(stagingdir, "__{}".format(filename)),
+                os.path.join(stagingdir, filename),
+            ))
+        return output
@@ -1,7 +1,7 @@
 import os
 import copy
-import errno
 import shutil
+import itertools
 
 import clique
 import pyblish.api
@@ -12,11 +12,18 @@ from ayon_api.operations import (
 )
 from ayon_api.utils import create_entity_id
 
-from ayon_core.lib import create_hard_link, source_hash
+from ayon_core.lib import (
+    emit_event,
+    link_or_clone_files,
+    source_hash,
+)
 from ayon_core.pipeline.publish import (
     get_publish_template_name,
     OptionalPyblishPluginMixin,
 )
+from ayon_core.pipeline.load.entity_contexts import (
+    ENTITY_CONTEXTS_INVALIDATE_TOPIC,
+)
 
 
 def prepare_changes(old_entity, new_entity):
@@ -410,11 +417,12 @@ class IntegrateHeroVersion(
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            transfer_stats = link_or_clone_files(
+                itertools.chain(
+                    src_to_dst_file_paths, other_file_paths_mapping
+                )
+            )
+            self.log.debug(transfer_stats.format_summary())
 
             # Update prepared representation etity data with files
             #   and integrate it to server.
@@ -474,6 +482,23 @@ class IntegrateHeroVersion(
 
             op_session.commit()
 
+            # Hero version and its representations were updated in place
+            emit_event(
+                ENTITY_CONTEXTS_INVALIDATE_TOPIC,
+                {
+                    "project_name": project_name,
+                    "entity_type": "version",
+                    "entity_ids": [new_hero_version["id"]],
+                }
+            )
+            emit_event(
+                ENTITY_CONTEXTS_INVALIDATE_TOPIC,
+                {
+                    "project_name": project_name,
+                    "entity_type": "representation",
+                }
+            )
+
             # Remove backuped previous hero
             if (
                 backup_hero_publish_dir is not None and
@@ -603,40 +628,6 @@ class IntegrateHeroVersion(
             ).format(path))
         return path
 
-    def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
-        dirname = os.path.dirname(dst_path)
-
-        try:
-            os.makedirs(dirname)
-            self.log.debug("Folder(s) created: \"{}\"".format(dirname))
-        except OSError as exc:
-            if exc.errno != errno.EEXIST:
-                self.log.error("An unexpected error occurred.", exc_info=True)
-                raise
-
-            self.log.debug("Folder already exists: \"{}\"".format(dirname))
-
-        self.log.debug("Copying file \"{}\" to \"{}\"".format(
-            src_path, dst_path
-        ))
-
-        # First try hardlink and copy if paths are cross drive
-        try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
-
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
-
-        shutil.copy(src_path, dst_path)
-
     def version_from_representations(self, project_name, repres):
         for repre in repres:
             version = ayon_api.get_version_by_id(
@@ -0,0 +1,83 @@
+import os
+
+import pyblish.api
+
+from ayon_core.lib import check_image_files
+from ayon_core.lib.transcoding import IMAGE_EXTENSIONS
+from ayon_core.pipeline.publish import (
+    PublishValidationError,
+    ValidateContentsOrder,
+)
+
+
+class ValidateRenderedFrames(pyblish.api.InstancePlugin):
+    """Validate that rendered image files are complete.
+
+    Frames written by crashed render nodes may be missing, truncated or
+    partially written. Headers of all image files of representations
+    are checked in one pass before the files are transcoded or
+    integrated. OpenEXR files are checked by header and chunk offset
+    table, other formats are checked with oiiotool if is available.
+    """
+
+    order = ValidateContentsOrder
+    # Keep "filesequence" for backwards compatibility of older jobs
+    targets = ["filesequence", "farm"]
+    label = "Validate Rendered Frames"
+
+    # Maximum number of threads reading files
+    max_workers = 8
+    # Maximum number of invalid files listed in error message
+    max_reported_files = 20
+
+    def process(self, instance):
+        filepaths = []
+        for repre in instance.data.get("representations", []):
+            ext = "." + repre.get("ext", "").lower()
+            if ext not in IMAGE_EXTENSIONS:
+                continue
+
+            files = repre.get("files")
+            if not files:
+                continue
+            if isinstance(files, str):
+                files = [files]
+            staging_dir = repre.get("stagingDir", "")
+            filepaths.extend(
+                os.path.join(staging_dir, filename)
+                for filename in files
+            )
+
+        if not filepaths:
+            return
+
+        errors = check_image_files(filepaths, self.max_workers)
+        if not errors:
+            self.log.debug(
+                "Checked {} image files.".format(len(filepaths))
+            )
+            return
+
+        lines = [
+            "- {}: {}".format(filepath, message)
+            for filepath, message in sorted(errors.items())
+        ]
+        if len(lines) > self.max_reported_files:
+            skipped = len(lines) - self.max_reported_files
+            lines = lines[:self.max_reported_files]
+            lines.append("- ... and {} more".format(skipped))
+
+        self.log.error("\n".join(lines))
+        raise PublishValidationError(
+            "{} of {} rendered files are missing or corrupted.".format(
+                len(errors), len(filepaths)
+            ),
+            title=self.label,
+            description=(
+                "## Corrupted rendered frames\n\n"
+                "Some rendered files are missing, empty or were not"
+                " written completely, e.g. because render node crashed."
+                "\n\n{}\n\n### How to repair?\n\n"
+                "Render the listed frames again and restart publishing."
+            ).format("\n".join(lines))
+        )
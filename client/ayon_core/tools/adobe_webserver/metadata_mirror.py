@@ -0,0 +1,165 @@
+"""Stub side mirror of metadata stored in Adobe documents.
+
+Adobe extensions (Photoshop, AfterEffects) store publishing metadata as one
+JSON document. Server stubs have to read whole document and write it back
+for every single change. 'MetadataMirror' keeps the document on stub side
+during a transaction so multiple changes cost only one read and one write.
+"""
+import copy
+import contextlib
+
+
+class MetadataMirror(object):
+    """Metadata of a document mirrored on stub side during transactions.
+
+    Metadata items are indexed by id of first member (layer or item id)
+    and by instance id. Mirror is filled on first access inside of a
+    transaction and changes are written when the outermost transaction
+    ends.
+
+    Args:
+        read_func (Callable[[], list[dict]]): Read metadata items from
+            document.
+        write_func (Callable[[list[dict]], Any]): Write metadata items
+            to document.
+    """
+
+    def __init__(self, read_func, write_func):
+        self._read_func = read_func
+        self._write_func = write_func
+
+        self._depth = 0
+        self._items = None
+        self._index = {}
+        self._changed = False
+
+    @property
+    def is_active(self):
+        """Transaction is in progress.
+
+        Returns:
+            bool: Changes are collected in mirror.
+        """
+        return self._depth > 0
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Collect metadata changes and write them to document at once.
+
+        Changes collected before an exception was raised inside the context
+        are written too, same as they would be without the transaction.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                try:
+                    if self._changed:
+                        self._write_func(self._items)
+                finally:
+                    self._items = None
+                    self._index = {}
+                    self._changed = False
+
+    def get_items(self):
+        """Metadata items of document.
+
+        Returns:
+            list[dict]: Copy of mirrored metadata items.
+        """
+        return copy.deepcopy(self._get_items())
+
+    def find_member_item(self, member_id):
+        """Find metadata item by id of its first member.
+
+        Mirror is not filled by this method, None is returned if metadata
+        were not read yet.
+
+        Args:
+            member_id (Union[str, int]): Layer or item id.
+
+        Returns:
+            Union[dict, None]: Copy of metadata item or None.
+        """
+        member_id = str(member_id)
+        for item in self._index.get(member_id, []):
+            members = item.get("members")
+            if members and str(members[0]) == member_id:
+                return copy.deepcopy(item)
+        return None
+
+    def imprint(self, item_id, data):
+        """Update, add or remove (with empty data) metadata item.
+
+        Args:
+            item_id (Union[str, int]): Member or instance id.
+            data (dict): Data to store, empty data removes the item.
+        """
+        data = copy.deepcopy(data)
+        items = self._get_items()
+        matching = self._index.get(str(item_id))
+        if not matching:
+            items.append(data)
+            for key in self._get_keys(data):
+                self._index.setdefault(key, []).append(data)
+
+        elif data:
+            for item in matching:
+                item.update(data)
+            # Keys might have changed with the update
+            self._set_items(items)
+
+        else:
+            matching_ids = {id(item) for item in matching}
+            self._set_items([
+                item
+                for item in items
+                if id(item) not in matching_ids
+            ])
+        self._changed = True
+
+    def remove_instance(self, instance_id):
+        """Remove metadata items of an instance.
+
+        Args:
+            instance_id (str): Instance id ('instance_id' or 'uuid').
+        """
+        items = self._get_items()
+        cleaned_items = [
+            item
+            for item in items
+            if (item.get("instance_id") or item.get("uuid")) != instance_id
+        ]
+        if len(cleaned_items) != len(items):
+            self._set_items(cleaned_items)
+            self._changed = True
+
+    def _get_items(self):
+        if self._items is None:
+            self._set_items(self._read_func())
+        return self._items
+
+    def _set_items(self, items):
+        self._items = items
+        self._index = {}
+        for item in items:
+            for key in self._get_keys(item):
+                self._index.setdefault(key, []).append(item)
+
+    @staticmethod
+    def _get_keys(item):
+        """Identifiers under which metadata item can be found by 'imprint'.
+
+        Returns:
+            set[str]: Id of first member and instance id.
+        """
+        keys = set()
+        members = item.get("members")
+        if members:
+            keys.add(str(members[0]))
+        instance_id = item.get("instance_id")
+        if instance_id:
+            keys.add(str(instance_id))
+        return keys
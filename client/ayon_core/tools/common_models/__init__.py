@@ -8,6 +8,7 @@ from .projects import (
 )
 from .hierarchy import (
     FolderItem,
+    FolderHierarchyStore,
     TaskItem,
     HierarchyModel,
     HIERARCHY_MODEL_SENDER,
@@ -25,6 +26,7 @@ __all__ = (
     "PROJECTS_MODEL_SENDER",
 
     "FolderItem",
+    "FolderHierarchyStore",
     "TaskItem",
     "HierarchyModel",
     "HIERARCHY_MODEL_SENDER",
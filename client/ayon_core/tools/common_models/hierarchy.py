@@ -1,4 +1,13 @@
+import os
+import sys
+import json
+import gzip
+import time
+import array
+import hashlib
+import datetime
 import collections
+import collections.abc
 import contextlib
 from abc import ABCMeta, abstractmethod
 
@@ -6,9 +15,11 @@ import ayon_api
 import six
 
 from ayon_core.style import get_default_entity_icon_color
-from ayon_core.lib import NestedCacheItem
+from ayon_core.lib import Logger, NestedCacheItem
+from ayon_core.lib.local_settings import get_ayon_appdirs
 
 HIERARCHY_MODEL_SENDER = "hierarchy.model"
+FOLDER_FIELDS = ["id", "name", "label", "parentId", "path", "folderType"]
 
 
 @six.add_metaclass(ABCMeta)
@@ -82,6 +93,450 @@ class FolderItem:
         return cls(**data)
 
 
+class FolderHierarchyStore(collections.abc.Mapping):
+    """Compact hierarchy of folders in a project.
+
+    Folders are stored in columns (ids, parent indexes, names, labels and
+    folder types) instead of object per folder. Parent is always stored
+    before its children. Paths, children lookup and 'FolderItem' objects
+    are created on demand.
+
+    Store behaves as read-only mapping of 'FolderItem' by folder id, so
+    it can be used where dictionary of folder items is expected.
+
+    Args:
+        ids (list[str]): Folder ids.
+        parent_indexes (Iterable[int]): Index of parent folder for each
+            folder. '-1' is used for folders under project.
+        names (list[str]): Folder names.
+        labels (list[Union[str, None]]): Folder labels. 'None' is used when
+            label is same as name.
+        folder_types (list[str]): Folder types.
+        timestamp (Optional[float]): Time when data were received from
+            server. Used as start of next folder events query.
+        full_timestamp (Optional[float]): Time when full hierarchy was
+            queried. Same as 'timestamp' if not passed.
+    """
+
+    snapshot_version = 2
+
+    def __init__(
+        self,
+        ids,
+        parent_indexes,
+        names,
+        labels,
+        folder_types,
+        timestamp=None,
+        full_timestamp=None,
+    ):
+        if timestamp is None:
+            timestamp = time.time()
+        if full_timestamp is None:
+            full_timestamp = timestamp
+        self._ids = ids
+        self._parent_indexes = array.array("l", parent_indexes)
+        self._names = names
+        self._labels = labels
+        self._folder_types = [
+            sys.intern(folder_type) for folder_type in folder_types
+        ]
+        self.timestamp = timestamp
+        self.full_timestamp = full_timestamp
+
+        self._index_by_id = {
+            folder_id: idx
+            for idx, folder_id in enumerate(ids)
+        }
+        self._paths = None
+        self._index_by_path = None
+        self._children_offsets = None
+        self._children_indexes = None
+        self._items_by_index = {}
+
+    def __getitem__(self, folder_id):
+        return self._get_item(self._index_by_id[folder_id])
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, folder_id):
+        return folder_id in self._index_by_id
+
+    def get_parent_id(self, folder_id):
+        """Parent folder id.
+
+        Args:
+            folder_id (str): Folder id.
+
+        Returns:
+            Union[str, None]: Parent id or 'None' if parent is project.
+        """
+
+        parent_idx = self._parent_indexes[self._index_by_id[folder_id]]
+        if parent_idx < 0:
+            return None
+        return self._ids[parent_idx]
+
+    def get_ancestor_ids(self, folder_id):
+        """Ids of all parents of folder.
+
+        Args:
+            folder_id (str): Folder id.
+
+        Returns:
+            list[str]: Ancestor ids ordered from top of hierarchy.
+        """
+
+        output = []
+        idx = self._parent_indexes[self._index_by_id[folder_id]]
+        while idx >= 0:
+            output.append(self._ids[idx])
+            idx = self._parent_indexes[idx]
+        output.reverse()
+        return output
+
+    def get_children_ids(self, folder_id):
+        """Ids of direct children of folder.
+
+        Args:
+            folder_id (Union[str, None]): Folder id or 'None' for folders
+                under project.
+
+        Returns:
+            list[str]: Children folder ids.
+        """
+
+        start, end = self._get_children_range(folder_id)
+        return [
+            self._ids[idx]
+            for idx in self._children_indexes[start:end]
+        ]
+
+    def has_children(self, folder_id):
+        start, end = self._get_children_range(folder_id)
+        return end > start
+
+    def get_folder_path(self, folder_id):
+        return self._get_paths()[self._index_by_id[folder_id]]
+
+    def get_folder_id_by_path(self, folder_path):
+        """Folder id by folder path.
+
+        Args:
+            folder_path (str): Folder path.
+
+        Returns:
+            Union[str, None]: Folder id or 'None' if path is not available.
+        """
+
+        if self._index_by_path is None:
+            self._index_by_path = {
+                path: idx
+                for idx, path in enumerate(self._get_paths())
+            }
+        idx = self._index_by_path.get(folder_path)
+        if idx is None:
+            return None
+        return self._ids[idx]
+
+    def get_matching_folder_ids(self, text):
+        """Ids of folders with label containing text.
+
+        Args:
+            text (str): Text to look for. Case is ignored.
+
+        Returns:
+            list[str]: Matching folder ids.
+        """
+
+        text = text.lower()
+        return [
+            folder_id
+            for folder_id, name, label in zip(
+                self._ids, self._names, self._labels
+            )
+            if text in (label or name).lower()
+        ]
+
+    def to_data(self):
+        """Convert store to data that can be stored as json.
+
+        Returns:
+            dict[str, Any]: Store data.
+        """
+
+        return {
+            "version": self.snapshot_version,
+            "timestamp": self.timestamp,
+            "full_timestamp": self.full_timestamp,
+            "ids": self._ids,
+            "parent_indexes": self._parent_indexes.tolist(),
+            "names": self._names,
+            "labels": self._labels,
+            "folder_types": self._folder_types,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        """Re-create store from data.
+
+        Args:
+            data (dict[str, Any]): Data created with 'to_data'.
+
+        Returns:
+            Union[FolderHierarchyStore, None]: Store or 'None' if data
+                were created by different version.
+        """
+
+        if data.get("version") != cls.snapshot_version:
+            return None
+        return cls(
+            data["ids"],
+            data["parent_indexes"],
+            data["names"],
+            data["labels"],
+            data["folder_types"],
+            data["timestamp"],
+            data["full_timestamp"],
+        )
+
+    def save_snapshot(self, path):
+        """Store data to a file.
+
+        File is replaced at once so readers never see partial data.
+
+        Args:
+            path (str): Path to file.
+        """
+
+        dirpath = os.path.dirname(path)
+        os.makedirs(dirpath, exist_ok=True)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with gzip.open(
+            tmp_path, "wt", compresslevel=1, encoding="utf-8"
+        ) as stream:
+            json.dump(self.to_data(), stream)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """Load store from a file created by 'save_snapshot'.
+
+        Args:
+            path (str): Path to file.
+
+        Returns:
+            Union[FolderHierarchyStore, None]: Store or 'None' if file is
+                not available or is not valid.
+        """
+
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as stream:
+                data = json.load(stream)
+            return cls.from_data(data)
+        except Exception:
+            return None
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy, timestamp=None):
+        """Create store from 'get_folders_hierarchy' output.
+
+        Args:
+            hierarchy (dict[str, Any]): Project hierarchy.
+            timestamp (Optional[float]): Time when hierarchy was queried.
+
+        Returns:
+            FolderHierarchyStore: Store with folders.
+        """
+
+        ids = []
+        parent_indexes = []
+        names = []
+        labels = []
+        folder_types = []
+        hierarchy_queue = collections.deque(
+            (item, -1) for item in hierarchy["hierarchy"]
+        )
+        while hierarchy_queue:
+            item, parent_idx = hierarchy_queue.popleft()
+            idx = len(ids)
+            name = item["name"]
+            label = item["label"]
+            if label == name:
+                label = None
+            ids.append(item["id"])
+            parent_indexes.append(parent_idx)
+            names.append(name)
+            labels.append(label)
+            folder_types.append(item["folderType"])
+            for child in item["children"] or []:
+                hierarchy_queue.append((child, idx))
+        return cls(
+            ids, parent_indexes, names, labels, folder_types, timestamp
+        )
+
+    @classmethod
+    def from_folders(cls, folders, timestamp=None, full_timestamp=None):
+        """Create store from folder entities.
+
+        Folders with parent that is not available are skipped.
+
+        Args:
+            folders (Iterable[dict[str, Any]]): Folder entities with fields
+                'id', 'parentId', 'name', 'label' and 'folderType'.
+            timestamp (Optional[float]): Time when folders were queried.
+            full_timestamp (Optional[float]): Time when full hierarchy
+                was queried.
+
+        Returns:
+            FolderHierarchyStore: Store with folders.
+        """
+
+        rows_by_parent_id = collections.defaultdict(list)
+        for folder in folders:
+            name = folder["name"]
+            label = folder["label"]
+            if label == name:
+                label = None
+            rows_by_parent_id[folder["parentId"]].append((
+                folder["id"], name, label, folder["folderType"]
+            ))
+
+        ids = []
+        parent_indexes = []
+        names = []
+        labels = []
+        folder_types = []
+        hierarchy_queue = collections.deque([(None, -1)])
+        while hierarchy_queue:
+            parent_id, parent_idx = hierarchy_queue.popleft()
+            for row in rows_by_parent_id.pop(parent_id, []):
+                folder_id, name, label, folder_type = row
+                hierarchy_queue.append((folder_id, len(ids)))
+                ids.append(folder_id)
+                parent_indexes.append(parent_idx)
+                names.append(name)
+                labels.append(label)
+                folder_types.append(folder_type)
+        return cls(
+            ids,
+            parent_indexes,
+            names,
+            labels,
+            folder_types,
+            timestamp,
+            full_timestamp,
+        )
+
+    def with_changes(self, folders, removed_ids, timestamp=None):
+        """Create new store with changed folders.
+
+        Args:
+            folders (Iterable[dict[str, Any]]): Created or changed folder
+                entities.
+            removed_ids (Iterable[str]): Ids of removed folders. Children
+                of removed folders are removed too.
+            timestamp (Optional[float]): Time when changes were queried.
+
+        Returns:
+            FolderHierarchyStore: New store. Time of full hierarchy query
+                is kept from this store.
+        """
+
+        folders_by_id = {
+            idx_folder_id: {
+                "id": idx_folder_id,
+                "parentId": (
+                    self._ids[parent_idx] if parent_idx >= 0 else None
+                ),
+                "name": name,
+                "label": label or name,
+                "folderType": folder_type,
+            }
+            for idx_folder_id, parent_idx, name, label, folder_type in zip(
+                self._ids,
+                self._parent_indexes,
+                self._names,
+                self._labels,
+                self._folder_types,
+            )
+        }
+        for folder_id in removed_ids:
+            folders_by_id.pop(folder_id, None)
+        for folder in folders:
+            folders_by_id[folder["id"]] = folder
+        return self.from_folders(
+            folders_by_id.values(), timestamp, self.full_timestamp
+        )
+
+    def _get_item(self, idx):
+        item = self._items_by_index.get(idx)
+        if item is None:
+            parent_idx = self._parent_indexes[idx]
+            parent_id = None
+            if parent_idx >= 0:
+                parent_id = self._ids[parent_idx]
+            item = FolderItem(
+                self._ids[idx],
+                parent_id,
+                self._names[idx],
+                self._get_paths()[idx],
+                self._folder_types[idx],
+                self._labels[idx],
+                None,
+            )
+            self._items_by_index[idx] = item
+        return item
+
+    def _get_paths(self):
+        if self._paths is None:
+            paths = []
+            for parent_idx, name in zip(self._parent_indexes, self._names):
+                parent_path = ""
+                if parent_idx >= 0:
+                    parent_path = paths[parent_idx]
+                paths.append("{}/{}".format(parent_path, name))
+            self._paths = paths
+        return self._paths
+
+    def _get_children_range(self, folder_id):
+        if self._children_offsets is None:
+            self._build_children_index()
+        # Offset '0' is used for folders under project
+        offset_idx = 0
+        if folder_id is not None:
+            offset_idx = self._index_by_id[folder_id] + 1
+        return (
+            self._children_offsets[offset_idx],
+            self._children_offsets[offset_idx + 1]
+        )
+
+    def _build_children_index(self):
+        # Counting sort of folder indexes by parent index
+        count = len(self._ids)
+        offsets = array.array("l", [0]) * (count + 2)
+        for parent_idx in self._parent_indexes:
+            offsets[parent_idx + 2] += 1
+        for idx in range(2, count + 2):
+            offsets[idx] += offsets[idx - 1]
+
+        positions = array.array("l", offsets)
+        children_indexes = array.array("l", [0]) * count
+        for idx, parent_idx in enumerate(self._parent_indexes):
+            position = positions[parent_idx + 1]
+            children_indexes[position] = idx
+            positions[parent_idx + 1] = position + 1
+
+        self._children_offsets = offsets
+        self._children_indexes = children_indexes
+
+
 class TaskItem:
     """Task item representing task entity on a server.
 
@@ -186,22 +641,6 @@ def _get_task_items_from_tasks(tasks):
     return output
 
 
-def _get_folder_item_from_hierarchy_item(item):
-    name = item["name"]
-    path_parts = list(item["parents"])
-    path_parts.append(name)
-    path = "/" + "/".join(path_parts)
-    return FolderItem(
-        item["id"],
-        item["parentId"],
-        name,
-        path,
-        item["folderType"],
-        item["label"],
-        None,
-    )
-
-
 def _get_folder_item_from_entity(entity):
     name = entity["name"]
     return FolderItem(
@@ -215,13 +654,49 @@ def _get_folder_item_from_entity(entity):
     )
 
 
+def _get_folders_snapshot_path(project_name):
+    """Path to snapshot of project folders hierarchy.
+
+    Snapshots are stored per server url and user because user may not have
+    access to all folders.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        str: Path to snapshot file.
+    """
+
+    con = ayon_api.get_server_api_connection()
+    server_key = hashlib.sha1(
+        "{}|{}".format(con.get_base_url(), con.username).encode("utf-8")
+    ).hexdigest()[:16]
+    return get_ayon_appdirs(
+        "cache",
+        "folders_hierarchy",
+        server_key,
+        "{}.json.gz".format(project_name)
+    )
+
+
 class HierarchyModel(object):
     """Model for project hierarchy items.
 
     Hierarchy items are folders and tasks. Folders can have as parent another
     folder or project. Tasks can have as parent only folder.
+
+    Folders hierarchy is stored to a snapshot on disk. When folders are
+    refreshed, the snapshot is updated using folder events created since
+    the snapshot was made, and full hierarchy is queried only if the
+    snapshot is too old or there are too many changes.
     """
     lifetime = 60  # A minute
+    # Full hierarchy is queried at least once a day
+    snapshot_max_age = 60 * 60 * 24
+    # Query full hierarchy if more folders than this changed
+    max_incremental_changes = 1000
+    # Events are queried with overlap to handle time difference to server
+    events_time_margin = 60 * 5
 
     def __init__(self, controller):
         self._folders_items = NestedCacheItem(
@@ -237,6 +712,13 @@ class HierarchyModel(object):
         self._folders_refreshing = set()
         self._tasks_refreshing = set()
         self._controller = controller
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
 
     def reset(self):
         self._folders_items.reset()
@@ -265,7 +747,8 @@ class HierarchyModel(object):
             sender (Union[str, None]): Who requested the folder ids.
 
         Returns:
-            dict[str, FolderItem]: Folder items by id.
+            Union[FolderHierarchyStore, dict[str, FolderItem]]: Folder
+                items by id.
         """
 
         if not self._folders_items[project_name].is_valid:
@@ -296,7 +779,7 @@ class HierarchyModel(object):
         folders = ayon_api.get_folders(
             project_name,
             folder_ids=folder_ids,
-            fields=["id", "name", "label", "parentId", "path", "folderType"]
+            fields=FOLDER_FIELDS
         )
         # Make sure all folder ids are in output
         output = {folder_id: None for folder_id in folder_ids}
@@ -327,14 +810,15 @@ class HierarchyModel(object):
 
         if self._folders_items[project_name].is_valid:
             cache_data = self._folders_items[project_name].get_data()
-            for folder_item in cache_data.values():
-                if folder_item.path in folder_paths:
-                    output[folder_item.path] = folder_item
+            for folder_path in folder_paths:
+                folder_id = cache_data.get_folder_id_by_path(folder_path)
+                if folder_id is not None:
+                    output[folder_path] = cache_data[folder_id]
             return output
         folders = ayon_api.get_folders(
             project_name,
             folder_paths=folder_paths,
-            fields=["id", "name", "label", "parentId", "path", "folderType"]
+            fields=FOLDER_FIELDS
         )
         # Make sure all folder ids are in output
         for folder in folders:
@@ -525,16 +1009,87 @@ class HierarchyModel(object):
             self._folders_items[project_name].update_data(folder_items)
 
     def _query_folders(self, project_name):
-        hierarchy = ayon_api.get_folders_hierarchy(project_name)
-
-        folder_items = {}
-        hierachy_queue = collections.deque(hierarchy["hierarchy"])
-        while hierachy_queue:
-            item = hierachy_queue.popleft()
-            folder_item = _get_folder_item_from_hierarchy_item(item)
-            folder_items[folder_item.entity_id] = folder_item
-            hierachy_queue.extend(item["children"] or [])
-        return folder_items
+        snapshot_path = _get_folders_snapshot_path(project_name)
+        prev_store = self._folders_items[project_name].get_data()
+        if not isinstance(prev_store, FolderHierarchyStore):
+            prev_store = FolderHierarchyStore.load_snapshot(snapshot_path)
+
+        store = None
+        if (
+            prev_store is not None
+            and (
+                time.time() - prev_store.full_timestamp
+                < self.snapshot_max_age
+            )
+        ):
+            try:
+                store = self._query_folders_changes(project_name, prev_store)
+            except Exception:
+                self.log.warning(
+                    "Failed to update folders of project '{}'.".format(
+                        project_name
+                    ),
+                    exc_info=True
+                )
+
+        if store is None:
+            timestamp = time.time()
+            hierarchy = ayon_api.get_folders_hierarchy(project_name)
+            store = FolderHierarchyStore.from_hierarchy(hierarchy, timestamp)
+
+        if store is prev_store:
+            return store
+
+        try:
+            store.save_snapshot(snapshot_path)
+        except Exception:
+            self.log.debug(
+                "Failed to store folders snapshot to '{}'.".format(
+                    snapshot_path
+                ),
+                exc_info=True
+            )
+        return store
+
+    def _query_folders_changes(self, project_name, store):
+        """Apply changes of folders made since store was created.
+
+        Args:
+            project_name (str): Project name.
+            store (FolderHierarchyStore): Previous folders hierarchy.
+
+        Returns:
+            Union[FolderHierarchyStore, None]: Updated store or 'None' if
+                full hierarchy should be queried.
+        """
+
+        timestamp = time.time()
+        newer_than = datetime.datetime.fromtimestamp(
+            store.timestamp - self.events_time_margin,
+            datetime.timezone.utc
+        ).isoformat()
+        changed_ids = set()
+        for event in ayon_api.get_events(
+            topics=["entity.folder.*"],
+            project_names=[project_name],
+            newer_than=newer_than,
+        ):
+            folder_id = (event.get("summary") or {}).get("entityId")
+            if not folder_id:
+                return None
+            changed_ids.add(folder_id)
+            if len(changed_ids) > self.max_incremental_changes:
+                return None
+
+        if not changed_ids:
+            store.timestamp = timestamp
+            return store
+
+        folders = list(ayon_api.get_folders(
+            project_name, folder_ids=changed_ids, fields=FOLDER_FIELDS
+        ))
+        removed_ids = changed_ids - {folder["id"] for folder in folders}
+        return store.with_changes(folders, removed_ids, timestamp)
 
     def _query_folder_entities(self, project_name, folder_ids):
         if not project_name or not folder_ids:
@@ -48,6 +48,8 @@ class ProductItem:
         folder_id (str): Folder id.
         folder_label (str): Folder label.
         version_items (dict[str, VersionItem]): Version items by id.
+        versions_complete (Optional[bool]): All versions of product are
+            in 'version_items'. Only last version is available otherwise.
     """
 
     def __init__(
@@ -62,6 +64,7 @@ class ProductItem:
         folder_id,
         folder_label,
         version_items,
+        versions_complete=True,
     ):
         self.product_id = product_id
         self.product_type = product_type
@@ -73,6 +76,7 @@ class ProductItem:
         self.folder_id = folder_id
         self.folder_label = folder_label
         self.version_items = version_items
+        self.versions_complete = versions_complete
 
     def to_data(self):
         return {
@@ -89,6 +93,7 @@ class ProductItem:
                 version_id: version_item.to_data()
                 for version_id, version_item in self.version_items.items()
             },
+            "versions_complete": self.versions_complete,
         }
 
     @classmethod
@@ -511,6 +516,49 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def iter_product_items(self, project_name, folder_ids, sender=None):
+        """Product items for folder ids in pages.
+
+        Product items contain only last version. Use 'get_version_items'
+        to receive all versions of a product.
+
+        Triggers event topics "products.refresh.started",
+        "products.refresh.page" and "products.refresh.finished" when
+        products are queried from server. Page event has additionally
+        'product_ids' in data.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Optional[str]): Sender who requested the items.
+
+        Returns:
+            Generator[list[ProductItem], None, None]: Pages of product
+                items.
+        """
+
+        pass
+
+    @abstractmethod
+    def get_version_items(self, project_name, product_ids, sender=None):
+        """All version items of products.
+
+        Received version items are cached, product items received before
+            are not modified. 'get_product_item' returns product item with
+            all versions once they were received.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (Iterable[str]): Product ids.
+            sender (Optional[str]): Sender who requested the items.
+
+        Returns:
+            dict[str, list[VersionItem]]: Version items by product id.
+        """
+
+        pass
+
     @abstractmethod
     def get_product_item(self, project_name, product_id):
         """Receive single product item.
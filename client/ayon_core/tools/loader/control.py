@@ -187,6 +187,14 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
         return self._products_model.get_product_items(
             project_name, folder_ids, sender)
 
+    def iter_product_items(self, project_name, folder_ids, sender=None):
+        return self._products_model.iter_product_items(
+            project_name, folder_ids, sender)
+
+    def get_version_items(self, project_name, product_ids, sender=None):
+        return self._products_model.get_version_items(
+            project_name, product_ids, sender)
+
     def get_product_item(self, project_name, product_id):
         return self._products_model.get_product_item(
             project_name, product_id
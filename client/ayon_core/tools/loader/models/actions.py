@@ -4,8 +4,6 @@ import inspect
 import collections
 import uuid
 
-import ayon_api
-
 from ayon_core.lib import NestedCacheItem
 from ayon_core.pipeline.load import (
     discover_loader_plugins,
@@ -18,6 +16,7 @@ from ayon_core.pipeline.load import (
     LoadError,
     IncompatibleLoaderError,
 )
+from ayon_core.pipeline.load.entity_contexts import get_entity_contexts_store
 from ayon_core.tools.loader.abstract import ActionItem
 
 ACTIONS_MODEL_SENDER = "actions.model"
@@ -58,6 +57,7 @@ class LoaderActionsModel:
         self._loaders_by_identifier.reset()
         self._product_loaders.reset()
         self._repre_loaders.reset()
+        get_entity_contexts_store().invalidate()
 
     def get_versions_action_items(self, project_name, version_ids):
         """Get action items for given version ids.
@@ -383,60 +383,15 @@ class LoaderActionsModel:
         if not project_name and not version_ids:
             return version_context_by_id, repre_context_by_id
 
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {}
-        version_entities_by_product_id = collections.defaultdict(list)
-        for version_entity in version_entities:
-            version_id = version_entity["id"]
-            product_id = version_entity["productId"]
-            version_entities_by_id[version_id] = version_entity
-            version_entities_by_product_id[product_id].append(version_entity)
-
-        _product_ids = set(version_entities_by_product_id.keys())
-        _product_entities = ayon_api.get_products(
-            project_name, product_ids=_product_ids
+        store = get_entity_contexts_store()
+        version_context_by_id = store.get_version_contexts(
+            project_name, version_ids
         )
-        product_entities_by_id = {p["id"]: p for p in _product_entities}
-
-        _folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        _folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=_folder_ids
+        repre_context_by_id = (
+            store.get_representation_contexts_by_version_ids(
+                project_name, version_context_by_id.keys()
+            )
         )
-        folder_entities_by_id = {f["id"]: f for f in _folder_entities}
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for version_id, version_entity in version_entities_by_id.items():
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            version_context_by_id[version_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-            }
-
-        repre_entities = ayon_api.get_representations(
-            project_name, version_ids=version_ids)
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
 
         return version_context_by_id, repre_context_by_id
 
@@ -464,59 +419,18 @@ class LoaderActionsModel:
         if not project_name and not repre_ids:
             return product_context_by_id, repre_context_by_id
 
-        repre_entities = list(ayon_api.get_representations(
-            project_name, representation_ids=repre_ids
-        ))
-        version_ids = {r["versionId"] for r in repre_entities}
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {
-            v["id"]: v for v in version_entities
-        }
-
-        product_ids = {v["productId"] for v in version_entities_by_id.values()}
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {
-            p["id"]: p for p in product_entities
-        }
-
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        store = get_entity_contexts_store()
+        repre_context_by_id = store.get_representation_contexts(
+            project_name, repre_ids
         )
-        folder_entities_by_id = {
-            f["id"]: f for f in folder_entities
-        }
-
-        project_entity = ayon_api.get_project(project_name)
-
-        for product_id, product_entity in product_entities_by_id.items():
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            product_context_by_id[product_id] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-            }
-
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-
-            repre_context_by_id[repre_entity["id"]] = {
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            }
+        for repre_context in repre_context_by_id.values():
+            product_id = repre_context["product"]["id"]
+            if product_id not in product_context_by_id:
+                product_context_by_id[product_id] = {
+                    "project": repre_context["project"],
+                    "folder": repre_context["folder"],
+                    "product": repre_context["product"],
+                }
         return product_context_by_id, repre_context_by_id
 
     def _get_action_items_for_contexts(
@@ -626,33 +540,11 @@ class LoaderActionsModel:
             version_ids (Iterable[str]): Version ids.
         """
 
-        project_entity = ayon_api.get_project(project_name)
-
-        version_entities = list(ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        ))
-        product_ids = {v["productId"] for v in version_entities}
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in product_entities}
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        store = get_entity_contexts_store()
+        version_context_by_id = store.get_version_contexts(
+            project_name, version_ids
         )
-        folder_entities_by_id = {f["id"]: f for f in folder_entities}
-        product_contexts = []
-        for version_entity in version_entities:
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            product_contexts.append({
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-            })
+        product_contexts = list(version_context_by_id.values())
 
         return self._load_products_by_loader(
             loader, product_contexts, options
@@ -678,42 +570,11 @@ class LoaderActionsModel:
             representation_ids (Iterable[str]): Representation ids.
         """
 
-        project_entity = ayon_api.get_project(project_name)
-        repre_entities = list(ayon_api.get_representations(
-            project_name, representation_ids=representation_ids
-        ))
-        version_ids = {r["versionId"] for r in repre_entities}
-        version_entities = ayon_api.get_versions(
-            project_name, version_ids=version_ids
-        )
-        version_entities_by_id = {v["id"]: v for v in version_entities}
-        product_ids = {
-            v["productId"] for v in version_entities_by_id.values()
-        }
-        product_entities = ayon_api.get_products(
-            project_name, product_ids=product_ids
-        )
-        product_entities_by_id = {p["id"]: p for p in product_entities}
-        folder_ids = {p["folderId"] for p in product_entities_by_id.values()}
-        folder_entities = ayon_api.get_folders(
-            project_name, folder_ids=folder_ids
+        store = get_entity_contexts_store()
+        repre_context_by_id = store.get_representation_contexts(
+            project_name, representation_ids
         )
-        folder_entities_by_id = {f["id"]: f for f in folder_entities}
-        repre_contexts = []
-        for repre_entity in repre_entities:
-            version_id = repre_entity["versionId"]
-            version_entity = version_entities_by_id[version_id]
-            product_id = version_entity["productId"]
-            product_entity = product_entities_by_id[product_id]
-            folder_id = product_entity["folderId"]
-            folder_entity = folder_entities_by_id[folder_id]
-            repre_contexts.append({
-                "project": project_entity,
-                "folder": folder_entity,
-                "product": product_entity,
-                "version": version_entity,
-                "representation": repre_entity,
-            })
+        repre_contexts = list(repre_context_by_id.values())
 
         return self._load_representations_by_loader(
             loader, repre_contexts, options
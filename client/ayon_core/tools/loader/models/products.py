@@ -1,3 +1,5 @@
+import copy
+import itertools
 import collections
 import contextlib
 
@@ -73,6 +75,7 @@ def product_item_from_entity(
     product_type_items_by_name,
     folder_label,
     product_in_scene,
+    versions_complete=True,
 ):
     product_attribs = product_entity["attrib"]
     group = product_attribs.get("productGroup")
@@ -109,6 +112,7 @@ def product_item_from_entity(
         folder_id=product_entity["folderId"],
         folder_label=folder_label,
         version_items=version_items,
+        versions_complete=versions_complete,
     )
 
 
@@ -140,12 +144,17 @@ class ProductsModel:
     All of the entities are product based. This model prepares data for UI
     and caches it for faster access.
 
+    Products are queried in pages with only last version of each product.
+    All versions of a product are queried on demand.
+
     Note:
         Data are not used for actions model because that would require to
             break OpenPype compatibility of 'LoaderPlugin's.
     """
 
     lifetime = 60  # In seconds (minute by default)
+    # Number of products queried at once
+    page_size = 200
 
     def __init__(self, controller):
         self._controller = controller
@@ -163,6 +172,10 @@ class ProductsModel:
             levels=2, default_factory=dict, lifetime=self.lifetime)
         self._repre_items_cache = NestedCacheItem(
             levels=2, default_factory=dict, lifetime=self.lifetime)
+        # All version items of products received in pages, cached product
+        #   items are not modified
+        self._version_items_cache = NestedCacheItem(
+            levels=2, default_factory=dict, lifetime=self.lifetime)
 
     def reset(self):
         """Reset model with all cached data."""
@@ -174,6 +187,7 @@ class ProductsModel:
         self._product_type_items_cache.reset()
         self._product_items_cache.reset()
         self._repre_items_cache.reset()
+        self._version_items_cache.reset()
 
     def get_product_type_items(self, project_name):
         """Product type items for project.
@@ -212,25 +226,131 @@ class ProductsModel:
             list[ProductItem]: Product items.
         """
 
+        output = []
+        for product_items in self._iter_product_items(
+            project_name, folder_ids, sender, last_versions_only=False
+        ):
+            output.extend(product_items)
+
+        # Cached items from paged refresh contain only last version
+        incomplete_product_ids = {
+            product_item.product_id
+            for product_item in output
+            if not product_item.versions_complete
+        }
+        if not incomplete_product_ids:
+            return output
+
+        version_items_by_product_id = self.get_version_items(
+            project_name, incomplete_product_ids, sender
+        )
+        return [
+            self._get_complete_product_item(
+                product_item, version_items_by_product_id
+            )
+            for product_item in output
+        ]
+
+    def iter_product_items(self, project_name, folder_ids, sender):
+        """Product items for project and folder ids in pages.
+
+        Cached product items are returned in first page. Products of folders
+        which are not cached are queried in pages, and are stored to cache
+        when all pages are received.
+
+        Product items contain only last version, all versions can be
+        received with 'get_version_items'.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Union[str, None]): Who triggered the method.
+
+        Returns:
+            Generator[list[ProductItem], None, None]: Pages of product
+                items.
+        """
+
+        return self._iter_product_items(
+            project_name, folder_ids, sender, last_versions_only=True
+        )
+
+    def _iter_product_items(
+        self, project_name, folder_ids, sender, last_versions_only
+    ):
         if not project_name or not folder_ids:
-            return []
+            return
 
         project_cache = self._product_items_cache[project_name]
-        output = []
+        cached_items = []
         folder_ids_to_update = set()
         for folder_id in folder_ids:
             cache = project_cache[folder_id]
             if cache.is_valid:
-                output.extend(cache.get_data().values())
+                cached_items.extend(cache.get_data().values())
             else:
                 folder_ids_to_update.add(folder_id)
 
-        self._refresh_product_items(
-            project_name, folder_ids_to_update, sender)
+        if cached_items:
+            yield cached_items
 
-        for folder_id in folder_ids_to_update:
-            cache = project_cache[folder_id]
-            output.extend(cache.get_data().values())
+        if folder_ids_to_update:
+            for product_items in self._refresh_product_items(
+                project_name,
+                folder_ids_to_update,
+                sender,
+                last_versions_only
+            ):
+                yield product_items
+
+    def get_version_items(self, project_name, product_ids, sender):
+        """All version items of products.
+
+        Versions are queried only for products that do not have all
+        versions yet. Queried version items are cached separately, cached
+        product items are not modified.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+            product_ids (Iterable[str]): Product ids.
+            sender (Union[str, None]): Who triggered the method.
+
+        Returns:
+            dict[str, list[VersionItem]]: Version items by product id.
+        """
+
+        if not project_name or not product_ids:
+            return {}
+
+        product_items_by_id = self._get_product_items_by_id(
+            project_name, product_ids
+        )
+        project_cache = self._version_items_cache[project_name]
+        output = {}
+        missing_product_ids = set()
+        for product_id, product_item in product_items_by_id.items():
+            if product_item.versions_complete:
+                output[product_id] = list(product_item.version_items.values())
+                continue
+
+            cache = project_cache[product_id]
+            if cache.is_valid:
+                output[product_id] = list(cache.get_data().values())
+            else:
+                missing_product_ids.add(product_id)
+
+        if missing_product_ids:
+            version_items_by_product_id = self._refresh_version_items(
+                project_name, missing_product_ids, sender
+            )
+            for product_id in missing_product_ids:
+                version_items = version_items_by_product_id.get(product_id)
+                if not version_items:
+                    # Product does not have any version anymore
+                    version_items = (
+                        product_items_by_id[product_id].version_items
+                    )
+                output[product_id] = list(version_items.values())
         return output
 
     def get_product_item(self, project_name, product_id):
@@ -253,7 +373,16 @@ class ProductsModel:
         product_items_by_id = self._product_item_by_id[project_name]
         product_item = product_items_by_id.get(product_id)
         if product_item is not None:
-            return product_item
+            if product_item.versions_complete:
+                return product_item
+            # Use all versions if they were already received
+            cache = self._version_items_cache[project_name][product_id]
+            if not cache.is_valid:
+                return product_item
+            return self._get_complete_product_item(
+                product_item,
+                {product_id: list(cache.get_data().values())}
+            )
         for product_item in self._query_product_items_by_ids(
             project_name, product_ids=[product_id]
         ).values():
@@ -445,6 +574,36 @@ class ProductsModel:
         )
         return output
 
+    def _get_complete_product_item(
+        self, product_item, version_items_by_product_id
+    ):
+        """Copy of product item with all versions.
+
+        Args:
+            product_item (ProductItem): Product item.
+            version_items_by_product_id (dict[str, list[VersionItem]]):
+                All version items by product id.
+
+        Returns:
+            ProductItem: Product item with all versions. Passed item if
+                versions are not available.
+        """
+
+        if product_item.versions_complete:
+            return product_item
+        version_items = version_items_by_product_id.get(
+            product_item.product_id
+        )
+        if not version_items:
+            return product_item
+        product_item = copy.copy(product_item)
+        product_item.version_items = {
+            version_item.version_id: version_item
+            for version_item in version_items
+        }
+        product_item.versions_complete = True
+        return product_item
+
     def _create_product_items(
         self,
         project_name,
@@ -452,6 +611,8 @@ class ProductsModel:
         versions,
         folder_items=None,
         product_type_items=None,
+        loaded_product_ids=None,
+        versions_complete=True,
     ):
         if folder_items is None:
             folder_items = self._controller.get_folder_items(project_name)
@@ -459,7 +620,8 @@ class ProductsModel:
         if product_type_items is None:
             product_type_items = self.get_product_type_items(project_name)
 
-        loaded_product_ids = self._controller.get_loaded_product_ids()
+        if loaded_product_ids is None:
+            loaded_product_ids = self._controller.get_loaded_product_ids()
 
         versions_by_product_id = collections.defaultdict(list)
         for version in versions:
@@ -484,6 +646,7 @@ class ProductsModel:
                 product_type_items_by_name,
                 folder_item.label,
                 product_id in loaded_product_ids,
+                versions_complete,
             )
             output[product_id] = product_item
         return output
@@ -513,8 +676,46 @@ class ProductsModel:
             dict[str, ProductItem]: Product items by product id.
         """
 
+        output = {}
+        for product_items in self._iter_product_items_pages(
+            project_name,
+            folder_ids=folder_ids,
+            product_ids=product_ids,
+            folder_items=folder_items,
+            last_versions_only=False,
+        ):
+            output.update(product_items)
+        return output
+
+    def _iter_product_items_pages(
+        self,
+        project_name,
+        folder_ids=None,
+        product_ids=None,
+        folder_items=None,
+        last_versions_only=True,
+    ):
+        """Query product items in pages.
+
+        One of 'product_ids' or 'folder_ids' must be passed to the method.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Optional[Iterable[str]]): Folder ids under which are
+                products.
+            product_ids (Optional[Iterable[str]]): Product ids to use.
+            folder_items (Optional[Dict[str, FolderItem]]): Prepared folder
+                items from controller.
+            last_versions_only (Optional[bool]): Query only last version of
+                products, all versions are queried otherwise.
+
+        Returns:
+            Generator[dict[str, ProductItem], None, None]: Pages of product
+                items by product id.
+        """
+
         if not folder_ids and not product_ids:
-            return {}
+            return
 
         kwargs = {}
         if folder_ids is not None:
@@ -523,16 +724,85 @@ class ProductsModel:
         if product_ids is not None:
             kwargs["product_ids"] = product_ids
 
-        products = list(ayon_api.get_products(project_name, **kwargs))
-        product_ids = {product["id"] for product in products}
+        if folder_items is None:
+            folder_items = self._controller.get_folder_items(project_name)
+        product_type_items = self.get_product_type_items(project_name)
+        loaded_product_ids = self._controller.get_loaded_product_ids()
 
-        versions = ayon_api.get_versions(
-            project_name, product_ids=product_ids
-        )
+        products_iter = iter(ayon_api.get_products(project_name, **kwargs))
+        while True:
+            products = list(itertools.islice(products_iter, self.page_size))
+            if not products:
+                break
 
-        return self._create_product_items(
-            project_name, products, versions, folder_items=folder_items
+            versions_kwargs = {}
+            if last_versions_only:
+                versions_kwargs["latest"] = True
+            versions = ayon_api.get_versions(
+                project_name,
+                product_ids={product["id"] for product in products},
+                **versions_kwargs
+            )
+            yield self._create_product_items(
+                project_name,
+                products,
+                versions,
+                folder_items=folder_items,
+                product_type_items=product_type_items,
+                loaded_product_ids=loaded_product_ids,
+                versions_complete=not last_versions_only,
+            )
+
+    def _refresh_version_items(self, project_name, product_ids, sender):
+        """Query all versions of products and store them to cache.
+
+        Args:
+            project_name (str): Project name.
+            product_ids (set[str]): Product ids.
+            sender (Union[str, None]): Who triggered the refresh.
+
+        Returns:
+            dict[str, dict[str, VersionItem]]: Version items by id by
+                product id.
+        """
+
+        event_data = {
+            "project_name": project_name,
+            "product_ids": product_ids,
+            "sender": sender,
+        }
+        self._controller.emit_event(
+            "versions.refresh.started", event_data, PRODUCTS_MODEL_SENDER
         )
+        try:
+            versions_by_product_id = collections.defaultdict(list)
+            for version in ayon_api.get_versions(
+                project_name, product_ids=product_ids
+            ):
+                versions_by_product_id[version["productId"]].append(version)
+
+            version_item_by_id = self._version_item_by_id[project_name]
+            project_cache = self._version_items_cache[project_name]
+            output = {}
+            for product_id in product_ids:
+                versions = versions_by_product_id[product_id]
+                if not versions:
+                    continue
+                version_items = {
+                    version["id"]: version_item_from_entity(version)
+                    for version in versions
+                }
+                project_cache[product_id].update_data(version_items)
+                version_item_by_id.update(version_items)
+                output[product_id] = version_items
+            return output
+
+        finally:
+            self._controller.emit_event(
+                "versions.refresh.finished",
+                event_data,
+                PRODUCTS_MODEL_SENDER
+            )
 
     def _query_version_items_by_ids(self, project_name, version_ids):
         versions = list(ayon_api.get_versions(
@@ -543,7 +813,7 @@ class ProductsModel:
             project_name, product_ids=product_ids
         ))
         product_items = self._create_product_items(
-            project_name, products, versions
+            project_name, products, versions, versions_complete=False
         )
         version_items = {}
         for product_item in product_items.values():
@@ -574,20 +844,36 @@ class ProductsModel:
             if not product_ids:
                 continue
 
+            version_items_cache = self._version_items_cache[project_name]
             for product_id in product_ids:
+                cache = version_items_cache[product_id]
+                if cache.is_valid:
+                    for version_id in cache.get_data():
+                        version_item_by_id.pop(version_id, None)
+                version_items_cache.clear_key(product_id)
                 product_item = product_item_by_id.pop(product_id, None)
                 if product_item is None:
                     continue
                 for version_item in product_item.version_items.values():
                     version_item_by_id.pop(version_item.version_id, None)
 
-    def _refresh_product_items(self, project_name, folder_ids, sender):
+    def _refresh_product_items(
+        self, project_name, folder_ids, sender, last_versions_only=True
+    ):
         """Refresh product items and store them in cache.
 
+        Product items are yielded in pages as they're received.
+
         Args:
             project_name (str): Name of project.
             folder_ids (Iterable[str]): Folder ids which are being refreshed.
             sender (Union[str, None]): Who triggered the refresh.
+            last_versions_only (Optional[bool]): Query only last version of
+                products.
+
+        Returns:
+            Generator[list[ProductItem], None, None]: Pages of product
+                items.
         """
 
         if not project_name or not folder_ids:
@@ -605,28 +891,37 @@ class ProductsModel:
         with self._product_refresh_event_manager(
             project_name, folder_ids, sender
         ):
-            folder_items = self._controller.get_folder_items(project_name)
             items_by_folder_id = {
                 folder_id: {}
                 for folder_id in folder_ids
             }
-            product_items_by_id = self._query_product_items_by_ids(
+            for product_items_by_id in self._iter_product_items_pages(
                 project_name,
                 folder_ids=folder_ids,
-                folder_items=folder_items
-            )
-            for product_id, product_item in product_items_by_id.items():
-                folder_id = product_item.folder_id
-                items_by_folder_id[product_item.folder_id][product_id] = (
-                    product_item
+                last_versions_only=last_versions_only,
+            ):
+                for product_id, product_item in product_items_by_id.items():
+                    folder_id = product_item.folder_id
+                    items_by_folder_id[folder_id][product_id] = product_item
+
+                    project_mapping[folder_id].add(product_id)
+                    product_item_by_id[product_id] = product_item
+                    for version_id, version_item in (
+                        product_item.version_items.items()
+                    ):
+                        version_item_by_id[version_id] = version_item
+
+                self._controller.emit_event(
+                    "products.refresh.page",
+                    {
+                        "project_name": project_name,
+                        "folder_ids": folder_ids,
+                        "product_ids": list(product_items_by_id),
+                        "sender": sender,
+                    },
+                    PRODUCTS_MODEL_SENDER
                 )
-
-                project_mapping[folder_id].add(product_id)
-                product_item_by_id[product_id] = product_item
-                for version_id, version_item in (
-                    product_item.version_items.items()
-                ):
-                    version_item_by_id[version_id] = version_item
+                yield list(product_items_by_id.values())
 
             project_cache = self._product_items_cache[project_name]
             for folder_id, product_items in items_by_folder_id.items():
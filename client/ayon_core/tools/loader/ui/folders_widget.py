@@ -187,6 +187,7 @@ class LoaderFoldersModel(FoldersQtModel):
         super(LoaderFoldersModel, self).__init__(*args, **kwargs)
 
         self._colored_items = set()
+        self._colors_by_id = {}
 
     def _fill_item_data(self, item, folder_item):
         """
@@ -197,6 +198,11 @@ class LoaderFoldersModel(FoldersQtModel):
         """
 
         super(LoaderFoldersModel, self)._fill_item_data(item, folder_item)
+        # Items can be created after colors were set
+        item.setData(
+            self._colors_by_id.get(folder_item.entity_id),
+            UNDERLINE_COLORS_ROLE
+        )
 
     def set_merged_products_selection(self, items):
         changes = {
@@ -224,6 +230,10 @@ class LoaderFoldersModel(FoldersQtModel):
                 changes[folder_id].append(folder_color)
 
         for folder_id, color_value in changes.items():
+            if color_value is None:
+                self._colors_by_id.pop(folder_id, None)
+            else:
+                self._colors_by_id[folder_id] = color_value
             item = self._items_by_id.get(folder_id)
             if item is not None:
                 item.setData(color_value, UNDERLINE_COLORS_ROLE)
@@ -312,6 +322,7 @@ class LoaderFoldersWidget(QtWidgets.QWidget):
         self._folders_label_delegate = folders_label_delegate
 
         self._expected_selection = None
+        self._name_filter = ""
 
     def set_name_filter(self, name):
         """Set filter of folder name.
@@ -320,6 +331,8 @@ class LoaderFoldersWidget(QtWidgets.QWidget):
             name (str): The string filter.
         """
 
+        self._name_filter = name
+        self._folders_model.fetch_matching(name)
         self._folders_proxy_model.setFilterFixedString(name)
 
     def set_merged_products_selection(self, items):
@@ -353,6 +366,7 @@ class LoaderFoldersWidget(QtWidgets.QWidget):
         self._update_expected_selection()
 
     def _on_model_refresh(self):
+        self._folders_model.fetch_matching(self._name_filter)
         if self._expected_selection:
             self._set_expected_selection()
         self._folders_proxy_model.sort(0)
@@ -18,6 +18,7 @@ from .products_model import (
 
 class VersionComboBox(QtWidgets.QComboBox):
     value_changed = QtCore.Signal(str)
+    popup_requested = QtCore.Signal(str)
 
     def __init__(self, product_id, parent):
         super(VersionComboBox, self).__init__(parent)
@@ -62,6 +63,11 @@ class VersionComboBox(QtWidgets.QComboBox):
         if self.currentIndex() != index:
             self.setCurrentIndex(index)
 
+    def showPopup(self):
+        # All versions are received when popup is opened for first time
+        self.popup_requested.emit(self._product_id)
+        super(VersionComboBox, self).showPopup()
+
     def _on_index_change(self):
         idx = self.currentIndex()
         value = self.itemData(idx)
@@ -75,10 +81,13 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
     """A delegate that display version integer formatted as version string."""
 
     version_changed = QtCore.Signal()
+    # Product id of which all versions should be available
+    versions_requested = QtCore.Signal(str)
 
     def __init__(self, *args, **kwargs):
         super(VersionDelegate, self).__init__(*args, **kwargs)
         self._editor_by_product_id = {}
+        self._index_by_product_id = {}
 
     def displayText(self, value, locale):
         if not isinstance(value, numbers.Integral):
@@ -136,10 +145,21 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
 
         editor = VersionComboBox(product_id, parent)
         self._editor_by_product_id[product_id] = editor
+        self._index_by_product_id[product_id] = (
+            QtCore.QPersistentModelIndex(index)
+        )
         editor.value_changed.connect(self._on_editor_change)
+        editor.popup_requested.connect(self._on_editor_popup_request)
 
         return editor
 
+    def _on_editor_popup_request(self, product_id):
+        self.versions_requested.emit(product_id)
+        editor = self._editor_by_product_id.get(product_id)
+        index = self._index_by_product_id.get(product_id)
+        if editor is not None and index is not None and index.isValid():
+            self.setEditorData(editor, QtCore.QModelIndex(index))
+
     def _on_editor_change(self, product_id):
         editor = self._editor_by_product_id[product_id]
 
@@ -149,8 +169,6 @@ class VersionDelegate(QtWidgets.QStyledItemDelegate):
         self.version_changed.emit()
 
     def setEditorData(self, editor, index):
-        editor.clear()
-
         # Current value of the index
         versions = index.data(VERSION_NAME_EDIT_ROLE) or []
         version_id = index.data(VERSION_ID_ROLE)
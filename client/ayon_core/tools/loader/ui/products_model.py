@@ -1,3 +1,4 @@
+import copy
 import collections
 
 import qtawesome
@@ -37,6 +38,12 @@ SYNC_REMOTE_SITE_AVAILABILITY = QtCore.Qt.UserRole + 26
 
 
 class ProductsModel(QtGui.QStandardItemModel):
+    """Products with last version grouped by product groups.
+
+    Products are added in pages, so first products are visible before
+    all products are received from server.
+    """
+
     refreshed = QtCore.Signal()
     version_changed = QtCore.Signal()
     column_labels = [
@@ -89,6 +96,9 @@ class ProductsModel(QtGui.QStandardItemModel):
 
         # product item objects (they have version information)
         self._product_items_by_id = {}
+        # Product ids by merge path '<group name>/<product name>'
+        self._product_ids_by_path = collections.defaultdict(list)
+        self._product_types_by_group_name = collections.defaultdict(set)
         self._grouping_enabled = True
         self._reset_merge_color = False
         self._color_iterator = self._color_iter()
@@ -97,6 +107,20 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._last_project_name = None
         self._last_folder_ids = []
 
+        self._active_site_icon = None
+        self._remote_site_icon = None
+        self._pages_iterator = None
+
+        page_timer = QtCore.QTimer(self)
+        page_timer.setSingleShot(True)
+        page_timer.setInterval(0)
+        page_timer.timeout.connect(self._fetch_next_page)
+        self._page_timer = page_timer
+
+    @property
+    def is_refreshing(self):
+        return self._pages_iterator is not None
+
     def get_product_item_indexes(self):
         return [
             item.index()
@@ -240,7 +264,42 @@ class ProductsModel(QtGui.QStandardItemModel):
                     break
                 yield color
 
+    def fetch_version_items(self, product_id):
+        """Make sure all versions of product are available.
+
+        Only last version of products is received with products. Other
+        versions are received when needed, e.g. when versions are shown.
+
+        Args:
+            product_id (str): Product id.
+        """
+
+        product_item = self._product_items_by_id.get(product_id)
+        if product_item is None or product_item.versions_complete:
+            return
+        version_items_by_product_id = self._controller.get_version_items(
+            self._last_project_name,
+            [product_id],
+            sender=PRODUCTS_MODEL_SENDER_NAME
+        )
+        version_items = version_items_by_product_id.get(product_id)
+        if not version_items:
+            return
+        # Product items from controller are shared, don't modify them
+        product_item = copy.copy(product_item)
+        product_item.version_items = {
+            version_item.version_id: version_item
+            for version_item in version_items
+        }
+        product_item.versions_complete = True
+        self._product_items_by_id[product_id] = product_item
+
     def _clear(self):
+        self._page_timer.stop()
+        if self._pages_iterator is not None:
+            self._pages_iterator.close()
+            self._pages_iterator = None
+
         root_item = self.invisibleRootItem()
         root_item.removeRows(0, root_item.rowCount())
 
@@ -248,6 +307,8 @@ class ProductsModel(QtGui.QStandardItemModel):
         self._group_items_by_name = {}
         self._merged_items_by_id = {}
         self._product_items_by_id = {}
+        self._product_ids_by_path = collections.defaultdict(list)
+        self._product_types_by_group_name = collections.defaultdict(set)
         self._reset_merge_color = True
 
     def _get_group_icon(self):
@@ -269,19 +330,18 @@ class ProductsModel(QtGui.QStandardItemModel):
             model_item.setEditable(False)
             model_item.setColumnCount(self.columnCount())
             self._group_items_by_name[group_name] = model_item
+            self.invisibleRootItem().appendRow(model_item)
         return model_item
 
-    def _get_merged_model_item(self, path, count, hex_color):
+    def _get_merged_model_item(self, path, product_name, hex_color):
         model_item = self._merged_items_by_id.get(path)
         if model_item is None:
-            model_item = QtGui.QStandardItem()
+            model_item = QtGui.QStandardItem(product_name)
             model_item.setData(1, GROUP_TYPE_ROLE)
             model_item.setData(hex_color, MERGED_COLOR_ROLE)
             model_item.setEditable(False)
             model_item.setColumnCount(self.columnCount())
             self._merged_items_by_id[path] = model_item
-        label = "{} ({})".format(path, count)
-        model_item.setData(label, QtCore.Qt.DisplayRole)
         return model_item
 
     def _set_version_data_to_product_item(
@@ -350,9 +410,7 @@ class ProductsModel(QtGui.QStandardItemModel):
         sync_availability_by_version_id,
     ):
         model_item = self._items_by_id.get(product_item.product_id)
-        versions = list(product_item.version_items.values())
-        versions.sort()
-        last_version = versions[-1]
+        last_version = max(product_item.version_items.values())
         if model_item is None:
             product_id = product_item.product_id
             model_item = QtGui.QStandardItem(product_item.product_name)
@@ -400,30 +458,64 @@ class ProductsModel(QtGui.QStandardItemModel):
         remote_site_icon_def = self._controller.get_remote_site_icon_def(
             project_name
         )
-        active_site_icon = get_qt_icon(active_site_icon_def)
-        remote_site_icon = get_qt_icon(remote_site_icon_def)
+        self._active_site_icon = get_qt_icon(active_site_icon_def)
+        self._remote_site_icon = get_qt_icon(remote_site_icon_def)
 
-        product_items = self._controller.get_product_items(
+        self._pages_iterator = iter(self._controller.iter_product_items(
             project_name,
             folder_ids,
             sender=PRODUCTS_MODEL_SENDER_NAME
-        )
-        product_items_by_id = {
-            product_item.product_id: product_item
+        ))
+        # First page is added directly, it contains cached items
+        self._fetch_next_page()
+
+    def _fetch_next_page(self):
+        if self._pages_iterator is None:
+            return
+
+        try:
+            product_items = next(self._pages_iterator)
+        except StopIteration:
+            self._pages_iterator = None
+            self.refreshed.emit()
+            return
+
+        self._add_product_items(product_items)
+        # Let UI process events before next page is fetched
+        self._page_timer.start()
+
+    def _get_parent_item(self, group_name):
+        if group_name:
+            return self._get_group_model_item(group_name)
+        return self.invisibleRootItem()
+
+    def _add_product_items(self, product_items):
+        """Add product items to model.
+
+        Products with same name in a group are merged under merged item.
+
+        Args:
+            product_items (list[ProductItem]): Product items to add.
+        """
+
+        product_items = [
+            product_item
+            for product_item in product_items
+            if product_item.version_items
+            and product_item.product_id not in self._product_items_by_id
+        ]
+        if not product_items:
+            return
+
+        project_name = self._last_project_name
+        version_ids = {
+            max(product_item.version_items.values()).version_id
             for product_item in product_items
         }
-        last_version_id_by_product_id = {}
-        for product_item in product_items:
-            versions = list(product_item.version_items.values())
-            versions.sort()
-            last_version = versions[-1]
-            last_version_id_by_product_id[product_item.product_id] = (
-                last_version.version_id
+        repre_count_by_version_id = (
+            self._controller.get_versions_representation_count(
+                project_name, version_ids
             )
-
-        version_ids = set(last_version_id_by_product_id.values())
-        repre_count_by_version_id = self._controller.get_versions_representation_count(
-            project_name, version_ids
         )
         sync_availability_by_version_id = (
             self._controller.get_version_sync_availability(
@@ -431,106 +523,80 @@ class ProductsModel(QtGui.QStandardItemModel):
             )
         )
 
-        # Prepare product groups
-        product_name_matches_by_group = collections.defaultdict(dict)
-        for product_item in product_items_by_id.values():
+        # New items are added at once for each parent
+        new_items_by_group_name = collections.defaultdict(list)
+        for product_item in product_items:
             group_name = None
             if self._grouping_enabled:
                 group_name = product_item.group_name
 
-            product_name = product_item.product_name
-            group = product_name_matches_by_group[group_name]
-            if product_name not in group:
-                group[product_name] = [product_item]
-                continue
-            group[product_name].append(product_item)
+            parent_item = self._get_parent_item(group_name)
+            if group_name:
+                group_product_types = (
+                    self._product_types_by_group_name[group_name]
+                )
+                group_product_types.add(product_item.product_type)
+                parent_item.setData(
+                    "|".join(group_product_types), PRODUCT_TYPE_ROLE
+                )
 
-        group_names = set(product_name_matches_by_group.keys())
+            item = self._get_product_model_item(
+                product_item,
+                self._active_site_icon,
+                self._remote_site_icon,
+                repre_count_by_version_id,
+                sync_availability_by_version_id,
+            )
 
-        root_item = self.invisibleRootItem()
-        new_root_items = []
-        merged_paths = set()
-        for group_name in group_names:
             key_parts = []
             if group_name:
                 key_parts.append(group_name)
+            product_name = product_item.product_name
+            path = "/".join(key_parts + [product_name])
+            path_product_ids = self._product_ids_by_path[path]
+            path_product_ids.append(product_item.product_id)
+            if len(path_product_ids) == 1:
+                new_items_by_group_name[group_name].append(item)
+                continue
 
-            groups = product_name_matches_by_group[group_name]
-            merged_product_items = {}
-            top_items = []
-            group_product_types = set()
-            for product_name, product_items in groups.items():
-                group_product_types |= {p.product_type for p in product_items}
-                if len(product_items) == 1:
-                    top_items.append(product_items[0])
+            merged_item = self._merged_items_by_id.get(path)
+            if merged_item is None:
+                # Move previous item with same name under merged item
+                first_item = self._items_by_id[path_product_ids[0]]
+                new_items = new_items_by_group_name[group_name]
+                if first_item in new_items:
+                    new_items.remove(first_item)
                 else:
-                    path = "/".join(key_parts + [product_name])
-                    merged_paths.add(path)
-                    merged_product_items[path] = (
-                        product_name,
-                        product_items,
-                    )
-
-            parent_item = None
-            if group_name:
-                parent_item = self._get_group_model_item(group_name)
-                parent_item.setData(
-                    "|".join(group_product_types), PRODUCT_TYPE_ROLE)
-
-            new_items = []
-            if parent_item is not None and parent_item.row() < 0:
-                new_root_items.append(parent_item)
-
-            for product_item in top_items:
-                item = self._get_product_model_item(
-                    product_item,
-                    active_site_icon,
-                    remote_site_icon,
-                    repre_count_by_version_id,
-                    sync_availability_by_version_id,
-                )
-                new_items.append(item)
+                    parent_item.takeRow(first_item.row())
 
-            for path_info in merged_product_items.values():
-                product_name, product_items = path_info
-                (merged_color_hex, merged_color_qt) = self._get_next_color()
-                merged_color = qtawesome.icon(
-                    "fa.circle", color=merged_color_qt)
+                merged_color_hex, merged_color_qt = self._get_next_color()
                 merged_item = self._get_merged_model_item(
-                    product_name, len(product_items), merged_color_hex)
-                merged_item.setData(merged_color, QtCore.Qt.DecorationRole)
-                new_items.append(merged_item)
-
-                merged_product_types = set()
-                new_merged_items = []
-                for product_item in product_items:
-                    item = self._get_product_model_item(
-                        product_item,
-                        active_site_icon,
-                        remote_site_icon,
-                        repre_count_by_version_id,
-                        sync_availability_by_version_id,
-                    )
-                    new_merged_items.append(item)
-                    merged_product_types.add(product_item.product_type)
-
+                    path, product_name, merged_color_hex
+                )
                 merged_item.setData(
-                    "|".join(merged_product_types), PRODUCT_TYPE_ROLE)
-                if new_merged_items:
-                    merged_item.appendRows(new_merged_items)
-
-            if not new_items:
-                continue
-
-            if parent_item is None:
-                new_root_items.extend(new_items)
-            else:
-                parent_item.appendRows(new_items)
+                    qtawesome.icon("fa.circle", color=merged_color_qt),
+                    QtCore.Qt.DecorationRole
+                )
+                parent_item.appendRow(merged_item)
+                merged_item.appendRow(first_item)
+
+            merged_item.appendRow(item)
+            merged_product_types = {
+                self._product_items_by_id[product_id].product_type
+                for product_id in path_product_ids
+            }
+            merged_item.setData(
+                "|".join(merged_product_types), PRODUCT_TYPE_ROLE
+            )
+            merged_item.setData(
+                "{} ({})".format(product_name, len(path_product_ids)),
+                QtCore.Qt.DisplayRole
+            )
 
-        if new_root_items:
-            root_item.appendRows(new_root_items)
+        for group_name, new_items in new_items_by_group_name.items():
+            if new_items:
+                self._get_parent_item(group_name).appendRows(new_items)
 
-        self.refreshed.emit()
     # ---------------------------------
     #   This implementation does not call '_clear' at the start
     #       but is more complex and probably slower
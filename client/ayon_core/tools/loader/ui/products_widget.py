@@ -130,6 +130,9 @@ class ProductsWidget(QtWidgets.QWidget):
         version_delegate = VersionDelegate()
         products_view.setItemDelegateForColumn(
             products_model.version_col, version_delegate)
+        version_delegate.versions_requested.connect(
+            products_model.fetch_version_items
+        )
 
         time_delegate = PrettyTimeDelegate()
         products_view.setItemDelegateForColumn(
@@ -235,35 +238,49 @@ class ProductsWidget(QtWidgets.QWidget):
             not sitesync_enabled
         )
 
-    def _fill_version_editor(self):
+    def _fill_version_editor(
+        self, parent_index=None, first_row=None, last_row=None
+    ):
+        """Open version editors for product rows.
+
+        Args:
+            parent_index (Optional[QtCore.QModelIndex]): Parent of rows.
+                Root is used if not passed.
+            first_row (Optional[int]): First row where editors are opened.
+            last_row (Optional[int]): Last row where editors are opened.
+        """
+
         model = self._products_proxy_model
+        if parent_index is None:
+            parent_index = QtCore.QModelIndex()
+        if first_row is None:
+            first_row = 0
+        if last_row is None:
+            last_row = model.rowCount(parent_index) - 1
+
         index_queue = collections.deque()
-        for row in range(model.rowCount()):
-            index_queue.append((row, None))
+        for row in range(first_row, last_row + 1):
+            index_queue.append((row, parent_index))
 
         version_col = self._products_model.version_col
         while index_queue:
             (row, parent_index) = index_queue.popleft()
-            args = [row, 0]
-            if parent_index is not None:
-                args.append(parent_index)
-            index = model.index(*args)
-            rows = model.rowCount(index)
-            for row in range(rows):
-                index_queue.append((row, index))
+            index = model.index(row, 0, parent_index)
+            for child_row in range(model.rowCount(index)):
+                index_queue.append((child_row, index))
 
             product_id = model.data(index, PRODUCT_ID_ROLE)
             if product_id is not None:
-                args[1] = version_col
-                v_index = model.index(*args)
+                v_index = model.index(row, version_col, parent_index)
                 self._products_view.openPersistentEditor(v_index)
 
     def _on_refresh(self):
+        # Make sure editors are opened for items added under merged items
         self._fill_version_editor()
         self.refreshed.emit()
 
-    def _on_rows_inserted(self):
-        self._fill_version_editor()
+    def _on_rows_inserted(self, parent_index, first_row, last_row):
+        self._fill_version_editor(parent_index, first_row, last_row)
 
     def _on_rows_moved(self):
         self._fill_version_editor()
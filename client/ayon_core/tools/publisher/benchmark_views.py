@@ -0,0 +1,121 @@
+"""Headless benchmark of publisher instance views.
+
+Fills list and card view with fake instances and measures time of
+refresh, state update and painting of views.
+
+Example:
+    python -m ayon_core.tools.publisher.benchmark_views --count 10000
+"""
+import os
+import sys
+import time
+import uuid
+import argparse
+
+from qtpy import QtWidgets
+
+
+class FakeInstance:
+    """Object with interface of 'CreatedInstance' used by views."""
+
+    def __init__(self, idx, group_label, creator_identifier):
+        self.id = str(uuid.uuid4())
+        self.label = "renderMain_{:0>5}".format(idx)
+        self.group_label = group_label
+        self.creator_identifier = creator_identifier
+        self.has_valid_context = idx % 50 != 0
+        self._data = {
+            "productName": self.label,
+            "variant": "Main_{:0>5}".format(idx),
+            "active": True,
+        }
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+
+class FakeController:
+    """Controller providing instances to views."""
+
+    def __init__(self, count, groups_count):
+        instances = {}
+        for idx in range(count):
+            group_idx = idx % groups_count
+            instance = FakeInstance(
+                idx,
+                "Group {}".format(group_idx),
+                "creator.{}".format(group_idx),
+            )
+            instances[instance.id] = instance
+        self.instances = instances
+        self.convertor_items = {}
+
+    def get_creator_icon(self, identifier):
+        return "fa.file"
+
+
+def _measure(label, func):
+    start = time.time()
+    func()
+    QtWidgets.QApplication.processEvents()
+    duration = time.time() - start
+    print("    {:<28} {:>8.3f}s".format(label, duration))
+    return duration
+
+
+def run_benchmark(count, groups_count):
+    from ayon_core.style import load_stylesheet
+    from ayon_core.tools.publisher.widgets.list_view_widgets import (
+        InstanceListView
+    )
+    from ayon_core.tools.publisher.widgets.card_view_widgets import (
+        InstanceCardView
+    )
+
+    print("Instances: {} Groups: {}".format(count, groups_count))
+    for view_cls in (InstanceListView, InstanceCardView):
+        controller = FakeController(count, groups_count)
+        view = view_cls(controller, None)
+        view.setStyleSheet(load_stylesheet())
+        view.resize(400, 800)
+        view.show()
+
+        instance_ids = list(controller.instances.keys())
+
+        def _toggle():
+            for instance_id in instance_ids[::10]:
+                instance = controller.instances[instance_id]
+                instance["active"] = not instance["active"]
+            view.refresh_instance_states()
+
+        def _select():
+            view.set_selected_items(instance_ids[:100], False, [])
+
+        print(view_cls.__name__)
+        _measure("initial refresh", view.refresh)
+        _measure("refresh without changes", view.refresh)
+        _measure("state change of 10%", _toggle)
+        _measure("selection of 100 items", _select)
+        _measure("paint", view.grab)
+        view.close()
+        view.deleteLater()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--groups", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    run_benchmark(args.count, args.groups)
+
+
+if __name__ == "__main__":
+    main()
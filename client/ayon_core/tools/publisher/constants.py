@@ -28,6 +28,10 @@ PRODUCT_TYPE_ROLE = QtCore.Qt.UserRole + 6
 GROUP_ROLE = QtCore.Qt.UserRole + 7
 CONVERTER_IDENTIFIER_ROLE = QtCore.Qt.UserRole + 8
 CREATOR_SORT_ROLE = QtCore.Qt.UserRole + 9
+ACTIVE_STATE_ROLE = QtCore.Qt.UserRole + 10
+HAS_VALID_CONTEXT_ROLE = QtCore.Qt.UserRole + 11
+VARIANT_ROLE = QtCore.Qt.UserRole + 12
+CREATOR_ICON_ROLE = QtCore.Qt.UserRole + 13
 
 ResetKeySequence = QtGui.QKeySequence(
     QtCore.Qt.ControlModifier | QtCore.Qt.Key_R
@@ -51,6 +55,10 @@ __all__ = (
     "PRODUCT_TYPE_ROLE",
     "GROUP_ROLE",
     "CONVERTER_IDENTIFIER_ROLE",
+    "ACTIVE_STATE_ROLE",
+    "HAS_VALID_CONTEXT_ROLE",
+    "VARIANT_ROLE",
+    "CREATOR_ICON_ROLE",
 
     "ResetKeySequence",
 )
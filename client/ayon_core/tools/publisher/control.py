@@ -1,5 +1,5 @@
 import os
-import copy
+import atexit
 import logging
 import traceback
 import collections
@@ -7,6 +7,7 @@ import uuid
 import tempfile
 import shutil
 import inspect
+import weakref
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -15,6 +16,12 @@ import pyblish.api
 import ayon_api
 
 from ayon_core.lib.events import QueuedEventSystem
+from ayon_core.lib.profiling import PublishProfiler
+from ayon_core.lib.ayon_connection import get_data_access
+from ayon_core.lib.directory_scan import (
+    open_directory_scan_scope,
+    close_directory_scan_scope,
+)
 from ayon_core.lib.attribute_definitions import (
     UIDef,
     serialize_attr_defs,
@@ -40,9 +47,30 @@ from ayon_core.pipeline.create.context import (
 from ayon_core.pipeline.publish import get_publish_instance_label
 from ayon_core.tools.common_models import HierarchyModel
 
+from .report_stream import PublishReportStreamWriter, REPORT_STREAM_EXT
+
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
 
+# Report streams which were not closed yet
+_open_report_streams = weakref.WeakSet()
+
+
+def _get_report_streams_dir():
+    return os.path.join(
+        tempfile.gettempdir(), "publisher_reports", get_process_id()
+    )
+
+
+def _remove_report_streams_dir():
+    """Remove streamed reports of this process when process ends."""
+    for report_stream in list(_open_report_streams):
+        report_stream.close()
+    shutil.rmtree(_get_report_streams_dir(), ignore_errors=True)
+
+
+atexit.register(_remove_report_streams_dir)
+
 
 class CardMessageTypes:
     standard = None
@@ -66,6 +94,8 @@ class PublishReportMaker:
     """Report for single publishing process.
 
     Report keeps current state of publishing and currently processed plugin.
+    Records of report are also streamed to a temporary file during
+    publishing, which can be exported using 'export_report'.
     """
 
     def __init__(self, controller):
@@ -79,6 +109,7 @@ class PublishReportMaker:
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = None
+        self._report_stream = None
 
     def reset(self, context, create_context):
         """Reset report and clear all data."""
@@ -94,18 +125,55 @@ class PublishReportMaker:
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = context
+        self._reset_report_stream()
 
         for plugin in create_context.publish_plugins_mismatch_targets:
             plugin_data = self._add_plugin_data_item(plugin)
-            plugin_data["skipped"] = True
+            self._update_plugin_data_item(plugin_data, skipped=True)
+
+    def _remove_report_stream(self):
+        report_stream = self._report_stream
+        if report_stream is None:
+            return
+        self._report_stream = None
+        _open_report_streams.discard(report_stream)
+        report_stream.close()
+        filepath = report_stream.filepath
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+        # Remove directory of process if is empty
+        dirpath = os.path.dirname(filepath)
+        try:
+            os.rmdir(dirpath)
+        except OSError:
+            pass
+
+    def _reset_report_stream(self):
+        self._remove_report_stream()
+
+        report_id = uuid.uuid4().hex
+        filepath = os.path.join(
+            _get_report_streams_dir(), report_id + REPORT_STREAM_EXT
+        )
+        self._report_stream = PublishReportStreamWriter(
+            filepath, report_id, arrow.utcnow().to("local").isoformat()
+        )
+        _open_report_streams.add(self._report_stream)
 
     def add_plugin_iter(self, plugin, context):
         """Add report about single iteration of plugin."""
         for instance in context:
-            self._all_instances_by_id[instance.id] = instance
+            if instance.id not in self._all_instances_by_id:
+                self._all_instances_by_id[instance.id] = instance
+                self._report_stream.add_instance(
+                    instance.id, self._extract_instance_data(instance, True)
+                )
 
         if self._current_plugin_data:
-            self._current_plugin_data["passed"] = True
+            self._update_plugin_data_item(
+                self._current_plugin_data, passed=True
+            )
 
         self._current_plugin = plugin
         self._current_plugin_data = self._add_plugin_data_item(plugin)
@@ -121,9 +189,14 @@ class PublishReportMaker:
 
         plugin_data_item = self._create_plugin_data_item(plugin)
         self._plugin_data_by_id[plugin.id] = plugin_data_item
+        self._report_stream.add_plugin(plugin_data_item)
 
         return plugin_data_item
 
+    def _update_plugin_data_item(self, plugin_data_item, **changes):
+        plugin_data_item.update(changes)
+        self._report_stream.add_plugin(plugin_data_item)
+
     def _create_plugin_data_item(self, plugin):
         label = None
         if hasattr(plugin, "label"):
@@ -143,7 +216,7 @@ class PublishReportMaker:
 
     def set_plugin_skipped(self):
         """Set that current plugin has been skipped."""
-        self._current_plugin_data["skipped"] = True
+        self._update_plugin_data_item(self._current_plugin_data, skipped=True)
 
     def add_result(self, result):
         """Handle result of one plugin and it's instance."""
@@ -152,11 +225,21 @@ class PublishReportMaker:
         instance_id = None
         if instance is not None:
             instance_id = instance.id
+        log_items = self._extract_instance_log_items(result)
+        profile = result.get("profile")
         self._current_plugin_data["instances_data"].append({
             "id": instance_id,
-            "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
+            "logs": log_items,
+            "process_time": result["duration"],
+            "profile": profile,
         })
+        self._report_stream.add_process(
+            self._current_plugin_data["id"],
+            instance_id,
+            log_items,
+            result["duration"],
+            profile
+        )
 
     def add_action_result(self, action, result):
         """Add result of single action."""
@@ -169,12 +252,14 @@ class PublishReportMaker:
         action_name = action.__name__
         action_label = action.label or action_name
         log_items = self._extract_log_items(result)
-        store_item["actions_data"].append({
+        action_data = {
             "success": result["success"],
             "name": action_name,
             "label": action_label,
             "logs": log_items
-        })
+        }
+        store_item["actions_data"].append(action_data)
+        self._report_stream.add_action(plugin.id, action_data)
 
     def get_report(self, publish_plugins=None):
         """Report data with all details of current state."""
@@ -186,9 +271,12 @@ class PublishReportMaker:
                 instance, instance in self._current_context
             )
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
+        # Log items are not changed after they're added so it is enough to
+        #   copy only plugin data which state can be changed
+        plugins_data_by_id = {
+            plugin_id: dict(plugin_data)
+            for plugin_id, plugin_data in self._plugin_data_by_id.items()
+        }
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -233,6 +321,18 @@ class PublishReportMaker:
             "report_version": "1.0.1",
         }
 
+    def export_report(self, filepath, publish_plugins=None):
+        """Export streamed report to a file.
+
+        Args:
+            filepath (str): Path to output file.
+            publish_plugins (Optional[list[pyblish.api.Plugin]]): Publish
+                plugins which should be in report even if they were not
+                processed yet.
+        """
+        self._report_stream.write_index(self.get_report(publish_plugins))
+        shutil.copyfile(self._report_stream.filepath, filepath)
+
     def _extract_context_data(self, context):
         context_label = "Context"
         if context is not None:
@@ -1198,6 +1298,16 @@ class AbstractPublisherController(object):
     def get_publish_report(self):
         pass
 
+    @abstractmethod
+    def export_publish_report(self, filepath):
+        """Export streamed publish report to a file.
+
+        Args:
+            filepath (str): Path to output file.
+        """
+
+        pass
+
     @abstractmethod
     def get_validation_errors(self):
         pass
@@ -1606,6 +1716,7 @@ class PublisherController(BasePublisherController):
         self._publish_context = None
         # Pyblish report
         self._publish_report = PublishReportMaker(self)
+        self._publish_profiler = PublishProfiler()
         # Store exceptions of validation error
         self._publish_validation_errors = PublishValidationErrors()
 
@@ -1928,29 +2039,22 @@ class PublisherController(BasePublisherController):
                 which should be attribute definitions returned.
         """
 
-        # NOTE it would be great if attrdefs would have hash method implemented
-        #   so they could be used as keys in dictionary
         output = []
-        _attr_defs = {}
+        # Attribute definitions are hashable so matching definitions of
+        #   all instances are grouped in single pass
+        items_by_attr_def = {}
         for instance in instances:
             for attr_def in instance.creator_attribute_defs:
-                found_idx = None
-                for idx, _attr_def in _attr_defs.items():
-                    if attr_def == _attr_def:
-                        found_idx = idx
-                        break
-
                 value = None
                 if attr_def.is_value_def:
                     value = instance.creator_attributes[attr_def.key]
-                if found_idx is None:
-                    idx = len(output)
-                    output.append((attr_def, [instance], [value]))
-                    _attr_defs[idx] = attr_def
-                else:
-                    item = output[found_idx]
-                    item[1].append(instance)
-                    item[2].append(value)
+                item = items_by_attr_def.get(attr_def)
+                if item is None:
+                    item = (attr_def, [], [])
+                    items_by_attr_def[attr_def] = item
+                    output.append(item)
+                item[1].append(instance)
+                item[2].append(value)
         return output
 
     def get_publish_attribute_definitions(self, instances, include_context):
@@ -2192,6 +2296,9 @@ class PublisherController(BasePublisherController):
     def get_publish_report(self):
         return self._publish_report.get_report(self._publish_plugins)
 
+    def export_publish_report(self, filepath):
+        self._publish_report.export_report(filepath, self._publish_plugins)
+
     def get_validation_errors(self):
         return self._publish_validation_errors.create_report()
 
@@ -2216,6 +2323,7 @@ class PublisherController(BasePublisherController):
         )
 
         self._publish_report.reset(self._publish_context, self._create_context)
+        self._publish_profiler.reset()
         self._publish_validation_errors.reset(self._publish_plugins_proxy)
 
         self.publish_max_progress = len(self._publish_plugins)
@@ -2263,6 +2371,9 @@ class PublisherController(BasePublisherController):
 
         self.publish_is_running = True
         self.publish_has_started = True
+        # Entities on server are not changed while publishing is running
+        get_data_access().open_cache_scope()
+        open_directory_scan_scope()
 
         self._emit_event("publish.process.started")
 
@@ -2271,6 +2382,8 @@ class PublisherController(BasePublisherController):
     def _stop_publish(self):
         """Stop or pause publishing."""
         self.publish_is_running = False
+        get_data_access().close_cache_scope()
+        close_directory_scan_scope()
 
         self._emit_event("publish.process.stopped")
 
@@ -2481,9 +2594,16 @@ class PublisherController(BasePublisherController):
         )
 
     def _process_and_continue(self, plugin, instance):
-        result = pyblish.plugin.process(
-            plugin, self._publish_context, instance
-        )
+        instance_name = "Context"
+        if instance is not None:
+            instance_name = instance.data.get("name")
+        with self._publish_profiler.span(
+            plugin.__name__, args={"instance": instance_name}
+        ) as span:
+            result = pyblish.plugin.process(
+                plugin, self._publish_context, instance
+            )
+        result["profile"] = span.to_data()
 
         exception = result.get("error")
         if exception:
@@ -364,6 +364,10 @@ class QtRemotePublishController(BasePublisherController):
     def get_publish_report(self):
         pass
 
+    @abstractmethod
+    def export_publish_report(self, filepath):
+        pass
+
     @abstractmethod
     def get_validation_errors(self):
         pass
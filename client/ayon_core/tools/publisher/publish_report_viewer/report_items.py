@@ -1,11 +1,14 @@
 import uuid
 import collections
-import copy
+
+from ayon_core.tools.publisher.report_stream import PublishReportStreamReader
 
 
 class PluginItem:
-    def __init__(self, plugin_data):
-        self._id = uuid.uuid4()
+    def __init__(self, plugin_data, plugin_id=None):
+        if plugin_id is None:
+            plugin_id = uuid.uuid4()
+        self._id = plugin_id
 
         self.name = plugin_data["name"]
         self.label = plugin_data["label"]
@@ -13,14 +16,17 @@ class PluginItem:
         self.skipped = plugin_data["skipped"]
         self.passed = plugin_data["passed"]
 
-        errored = False
-        for instance_data in plugin_data["instances_data"]:
-            for log_item in instance_data["logs"]:
-                errored = log_item["type"] == "error"
+        # Streamed report has precalculated errored state in index
+        errored = plugin_data.get("errored")
+        if errored is None:
+            errored = False
+            for instance_data in plugin_data["instances_data"]:
+                for log_item in instance_data["logs"]:
+                    errored = log_item["type"] == "error"
+                    if errored:
+                        break
                 if errored:
                     break
-            if errored:
-                break
 
         self.errored = errored
 
@@ -36,12 +42,14 @@ class InstanceItem:
         self.family = instance_data.get("family")
         self.removed = not instance_data.get("exists", True)
 
-        logs = logs_by_instance_id.get(instance_id) or []
-        errored = False
-        for log_item in logs:
-            if log_item.errored:
-                errored = True
-                break
+        errored = instance_data.get("errored")
+        if errored is None:
+            errored = False
+            logs = logs_by_instance_id.get(instance_id) or []
+            for log_item in logs:
+                if log_item.errored:
+                    errored = True
+                    break
 
         self.errored = errored
 
@@ -74,37 +82,74 @@ class LogItem:
 
 
 class PublishReport:
-    def __init__(self, report_data):
-        data = copy.deepcopy(report_data)
+    """Publish report in legacy json format loaded in memory.
 
-        context_data = data["context"]
-        context_data["name"] = "context"
-        context_data["label"] = context_data.get("label") or "Context"
+    Args:
+        report_data (dict[str, Any]): Report data.
+    """
 
+    def __init__(self, report_data):
         logs = []
         plugins_items_by_id = {}
-        for plugin_data in data["plugins_data"]:
+        for plugin_data in report_data["plugins_data"]:
             item = PluginItem(plugin_data)
             plugins_items_by_id[item.id] = item
             for instance_data_item in plugin_data["instances_data"]:
                 instance_id = instance_data_item["id"]
                 for log_item_data in instance_data_item["logs"]:
-                    log_item = LogItem(
-                        copy.deepcopy(log_item_data), item.id, instance_id
-                    )
+                    log_item = LogItem(log_item_data, item.id, instance_id)
                     logs.append(log_item)
+
+        logs_by_instance_id = collections.defaultdict(list)
+        for log_item in logs:
+            logs_by_instance_id[log_item.instance_id].append(log_item)
+
+        self._set_items(
+            plugins_items_by_id,
+            report_data["context"],
+            report_data["instances"],
+            logs_by_instance_id
+        )
+        self.logs = logs
+        self.crashed_plugin_paths = report_data["crashed_file_paths"]
+
+    def iter_logs(self, plugin_ids=None, instance_ids=None):
+        """Iterate log items of report.
+
+        Args:
+            plugin_ids (Optional[set[str]]): Filter by plugin ids.
+            instance_ids (Optional[set[Union[str, None]]]): Filter by
+                instance ids.
+
+        Yields:
+            LogItem: Log item.
+        """
+        for log_item in self.logs:
+            if instance_ids and log_item.instance_id not in instance_ids:
+                continue
+            if plugin_ids and log_item.plugin_id not in plugin_ids:
+                continue
+            yield log_item
+
+    def _set_items(
+        self,
+        plugins_items_by_id,
+        context_data,
+        instances_data_by_id,
+        logs_by_instance_id
+    ):
         sorted_plugins = sorted(
             plugins_items_by_id.values(),
-            key=lambda item: item.order
+            key=lambda item: item.order or 0
         )
         plugins_id_order = [
             plugin_item.id
             for plugin_item in sorted_plugins
         ]
 
-        logs_by_instance_id = collections.defaultdict(list)
-        for log_item in logs:
-            logs_by_instance_id[log_item.instance_id].append(log_item)
+        context_data = dict(context_data)
+        context_data["name"] = "context"
+        context_data["label"] = context_data.get("label") or "Context"
 
         instance_items_by_id = {}
         instance_items_by_family = {}
@@ -112,7 +157,7 @@ class PublishReport:
         instance_items_by_id[context_item.id] = context_item
         instance_items_by_family[context_item.family] = [context_item]
 
-        for instance_id, instance_data in data["instances"].items():
+        for instance_id, instance_data in instances_data_by_id.items():
             item = InstanceItem(
                 instance_id, instance_data, logs_by_instance_id
             )
@@ -127,6 +172,45 @@ class PublishReport:
         self.plugins_id_order = plugins_id_order
         self.plugins_items_by_id = plugins_items_by_id
 
-        self.logs = logs
 
-        self.crashed_plugin_paths = report_data["crashed_file_paths"]
+class StreamedPublishReport(PublishReport):
+    """Publish report in streamed format.
+
+    Only index of report is loaded, log items are read from file on demand.
+
+    Args:
+        reader (PublishReportStreamReader): Reader of report file.
+    """
+
+    def __init__(self, reader):
+        index = reader.index
+        plugins_items_by_id = {}
+        for plugin_data in index["plugins_data"]:
+            item = PluginItem(plugin_data, plugin_data["id"])
+            plugins_items_by_id[item.id] = item
+
+        self._set_items(
+            plugins_items_by_id,
+            index["context"],
+            index["instances"],
+            {}
+        )
+        self._reader = reader
+        self.crashed_plugin_paths = index["crashed_file_paths"]
+
+    @classmethod
+    def from_filepath(cls, filepath):
+        return cls(PublishReportStreamReader(filepath))
+
+    @property
+    def logs(self):
+        return list(self.iter_logs())
+
+    def iter_logs(self, plugin_ids=None, instance_ids=None):
+        for record in self._reader.iter_logs(plugin_ids, instance_ids):
+            # Records are cached by reader so they must not be modified
+            log_item_data = dict(record)
+            log_item_data["type"] = record["log_type"]
+            yield LogItem(
+                log_item_data, record["plugin_id"], record["instance_id"]
+            )
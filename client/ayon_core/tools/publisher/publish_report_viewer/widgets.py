@@ -1,3 +1,4 @@
+import itertools
 from math import ceil
 from qtpy import QtWidgets, QtCore, QtGui
 
@@ -218,6 +219,13 @@ class ZoomPlainText(QtWidgets.QPlainTextEdit):
 
 
 class DetailsWidget(QtWidgets.QWidget):
+    """Logs of report.
+
+    Logs are added in pages when user scrolls to the bottom, so only logs
+    that are visible are read and converted to text.
+    """
+    logs_page_size = 500
+
     def __init__(self, parent):
         super(DetailsWidget, self).__init__(parent)
 
@@ -229,12 +237,19 @@ class DetailsWidget(QtWidgets.QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(output_widget)
 
+        output_widget.verticalScrollBar().valueChanged.connect(
+            self._on_scroll
+        )
+
         self._output_widget = output_widget
         self._report_item = None
         self._instance_filter = set()
         self._plugin_filter = set()
+        self._logs_iter = None
+        self._adding_logs = False
 
     def clear(self):
+        self._logs_iter = None
         self._output_widget.setPlainText("")
 
     def set_report(self, report):
@@ -252,28 +267,37 @@ class DetailsWidget(QtWidgets.QWidget):
         self._update_logs()
 
     def _update_logs(self):
+        self.clear()
         if not self._report_item:
-            self._output_widget.setPlainText("")
             return
 
-        filtered_logs = []
-        for log in self._report_item.logs:
-            if (
-                self._instance_filter
-                and log.instance_id not in self._instance_filter
-            ):
-                continue
+        self._logs_iter = self._report_item.iter_logs(
+            self._plugin_filter, self._instance_filter
+        )
+        self._fetch_logs()
 
-            if (
-                self._plugin_filter
-                and log.plugin_id not in self._plugin_filter
-            ):
-                continue
-            filtered_logs.append(log)
+    def _on_scroll(self, value):
+        scroll_bar = self._output_widget.verticalScrollBar()
+        if value >= scroll_bar.maximum():
+            self._fetch_logs()
+
+    def _fetch_logs(self):
+        # Adding of text may change scroll bar value
+        if self._logs_iter is None or self._adding_logs:
+            return
 
-        self._set_logs(filtered_logs)
+        logs = list(itertools.islice(self._logs_iter, self.logs_page_size))
+        if len(logs) < self.logs_page_size:
+            self._logs_iter = None
 
-    def _set_logs(self, logs):
+        if logs:
+            self._adding_logs = True
+            try:
+                self._add_logs(logs)
+            finally:
+                self._adding_logs = False
+
+    def _add_logs(self, logs):
         lines = []
         for log in logs:
             if log["type"] == "record":
@@ -291,7 +315,13 @@ class DetailsWidget(QtWidgets.QWidget):
                 print(log["type"])
 
         text = "\n".join(lines)
-        self._output_widget.setPlainText(text)
+        scroll_bar = self._output_widget.verticalScrollBar()
+        scroll_value = scroll_bar.value()
+        if self._output_widget.document().isEmpty():
+            self._output_widget.setPlainText(text)
+        else:
+            self._output_widget.appendPlainText(text)
+        scroll_bar.setValue(scroll_value)
 
 
 class DeselectableTreeView(QtWidgets.QTreeView):
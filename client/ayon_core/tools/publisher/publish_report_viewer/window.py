@@ -1,5 +1,6 @@
 import os
 import json
+import shutil
 import six
 import uuid
 
@@ -16,13 +17,18 @@ from ayon_core.tools.utils import (
 )
 
 from ayon_core.tools.utils.delegates import PrettyTimeDelegate
+from ayon_core.tools.publisher.report_stream import (
+    REPORT_STREAM_EXT,
+    PublishReportStreamReader,
+    is_report_stream,
+)
 
 if __package__:
     from .widgets import PublishReportViewerWidget
-    from .report_items import PublishReport
+    from .report_items import PublishReport, StreamedPublishReport
 else:
     from widgets import PublishReportViewerWidget
-    from report_items import PublishReport
+    from report_items import PublishReport, StreamedPublishReport
 
 
 ITEM_ID_ROLE = QtCore.Qt.UserRole + 1
@@ -144,16 +150,20 @@ class PublishReportItem:
         """Create report item from file.
 
         Args:
-            filepath (str): Path to report file. Content must be json.
+            filepath (str): Path to report file. Content must be json or
+                streamed report.
 
         Returns:
-            PublishReportItem: Report item.
+            Union[PublishReportItem, StreamedPublishReportItem]: Report item.
         """
 
         if not os.path.exists(filepath):
             return None
 
         try:
+            if is_report_stream(filepath):
+                return StreamedPublishReportItem(filepath)
+
             with open(filepath, "r") as stream:
                 content = json.load(stream)
 
@@ -248,6 +258,96 @@ class PublishReportItem:
         return True
 
 
+class StreamedPublishReportItem:
+    """Report item of streamed report.
+
+    Only index of report is read when item is created, logs are read
+    on demand by viewer.
+
+    Args:
+        filepath (str): Path to report file.
+    """
+
+    def __init__(self, filepath):
+        reader = PublishReportStreamReader(filepath)
+        index = reader.index
+
+        report_path = os.path.join(
+            get_reports_dir(), index["id"] + REPORT_STREAM_EXT
+        )
+        file_modified = None
+        if os.path.exists(report_path):
+            file_modified = os.path.getmtime(report_path)
+
+        created_at_obj = arrow.get(index["created_at"]).to("local")
+
+        self.report_path = report_path
+        self.file_modified = file_modified
+        self.created_at = float(created_at_obj.float_timestamp)
+        self._reader = reader
+        self._label = index.get("label")
+        self._loaded_label = self._label
+        # Index is written to file on save if file did not contain any
+        self._changed = reader.index_rebuilt
+        self._publish_report = None
+
+    @property
+    def version(self):
+        return self._reader.index["report_version"]
+
+    @property
+    def id(self):
+        return self._reader.index["id"]
+
+    def get_label(self):
+        return self._label or "Unfilled label"
+
+    def set_label(self, label):
+        self._label = label or None
+
+    label = property(get_label, set_label)
+
+    @property
+    def loaded_label(self):
+        return self._loaded_label
+
+    @property
+    def publish_report(self):
+        if self._publish_report is None:
+            self._publish_report = StreamedPublishReport(self._reader)
+        return self._publish_report
+
+    def mark_as_changed(self):
+        self._changed = True
+
+    def save(self):
+        """Copy report to reports directory and store label changes.
+
+        Changes are appended to the file as new index so the records are
+        not rewritten.
+        """
+
+        if not os.path.exists(self.report_path):
+            shutil.copyfile(self._reader.filepath, self.report_path)
+            self._reader.set_filepath(self.report_path)
+
+        elif self.file_modified != os.path.getmtime(self.report_path):
+            self._changed = True
+
+        if self._changed or self._loaded_label != self._label:
+            self._reader.write_index(label=self._label)
+
+        self._loaded_label = self._label
+        self._changed = False
+        self.file_modified = os.path.getmtime(self.report_path)
+
+    def remove_file(self):
+        """Remove report file."""
+
+        if os.path.exists(self.report_path):
+            os.remove(self.report_path)
+
+
 class PublisherReportHandler:
     """Class handling storing publish report items."""
 
@@ -414,9 +514,12 @@ class LoadedFilesModel(QtGui.QStandardItemModel):
                 continue
 
             if not report_item.loaded_label:
-                report_item.label = (
-                    os.path.splitext(os.path.basename(filepath))[0]
-                )
+                filename = os.path.basename(normalized_path)
+                if filename.endswith(REPORT_STREAM_EXT):
+                    label = filename[:-len(REPORT_STREAM_EXT)]
+                else:
+                    label = os.path.splitext(filename)[0]
+                report_item.label = label
 
             item = self._create_item(report_item)
             if item is None:
@@ -578,7 +681,9 @@ class LoadedFilesWidget(QtWidgets.QWidget):
             for url in mime_data.urls():
                 filepath = url.toLocalFile()
                 ext = os.path.splitext(filepath)[-1]
-                if os.path.exists(filepath) and ext == ".json":
+                if os.path.exists(filepath) and (
+                    ext == ".json" or filepath.endswith(REPORT_STREAM_EXT)
+                ):
                     filepaths.append(filepath)
             self._add_filepaths(filepaths)
         event.accept()
@@ -0,0 +1,569 @@
+"""Streamed publish report format.
+
+Report is written during publishing as gzip compressed JSON lines. Records
+are buffered and written in chunks where each chunk is standalone gzip
+member, so the file is valid gzip file at any moment and any chunk can be
+decompressed without reading the rest of the file.
+
+Index with plugins, instances and offsets of chunks with their logs is
+appended at the end of file as last chunk, followed by small uncompressed
+trailer with offset of the index. Index can be appended multiple times
+(e.g. on label change), last one is used. If trailer is missing, e.g. when
+publishing crashed, index is rebuilt from records.
+
+```
+<chunk 0: {"type": "report", ...}\n{"type": "plugin", ...}\n...>
+<chunk 1: {"type": "log", ...}\n{"type": "process", ...}\n...>
+...
+<index chunk: {"type": "index", ...}\n>
+<trailer: {"type": "index_pointer", "offset": "<offset of index chunk>"}\n>
+```
+"""
+import os
+import json
+import zlib
+import collections
+
+REPORT_STREAM_VERSION = "2.0.0"
+REPORT_STREAM_EXT = ".jsonl.gz"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+# Keys of plugin data stored to records and index
+_PLUGIN_KEYS = (
+    "id", "name", "label", "order", "targets", "skipped", "passed"
+)
+
+
+def _compress_chunk(data, level=6):
+    # Use zlib directly so gzip header does not contain modification time
+    #   and output of same input has always same size
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _create_trailer(offset):
+    payload = (
+        '{{"type": "index_pointer", "offset": "{:0>20}"}}\n'.format(offset)
+    )
+    return _compress_chunk(payload.encode("utf-8"), 0)
+
+
+_TRAILER_SIZE = len(_create_trailer(0))
+
+
+def _encode_records(records):
+    return "".join(
+        json.dumps(record) + "\n"
+        for record in records
+    ).encode("utf-8")
+
+
+def _decode_records(data):
+    return [
+        json.loads(line)
+        for line in data.decode("utf-8").splitlines()
+        if line
+    ]
+
+
+def is_report_stream(filepath):
+    """Check if file is streamed publish report.
+
+    Args:
+        filepath (str): Path to file.
+
+    Returns:
+        bool: File is gzip compressed streamed report.
+    """
+    with open(filepath, "rb") as stream:
+        return stream.read(2) == _GZIP_MAGIC
+
+
+class _ReportIndexBuilder:
+    """Collect index data from records of report.
+
+    Used by writer during publishing and by reader to rebuild index of
+    report that does not have one.
+    """
+
+    def __init__(self):
+        self._report_data = {}
+        self._context_data = {
+            "label": None,
+            "errored": False,
+            "chunks": set(),
+        }
+        self._crashed_file_paths = {}
+        self._plugins_by_id = collections.OrderedDict()
+        self._instances_by_id = collections.OrderedDict()
+
+    def add_record(self, record, chunk_idx):
+        record_type = record["type"]
+        if record_type == "log":
+            plugin_item = self._get_plugin_item(record["plugin_id"])
+            instance_item = self._get_instance_item(record["instance_id"])
+            errored = record["log_type"] == "error"
+            for item in (plugin_item, instance_item):
+                item["chunks"].add(chunk_idx)
+                if errored:
+                    item["errored"] = True
+
+        elif record_type == "process":
+            plugin_item = self._get_plugin_item(record["plugin_id"])
+            plugin_item["instances_data"].append({
+                "id": record["instance_id"],
+                "process_time": record["process_time"],
+                "logs_count": record["logs_count"],
+                "profile": record.get("profile"),
+            })
+
+        elif record_type == "plugin":
+            plugin_item = self._get_plugin_item(record["id"])
+            for key in _PLUGIN_KEYS:
+                plugin_item[key] = record[key]
+
+        elif record_type == "instance":
+            instance_item = self._get_instance_item(record["id"])
+            instance_item.update(record["data"])
+
+        elif record_type == "action":
+            plugin_item = self._get_plugin_item(record["plugin_id"])
+            plugin_item["actions_data"].append(record["data"])
+
+        elif record_type == "context":
+            self._context_data["label"] = record["label"]
+            self._crashed_file_paths = record["crashed_file_paths"]
+
+        elif record_type == "report":
+            self._report_data = {
+                "id": record["id"],
+                "created_at": record["created_at"],
+                "report_version": record["report_version"],
+            }
+
+    def get_index(self, chunks, report_data=None):
+        """Index data.
+
+        Args:
+            chunks (list[list[int]]): Offset and size of each chunk.
+            report_data (Optional[dict[str, Any]]): Report data in legacy
+                format from which are used states of plugins, instances
+                details and context.
+
+        Returns:
+            dict[str, Any]: Index data.
+        """
+        plugins_by_id = collections.OrderedDict(
+            (plugin_id, dict(plugin_item))
+            for plugin_id, plugin_item in self._plugins_by_id.items()
+        )
+        instances_by_id = collections.OrderedDict(
+            (instance_id, dict(instance_item))
+            for instance_id, instance_item in self._instances_by_id.items()
+        )
+        context_data = dict(self._context_data)
+        crashed_file_paths = self._crashed_file_paths
+        if report_data is not None:
+            for plugin_data in report_data["plugins_data"]:
+                plugin_item = plugins_by_id.get(plugin_data["id"])
+                if plugin_item is None:
+                    plugin_item = self._create_plugin_item(plugin_data["id"])
+                    plugins_by_id[plugin_data["id"]] = plugin_item
+                for key in _PLUGIN_KEYS:
+                    plugin_item[key] = plugin_data[key]
+
+            for instance_id, instance_data in (
+                report_data["instances"].items()
+            ):
+                instance_item = instances_by_id.get(instance_id)
+                if instance_item is None:
+                    instance_item = self._create_instance_item()
+                    instances_by_id[instance_id] = instance_item
+                instance_item.update(instance_data)
+            context_data["label"] = report_data["context"]["label"]
+            crashed_file_paths = report_data["crashed_file_paths"]
+
+        for item in (
+            [context_data]
+            + list(plugins_by_id.values())
+            + list(instances_by_id.values())
+        ):
+            item["chunks"] = list(sorted(item["chunks"]))
+
+        index = {"type": "index"}
+        index.update(self._report_data)
+        index.update({
+            "context": context_data,
+            "crashed_file_paths": crashed_file_paths,
+            "plugins_data": list(plugins_by_id.values()),
+            "instances": instances_by_id,
+            "chunks": chunks,
+        })
+        return index
+
+    def _create_plugin_item(self, plugin_id):
+        return {
+            "id": plugin_id,
+            "name": None,
+            "label": None,
+            "order": None,
+            "targets": [],
+            "skipped": False,
+            "passed": False,
+            "errored": False,
+            "instances_data": [],
+            "actions_data": [],
+            "chunks": set(),
+        }
+
+    def _create_instance_item(self):
+        return {"errored": False, "chunks": set()}
+
+    def _get_plugin_item(self, plugin_id):
+        plugin_item = self._plugins_by_id.get(plugin_id)
+        if plugin_item is None:
+            plugin_item = self._create_plugin_item(plugin_id)
+            self._plugins_by_id[plugin_id] = plugin_item
+        return plugin_item
+
+    def _get_instance_item(self, instance_id):
+        if instance_id is None:
+            return self._context_data
+        instance_item = self._instances_by_id.get(instance_id)
+        if instance_item is None:
+            instance_item = self._create_instance_item()
+            self._instances_by_id[instance_id] = instance_item
+        return instance_item
+
+
+class PublishReportStreamWriter:
+    """Write publish report records to file during publishing.
+
+    Args:
+        filepath (str): Path to output file.
+        report_id (str): Report id.
+        created_at (str): Report creation time in iso format.
+    """
+    chunk_size = 256 * 1024
+
+    def __init__(self, filepath, report_id, created_at):
+        dirpath = os.path.dirname(filepath)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        self._filepath = filepath
+        self._stream = open(filepath, "wb")
+        self._chunks = []
+        self._lines = []
+        self._lines_size = 0
+        self._index_builder = _ReportIndexBuilder()
+
+        self._add_record({
+            "type": "report",
+            "id": report_id,
+            "created_at": created_at,
+            "report_version": REPORT_STREAM_VERSION,
+        })
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def add_plugin(self, plugin_data):
+        """Add plugin or update state of plugin.
+
+        Args:
+            plugin_data (dict[str, Any]): Plugin data of publish report.
+        """
+        record = {"type": "plugin"}
+        for key in _PLUGIN_KEYS:
+            record[key] = plugin_data[key]
+        self._add_record(record)
+
+    def add_instance(self, instance_id, instance_data):
+        self._add_record({
+            "type": "instance",
+            "id": instance_id,
+            "data": instance_data,
+        })
+
+    def add_process(
+        self, plugin_id, instance_id, log_items, process_time, profile=None
+    ):
+        """Add result of plugin processing with logs.
+
+        Args:
+            plugin_id (str): Plugin id.
+            instance_id (Union[str, None]): Instance id or None for context.
+            log_items (list[dict[str, Any]]): Log items of processing.
+            process_time (float): Duration of processing.
+            profile (Optional[dict[str, Any]]): Profiling data of
+                processing.
+        """
+        for log_item in log_items:
+            record = dict(log_item)
+            record["type"] = "log"
+            record["log_type"] = log_item["type"]
+            record["plugin_id"] = plugin_id
+            record["instance_id"] = instance_id
+            self._add_record(record)
+
+        self._add_record({
+            "type": "process",
+            "plugin_id": plugin_id,
+            "instance_id": instance_id,
+            "process_time": process_time,
+            "logs_count": len(log_items),
+            "profile": profile,
+        })
+
+    def add_action(self, plugin_id, action_data):
+        self._add_record({
+            "type": "action",
+            "plugin_id": plugin_id,
+            "data": action_data,
+        })
+
+    def write_index(self, report_data):
+        """Write index of report to file.
+
+        Can be called multiple times, e.g. when publishing is paused and
+            continues later.
+
+        Args:
+            report_data (dict[str, Any]): Report in legacy format which is
+                used for final state of plugins, instances and context.
+        """
+        self._add_record({
+            "type": "context",
+            "label": report_data["context"]["label"],
+            "crashed_file_paths": report_data["crashed_file_paths"],
+        })
+        self.flush()
+        index = self._index_builder.get_index(
+            list(self._chunks), report_data
+        )
+        offset = self._stream.tell()
+        self._stream.write(_compress_chunk(_encode_records([index])))
+        self._stream.write(_create_trailer(offset))
+        self._stream.flush()
+
+    def flush(self):
+        """Write buffered records as new chunk."""
+        if not self._lines:
+            return
+        offset = self._stream.tell()
+        data = _compress_chunk("".join(self._lines).encode("utf-8"))
+        self._stream.write(data)
+        self._stream.flush()
+        self._chunks.append([offset, len(data)])
+        self._lines = []
+        self._lines_size = 0
+
+    def close(self):
+        if self._stream.closed:
+            return
+        self.flush()
+        self._stream.close()
+
+    def _add_record(self, record):
+        self._index_builder.add_record(record, len(self._chunks))
+        line = json.dumps(record) + "\n"
+        self._lines.append(line)
+        self._lines_size += len(line)
+        if self._lines_size >= self.chunk_size:
+            self.flush()
+
+
+class PublishReportStreamReader:
+    """Read streamed publish report.
+
+    Only index is read on initialization. Chunks with records are read on
+        demand and few last are cached.
+
+    Args:
+        filepath (str): Path to report file.
+    """
+    max_cached_chunks = 8
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._index = None
+        self._index_rebuilt = False
+        self._cached_chunks = collections.OrderedDict()
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    @property
+    def index(self):
+        """Index of report.
+
+        Returns:
+            dict[str, Any]: Index data.
+        """
+        if self._index is None:
+            self._index = self._read_index()
+            if self._index is None:
+                self._index = self._rebuild_index()
+                self._index_rebuilt = True
+        return self._index
+
+    @property
+    def index_rebuilt(self):
+        """Index was rebuilt from records because file did not have one.
+
+        Returns:
+            bool: Index is not stored in file.
+        """
+        self.index
+        return self._index_rebuilt
+
+    def set_filepath(self, filepath):
+        """Change path to report, e.g. when file was copied."""
+        self._filepath = filepath
+
+    def write_index(self, **changes):
+        """Append updated index to the report file.
+
+        Args:
+            **changes: Changed keys of index, e.g. 'label'.
+        """
+        index = dict(self.index)
+        index.update(changes)
+        with open(self._filepath, "ab") as stream:
+            offset = stream.tell()
+            stream.write(_compress_chunk(_encode_records([index])))
+            stream.write(_create_trailer(offset))
+        self._index = index
+        self._index_rebuilt = False
+
+    def read_chunk(self, chunk_idx):
+        """Records of chunk.
+
+        Args:
+            chunk_idx (int): Index of chunk.
+
+        Returns:
+            list[dict[str, Any]]: Records of chunk.
+        """
+        records = self._cached_chunks.pop(chunk_idx, None)
+        if records is None:
+            offset, size = self.index["chunks"][chunk_idx]
+            with open(self._filepath, "rb") as stream:
+                stream.seek(offset)
+                data = stream.read(size)
+            records = _decode_records(zlib.decompress(data, 31))
+
+        self._cached_chunks[chunk_idx] = records
+        while len(self._cached_chunks) > self.max_cached_chunks:
+            self._cached_chunks.popitem(last=False)
+        return records
+
+    def iter_logs(self, plugin_ids=None, instance_ids=None):
+        """Iterate log records of report.
+
+        Only chunks containing logs of passed plugins and instances are
+            read.
+
+        Args:
+            plugin_ids (Optional[Iterable[str]]): Filter by plugin ids.
+            instance_ids (Optional[Iterable[Union[str, None]]]): Filter by
+                instance ids. Context is represented by 'None'.
+
+        Yields:
+            dict[str, Any]: Log record.
+        """
+        index = self.index
+        chunk_indexes = set(range(len(index["chunks"])))
+        if plugin_ids:
+            plugin_ids = set(plugin_ids)
+            plugin_chunks = set()
+            for plugin_item in index["plugins_data"]:
+                if plugin_item["id"] in plugin_ids:
+                    plugin_chunks |= set(plugin_item["chunks"])
+            chunk_indexes &= plugin_chunks
+
+        if instance_ids:
+            instance_ids = set(instance_ids)
+            instance_chunks = set()
+            for instance_id in instance_ids:
+                if instance_id is None:
+                    instance_item = index["context"]
+                else:
+                    instance_item = index["instances"].get(instance_id)
+                if instance_item:
+                    instance_chunks |= set(instance_item["chunks"])
+            chunk_indexes &= instance_chunks
+
+        for chunk_idx in sorted(chunk_indexes):
+            for record in self.read_chunk(chunk_idx):
+                if record["type"] != "log":
+                    continue
+                if plugin_ids and record["plugin_id"] not in plugin_ids:
+                    continue
+                if (
+                    instance_ids
+                    and record["instance_id"] not in instance_ids
+                ):
+                    continue
+                yield record
+
+    def _read_index(self):
+        file_size = os.path.getsize(self._filepath)
+        if file_size < _TRAILER_SIZE:
+            return None
+
+        with open(self._filepath, "rb") as stream:
+            stream.seek(file_size - _TRAILER_SIZE)
+            try:
+                records = _decode_records(
+                    zlib.decompress(stream.read(), 31)
+                )
+            except (zlib.error, ValueError):
+                return None
+
+            if len(records) != 1 or records[0]["type"] != "index_pointer":
+                return None
+
+            offset = int(records[0]["offset"])
+            stream.seek(offset)
+            data = stream.read(file_size - _TRAILER_SIZE - offset)
+        return _decode_records(zlib.decompress(data, 31))[0]
+
+    def _rebuild_index(self):
+        with open(self._filepath, "rb") as stream:
+            data = memoryview(stream.read())
+
+        index_builder = _ReportIndexBuilder()
+        chunks = []
+        offset = 0
+        while offset < len(data):
+            decompressor = zlib.decompressobj(31)
+            try:
+                content = decompressor.decompress(data[offset:])
+            except zlib.error:
+                break
+
+            # Last chunk was not fully written
+            if not decompressor.eof:
+                break
+
+            size = len(data) - offset - len(decompressor.unused_data)
+            records = _decode_records(content)
+            if records and records[0]["type"] not in (
+                "index", "index_pointer"
+            ):
+                chunk_idx = len(chunks)
+                chunks.append([offset, size])
+                for record in records:
+                    index_builder.add_record(record, chunk_idx)
+            offset += size
+
+        index = index_builder.get_index(chunks)
+        if "id" not in index:
+            raise ValueError(
+                "File '{}' is not a publish report".format(self._filepath)
+            )
+        return index
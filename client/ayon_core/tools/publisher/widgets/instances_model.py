@@ -0,0 +1,413 @@
+"""Model of instances shared by list and card view.
+
+Model does not create any widgets. Views paint the items with delegates
+so only visible items are painted. Changes of instances are propagated
+to items with 'setData' which triggers 'dataChanged' of changed rows only.
+
+```
+|- Context
+|- <Incompatible products>
+|  |- <Convertor item 1>
+|  ...
+|- <Group 1>
+|  |- <Instance 1>
+|  |- <Instance 2>
+|  ...
+...
+```
+"""
+import collections
+
+from qtpy import QtCore, QtGui
+
+from ..constants import (
+    INSTANCE_ID_ROLE,
+    SORT_VALUE_ROLE,
+    IS_GROUP_ROLE,
+    CREATOR_IDENTIFIER_ROLE,
+    GROUP_ROLE,
+    CONVERTER_IDENTIFIER_ROLE,
+    ACTIVE_STATE_ROLE,
+    HAS_VALID_CONTEXT_ROLE,
+    VARIANT_ROLE,
+    CREATOR_ICON_ROLE,
+    CONTEXT_ID,
+    CONTEXT_LABEL,
+    CONTEXT_GROUP,
+    CONVERTOR_ITEM_GROUP,
+)
+
+
+def _set_item_data(item, value, role):
+    """Set data on item only if value changed.
+
+    Returns:
+        bool: Value was changed.
+    """
+    if item.data(role) == value:
+        return False
+    item.setData(value, role)
+    return True
+
+
+def _remove_items(items):
+    """Remove items from their parents.
+
+    Rows of items are grouped to continuous blocks removed with single
+    'removeRows' call, so model does not emit signals for each row.
+
+    Args:
+        items (Iterable[QtGui.QStandardItem]): Items to remove.
+    """
+    rows_by_parent = collections.defaultdict(list)
+    parents_by_id = {}
+    for item in items:
+        parent_item = item.parent()
+        if parent_item is None:
+            continue
+        parents_by_id[id(parent_item)] = parent_item
+        rows_by_parent[id(parent_item)].append(item.row())
+
+    for parent_id, rows in rows_by_parent.items():
+        parent_item = parents_by_id[parent_id]
+        rows.sort(reverse=True)
+        # Remove blocks from the end so rows of other blocks don't change
+        end_row = start_row = rows[0]
+        for row in rows[1:]:
+            if row == start_row - 1:
+                start_row = row
+                continue
+            parent_item.removeRows(start_row, end_row - start_row + 1)
+            end_row = start_row = row
+        parent_item.removeRows(start_row, end_row - start_row + 1)
+
+
+def _active_to_checkstate(active):
+    if active:
+        return QtCore.Qt.Checked
+    return QtCore.Qt.Unchecked
+
+
+class InstancesModel(QtGui.QStandardItemModel):
+    """Instances, convertor items and context item grouped by groups.
+
+    Args:
+        controller (AbstractPublisherFrontend): Publisher controller.
+    """
+
+    def __init__(self, controller):
+        super(InstancesModel, self).__init__()
+
+        self._controller = controller
+
+        self._context_item = None
+        self._convertor_group_item = None
+        self._convertor_items_by_id = {}
+        self._group_items = {}
+        self._instance_items_by_id = {}
+        self._instances_by_id = {}
+        # Group by instance id for handling of active state
+        self._group_by_instance_id = {}
+
+    def get_context_item(self):
+        return self._context_item
+
+    def get_convertor_group_item(self):
+        return self._convertor_group_item
+
+    def get_group_item(self, group_name):
+        if group_name == CONVERTOR_ITEM_GROUP:
+            return self._convertor_group_item
+        return self._group_items.get(group_name)
+
+    def get_group_names(self):
+        return set(self._group_items.keys())
+
+    def get_instance_item(self, instance_id):
+        return self._instance_items_by_id.get(instance_id)
+
+    def get_group_instance_ids(self, group_name):
+        return {
+            instance_id
+            for instance_id, _group_name in self._group_by_instance_id.items()
+            if _group_name == group_name
+        }
+
+    def has_items(self):
+        if self._convertor_group_item is not None:
+            return True
+        if self._group_items:
+            return True
+        return False
+
+    def refresh(self):
+        """Refresh items based on current instances of controller.
+
+        Existing items are updated, only new instances create new items.
+
+        Returns:
+            set[str]: Names of groups where were added new instances with
+                invalid context.
+        """
+        self._make_sure_context_item_exists()
+        self._update_convertor_items_group()
+
+        instances_by_group_name = collections.defaultdict(list)
+        for instance in self._controller.instances.values():
+            instances_by_group_name[instance.group_label].append(instance)
+
+        self._make_sure_groups_exists(instances_by_group_name.keys())
+        self._remove_groups_except(instances_by_group_name.keys())
+
+        icons_by_identifier = {}
+        instances_by_id = {}
+        invalid_groups = set()
+        items_to_remove = []
+        for group_name, instances in instances_by_group_name.items():
+            group_item = self._group_items[group_name]
+            new_items = []
+            for instance in instances:
+                instance_id = instance.id
+                instances_by_id[instance_id] = instance
+                self._group_by_instance_id[instance_id] = group_name
+
+                creator_identifier = instance.creator_identifier
+                if creator_identifier not in icons_by_identifier:
+                    icons_by_identifier[creator_identifier] = (
+                        self._controller.get_creator_icon(creator_identifier)
+                    )
+
+                item = self._instance_items_by_id.get(instance_id)
+                if item is not None and item.parent() is not group_item:
+                    # Group of instance changed
+                    items_to_remove.append(item)
+                    item = None
+
+                if item is None:
+                    item = QtGui.QStandardItem()
+                    item.setFlags(
+                        QtCore.Qt.ItemIsEnabled
+                        | QtCore.Qt.ItemIsSelectable
+                    )
+                    item.setData(instance_id, INSTANCE_ID_ROLE)
+                    self._instance_items_by_id[instance_id] = item
+                    new_items.append(item)
+                    if not instance.has_valid_context:
+                        invalid_groups.add(group_name)
+
+                _set_item_data(item, group_name, GROUP_ROLE)
+                if _set_item_data(
+                    item, creator_identifier, CREATOR_IDENTIFIER_ROLE
+                ):
+                    item.setData(
+                        icons_by_identifier[creator_identifier],
+                        CREATOR_ICON_ROLE
+                    )
+                self._update_instance_item(item, instance)
+
+            if new_items:
+                group_item.appendRows(new_items)
+
+        # Remove items of instances that are not available anymore
+        for instance_id in set(self._instance_items_by_id) - set(
+            instances_by_id
+        ):
+            items_to_remove.append(
+                self._instance_items_by_id.pop(instance_id)
+            )
+            self._group_by_instance_id.pop(instance_id, None)
+        _remove_items(items_to_remove)
+
+        self._instances_by_id = instances_by_id
+        for group_name in instances_by_group_name:
+            self._update_group_checkstate(group_name)
+
+        return invalid_groups
+
+    def refresh_instance_states(self):
+        """Update data of items based on current state of instances."""
+        group_names = set()
+        for instance_id, instance in self._instances_by_id.items():
+            item = self._instance_items_by_id.get(instance_id)
+            if item is None:
+                continue
+            if self._update_instance_item(item, instance):
+                group_names.add(self._group_by_instance_id[instance_id])
+
+        for group_name in group_names:
+            self._update_group_checkstate(group_name)
+
+    def is_instance_active(self, instance_id):
+        instance = self._instances_by_id.get(instance_id)
+        if instance is None:
+            return None
+        return instance["active"]
+
+    def set_instances_active(self, instance_ids, active):
+        """Change active state of instances.
+
+        Args:
+            instance_ids (Iterable[str]): Instance ids.
+            active (Union[bool, None]): New active state. State of each
+                instance is inverted if is 'None'.
+
+        Returns:
+            bool: Active state of any instance changed.
+        """
+        changed = False
+        group_names = set()
+        for instance_id in instance_ids:
+            instance = self._instances_by_id.get(instance_id)
+            item = self._instance_items_by_id.get(instance_id)
+            if instance is None or item is None:
+                continue
+
+            new_value = active
+            if new_value is None:
+                new_value = not instance["active"]
+
+            if instance["active"] != new_value:
+                instance["active"] = new_value
+                changed = True
+
+            if _set_item_data(
+                item, _active_to_checkstate(new_value), ACTIVE_STATE_ROLE
+            ):
+                group_names.add(self._group_by_instance_id[instance_id])
+
+        for group_name in group_names:
+            self._update_group_checkstate(group_name)
+        return changed
+
+    def _update_instance_item(self, item, instance):
+        """Update item data by instance.
+
+        Returns:
+            bool: Active state of item changed.
+        """
+        label = instance.label
+        if label is None:
+            # Do not cause UI crash if label is 'None'
+            label = "No label"
+        _set_item_data(item, label, QtCore.Qt.DisplayRole)
+        _set_item_data(item, instance["productName"], SORT_VALUE_ROLE)
+        _set_item_data(item, instance["variant"], VARIANT_ROLE)
+        _set_item_data(
+            item, instance.has_valid_context, HAS_VALID_CONTEXT_ROLE
+        )
+        return _set_item_data(
+            item,
+            _active_to_checkstate(instance["active"]),
+            ACTIVE_STATE_ROLE
+        )
+
+    def _update_group_checkstate(self, group_name):
+        group_item = self._group_items.get(group_name)
+        if group_item is None:
+            return
+
+        activity = None
+        for row in range(group_item.rowCount()):
+            state = group_item.child(row).data(ACTIVE_STATE_ROLE)
+            if activity is None:
+                activity = state
+            elif activity != state:
+                activity = QtCore.Qt.PartiallyChecked
+                break
+
+        if activity is not None:
+            _set_item_data(group_item, activity, ACTIVE_STATE_ROLE)
+
+    def _make_sure_context_item_exists(self):
+        if self._context_item is not None:
+            return
+
+        context_item = QtGui.QStandardItem(CONTEXT_LABEL)
+        context_item.setFlags(
+            QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        )
+        context_item.setData(0, SORT_VALUE_ROLE)
+        context_item.setData(CONTEXT_ID, INSTANCE_ID_ROLE)
+        context_item.setData(CONTEXT_GROUP, GROUP_ROLE)
+        self.invisibleRootItem().appendRow(context_item)
+        self._context_item = context_item
+
+    def _update_convertor_items_group(self):
+        convertor_items_by_id = self._controller.convertor_items
+        group_item = self._convertor_group_item
+        if not convertor_items_by_id and group_item is None:
+            return
+
+        root_item = self.invisibleRootItem()
+        if not convertor_items_by_id:
+            root_item.removeRow(group_item.row())
+            self._convertor_group_item = None
+            self._convertor_items_by_id = {}
+            return
+
+        if group_item is None:
+            group_item = QtGui.QStandardItem(CONVERTOR_ITEM_GROUP)
+            group_item.setData(CONVERTOR_ITEM_GROUP, GROUP_ROLE)
+            group_item.setData(1, SORT_VALUE_ROLE)
+            group_item.setData(True, IS_GROUP_ROLE)
+            group_item.setFlags(QtCore.Qt.ItemIsEnabled)
+            root_item.appendRow(group_item)
+            self._convertor_group_item = group_item
+
+        for row in reversed(range(group_item.rowCount())):
+            child_item = group_item.child(row)
+            child_identifier = child_item.data(CONVERTER_IDENTIFIER_ROLE)
+            if child_identifier not in convertor_items_by_id:
+                self._convertor_items_by_id.pop(child_identifier, None)
+                group_item.removeRows(row, 1)
+
+        new_items = []
+        for identifier, convertor_item in convertor_items_by_id.items():
+            item = self._convertor_items_by_id.get(identifier)
+            if item is None:
+                item = QtGui.QStandardItem()
+                item.setFlags(
+                    QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+                )
+                new_items.append(item)
+            _set_item_data(item, convertor_item.label, QtCore.Qt.DisplayRole)
+            _set_item_data(item, convertor_item.id, INSTANCE_ID_ROLE)
+            _set_item_data(item, convertor_item.label, SORT_VALUE_ROLE)
+            _set_item_data(item, CONVERTOR_ITEM_GROUP, GROUP_ROLE)
+            _set_item_data(
+                item, convertor_item.identifier, CONVERTER_IDENTIFIER_ROLE
+            )
+            self._convertor_items_by_id[identifier] = item
+
+        if new_items:
+            group_item.appendRows(new_items)
+
+    def _make_sure_groups_exists(self, group_names):
+        new_group_items = []
+        for group_name in group_names:
+            if group_name in self._group_items:
+                continue
+
+            group_item = QtGui.QStandardItem(group_name)
+            group_item.setData(group_name, GROUP_ROLE)
+            group_item.setData(group_name, SORT_VALUE_ROLE)
+            group_item.setData(True, IS_GROUP_ROLE)
+            group_item.setFlags(QtCore.Qt.ItemIsEnabled)
+            self._group_items[group_name] = group_item
+            new_group_items.append(group_item)
+
+        if new_group_items:
+            self.invisibleRootItem().appendRows(new_group_items)
+
+    def _remove_groups_except(self, group_names):
+        root_item = self.invisibleRootItem()
+        for group_name in tuple(self._group_items.keys()):
+            if group_name in group_names:
+                continue
+
+            group_item = self._group_items.pop(group_name)
+            for row in range(group_item.rowCount()):
+                instance_id = group_item.child(row).data(INSTANCE_ID_ROLE)
+                self._instance_items_by_id.pop(instance_id, None)
+                self._group_by_instance_id.pop(instance_id, None)
+            root_item.removeRow(group_item.row())
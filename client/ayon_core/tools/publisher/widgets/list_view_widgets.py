@@ -21,38 +21,45 @@ selection can be enabled disabled using checkbox or keyboard key presses:
 |  ...
 ...
 ```
+
+Rows are painted by delegate and no widget is created per item, so only
+visible rows are painted. Changes of instances are applied to items of
+model which triggers repaint of changed rows only.
 """
 import collections
 
 from qtpy import QtWidgets, QtCore, QtGui
 
 from ayon_core.style import get_objected_colors
-from ayon_core.tools.utils import NiceCheckbox
-from ayon_core.tools.utils.lib import html_escape, checkstate_int_to_enum
+from ayon_core.tools.utils.nice_checkbox import NiceCheckbox
 from .widgets import AbstractInstanceView
+from .instances_model import InstancesModel
 from ..constants import (
     INSTANCE_ID_ROLE,
     SORT_VALUE_ROLE,
     IS_GROUP_ROLE,
     CONTEXT_ID,
-    CONTEXT_LABEL,
     GROUP_ROLE,
     CONVERTER_IDENTIFIER_ROLE,
-    CONVERTOR_ITEM_GROUP,
+    ACTIVE_STATE_ROLE,
+    HAS_VALID_CONTEXT_ROLE,
 )
 
 
 class ListItemDelegate(QtWidgets.QStyledItemDelegate):
-    """Generic delegate for instance group.
+    """Delegate painting all items of instance list view.
 
     All indexes having `IS_GROUP_ROLE` data set to True will use
-    `group_item_paint` method to draw it's content otherwise default styled
-    item delegate paint method is used.
+    `group_item_paint` method to draw it's content otherwise
+    `instance_item_paint` is used.
 
     Goal is to draw group items with different colors for normal, hover and
-    pressed state.
+    pressed state. Items with `ACTIVE_STATE_ROLE` have checkbox painted on
+    the right side.
     """
     radius_ratio = 0.3
+    text_margin = 5
+    checkbox_margin = 2
 
     def __init__(self, parent):
         super(ListItemDelegate, self).__init__(parent)
@@ -63,12 +70,110 @@ class ListItemDelegate(QtWidgets.QStyledItemDelegate):
             key: value.get_qcolor()
             for key, value in group_color_info.items()
         }
+        self._error_color = get_objected_colors(
+            "publisher", "error"
+        ).get_qcolor()
+        self._active_toggle_enabled = True
+
+    def set_active_toggle_enabled(self, enabled):
+        self._active_toggle_enabled = enabled
+
+    def get_checkbox_rect(self, rect, font_metrics):
+        """Rect of checkbox in item rect.
+
+        Args:
+            rect (QtCore.QRect): Rect of item.
+            font_metrics (QtGui.QFontMetrics): Font metrics of view.
+
+        Returns:
+            QtCore.QRect: Rect of checkbox.
+        """
+        height = min(font_metrics.height(), rect.height())
+        return NiceCheckbox.get_checkbox_rect(QtCore.QRect(
+            rect.left(),
+            rect.top() + int((rect.height() - height) / 2),
+            rect.width() - self.checkbox_margin,
+            height
+        ))
+
+    def sizeHint(self, option, index):
+        size = super(ListItemDelegate, self).sizeHint(option, index)
+        size.setHeight(option.fontMetrics.height() + 8)
+        return size
 
     def paint(self, painter, option, index):
         if index.data(IS_GROUP_ROLE):
             self.group_item_paint(painter, option, index)
         else:
-            super(ListItemDelegate, self).paint(painter, option, index)
+            self.instance_item_paint(painter, option, index)
+
+    def _paint_checkbox(self, painter, option, index):
+        """Paint checkbox if item has active state.
+
+        Returns:
+            int: Left position of checkbox or right position of item.
+        """
+        checkstate = index.data(ACTIVE_STATE_ROLE)
+        if checkstate is None:
+            return option.rect.right()
+
+        hovered = bool(option.state & QtWidgets.QStyle.State_MouseOver)
+        checkbox_rect = NiceCheckbox.paint_checkbox(
+            painter,
+            self.get_checkbox_rect(option.rect, option.fontMetrics),
+            checkstate,
+            enabled=self._active_toggle_enabled,
+            hovered=hovered,
+        )
+        return checkbox_rect.left()
+
+    def _paint_text(self, painter, option, text, left, right, color=None):
+        text_rect = QtCore.QRect(
+            left,
+            option.rect.top(),
+            max(0, right - left),
+            option.rect.height()
+        )
+        text = option.fontMetrics.elidedText(
+            text, QtCore.Qt.ElideRight, text_rect.width()
+        )
+        painter.save()
+        if color is not None:
+            painter.setPen(color)
+        else:
+            painter.setPen(option.palette.color(QtGui.QPalette.Text))
+        painter.drawText(
+            text_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            text
+        )
+        painter.restore()
+
+    def instance_item_paint(self, painter, option, index):
+        """Paint instance, context or convertor item."""
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        # Text is painted separately to not overlap checkbox
+        text = opt.text
+        opt.text = ""
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        style.drawControl(
+            QtWidgets.QStyle.CE_ItemViewItem, opt, painter, widget
+        )
+
+        right = self._paint_checkbox(painter, option, index)
+        color = None
+        if index.data(HAS_VALID_CONTEXT_ROLE) is False:
+            color = self._error_color
+        self._paint_text(
+            painter,
+            option,
+            text,
+            option.rect.left() + self.text_margin + 2,
+            right - self.text_margin,
+            color
+        )
 
     def group_item_paint(self, painter, option, index):
         """Paint group item."""
@@ -101,235 +206,52 @@ class ListItemDelegate(QtWidgets.QStyledItemDelegate):
         elif hovered:
             painter.fillPath(bg_path, self._group_colors["bg-hover"])
 
-        painter.restore()
-
-
-class InstanceListItemWidget(QtWidgets.QWidget):
-    """Widget with instance info drawn over delegate paint.
-
-    This is required to be able use custom checkbox on custom place.
-    """
-    active_changed = QtCore.Signal(str, bool)
-    double_clicked = QtCore.Signal()
-
-    def __init__(self, instance, parent):
-        super(InstanceListItemWidget, self).__init__(parent)
-
-        self.instance = instance
-
-        instance_label = instance.label
-        if instance_label is None:
-            # Do not cause UI crash if label is 'None'
-            instance_label = "No label"
-
-        instance_label = html_escape(instance_label)
-
-        product_name_label = QtWidgets.QLabel(instance_label, self)
-        product_name_label.setObjectName("ListViewProductName")
-
-        active_checkbox = NiceCheckbox(parent=self)
-        active_checkbox.setChecked(instance["active"])
-
-        layout = QtWidgets.QHBoxLayout(self)
-        content_margins = layout.contentsMargins()
-        layout.setContentsMargins(content_margins.left() + 2, 0, 2, 0)
-        layout.addWidget(product_name_label)
-        layout.addStretch(1)
-        layout.addWidget(active_checkbox)
-
-        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        product_name_label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        active_checkbox.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-
-        active_checkbox.stateChanged.connect(self._on_active_change)
-
-        self._instance_label_widget = product_name_label
-        self._active_checkbox = active_checkbox
-
-        self._has_valid_context = None
-
-        self._set_valid_property(instance.has_valid_context)
-
-    def mouseDoubleClickEvent(self, event):
-        widget = self.childAt(event.pos())
-        super(InstanceListItemWidget, self).mouseDoubleClickEvent(event)
-        if widget is not self._active_checkbox:
-            self.double_clicked.emit()
-
-    def _set_valid_property(self, valid):
-        if self._has_valid_context == valid:
-            return
-        self._has_valid_context = valid
-        state = ""
-        if not valid:
-            state = "invalid"
-        self._instance_label_widget.setProperty("state", state)
-        self._instance_label_widget.style().polish(self._instance_label_widget)
-
-    def is_active(self):
-        """Instance is activated."""
-        return self.instance["active"]
-
-    def set_active(self, new_value):
-        """Change active state of instance and checkbox."""
-        checkbox_value = self._active_checkbox.isChecked()
-        instance_value = self.instance["active"]
-        if new_value is None:
-            new_value = not instance_value
-
-        # First change instance value and them change checkbox
-        # - prevent to trigger `active_changed` signal
-        if instance_value != new_value:
-            self.instance["active"] = new_value
-
-        if checkbox_value != new_value:
-            self._active_checkbox.setChecked(new_value)
-
-    def update_instance(self, instance):
-        """Update instance object."""
-        self.instance = instance
-        self.update_instance_values()
-
-    def update_instance_values(self):
-        """Update instance data propagated to widgets."""
-        # Check product name
-        label = self.instance.label
-        if label != self._instance_label_widget.text():
-            self._instance_label_widget.setText(html_escape(label))
-        # Check active state
-        self.set_active(self.instance["active"])
-        # Check valid states
-        self._set_valid_property(self.instance.has_valid_context)
-
-    def _on_active_change(self):
-        new_value = self._active_checkbox.isChecked()
-        old_value = self.instance["active"]
-        if new_value == old_value:
-            return
-
-        self.instance["active"] = new_value
-        self.active_changed.emit(self.instance.id, new_value)
-
-    def set_active_toggle_enabled(self, enabled):
-        self._active_checkbox.setEnabled(enabled)
-
-
-class ListContextWidget(QtWidgets.QFrame):
-    """Context (or global attributes) widget."""
-    double_clicked = QtCore.Signal()
-
-    def __init__(self, parent):
-        super(ListContextWidget, self).__init__(parent)
-
-        label_widget = QtWidgets.QLabel(CONTEXT_LABEL, self)
-
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(5, 0, 2, 0)
-        layout.addWidget(
-            label_widget, 1, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+        # Draw expand arrow
+        view = self.parent()
+        expanded = False
+        if isinstance(view, QtWidgets.QTreeView):
+            expanded = view.isExpanded(index)
+        arrow_size = int(option.fontMetrics.height() / 2)
+        arrow_left = option.rect.left() + self.text_margin + 2
+        center_y = option.rect.center().y()
+        arrow_path = QtGui.QPainterPath()
+        if expanded:
+            arrow_path.moveTo(arrow_left, center_y - arrow_size / 4)
+            arrow_path.lineTo(
+                arrow_left + arrow_size, center_y - arrow_size / 4
+            )
+            arrow_path.lineTo(
+                arrow_left + arrow_size / 2, center_y + arrow_size / 4
+            )
+        else:
+            arrow_path.moveTo(
+                arrow_left + arrow_size / 4, center_y - arrow_size / 2
+            )
+            arrow_path.lineTo(arrow_left + arrow_size * 3 / 4, center_y)
+            arrow_path.lineTo(
+                arrow_left + arrow_size / 4, center_y + arrow_size / 2
+            )
+        arrow_path.closeSubpath()
+        painter.fillPath(
+            arrow_path, option.palette.color(QtGui.QPalette.Text)
         )
 
-        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        label_widget.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-
-        self.label_widget = label_widget
-
-    def mouseDoubleClickEvent(self, event):
-        super(ListContextWidget, self).mouseDoubleClickEvent(event)
-        self.double_clicked.emit()
-
-
-class InstanceListGroupWidget(QtWidgets.QFrame):
-    """Widget representing group of instances.
-
-    Has collapse/expand indicator, label of group and checkbox modifying all of
-    it's children.
-    """
-    expand_changed = QtCore.Signal(str, bool)
-    toggle_requested = QtCore.Signal(str, int)
-
-    def __init__(self, group_name, parent):
-        super(InstanceListGroupWidget, self).__init__(parent)
-        self.setObjectName("InstanceListGroupWidget")
-
-        self.group_name = group_name
-        self._expanded = False
-
-        expand_btn = QtWidgets.QToolButton(self)
-        expand_btn.setObjectName("ArrowBtn")
-        expand_btn.setArrowType(QtCore.Qt.RightArrow)
-        expand_btn.setMaximumWidth(14)
-
-        name_label = QtWidgets.QLabel(group_name, self)
-
-        toggle_checkbox = NiceCheckbox(parent=self)
+        painter.restore()
 
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(5, 0, 2, 0)
-        layout.addWidget(expand_btn)
-        layout.addWidget(
-            name_label, 1, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+        right = self._paint_checkbox(painter, option, index)
+        self._paint_text(
+            painter,
+            option,
+            index.data(QtCore.Qt.DisplayRole),
+            arrow_left + arrow_size + self.text_margin,
+            right - self.text_margin,
         )
-        layout.addWidget(toggle_checkbox, 0)
-
-        name_label.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-        expand_btn.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-
-        expand_btn.clicked.connect(self._on_expand_clicked)
-        toggle_checkbox.stateChanged.connect(self._on_checkbox_change)
-
-        self._ignore_state_change = False
-
-        self._expected_checkstate = None
-
-        self.name_label = name_label
-        self.expand_btn = expand_btn
-        self.toggle_checkbox = toggle_checkbox
-
-    def set_checkstate(self, state):
-        """Change checkstate of "active" checkbox.
-
-        Args:
-            state(QtCore.Qt.CheckState): Checkstate of checkbox. Have 3
-                variants Unchecked, Checked and PartiallyChecked.
-        """
-
-        if self.checkstate() == state:
-            return
-        self._ignore_state_change = True
-        self.toggle_checkbox.setCheckState(state)
-        self._ignore_state_change = False
-
-    def checkstate(self):
-        """Current checkstate of "active" checkbox."""
-
-        return self.toggle_checkbox.checkState()
-
-    def _on_checkbox_change(self, state):
-        if not self._ignore_state_change:
-            self.toggle_requested.emit(self.group_name, state)
-
-    def _on_expand_clicked(self):
-        self.expand_changed.emit(self.group_name, not self._expanded)
-
-    def set_expanded(self, expanded):
-        """Change icon of collapse/expand identifier."""
-        if self._expanded == expanded:
-            return
-
-        self._expanded = expanded
-        if expanded:
-            self.expand_btn.setArrowType(QtCore.Qt.DownArrow)
-        else:
-            self.expand_btn.setArrowType(QtCore.Qt.RightArrow)
-
-    def set_active_toggle_enabled(self, enabled):
-        self.toggle_checkbox.setEnabled(enabled)
 
 
 class InstanceTreeView(QtWidgets.QTreeView):
     """View showing instances and their groups."""
     toggle_requested = QtCore.Signal(int)
+    active_toggle_requested = QtCore.Signal(QtCore.QModelIndex)
     double_clicked = QtCore.Signal()
 
     def __init__(self, *args, **kwargs):
@@ -344,6 +266,7 @@ class InstanceTreeView(QtWidgets.QTreeView):
         )
         self.viewport().setMouseTracking(True)
         self._pressed_group_index = None
+        self._pressed_checkbox_index = None
 
     def _expand_item(self, index, expand=None):
         is_expanded = self.isExpanded(index)
@@ -386,6 +309,35 @@ class InstanceTreeView(QtWidgets.QTreeView):
 
         return super(InstanceTreeView, self).event(event)
 
+    def _get_checkbox_index(self, pos):
+        """Index of item which has checkbox under passed position."""
+        index = self.indexAt(pos)
+        if not index.isValid() or index.data(ACTIVE_STATE_ROLE) is None:
+            return None
+
+        checkbox_rect = self.itemDelegate().get_checkbox_rect(
+            self.visualRect(index), self.fontMetrics()
+        )
+        if checkbox_rect.contains(pos):
+            return index
+        return None
+
+    def _checkbox_press(self, event):
+        """Store index of pressed checkbox.
+
+        Returns:
+            bool: Checkbox was pressed and event should not be processed.
+        """
+        if event.button() != QtCore.Qt.LeftButton:
+            return False
+
+        index = self._get_checkbox_index(event.pos())
+        if index is None:
+            return False
+        self._pressed_checkbox_index = QtCore.QPersistentModelIndex(index)
+        event.accept()
+        return True
+
     def _mouse_press(self, event):
         """Store index of pressed group.
 
@@ -403,12 +355,39 @@ class InstanceTreeView(QtWidgets.QTreeView):
         self._pressed_group_index = pressed_group_index
 
     def mousePressEvent(self, event):
+        if self._checkbox_press(event):
+            return
         self._mouse_press(event)
         super(InstanceTreeView, self).mousePressEvent(event)
 
     def mouseDoubleClickEvent(self, event):
+        if self._checkbox_press(event):
+            return
         self._mouse_press(event)
         super(InstanceTreeView, self).mouseDoubleClickEvent(event)
+        if event.button() != QtCore.Qt.LeftButton:
+            return
+        index = self.indexAt(event.pos())
+        if index.isValid() and not index.data(IS_GROUP_ROLE):
+            self.double_clicked.emit()
+
+    def _checkbox_release(self, event):
+        pressed_index = self._pressed_checkbox_index
+        self._pressed_checkbox_index = None
+        if pressed_index is None:
+            return False
+
+        event.accept()
+        if event.button() != QtCore.Qt.LeftButton:
+            return True
+        index = self._get_checkbox_index(event.pos())
+        if (
+            index is not None
+            and pressed_index.isValid()
+            and pressed_index == index
+        ):
+            self.active_toggle_requested.emit(index)
+        return True
 
     def _mouse_release(self, event, pressed_index):
         if event.button() != QtCore.Qt.LeftButton:
@@ -427,6 +406,8 @@ class InstanceTreeView(QtWidgets.QTreeView):
         return True
 
     def mouseReleaseEvent(self, event):
+        if self._checkbox_release(event):
+            return
         pressed_index = self._pressed_group_index
         self._pressed_group_index = None
         result = self._mouse_release(event, pressed_index)
@@ -441,16 +422,21 @@ class InstanceListView(AbstractInstanceView):
     """
 
     double_clicked = QtCore.Signal()
+    view_class = InstanceTreeView
+    delegate_class = ListItemDelegate
 
     def __init__(self, controller, parent):
         super(InstanceListView, self).__init__(parent)
 
         self._controller = controller
 
-        instance_view = InstanceTreeView(self)
-        instance_delegate = ListItemDelegate(instance_view)
+        instance_view = self.view_class(self)
+        instance_delegate = self.delegate_class(instance_view)
         instance_view.setItemDelegate(instance_delegate)
-        instance_model = QtGui.QStandardItemModel()
+        # All rows have same height which allows view to skip size hint
+        #   calculation of each row
+        instance_view.setUniformRowHeights(True)
+        instance_model = InstancesModel(controller)
 
         proxy_model = QtCore.QSortFilterProxyModel()
         proxy_model.setSourceModel(instance_model)
@@ -458,6 +444,7 @@ class InstanceListView(AbstractInstanceView):
         proxy_model.setSortRole(SORT_VALUE_ROLE)
         proxy_model.setFilterKeyColumn(0)
         proxy_model.setDynamicSortFilter(True)
+        proxy_model.sort(0)
 
         instance_view.setModel(proxy_model)
 
@@ -468,23 +455,12 @@ class InstanceListView(AbstractInstanceView):
         instance_view.selectionModel().selectionChanged.connect(
             self._on_selection_change
         )
-        instance_view.collapsed.connect(self._on_collapse)
-        instance_view.expanded.connect(self._on_expand)
         instance_view.toggle_requested.connect(self._on_toggle_request)
+        instance_view.active_toggle_requested.connect(
+            self._on_active_toggle_request
+        )
         instance_view.double_clicked.connect(self.double_clicked)
 
-        self._group_items = {}
-        self._group_widgets = {}
-        self._widgets_by_id = {}
-        # Group by instance id for handling of active state
-        self._group_by_instance_id = {}
-        self._context_item = None
-        self._context_widget = None
-
-        self._convertor_group_item = None
-        self._convertor_group_widget = None
-        self._convertor_items_by_id = {}
-
         self._instance_view = instance_view
         self._instance_delegate = instance_delegate
         self._instance_model = instance_model
@@ -492,22 +468,6 @@ class InstanceListView(AbstractInstanceView):
 
         self._active_toggle_enabled = True
 
-    def _on_expand(self, index):
-        self._update_widget_expand_state(index, True)
-
-    def _on_collapse(self, index):
-        self._update_widget_expand_state(index, False)
-
-    def _update_widget_expand_state(self, index, expanded):
-        group_name = index.data(GROUP_ROLE)
-        if group_name == CONVERTOR_ITEM_GROUP:
-            group_widget = self._convertor_group_widget
-        else:
-            group_widget = self._group_widgets.get(group_name)
-
-        if group_widget:
-            group_widget.set_expanded(expanded)
-
     def _on_toggle_request(self, toggle):
         if not self._active_toggle_enabled:
             return
@@ -520,449 +480,62 @@ class InstanceListView(AbstractInstanceView):
         else:
             active = False
 
-        group_names = set()
-        for instance_id in selected_instance_ids:
-            widget = self._widgets_by_id.get(instance_id)
-            if widget is None:
-                continue
-
-            widget.set_active(active)
-            group_name = self._group_by_instance_id.get(instance_id)
-            if group_name is not None:
-                group_names.add(group_name)
-
-        for group_name in group_names:
-            self._update_group_checkstate(group_name)
+        self._change_active_instances(selected_instance_ids, active)
 
-    def _update_group_checkstate(self, group_name):
-        """Update checkstate of one group."""
-        widget = self._group_widgets.get(group_name)
-        if widget is None:
+    def _on_active_toggle_request(self, index):
+        if not self._active_toggle_enabled:
             return
 
-        activity = None
-        for instance_id, _group_name in self._group_by_instance_id.items():
-            if _group_name != group_name:
-                continue
+        if index.data(IS_GROUP_ROLE):
+            self._on_group_toggle_request(index)
+            return
 
-            instance_widget = self._widgets_by_id.get(instance_id)
-            if not instance_widget:
-                continue
+        instance_id = index.data(INSTANCE_ID_ROLE)
+        new_value = not self._instance_model.is_instance_active(instance_id)
+        selected_instance_ids = self._instance_view.get_selected_instance_ids()
+        if instance_id in selected_instance_ids:
+            instance_ids = selected_instance_ids
+        else:
+            instance_ids = {instance_id}
+        self._change_active_instances(instance_ids, new_value)
 
-            if activity is None:
-                activity = int(instance_widget.is_active())
+    def _on_group_toggle_request(self, proxy_index):
+        active = proxy_index.data(ACTIVE_STATE_ROLE) != QtCore.Qt.Checked
+        group_name = proxy_index.data(GROUP_ROLE)
+        instance_ids = self._instance_model.get_group_instance_ids(group_name)
+        self._change_active_instances(instance_ids, active)
 
-            elif activity != instance_widget.is_active():
-                activity = -1
-                break
+        if not self._instance_view.isExpanded(proxy_index):
+            self._instance_view.expand(proxy_index)
 
-        if activity is None:
+    def _change_active_instances(self, instance_ids, new_value):
+        if not instance_ids:
             return
 
-        state = QtCore.Qt.PartiallyChecked
-        if activity == 0:
-            state = QtCore.Qt.Unchecked
-        elif activity == 1:
-            state = QtCore.Qt.Checked
-        widget.set_checkstate(state)
+        if self._instance_model.set_instances_active(instance_ids, new_value):
+            self.active_changed.emit()
 
     def refresh(self):
         """Refresh instances in the view."""
-        # Sort view at the end of refresh
-        # - is turned off until any change in view happens
-        sort_at_the_end = False
-        # Create or use already existing context item
-        # - context widget does not change so we don't have to update anything
-        if self._make_sure_context_item_exists():
-            sort_at_the_end = True
-
-        self._update_convertor_items_group()
-
-        # Prepare instances by their groups
-        instances_by_group_name = collections.defaultdict(list)
-        group_names = set()
-        for instance in self._controller.instances.values():
-            group_label = instance.group_label
-            group_names.add(group_label)
-            instances_by_group_name[group_label].append(instance)
-
-        # Create new groups based on prepared `instances_by_group_name`
-        if self._make_sure_groups_exists(group_names):
-            sort_at_the_end = True
-
-        # Remove groups that are not available anymore
-        self._remove_groups_except(group_names)
-
-        # Store which groups should be expanded at the end
-        expand_groups = set()
-        # Process changes in each group item
-        # - create new instance, update existing and remove not existing
-        for group_name, group_item in self._group_items.items():
-            # Instance items to remove
-            # - will contain all existing instance ids at the start
-            # - instance ids may be removed when existing instances are checked
-            to_remove = set()
-            # Mapping of existing instances under group item
-            existing_mapping = {}
-
-            # Get group index to be able get children indexes
-            group_index = self._instance_model.index(
-                group_item.row(), group_item.column()
-            )
-
-            # Iterate over children indexes of group item
-            for idx in range(group_item.rowCount()):
-                index = self._instance_model.index(idx, 0, group_index)
-                instance_id = index.data(INSTANCE_ID_ROLE)
-                # Add all instance into `to_remove` set
-                to_remove.add(instance_id)
-                existing_mapping[instance_id] = idx
-
-            # Collect all new instances that are not existing under group
-            # New items
-            new_items = []
-            # Tuples of new instance and instance itself
-            new_items_with_instance = []
-            # Group activity (should be {-1;0;1} at the end)
-            # - 0 when all instances are disabled
-            # - 1 when all instances are enabled
-            # - -1 when it's mixed
-            activity = None
-            for instance in instances_by_group_name[group_name]:
-                instance_id = instance.id
-                # Handle group activity
-                if activity is None:
-                    activity = int(instance["active"])
-                elif activity == -1:
-                    pass
-                elif activity != instance["active"]:
-                    activity = -1
-
-                self._group_by_instance_id[instance_id] = group_name
-                # Remove instance id from `to_remove` if already exists and
-                #   trigger update of widget
-                if instance_id in to_remove:
-                    to_remove.remove(instance_id)
-                    widget = self._widgets_by_id[instance_id]
-                    widget.update_instance(instance)
-                    continue
-
-                # Create new item and store it as new
-                item = QtGui.QStandardItem()
-                item.setData(instance["productName"], SORT_VALUE_ROLE)
-                item.setData(instance["productName"], GROUP_ROLE)
-                item.setData(instance_id, INSTANCE_ID_ROLE)
-                new_items.append(item)
-                new_items_with_instance.append((item, instance))
-
-            # Set checkstate of group checkbox
-            state = QtCore.Qt.PartiallyChecked
-            if activity == 0:
-                state = QtCore.Qt.Unchecked
-            elif activity == 1:
-                state = QtCore.Qt.Checked
-
-            widget = self._group_widgets[group_name]
-            widget.set_checkstate(state)
-
-            # Remove items that were not found
-            idx_to_remove = []
-            for instance_id in to_remove:
-                idx_to_remove.append(existing_mapping[instance_id])
-
-            # Remove them in reverse order to prevent row index changes
-            for idx in reversed(sorted(idx_to_remove)):
-                group_item.removeRows(idx, 1)
-
-            # Cleanup instance related widgets
-            for instance_id in to_remove:
-                self._group_by_instance_id.pop(instance_id)
-                widget = self._widgets_by_id.pop(instance_id)
-                widget.deleteLater()
-
-            # Process new instance items and add them to model and create
-            #   their widgets
-            if new_items:
-                # Trigger sort at the end when new instances are available
-                sort_at_the_end = True
-
-                # Add items under group item
-                group_item.appendRows(new_items)
-
-                for item, instance in new_items_with_instance:
-                    if not instance.has_valid_context:
-                        expand_groups.add(group_name)
-                    item_index = self._instance_model.index(
-                        item.row(),
-                        item.column(),
-                        group_index
-                    )
-                    proxy_index = self._proxy_model.mapFromSource(item_index)
-                    widget = InstanceListItemWidget(
-                        instance, self._instance_view
-                    )
-                    widget.set_active_toggle_enabled(
-                        self._active_toggle_enabled
-                    )
-                    widget.active_changed.connect(self._on_active_changed)
-                    widget.double_clicked.connect(self.double_clicked)
-                    self._instance_view.setIndexWidget(proxy_index, widget)
-                    self._widgets_by_id[instance.id] = widget
+        expand_groups = self._instance_model.refresh()
 
-            # Trigger sort at the end of refresh
-            if sort_at_the_end:
-                self._proxy_model.sort(0)
-
-        # Expand groups marked for expanding
+        # Expand groups with new instances with invalid context
         for group_name in expand_groups:
-            group_item = self._group_items[group_name]
+            group_item = self._instance_model.get_group_item(group_name)
+            if group_item is None:
+                continue
             proxy_index = self._proxy_model.mapFromSource(group_item.index())
-
             self._instance_view.expand(proxy_index)
 
-    def _make_sure_context_item_exists(self):
-        if self._context_item is not None:
-            return False
-
-        root_item = self._instance_model.invisibleRootItem()
-        context_item = QtGui.QStandardItem()
-        context_item.setData(0, SORT_VALUE_ROLE)
-        context_item.setData(CONTEXT_ID, INSTANCE_ID_ROLE)
-
-        root_item.appendRow(context_item)
-
-        index = self._instance_model.index(
-            context_item.row(), context_item.column()
-        )
-        proxy_index = self._proxy_model.mapFromSource(index)
-        widget = ListContextWidget(self._instance_view)
-        widget.double_clicked.connect(self.double_clicked)
-        self._instance_view.setIndexWidget(proxy_index, widget)
-
-        self._context_widget = widget
-        self._context_item = context_item
-        return True
-
-    def _update_convertor_items_group(self):
-        created_new_items = False
-        convertor_items_by_id = self._controller.convertor_items
-        group_item = self._convertor_group_item
-        if not convertor_items_by_id and group_item is None:
-            return created_new_items
-
-        root_item = self._instance_model.invisibleRootItem()
-        if not convertor_items_by_id:
-            root_item.removeRow(group_item.row())
-            self._convertor_group_widget.deleteLater()
-            self._convertor_group_widget = None
-            self._convertor_items_by_id = {}
-            return created_new_items
-
-        if group_item is None:
-            created_new_items = True
-            group_item = QtGui.QStandardItem()
-            group_item.setData(CONVERTOR_ITEM_GROUP, GROUP_ROLE)
-            group_item.setData(1, SORT_VALUE_ROLE)
-            group_item.setData(True, IS_GROUP_ROLE)
-            group_item.setFlags(QtCore.Qt.ItemIsEnabled)
-
-            root_item.appendRow(group_item)
-
-            index = self._instance_model.index(
-                group_item.row(), group_item.column()
-            )
-            proxy_index = self._proxy_model.mapFromSource(index)
-            widget = InstanceListGroupWidget(
-                CONVERTOR_ITEM_GROUP, self._instance_view
-            )
-            widget.toggle_checkbox.setVisible(False)
-            widget.expand_changed.connect(
-                self._on_convertor_group_expand_request
-            )
-            self._instance_view.setIndexWidget(proxy_index, widget)
-
-            self._convertor_group_item = group_item
-            self._convertor_group_widget = widget
-
-        for row in reversed(range(group_item.rowCount())):
-            child_item = group_item.child(row)
-            child_identifier = child_item.data(CONVERTER_IDENTIFIER_ROLE)
-            if child_identifier not in convertor_items_by_id:
-                self._convertor_items_by_id.pop(child_identifier, None)
-                group_item.removeRows(row, 1)
-
-        new_items = []
-        for identifier, convertor_item in convertor_items_by_id.items():
-            item = self._convertor_items_by_id.get(identifier)
-            if item is None:
-                created_new_items = True
-                item = QtGui.QStandardItem(convertor_item.label)
-                new_items.append(item)
-            item.setData(convertor_item.id, INSTANCE_ID_ROLE)
-            item.setData(convertor_item.label, SORT_VALUE_ROLE)
-            item.setData(CONVERTOR_ITEM_GROUP, GROUP_ROLE)
-            item.setData(
-                convertor_item.identifier, CONVERTER_IDENTIFIER_ROLE
-            )
-            self._convertor_items_by_id[identifier] = item
-
-        if new_items:
-            group_item.appendRows(new_items)
-
-        return created_new_items
-
-    def _make_sure_groups_exists(self, group_names):
-        new_group_items = []
-        for group_name in group_names:
-            if group_name in self._group_items:
-                continue
-
-            group_item = QtGui.QStandardItem()
-            group_item.setData(group_name, GROUP_ROLE)
-            group_item.setData(group_name, SORT_VALUE_ROLE)
-            group_item.setData(True, IS_GROUP_ROLE)
-            group_item.setFlags(QtCore.Qt.ItemIsEnabled)
-            self._group_items[group_name] = group_item
-            new_group_items.append(group_item)
-
-        # Add new group items to root item if there are any
-        if not new_group_items:
-            return False
-
-        # Access to root item of main model
-        root_item = self._instance_model.invisibleRootItem()
-        root_item.appendRows(new_group_items)
-
-        # Create widget for each new group item and store it for future usage
-        for group_item in new_group_items:
-            index = self._instance_model.index(
-                group_item.row(), group_item.column()
-            )
-            proxy_index = self._proxy_model.mapFromSource(index)
-            group_name = group_item.data(GROUP_ROLE)
-            widget = InstanceListGroupWidget(group_name, self._instance_view)
-            widget.set_active_toggle_enabled(
-                self._active_toggle_enabled
-            )
-            widget.expand_changed.connect(self._on_group_expand_request)
-            widget.toggle_requested.connect(self._on_group_toggle_request)
-            self._group_widgets[group_name] = widget
-            self._instance_view.setIndexWidget(proxy_index, widget)
-
-        return True
-
-    def _remove_groups_except(self, group_names):
-        # Remove groups that are not available anymore
-        root_item = self._instance_model.invisibleRootItem()
-        for group_name in tuple(self._group_items.keys()):
-            if group_name in group_names:
-                continue
-
-            group_item = self._group_items.pop(group_name)
-            root_item.removeRow(group_item.row())
-            widget = self._group_widgets.pop(group_name)
-            widget.deleteLater()
-
     def refresh_instance_states(self):
         """Trigger update of all instances."""
-        for widget in self._widgets_by_id.values():
-            widget.update_instance_values()
-
-    def _on_active_changed(self, changed_instance_id, new_value):
-        selected_instance_ids, _, _ = self.get_selected_items()
-
-        selected_ids = set()
-        found = False
-        for instance_id in selected_instance_ids:
-            selected_ids.add(instance_id)
-            if not found and instance_id == changed_instance_id:
-                found = True
-
-        if not found:
-            selected_ids = set()
-            selected_ids.add(changed_instance_id)
-
-        self._change_active_instances(selected_ids, new_value)
-        group_names = set()
-        for instance_id in selected_ids:
-            group_name = self._group_by_instance_id.get(instance_id)
-            if group_name is not None:
-                group_names.add(group_name)
-
-        for group_name in group_names:
-            self._update_group_checkstate(group_name)
-
-    def _change_active_instances(self, instance_ids, new_value):
-        if not instance_ids:
-            return
-
-        changed_ids = set()
-        for instance_id in instance_ids:
-            widget = self._widgets_by_id.get(instance_id)
-            if widget:
-                changed_ids.add(instance_id)
-                widget.set_active(new_value)
-
-        if changed_ids:
-            self.active_changed.emit()
+        self._instance_model.refresh_instance_states()
 
     def _on_selection_change(self, *_args):
         self.selection_changed.emit()
 
-    def _on_group_expand_request(self, group_name, expanded):
-        group_item = self._group_items.get(group_name)
-        if not group_item:
-            return
-
-        group_index = self._instance_model.index(
-            group_item.row(), group_item.column()
-        )
-        proxy_index = self._proxy_model.mapFromSource(group_index)
-        self._instance_view.setExpanded(proxy_index, expanded)
-
-    def _on_convertor_group_expand_request(self, _, expanded):
-        group_item = self._convertor_group_item
-        if not group_item:
-            return
-        group_index = self._instance_model.index(
-            group_item.row(), group_item.column()
-        )
-        proxy_index = self._proxy_model.mapFromSource(group_index)
-        self._instance_view.setExpanded(proxy_index, expanded)
-
-    def _on_group_toggle_request(self, group_name, state):
-        state = checkstate_int_to_enum(state)
-        if state == QtCore.Qt.PartiallyChecked:
-            return
-
-        if state == QtCore.Qt.Checked:
-            active = True
-        else:
-            active = False
-
-        group_item = self._group_items.get(group_name)
-        if not group_item:
-            return
-
-        instance_ids = set()
-        for row in range(group_item.rowCount()):
-            item = group_item.child(row)
-            instance_id = item.data(INSTANCE_ID_ROLE)
-            if instance_id is not None:
-                instance_ids.add(instance_id)
-
-        self._change_active_instances(instance_ids, active)
-
-        proxy_index = self._proxy_model.mapFromSource(group_item.index())
-        if not self._instance_view.isExpanded(proxy_index):
-            self._instance_view.expand(proxy_index)
-
     def has_items(self):
-        if self._convertor_group_widget is not None:
-            return True
-        if self._group_items:
-            return True
-        return False
+        return self._instance_model.has_items()
 
     def get_selected_items(self):
         """Get selected instance ids and context selection.
@@ -1100,10 +673,5 @@ class InstanceListView(AbstractInstanceView):
             return
 
         self._active_toggle_enabled = enabled
-        for widget in self._widgets_by_id.values():
-            if isinstance(widget, InstanceListItemWidget):
-                widget.set_active_toggle_enabled(enabled)
-
-        for widget in self._group_widgets.values():
-            if isinstance(widget, InstanceListGroupWidget):
-                widget.set_active_toggle_enabled(enabled)
+        self._instance_delegate.set_active_toggle_enabled(enabled)
+        self._instance_view.viewport().update()
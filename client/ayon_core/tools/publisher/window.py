@@ -20,6 +20,7 @@ from ayon_core.tools.utils.lib import center_window
 from .constants import ResetKeySequence
 from .publish_report_viewer import PublishReportViewerWidget
 from .control import CardMessageTypes
+from .report_stream import REPORT_STREAM_EXT
 from .control_qt import QtPublisherController
 from .widgets import (
     OverviewWidget,
@@ -1059,19 +1060,26 @@ class PublisherWindow(QtWidgets.QDialog):
             default_filename
         )
         new_filepath, ext = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save report", default_filepath, ".json"
+            self,
+            "Save report",
+            default_filepath,
+            ";;".join((REPORT_STREAM_EXT, ".json"))
         )
         if not ext or not new_filepath:
             return
 
-        logs = self._controller.get_publish_report()
         full_path = new_filepath + ext
         dir_path = os.path.dirname(full_path)
         if not os.path.exists(dir_path):
             os.makedirs(dir_path)
 
-        with open(full_path, "w") as file_stream:
-            json.dump(logs, file_stream)
+        if ext == REPORT_STREAM_EXT:
+            self._controller.export_publish_report(full_path)
+        else:
+            # Legacy report format
+            logs = self._controller.get_publish_report()
+            with open(full_path, "w") as file_stream:
+                json.dump(logs, file_stream)
 
         self._controller.emit_card_message(
             "Report saved",
@@ -6,6 +6,7 @@ from ayon_core.pipeline import (
     registered_host,
     get_current_context,
 )
+from ayon_core.pipeline.load.entity_contexts import get_entity_contexts_store
 from ayon_core.tools.common_models import HierarchyModel
 
 from .models import SiteSyncModel
@@ -49,6 +50,7 @@ class SceneInventoryController:
 
         self._sitesync_model.reset()
         self._hierarchy_model.reset()
+        get_entity_contexts_store().invalidate()
 
     def get_current_context(self):
         if self._current_context is None:
@@ -12,6 +12,7 @@ from ayon_core.pipeline import (
     get_current_project_name,
     HeroVersionType,
 )
+from ayon_core.pipeline.load.entity_contexts import get_entity_contexts_store
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.tools.utils import get_qt_icon
 from ayon_core.tools.utils.models import TreeModel, Item
@@ -405,11 +406,10 @@ class InventoryModel(TreeModel):
         if not filtered_repre_ids:
             return output
 
-        repre_entities = ayon_api.get_representations(project_name, repre_ids)
-        repres_by_id.update({
-            repre_entity["id"]: repre_entity
-            for repre_entity in repre_entities
-        })
+        store = get_entity_contexts_store()
+        repres_by_id.update(store.get_existing_entities(
+            project_name, "representation", filtered_repre_ids
+        ))
         version_ids = {
             repre_entity["versionId"]
             for repre_entity in repres_by_id.values()
@@ -417,12 +417,9 @@ class InventoryModel(TreeModel):
         if not version_ids:
             return output
 
-        versions_by_id.update({
-            version_entity["id"]: version_entity
-            for version_entity in ayon_api.get_versions(
-                project_name, version_ids=version_ids
-            )
-        })
+        versions_by_id.update(store.get_existing_entities(
+            project_name, "version", version_ids
+        ))
 
         product_ids = {
             version_entity["productId"]
@@ -431,12 +428,9 @@ class InventoryModel(TreeModel):
         if not product_ids:
             return output
 
-        products_by_id.update({
-            product_entity["id"]: product_entity
-            for product_entity in ayon_api.get_products(
-                project_name, product_ids=product_ids
-            )
-        })
+        products_by_id.update(store.get_existing_entities(
+            project_name, "product", product_ids
+        ))
         folder_ids = {
             product_entity["folderId"]
             for product_entity in products_by_id.values()
@@ -444,12 +438,9 @@ class InventoryModel(TreeModel):
         if not folder_ids:
             return output
 
-        folders_by_id.update({
-            folder_entity["id"]: folder_entity
-            for folder_entity in ayon_api.get_folders(
-                project_name, folder_ids=folder_ids
-            )
-        })
+        folders_by_id.update(store.get_existing_entities(
+            project_name, "folder", folder_ids
+        ))
         return output
 
 
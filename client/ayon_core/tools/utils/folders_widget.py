@@ -4,6 +4,7 @@ from qtpy import QtWidgets, QtGui, QtCore
 
 from ayon_core.lib.events import QueuedEventSystem
 from ayon_core.tools.common_models import (
+    FolderHierarchyStore,
     HierarchyModel,
     HierarchyExpectedSelection,
 )
@@ -23,6 +24,10 @@ FOLDER_TYPE_ROLE = QtCore.Qt.UserRole + 4
 class FoldersQtModel(QtGui.QStandardItemModel):
     """Folders model which cares about refresh of folders.
 
+    Items are created lazily. Children items of a folder are created when
+    the folder is expanded in view, or when folder inside is requested
+    (e.g. by selection or filtering).
+
     Args:
         controller (AbstractWorkfilesFrontend): The control object.
     """
@@ -33,8 +38,10 @@ class FoldersQtModel(QtGui.QStandardItemModel):
         super(FoldersQtModel, self).__init__()
 
         self._controller = controller
+        self._folders_store = None
         self._items_by_id = {}
-        self._parent_id_by_id = {}
+        # Folder ids which have created children items, 'None' is root
+        self._fetched_ids = set()
 
         self._refresh_threads = {}
         self._current_refresh_thread = None
@@ -72,8 +79,9 @@ class FoldersQtModel(QtGui.QStandardItemModel):
         self.set_project_name(self._last_project_name)
 
     def _clear_items(self):
+        self._folders_store = None
         self._items_by_id = {}
-        self._parent_id_by_id = {}
+        self._fetched_ids = set()
         self._has_content = False
         root_item = self.invisibleRootItem()
         root_item.removeRows(0, root_item.rowCount())
@@ -85,7 +93,7 @@ class FoldersQtModel(QtGui.QStandardItemModel):
             QtCore.QModelIndex: Index of the folder. Can be invalid if folder
                 is not available.
         """
-        item = self._items_by_id.get(item_id)
+        item = self._get_item_by_id(item_id)
         if item is None:
             return QtCore.QModelIndex()
         return self.indexFromItem(item)
@@ -100,10 +108,41 @@ class FoldersQtModel(QtGui.QStandardItemModel):
             Union[str, None]: Folder id or None if folder is not available.
 
         """
-        for folder_id, item in self._items_by_id.values():
-            if item.data(FOLDER_PATH_ROLE) == folder_path:
-                return folder_id
-        return None
+        if self._folders_store is None:
+            return None
+        return self._folders_store.get_folder_id_by_path(folder_path)
+
+    def fetch_matching(self, text):
+        """Create items of folders with label containing text.
+
+        Filter of proxy model can filter only existing items, so items of
+        matching folders and their parents must be created first.
+
+        Args:
+            text (str): Text to look for in folder labels.
+        """
+
+        if not text or self._folders_store is None:
+            return
+        for folder_id in self._folders_store.get_matching_folder_ids(text):
+            self._get_item_by_id(folder_id)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        folder_id = self._get_unfetched_folder_id(parent)
+        if folder_id is None:
+            return super(FoldersQtModel, self).hasChildren(parent)
+        return self._folders_store.has_children(folder_id)
+
+    def canFetchMore(self, parent):
+        folder_id = self._get_unfetched_folder_id(parent)
+        if folder_id is None:
+            return False
+        return self._folders_store.has_children(folder_id)
+
+    def fetchMore(self, parent):
+        folder_id = self._get_unfetched_folder_id(parent)
+        if folder_id is not None:
+            self._fetch_children(folder_id)
 
     def get_project_name(self):
         """Project name which model currently use.
@@ -189,6 +228,92 @@ class FoldersQtModel(QtGui.QStandardItemModel):
         item.setData(folder_item.label, QtCore.Qt.DisplayRole)
         item.setData(icon, QtCore.Qt.DecorationRole)
 
+    def _get_unfetched_folder_id(self, index):
+        """Folder id of index if children items were not created yet."""
+        if self._folders_store is None or not index.isValid():
+            return None
+        folder_id = index.data(FOLDER_ID_ROLE)
+        if (
+            folder_id in self._fetched_ids
+            or folder_id not in self._folders_store
+        ):
+            return None
+        return folder_id
+
+    def _get_item_by_id(self, folder_id):
+        """Get item by folder id, items of parents are created if needed."""
+        item = self._items_by_id.get(folder_id)
+        if (
+            item is not None
+            or self._folders_store is None
+            or folder_id not in self._folders_store
+        ):
+            return item
+
+        self._fetch_children(None)
+        for parent_id in self._folders_store.get_ancestor_ids(folder_id):
+            self._fetch_children(parent_id)
+        return self._items_by_id.get(folder_id)
+
+    def _fetch_children(self, folder_id):
+        """Create items of children folders.
+
+        Args:
+            folder_id (Union[str, None]): Folder id or 'None' for root.
+        """
+
+        if folder_id in self._fetched_ids:
+            return
+
+        if folder_id is None:
+            parent_item = self.invisibleRootItem()
+        else:
+            parent_item = self._items_by_id.get(folder_id)
+            if parent_item is None:
+                return
+
+        self._fetched_ids.add(folder_id)
+        new_items = [
+            self._create_item(child_id)
+            for child_id in self._folders_store.get_children_ids(folder_id)
+        ]
+        if new_items:
+            parent_item.appendRows(new_items)
+
+    def _create_item(self, folder_id):
+        item = QtGui.QStandardItem()
+        item.setEditable(False)
+        self._fill_item_data(item, self._folders_store[folder_id])
+        self._items_by_id[folder_id] = item
+        return item
+
+    def _remove_item_ids(self, item):
+        """Remove item and its children from cached items."""
+        items_queue = collections.deque([item])
+        while items_queue:
+            item = items_queue.popleft()
+            item_id = item.data(FOLDER_ID_ROLE)
+            # Item of the folder may already exist under different parent
+            if self._items_by_id.get(item_id) is item:
+                self._items_by_id.pop(item_id)
+                self._fetched_ids.discard(item_id)
+            for row in range(item.rowCount()):
+                items_queue.append(item.child(row))
+
+    def _get_folders_store(self, folder_items_by_id):
+        if isinstance(folder_items_by_id, FolderHierarchyStore):
+            return folder_items_by_id
+        return FolderHierarchyStore.from_folders(
+            {
+                "id": folder_item.entity_id,
+                "parentId": folder_item.parent_id,
+                "name": folder_item.name,
+                "label": folder_item.label,
+                "folderType": folder_item.folder_type,
+            }
+            for folder_item in folder_items_by_id.values()
+        )
+
     def _fill_items(self, folder_items_by_id):
         if not folder_items_by_id:
             if folder_items_by_id is not None:
@@ -199,64 +324,53 @@ class FoldersQtModel(QtGui.QStandardItemModel):
 
         self._has_content = True
 
-        folder_ids = set(folder_items_by_id)
-        ids_to_remove = set(self._items_by_id) - folder_ids
-
-        folder_items_by_parent = collections.defaultdict(dict)
-        for folder_item in folder_items_by_id.values():
-            (
-                folder_items_by_parent
-                [folder_item.parent_id]
-                [folder_item.entity_id]
-            ) = folder_item
-
-        hierarchy_queue = collections.deque()
-        hierarchy_queue.append((self.invisibleRootItem(), None))
+        store = self._get_folders_store(folder_items_by_id)
+        self._folders_store = store
 
+        # Update only items of folders which already have created children,
+        #   children of other folders are created when they're fetched
+        prev_fetched_ids = self._fetched_ids
+        self._fetched_ids = set()
         # Keep pointers to removed items until the refresh finishes
-        #   - some children of the items could be moved and reused elsewhere
         removed_items = []
+        hierarchy_queue = collections.deque([None])
         while hierarchy_queue:
-            item = hierarchy_queue.popleft()
-            parent_item, parent_id = item
-            folder_items = folder_items_by_parent[parent_id]
-
+            parent_id = hierarchy_queue.popleft()
+            if parent_id is None:
+                parent_item = self.invisibleRootItem()
+            else:
+                parent_item = self._items_by_id.get(parent_id)
+                if parent_item is None:
+                    continue
+            self._fetched_ids.add(parent_id)
+
+            children_ids = store.get_children_ids(parent_id)
+            children_ids_set = set(children_ids)
             items_by_id = {}
-            folder_ids_to_add = set(folder_items)
             for row_idx in reversed(range(parent_item.rowCount())):
                 child_item = parent_item.child(row_idx)
                 child_id = child_item.data(FOLDER_ID_ROLE)
-                if child_id in ids_to_remove:
-                    removed_items.append(parent_item.takeRow(row_idx))
-                else:
+                if child_id in children_ids_set:
                     items_by_id[child_id] = child_item
+                    continue
+                self._remove_item_ids(child_item)
+                removed_items.append(parent_item.takeRow(row_idx))
 
             new_items = []
-            for item_id in folder_ids_to_add:
-                folder_item = folder_items[item_id]
-                item = items_by_id.get(item_id)
+            for child_id in children_ids:
+                item = items_by_id.get(child_id)
                 if item is None:
-                    is_new = True
-                    item = QtGui.QStandardItem()
-                    item.setEditable(False)
-                else:
-                    is_new = self._parent_id_by_id[item_id] != parent_id
+                    new_items.append(self._create_item(child_id))
+                    continue
 
-                self._fill_item_data(item, folder_item)
-                if is_new:
-                    new_items.append(item)
-                self._items_by_id[item_id] = item
-                self._parent_id_by_id[item_id] = parent_id
-
-                hierarchy_queue.append((item, item_id))
+                self._fill_item_data(item, store[child_id])
+                self._items_by_id[child_id] = item
+                if child_id in prev_fetched_ids:
+                    hierarchy_queue.append(child_id)
 
             if new_items:
                 parent_item.appendRows(new_items)
 
-        for item_id in ids_to_remove:
-            self._items_by_id.pop(item_id)
-            self._parent_id_by_id.pop(item_id)
-
         self._is_refreshing = False
         self.refreshed.emit()
 
@@ -341,6 +455,7 @@ class FoldersWidget(QtWidgets.QWidget):
 
         self._handle_expected_selection = handle_expected_selection
         self._expected_selection = None
+        self._name_filter = ""
 
     @property
     def is_refreshing(self):
@@ -369,6 +484,8 @@ class FoldersWidget(QtWidgets.QWidget):
             name (str): The string filter.
         """
 
+        self._name_filter = name
+        self._folders_model.fetch_matching(name)
         self._folders_proxy_model.setFilterFixedString(name)
 
     def refresh(self):
@@ -516,6 +633,7 @@ class FoldersWidget(QtWidgets.QWidget):
         self._update_expected_selection()
 
     def _on_model_refresh(self):
+        self._folders_model.fetch_matching(self._name_filter)
         if self._expected_selection:
             self._set_expected_selection()
         self._folders_proxy_model.sort(0)
@@ -538,3 +538,86 @@ class NiceCheckbox(QtWidgets.QFrame):
         path.lineTo(line2_p2)
 
         return self.icon_path_stroker.createStroke(path)
+
+    @classmethod
+    def paint_checkbox(
+        cls, painter, rect, checkstate, enabled=True, hovered=False
+    ):
+        """Paint checkbox without widget.
+
+        Used by item delegates to draw the checkbox of the same look
+        without creating widget for each item. Checkbox is drawn to the
+        right side of passed rect and uses its height.
+
+        Args:
+            painter (QtGui.QPainter): Painter used for drawing.
+            rect (QtCore.QRect): Available rect.
+            checkstate (QtCore.Qt.CheckState): State of checkbox.
+            enabled (Optional[bool]): Checkbox is enabled.
+            hovered (Optional[bool]): Mouse is over checkbox.
+
+        Returns:
+            QtCore.QRect: Rect of painted checkbox.
+        """
+        cls._load_colors()
+        checkbox_rect = cls.get_checkbox_rect(rect)
+        if checkstate == QtCore.Qt.Checked:
+            bg_color = cls._checked_bg_color
+            offset_ratio = 1.0
+        elif checkstate == QtCore.Qt.Unchecked:
+            bg_color = cls._unchecked_bg_color
+            offset_ratio = 0.0
+        else:
+            bg_color = cls.steped_color(
+                cls._checked_bg_color, cls._unchecked_bg_color, 0.5
+            )
+            offset_ratio = 0.5
+
+        radius = floor(checkbox_rect.height() * 0.5)
+        checker_size = checkbox_rect.height()
+        x_offset = (checkbox_rect.width() - checker_size) * offset_ratio
+        checker_rect = QtCore.QRect(
+            int(checkbox_rect.x() + x_offset),
+            checkbox_rect.y(),
+            checker_size,
+            checker_size
+        )
+        if enabled and hovered:
+            checker_color = cls._checker_hover_color
+        else:
+            checker_color = cls._checker_color
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.transparent)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(checkbox_rect, radius, radius)
+        painter.setBrush(checker_color)
+        painter.drawEllipse(checker_rect)
+        if not enabled:
+            level = 33
+            alpha = 127
+            painter.setBrush(QtGui.QColor(level, level, level, alpha))
+            painter.drawRoundedRect(checkbox_rect, radius, radius)
+        painter.restore()
+        return checkbox_rect
+
+    @classmethod
+    def get_checkbox_rect(cls, rect):
+        """Rect of checkbox painted by 'paint_checkbox'.
+
+        Args:
+            rect (QtCore.QRect): Available rect.
+
+        Returns:
+            QtCore.QRect: Rect of checkbox.
+        """
+        height = rect.height()
+        # Keep same ratio as widget (90x50)
+        width = int(height * 1.8)
+        return QtCore.QRect(
+            rect.right() - width + 1,
+            rect.top(),
+            width,
+            height
+        )
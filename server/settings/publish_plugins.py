@@ -312,6 +312,20 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    max_workers: int = SettingsField(
+        0,
+        title="Max parallel conversions",
+        description="Use 0 for default based on number of CPUs.",
+        ge=0,
+    )
+    oiiotool_threads: int = SettingsField(
+        0,
+        title="Threads per oiiotool process",
+        description=(
+            "Use 0 to split CPUs between parallel conversions."
+        ),
+        ge=0,
+    )
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -930,6 +944,8 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "max_workers": 0,
+        "oiiotool_threads": 0,
         "profiles": []
     },
     "ExtractReview": {
@@ -8,6 +8,7 @@ from .exceptions import (
     ApplicationExecutableNotFound,
     ApplicationLaunchFailed,
     MissingRequiredKey,
+    EnvironmentCycleError,
 )
 from .defs import (
     LaunchTypes,
@@ -39,6 +40,7 @@ __all__ = (
     "ApplicationExecutableNotFound",
     "ApplicationLaunchFailed",
     "MissingRequiredKey",
+    "EnvironmentCycleError",
 
     "LaunchTypes",
     "ApplicationExecutable",
@@ -24,6 +24,7 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
         env_group=None,
         launch_type=None,
         env=None,
+        use_cache=False,
     ):
         """Calculate environment variables for launch context.
 
@@ -35,17 +36,26 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
             env_group (Optional[str]): Environment group.
             launch_type (Optional[str]): Launch type.
             env (Optional[dict[str, str]]): Environment variables to update.
+            use_cache (Optional[bool]): Reuse environment prepared for
+                the same context stored in on-disk cache.
 
         Returns:
             dict[str, str]: Environment variables for context.
 
         """
-        from ayon_applications.utils import get_app_environments_for_context
+        from ayon_applications.utils import (
+            get_app_environments_for_context,
+            get_app_environments_for_context_cached,
+        )
 
         if not full_app_name:
             return {}
 
-        return get_app_environments_for_context(
+        func = get_app_environments_for_context
+        if use_cache:
+            func = get_app_environments_for_context_cached
+
+        return func(
             project_name,
             folder_path,
             task_name,
@@ -63,6 +73,7 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
         task_name,
         full_app_name=None,
         env_group=None,
+        use_cache=False,
     ):
         """Calculate environment variables for farm publish.
 
@@ -74,6 +85,8 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
             full_app_name (Optional[str]): Full application name. Value from
                 environment variable 'AYON_APP_NAME' is used if 'None' is
                 passed.
+            use_cache (Optional[bool]): Reuse environment prepared for
+                the same context stored in on-disk cache.
 
         Returns:
             dict[str, str]: Environment variables for farm publish.
@@ -88,7 +101,8 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
             task_name,
             full_app_name,
             env_group=env_group,
-            launch_type=LaunchTypes.farm_publish
+            launch_type=LaunchTypes.farm_publish,
+            use_cache=use_cache,
         )
 
     def get_applications_manager(self, settings=None):
@@ -179,6 +193,8 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
         """Produces json file with environment based on project and app.
 
         Called by farm integration to propagate environment into farm jobs.
+        Many farm tasks share the same context, so prepared environment
+        is cached on disk.
 
         Args:
             output_json_path (str): Output json file path.
@@ -191,7 +207,7 @@ class ApplicationsAddon(AYONAddon, IPluginPaths):
         """
         if all((project, folder, task, app)):
             env = self.get_farm_publish_environment_variables(
-                project, folder, task, app, env_group=envgroup,
+                project, folder, task, app, env_group=envgroup, use_cache=True
             )
         else:
             env = os.environ.copy()
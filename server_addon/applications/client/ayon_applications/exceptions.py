@@ -48,3 +48,13 @@ class ApplicationLaunchFailed(Exception):
 
 class MissingRequiredKey(KeyError):
     pass
+
+
+class EnvironmentCycleError(ValueError):
+    """Environment variables reference each other in a cycle."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        super(EnvironmentCycleError, self).__init__(
+            "A cycle is detected on: {}".format(", ".join(sorted(keys)))
+        )
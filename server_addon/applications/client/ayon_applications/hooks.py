@@ -25,6 +25,10 @@ class LaunchHook:
     # - if empty then is available for all launch types
     # - by default has 'local' which is most common reason for launc hooks
     launch_types = {LaunchTypes.local}
+    # Hook only changes environment variables of launch context
+    # - environment prepared by such hooks can be cached and reused
+    # - hooks with other side effects (e.g. create files) must keep False
+    environment_only = False
 
     def __init__(self, launch_context):
         """Constructor of launch hook.
@@ -5,6 +5,7 @@ import json
 import tempfile
 import platform
 import inspect
+import threading
 import subprocess
 
 import six
@@ -24,10 +25,144 @@ from .exceptions import (
     ApplicationNotFound,
     ApplicationExecutableNotFound,
 )
-from .hooks import PostLaunchHook, PreLaunchHook
+from .hooks import LaunchHook, PostLaunchHook, PreLaunchHook
 from .defs import EnvironmentToolGroup, ApplicationGroup, LaunchTypes
 
 
+class _LaunchHooksRegistry:
+    """Process-wide cache of launch hook classes.
+
+    Hook files of a directory are imported only once and are imported
+    again only when modification time, size or list of python files in
+    the directory changes. Hook classes filtered by launch context
+    attributes and sorted by order are cached too, so launch only
+    instantiates the hooks.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._classes_by_dir = {}
+        self._filtered_classes = {}
+
+    def clear(self):
+        with self._lock:
+            self._classes_by_dir = {}
+            self._filtered_classes = {}
+
+    def get_hook_classes(self, paths, launch_context, log):
+        """Hook classes which are valid for launch context by attributes.
+
+        Args:
+            paths (list[str]): Directories with launch hooks.
+            launch_context (ApplicationLaunchContext): Launch context.
+            log (logging.Logger): Logger.
+
+        Returns:
+            dict[str, list[type[LaunchHook]]]: Hook classes by 'pre' and
+                'post' keys sorted by order.
+        """
+        with self._lock:
+            dir_items = []
+            for path in paths:
+                token = self._get_dir_token(path)
+                if token is None:
+                    if self._classes_by_dir.pop(path, None) is not None:
+                        self._filtered_classes = {}
+                    log.info(
+                        "Path to launch hooks does not exist: \"{}\"".format(
+                            path
+                        )
+                    )
+                    continue
+
+                item = self._classes_by_dir.get(path)
+                if item is None or item[0] != token:
+                    item = (token, self._import_hook_classes(path))
+                    self._classes_by_dir[path] = item
+                    # Filtered classes may contain outdated classes
+                    self._filtered_classes = {}
+                dir_items.append(item[1])
+
+            app_group = launch_context.app_group
+            key = (
+                tuple(paths),
+                launch_context.host_name,
+                getattr(app_group, "name", None),
+                launch_context.app_name,
+                launch_context.launch_type,
+            )
+            output = self._filtered_classes.get(key)
+            if output is None:
+                output = self._filter_classes(dir_items, launch_context)
+                self._filtered_classes[key] = output
+
+        return {
+            hook_type: list(classes)
+            for hook_type, classes in output.items()
+        }
+
+    @staticmethod
+    def _get_dir_token(path):
+        try:
+            with os.scandir(path) as entries:
+                token = []
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".py") and not name.startswith("_"):
+                        stat = entry.stat()
+                        token.append((name, stat.st_mtime_ns, stat.st_size))
+                return tuple(sorted(token))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    @staticmethod
+    def _import_hook_classes(path):
+        classes = {"pre": [], "post": []}
+        modules, _crashed = modules_from_path(path)
+        for _filepath, module in modules:
+            classes["pre"].extend(
+                classes_from_module(PreLaunchHook, module)
+            )
+            classes["post"].extend(
+                classes_from_module(PostLaunchHook, module)
+            )
+        return classes
+
+    @staticmethod
+    def _filter_classes(dir_items, launch_context):
+        base_validation = LaunchHook.class_validation.__func__
+        output = {}
+        for hook_type in ("pre", "post"):
+            classes_with_order = []
+            classes_without_order = []
+            for classes in dir_items:
+                for klass in classes[hook_type]:
+                    if inspect.isabstract(klass):
+                        continue
+                    # Classes with custom validation are validated
+                    #   on initialization only
+                    if (
+                        klass.class_validation.__func__ is base_validation
+                        and not klass.class_validation(launch_context)
+                    ):
+                        continue
+                    if klass.order is None:
+                        classes_without_order.append(klass)
+                    else:
+                        classes_with_order.append(klass)
+
+            # Sort hooks with order by order and add hooks without order
+            ordered_classes = sorted(
+                classes_with_order, key=lambda klass: klass.order
+            )
+            ordered_classes.extend(classes_without_order)
+            output[hook_type] = tuple(ordered_classes)
+        return output
+
+
+_launch_hooks_registry = _LaunchHooksRegistry()
+
+
 class ApplicationManager:
     """Load applications and tools and store them by their full name.
 
@@ -425,29 +560,12 @@ class ApplicationLaunchContext:
             "\n".join("- {}".format(path) for path in paths)
         ))
 
-        all_classes = {
-            "pre": [],
-            "post": []
-        }
-        for path in paths:
-            if not os.path.exists(path):
-                self.log.info(
-                    "Path to launch hooks does not exist: \"{}\"".format(path)
-                )
-                continue
-
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
-
+        # Classes are already filtered by class attributes and sorted
+        all_classes = _launch_hooks_registry.get_hook_classes(
+            paths, self, self.log
+        )
         for launch_type, classes in all_classes.items():
-            hooks_with_order = []
-            hooks_without_order = []
+            ordered_hooks = []
             for klass in classes:
                 try:
                     hook = klass(self)
@@ -458,17 +576,7 @@ class ApplicationLaunchContext:
                         )
                         continue
 
-                    if inspect.isabstract(hook):
-                        self.log.debug("Skipped abstract hook: {}".format(
-                            klass.__name__
-                        ))
-                        continue
-
-                    # Separate hooks by pre/post class
-                    if hook.order is None:
-                        hooks_without_order.append(hook)
-                    else:
-                        hooks_with_order.append(hook)
+                    ordered_hooks.append(hook)
 
                 except Exception:
                     self.log.warning(
@@ -477,13 +585,6 @@ class ApplicationLaunchContext:
                         exc_info=True
                     )
 
-            # Sort hooks with order by order
-            ordered_hooks = list(sorted(
-                hooks_with_order, key=lambda obj: obj.order
-            ))
-            # Extend ordered hooks with hooks without defined order
-            ordered_hooks.extend(hooks_without_order)
-
             if launch_type == "pre":
                 self.prelaunch_hooks = ordered_hooks
             else:
@@ -1,15 +1,22 @@
 import os
+import re
 import copy
 import json
+import time
+import uuid
+import string
+import hashlib
 import platform
 import collections
 
 import six
 import acre
+import ayon_api
 
 from ayon_core import AYON_CORE_ROOT
 from ayon_core.settings import get_project_settings
-from ayon_core.lib import Logger, get_ayon_username
+from ayon_core.lib import Logger, get_ayon_username, get_local_site_id
+from ayon_core.lib.local_settings import get_ayon_appdirs
 from ayon_core.addon import AddonsManager
 from ayon_core.pipeline import HOST_WORKFILE_EXTENSIONS
 from ayon_core.pipeline.template_data import get_template_data
@@ -22,7 +29,11 @@ from ayon_core.pipeline.workfile import (
 )
 
 from .constants import PLATFORM_NAMES, DEFAULT_ENV_SUBGROUP
-from .exceptions import MissingRequiredKey, ApplicationLaunchFailed
+from .exceptions import (
+    MissingRequiredKey,
+    ApplicationLaunchFailed,
+    EnvironmentCycleError,
+)
 from .manager import ApplicationManager
 
 
@@ -189,16 +200,448 @@ def get_app_environments_for_context(
     return context.env
 
 
+# Version of cache file content
+_APP_ENV_CACHE_VERSION = 3
+# Cached environments are rebuilt after a day by default
+_APP_ENV_CACHE_TTL = 24 * 60 * 60
+# Variables of source environment which are part of cache key, other
+#   variables (e.g. ids of farm job) would make each key unique. More can
+#   be added with 'AYON_APP_ENV_CACHE_KEYS' (separated by ',').
+_APP_ENV_CACHE_ENV_KEYS = (
+    "PATH",
+    "PYTHONPATH",
+    "HOME",
+    "USERPROFILE",
+    "AYON_SERVER_URL",
+    "AYON_BUNDLE_NAME",
+    "AYON_STUDIO_BUNDLE_NAME",
+    "AYON_USE_STAGING",
+    "AYON_USE_DEV",
+    "AYON_LAUNCHER_STORAGE_DIR",
+    "AYON_EXECUTABLE",
+    "OCIO",
+)
+# Variables removed from source environment by launch context
+_LAUNCH_IGNORED_ENV = {"QT_API"}
+
+
+def get_app_env_cache_dir():
+    """Directory where prepared launch environments are cached.
+
+    Can be changed with 'AYON_APP_ENV_CACHE_DIR' environment variable,
+    e.g. to a directory shared by all render nodes.
+
+    Returns:
+        str: Path to cache directory.
+    """
+    cache_dir = os.getenv("AYON_APP_ENV_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    return get_ayon_appdirs("cache", "app_environments")
+
+
+def _get_app_env_cache_key(
+    project_name,
+    folder_path,
+    task_name,
+    app_name,
+    env_group,
+    launch_type,
+    addons_manager,
+    src_env,
+):
+    """Hash of context, bundle, addon versions and settings revision.
+
+    Key is calculated only from values available without server requests,
+    so cache hit does not touch server at all. Changes of settings or
+    entities are not detected, cached environment is used until it
+    expires ('AYON_APP_ENV_CACHE_TTL') or until settings revision
+    'AYON_APP_ENV_CACHE_REVISION' is changed, e.g. by farm job submission.
+    """
+    env_keys = set(_APP_ENV_CACHE_ENV_KEYS)
+    extra_keys = src_env.get("AYON_APP_ENV_CACHE_KEYS") or ""
+    env_keys |= {key.strip() for key in extra_keys.split(",") if key.strip()}
+
+    key_data = {
+        "version": _APP_ENV_CACHE_VERSION,
+        "bundle": src_env.get("AYON_BUNDLE_NAME"),
+        "studio_bundle": src_env.get("AYON_STUDIO_BUNDLE_NAME"),
+        "settings_revision": src_env.get("AYON_APP_ENV_CACHE_REVISION"),
+        "user": get_ayon_username(),
+        "site_id": get_local_site_id(),
+        "platform": platform.system().lower(),
+        "project_name": project_name,
+        "folder_path": folder_path,
+        "task_name": task_name,
+        "app_name": app_name,
+        "env_group": env_group,
+        "launch_type": launch_type,
+        "addons": {
+            addon.name: str(addon.version)
+            for addon in addons_manager.get_enabled_addons()
+        },
+        "env": {
+            key: src_env.get(key)
+            for key in sorted(env_keys)
+        },
+    }
+    content = json.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _read_app_env_cache(filepath, env):
+    try:
+        with open(filepath, "r") as stream:
+            cache_data = json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+    ttl = float(os.getenv("AYON_APP_ENV_CACHE_TTL") or _APP_ENV_CACHE_TTL)
+    if time.time() - cache_data.get("created", 0) > ttl:
+        return None
+
+    output = dict(env)
+    output.update(cache_data["changes"])
+    for key in cache_data["removed"]:
+        output.pop(key, None)
+    return output
+
+
+def _ensure_cached_workdir(env):
+    """Create workdir which would be created by context preparation."""
+    workdir = env.get("AYON_WORKDIR")
+    if not workdir or os.path.exists(workdir):
+        return
+    try:
+        os.makedirs(workdir, exist_ok=True)
+    except Exception as exc:
+        raise ApplicationLaunchFailed(
+            "Couldn't create workdir because: {}".format(str(exc))
+        )
+
+
+def _write_app_env_cache(filepath, src_env, env):
+    changes = {
+        key: value
+        for key, value in env.items()
+        if src_env.get(key) != value
+    }
+    removed = [key for key in src_env if key not in env]
+    cache_data = {
+        "created": time.time(),
+        "changes": changes,
+        "removed": removed,
+    }
+    dirpath = os.path.dirname(filepath)
+    # Write to temp file first so parallel tasks never read partial file
+    tmp_path = "{}.{}.tmp".format(filepath, uuid.uuid4().hex)
+    try:
+        os.makedirs(dirpath, exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            json.dump(cache_data, stream)
+        os.replace(tmp_path, filepath)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def get_app_environments_for_context_cached(
+    project_name,
+    folder_path,
+    task_name,
+    app_name,
+    env_group=None,
+    launch_type=None,
+    env=None,
+    addons_manager=None
+):
+    """Prepare environment variables by context using on-disk cache.
+
+    Same as 'get_app_environments_for_context' but result is stored to
+    cache directory and reused by following calls with the same context,
+    settings and addon versions. Useful on farm where many tasks prepare
+    the same environment.
+
+    Cache key is calculated without server requests (see
+    '_get_app_env_cache_key'), so cache hit does not create application
+    manager, launch context nor query settings. Only changes of passed
+    environment are stored. Environment is cached only if all prelaunch
+    hooks for the context are marked as 'environment_only', workdir is
+    created from cached 'AYON_WORKDIR' as context preparation would do.
+    Caching can be disabled with 'AYON_APP_ENV_CACHE_DISABLED'
+    environment variable.
+
+    Args:
+        project_name (str): Name of project.
+        folder_path (str): Folder path.
+        task_name (str): Name of task.
+        app_name (str): Name of application.
+        env_group (Optional[str]): Name of environment group.
+        launch_type (Optional[str]): Type for which prelaunch hooks are
+            executed.
+        env (Optional[dict[str, str]]): Initial environment variables.
+            `os.environ` is used when not passed.
+        addons_manager (Optional[AddonsManager]): Initialized addons
+            manager.
+
+    Returns:
+        dict: Environments for passed context and application.
+    """
+    log = Logger.get_logger("AppEnvironmentsCache")
+    if env is None:
+        env = os.environ
+    # Launch context filters and converts passed environment the same way
+    src_env = {
+        key: str(value)
+        for key, value in env.items()
+        if key not in _LAUNCH_IGNORED_ENV
+    }
+
+    if os.getenv("AYON_APP_ENV_CACHE_DISABLED") in ("1", "true", "True"):
+        return get_app_environments_for_context(
+            project_name,
+            folder_path,
+            task_name,
+            app_name,
+            env_group=env_group,
+            launch_type=launch_type,
+            env=src_env,
+            addons_manager=addons_manager,
+        )
+
+    if addons_manager is None:
+        addons_manager = AddonsManager()
+
+    # Cache file exists only if environment preparation does not have
+    #   side effects, those are the same for the same key
+    cache_key = _get_app_env_cache_key(
+        project_name,
+        folder_path,
+        task_name,
+        app_name,
+        env_group,
+        launch_type,
+        addons_manager,
+        src_env,
+    )
+    filepath = os.path.join(
+        get_app_env_cache_dir(), "{}.json".format(cache_key)
+    )
+    output = _read_app_env_cache(filepath, src_env)
+    if output is not None:
+        log.debug("Using cached environment '{}'".format(filepath))
+        _ensure_cached_workdir(output)
+        return output
+
+    app_manager = ApplicationManager()
+    context = app_manager.create_launch_context(
+        app_name,
+        project_name=project_name,
+        folder_path=folder_path,
+        task_name=task_name,
+        env_group=env_group,
+        launch_type=launch_type,
+        env=src_env,
+        addons_manager=addons_manager,
+        modules_manager=addons_manager,
+    )
+    context.discover_launch_hooks()
+    context.run_prelaunch_hooks()
+    output = context.env
+
+    side_effect_hooks = [
+        hook.__class__.__name__
+        for hook in context.prelaunch_hooks
+        if not hook.environment_only
+    ]
+    if side_effect_hooks:
+        log.debug(
+            "Environment is not cached because of hooks: {}".format(
+                ", ".join(side_effect_hooks)
+            )
+        )
+        return output
+
+    try:
+        _write_app_env_cache(filepath, src_env, output)
+    except OSError:
+        log.warning(
+            "Failed to cache environment to '{}'".format(filepath),
+            exc_info=True
+        )
+    return output
+
+
+_env_formatter = string.Formatter()
+_env_ref_regex = re.compile(r"{(.+?)}")
+# Merged environments of apps and tools by their settings
+_merged_envs_cache = collections.OrderedDict()
+_merged_envs_cache_size = 32
+
+
+class _EnvFormatMapping:
+    """Mapping used to format environment value without copying data.
+
+    Missing keys, and key which is formatted, are kept as they are,
+    same as 'acre.lib.partial_format' does.
+    """
+
+    def __init__(self, data, exclude_key=None):
+        self._data = data
+        self._exclude_key = exclude_key
+
+    def __getitem__(self, key):
+        if key != self._exclude_key and key in self._data:
+            return self._data[key]
+        return "{" + key + "}"
+
+
+def _partial_format(value, data, exclude_key=None):
+    """Format value with data, keep unknown keys in place.
+
+    Output matches 'acre.lib.partial_format', but data are not copied for
+    each value.
+    """
+    if not isinstance(value, str) or (
+        "{" not in value and "}" not in value
+    ):
+        return value
+    try:
+        return _env_formatter.vformat(
+            value, (), _EnvFormatMapping(data, exclude_key)
+        )
+    except Exception:
+        # Let acre handle values which are not valid format strings
+        if exclude_key is not None:
+            data = dict(data)
+            data.pop(exclude_key, None)
+        return acre.lib.partial_format(value, data=data)
+
+
 def _merge_env(env, current_env):
     """Modified function(merge) from acre module."""
     result = current_env.copy()
     for key, value in env.items():
         # Keep missing keys by not filling `missing` kwarg
-        value = acre.lib.partial_format(value, data=current_env)
-        result[key] = value
+        result[key] = _partial_format(value, current_env)
     return result
 
 
+def _compute_env(env):
+    """Resolve references between environment variables.
+
+    Replacement of 'acre.compute(env, cleanup=False)'. Dependency graph
+    of values is sorted once, then each value is formatted only once
+    with already resolved values of its dependencies.
+
+    Args:
+        env (dict[str, str]): Environment variables.
+
+    Returns:
+        dict[str, str]: Environment with resolved values.
+
+    Raises:
+        EnvironmentCycleError: When values reference each other in cycle.
+    """
+    env = env.copy()
+    # Keys which are formatted (same keys as acre formats)
+    keys_to_format = set()
+    dependencies_by_key = {}
+    for key, value in env.items():
+        if not isinstance(value, str) or "{" not in value:
+            continue
+        # Value is never formatted with itself
+        references = {
+            reference
+            for reference in _env_ref_regex.findall(value)
+            if reference != key
+        }
+        if not references:
+            continue
+        keys_to_format.add(key)
+        keys_to_format |= references
+        dependencies = {
+            reference
+            for reference in references
+            if reference in env
+        }
+        if dependencies:
+            dependencies_by_key[key] = dependencies
+
+    # Sort keys so dependencies are resolved before keys using them
+    dependents_by_key = collections.defaultdict(list)
+    for key, dependencies in dependencies_by_key.items():
+        for dependency in dependencies:
+            dependents_by_key[dependency].append(key)
+
+    remaining = {
+        key: len(dependencies)
+        for key, dependencies in dependencies_by_key.items()
+    }
+    queue = collections.deque(key for key in env if key not in remaining)
+    while queue:
+        key = queue.popleft()
+        if key in keys_to_format:
+            env[key] = _partial_format(env[key], env, exclude_key=key)
+        for dependent in dependents_by_key.get(key, ()):
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                queue.append(dependent)
+
+    cyclic = [key for key, count in remaining.items() if count]
+    if cyclic:
+        raise EnvironmentCycleError(cyclic)
+
+    # Format dynamic keys
+    if any("{" in key or "}" in key for key in env):
+        formatted = {}
+        for key, value in env.items():
+            new_key = _partial_format(key, env)
+            if new_key in formatted:
+                raise KeyError(
+                    "Key clashes on: {} (source: {})".format(new_key, key)
+                )
+            formatted[new_key] = value
+        env = formatted
+    return env
+
+
+def _get_merged_environments(environments, env_group):
+    """Merge environments of application and tools.
+
+    Merged values depend only on settings, so result is cached and
+    reused by following launches with the same settings.
+
+    Args:
+        environments (list[dict[str, Any]]): Environments from settings
+            in order in which they are merged.
+        env_group (Optional[str]): Environment group.
+
+    Returns:
+        dict[str, str]: Merged environments.
+    """
+    cache_key = json.dumps([environments, env_group], sort_keys=True)
+    env_values = _merged_envs_cache.get(cache_key)
+    if env_values is not None:
+        _merged_envs_cache.move_to_end(cache_key)
+        return dict(env_values)
+
+    env_values = {}
+    for _env_values in environments:
+        if not _env_values:
+            continue
+        # Choose right platform
+        tool_env = parse_environments(_env_values, env_group)
+        # Merge dictionaries
+        env_values = _merge_env(tool_env, env_values)
+
+    _merged_envs_cache[cache_key] = env_values
+    while len(_merged_envs_cache) > _merged_envs_cache_size:
+        _merged_envs_cache.popitem(last=False)
+    return dict(env_values)
+
+
 def _add_python_version_paths(app, env, logger, addons_manager):
     """Add vendor packages specific for a Python version."""
 
@@ -315,27 +758,30 @@ def prepare_app_environments(
         )
     )
 
-    env_values = {}
-    for _env_values in environments:
-        if not _env_values:
-            continue
+    if filtered_local_envs:
+        env_values = {}
+        for _env_values in environments:
+            if not _env_values:
+                continue
 
-        # Choose right platform
-        tool_env = parse_environments(_env_values, env_group)
+            # Choose right platform
+            tool_env = parse_environments(_env_values, env_group)
 
-        # Apply local environment variables
-        # - must happen between all values because they may be used during
-        #   merge
-        for key, value in filtered_local_envs.items():
-            if key in tool_env:
-                tool_env[key] = value
+            # Apply local environment variables
+            # - must happen between all values because they may be used
+            #   during merge
+            for key, value in filtered_local_envs.items():
+                if key in tool_env:
+                    tool_env[key] = value
 
-        # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
+            # Merge dictionaries
+            env_values = _merge_env(tool_env, env_values)
+    else:
+        env_values = _get_merged_environments(environments, env_group)
 
     merged_env = _merge_env(env_values, source_env)
 
-    loaded_env = acre.compute(merged_env, cleanup=False)
+    loaded_env = _compute_env(merged_env)
 
     final_env = None
     # Add host specific environments
@@ -392,10 +838,7 @@ def apply_project_environments_value(
     if env_value:
         env_value = json.loads(env_value)
         parsed_value = parse_environments(env_value, env_group)
-        env.update(acre.compute(
-            _merge_env(parsed_value, env),
-            cleanup=False
-        ))
+        env.update(_compute_env(_merge_env(parsed_value, env)))
     return env
 
 
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+pytest.importorskip("wsrpc_aiohttp")
+ws_stub = pytest.importorskip("ayon_core.hosts.photoshop.api.ws_stub")
+
+
+class FakeExtension:
+    """Local stand-in for Photoshop extension connected over websocket.
+
+    Calls are answered synchronously with json strings, same as
+    the extension does, and are recorded for assertions.
+    """
+
+    def __init__(self, layers, metadata):
+        self.layers = layers
+        self.metadata = metadata
+        self.calls = []
+
+    def call(self, method, **kwargs):
+        self.calls.append(method)
+        if method == "Photoshop.get_layers":
+            return json.dumps(self.layers)
+        if method == "Photoshop.read":
+            return json.dumps(self.metadata)
+        if method == "Photoshop.imprint":
+            self.metadata = json.loads(kwargs["payload"])
+            return None
+        raise AssertionError("Unexpected call {}".format(method))
+
+
+class FakeWebServer:
+    """Stand-in for 'WebServerTool' returning results of client calls."""
+
+    @staticmethod
+    def call(result):
+        return result
+
+
+@pytest.fixture
+def extension():
+    layers = [
+        {"id": idx, "name": "layer{}".format(idx)}
+        for idx in range(1, 201)
+    ]
+    metadata = [
+        {
+            "members": [str(layer["id"])],
+            "instance_id": "instance{}".format(layer["id"]),
+            "variant": "Main",
+        }
+        for layer in layers
+    ]
+    return FakeExtension(layers, metadata)
+
+
+@pytest.fixture
+def stub(monkeypatch, extension):
+    monkeypatch.setattr(
+        ws_stub.WebServerTool, "get_instance", lambda: FakeWebServer()
+    )
+    monkeypatch.setattr(
+        ws_stub.PhotoshopServerStub,
+        "get_client",
+        staticmethod(lambda: extension),
+    )
+    return ws_stub.PhotoshopServerStub()
+
+
+def test_imprint_transaction_round_trips(stub, extension):
+    with stub.imprint_transaction():
+        for item in stub.get_layers_metadata():
+            stub.imprint(item["instance_id"], {"variant": "Other"})
+
+    assert extension.calls == [
+        "Photoshop.read",
+        "Photoshop.get_layers",
+        "Photoshop.imprint",
+    ]
+    assert {item["variant"] for item in extension.metadata} == {"Other"}
+
+
+def test_read_uses_mirror(stub, extension):
+    with stub.imprint_transaction():
+        stub.get_layers_metadata()
+        for layer in stub.get_layers():
+            assert stub.read(layer)["members"] == [str(layer.id)]
+
+    assert extension.calls == ["Photoshop.read", "Photoshop.get_layers"]
+
+
+def test_imprint_without_transaction(stub, extension):
+    stub.imprint("instance1", {"variant": "Other"})
+
+    assert extension.calls == [
+        "Photoshop.read",
+        "Photoshop.get_layers",
+        "Photoshop.imprint",
+    ]
+    assert extension.metadata[0]["variant"] == "Other"
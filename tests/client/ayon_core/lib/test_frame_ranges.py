@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+pytest.importorskip("clique")
+frame_ranges = pytest.importorskip("ayon_core.lib.frame_ranges")
+
+FrameRanges = frame_ranges.FrameRanges
+
+
+def _random_frames(rng, size=200):
+    """Random frames with mix of continuous ranges and single frames."""
+    frames = set()
+    for _ in range(rng.randint(0, 10)):
+        start = rng.randint(-size // 4, size)
+        frames.update(range(start, start + rng.randint(0, size // 4)))
+    for _ in range(rng.randint(0, 20)):
+        frames.add(rng.randint(-size // 4, size))
+    return frames
+
+
+@pytest.fixture
+def frames_pairs():
+    rng = random.Random(1001)
+    return [
+        (_random_frames(rng), _random_frames(rng))
+        for _ in range(300)
+    ]
+
+
+def test_frames_round_trip(frames_pairs):
+    for frames, _ in frames_pairs:
+        ranges = FrameRanges.from_frames(frames)
+        assert list(ranges) == sorted(frames)
+        assert len(ranges) == len(frames)
+        assert bool(ranges) == bool(frames)
+        assert FrameRanges.from_string(ranges.to_string()) == ranges
+        assert FrameRanges(ranges.ranges) == ranges
+
+
+def test_operations_match_set_operations(frames_pairs):
+    for frames, other_frames in frames_pairs:
+        ranges = FrameRanges.from_frames(frames)
+        other = FrameRanges.from_frames(other_frames)
+        assert set(ranges | other) == frames | other_frames
+        assert set(ranges & other) == frames & other_frames
+        assert set(ranges - other) == frames - other_frames
+        assert set(other - ranges) == other_frames - frames
+
+
+def test_contains_matches_set(frames_pairs):
+    for frames, other_frames in frames_pairs:
+        ranges = FrameRanges.from_frames(frames)
+        for frame in other_frames:
+            assert (frame in ranges) == (frame in frames)
+
+
+def test_gaps_match_set(frames_pairs):
+    for frames, _ in frames_pairs:
+        ranges = FrameRanges.from_frames(frames)
+        if not frames:
+            assert not ranges.get_gaps()
+            continue
+
+        start = min(frames) - 5
+        end = max(frames) + 5
+        expected = set(range(start, end + 1)) - frames
+        assert set(ranges.get_gaps(start, end)) == expected
+
+        previous_frames = ranges.get_previous_frames_for_gaps(start, end)
+        sorted_frames = sorted(frames)
+        for frame in expected:
+            existing = [item for item in sorted_frames if item < frame]
+            src_frame = existing[-1] if existing else sorted_frames[0]
+            assert previous_frames[frame] == src_frame
+
+
+def test_shifted_matches_set(frames_pairs):
+    for frames, _ in frames_pairs:
+        ranges = FrameRanges.from_frames(frames)
+        assert set(ranges.shifted(-1001)) == {
+            frame - 1001 for frame in frames
+        }
+
+
+def test_negative_frames_string():
+    ranges = FrameRanges.from_string("-10--5,-1,3-4")
+    assert list(ranges) == [-10, -9, -8, -7, -6, -5, -1, 3, 4]
+    assert ranges.to_string() == "-10--5,-1,3-4"
+
+
+def test_format_frame_names():
+    names = frame_ranges.format_frame_names(
+        "beauty_%v.", ".exr", 4, FrameRanges.from_string("9-10,1001")
+    )
+    assert names == [
+        "beauty_%v.0009.exr",
+        "beauty_%v.0010.exr",
+        "beauty_%v.1001.exr",
+    ]
@@ -0,0 +1,108 @@
+"""Micro-benchmarks of 'FrameRanges' compared to set of frames.
+
+Timings are printed, run with 'pytest -s' to see them. Tests only check
+that both implementations give the same result, so they don't fail on
+slow machines.
+"""
+import timeit
+
+import pytest
+
+pytest.importorskip("clique")
+frame_ranges = pytest.importorskip("ayon_core.lib.frame_ranges")
+
+FrameRanges = frame_ranges.FrameRanges
+
+REPEAT = 5
+
+
+def _expected_frames():
+    # Multiple shots with handles of a long sequence
+    return set(range(1001, 11001))
+
+
+def _rendered_frames():
+    # Rendered frames with few missing chunks and frames
+    frames = _expected_frames()
+    frames -= set(range(2500, 2600))
+    frames -= set(range(7000, 7003))
+    frames -= {5000, 9999}
+    return frames
+
+
+def _benchmark(label, func):
+    duration = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    print("{}: {:.3f}ms".format(label, duration * 1000))
+    return func()
+
+
+def test_benchmark_gaps():
+    rendered = _rendered_frames()
+    rendered_ranges = FrameRanges.from_frames(rendered)
+
+    expected = _benchmark(
+        "set gaps",
+        lambda: set(range(1001, 11001)) - rendered
+    )
+    result = _benchmark(
+        "ranges gaps",
+        lambda: rendered_ranges.get_gaps(1001, 11000)
+    )
+    assert set(result) == expected
+
+
+def test_benchmark_set_operations():
+    expected_frames = _expected_frames()
+    rendered = _rendered_frames()
+    expected_ranges = FrameRanges.from_frames(expected_frames)
+    rendered_ranges = FrameRanges.from_frames(rendered)
+
+    for label, set_func, ranges_func in (
+        (
+            "union",
+            lambda: expected_frames | rendered,
+            lambda: expected_ranges | rendered_ranges,
+        ),
+        (
+            "intersection",
+            lambda: expected_frames & rendered,
+            lambda: expected_ranges & rendered_ranges,
+        ),
+        (
+            "difference",
+            lambda: expected_frames - rendered,
+            lambda: expected_ranges - rendered_ranges,
+        ),
+    ):
+        expected = _benchmark("set " + label, set_func)
+        result = _benchmark("ranges " + label, ranges_func)
+        assert set(result) == expected
+
+
+def test_benchmark_from_frames():
+    rendered = _rendered_frames()
+    result = _benchmark(
+        "ranges from frames",
+        lambda: FrameRanges.from_frames(rendered)
+    )
+    assert set(result) == rendered
+
+
+def test_benchmark_frame_names():
+    rendered = _rendered_frames()
+    rendered_ranges = FrameRanges.from_frames(rendered)
+
+    expected = _benchmark(
+        "format names",
+        lambda: [
+            "beauty.{:0>4}.exr".format(frame)
+            for frame in sorted(rendered)
+        ]
+    )
+    result = _benchmark(
+        "ranges names",
+        lambda: frame_ranges.format_frame_names(
+            "beauty.", ".exr", 4, rendered_ranges
+        )
+    )
+    assert result == expected
@@ -0,0 +1,187 @@
+import time
+import logging
+
+import pytest
+
+pyblish_api = pytest.importorskip("pyblish.api")
+pyblish_plugin = pytest.importorskip("pyblish.plugin")
+pyblish_util = pytest.importorskip("pyblish.util")
+parallel_publish = pytest.importorskip(
+    "ayon_core.pipeline.publish.parallel_publish"
+)
+
+
+class CollectInstances(pyblish_api.ContextPlugin):
+    order = pyblish_api.CollectorOrder
+
+    def process(self, context):
+        for name in ("a", "b", "c"):
+            instance = context.create_instance(name)
+            instance.data["family"] = "mock"
+            instance.data["families"] = ["mock"]
+
+
+class ExtractLog(pyblish_api.InstancePlugin):
+    order = pyblish_api.ExtractorOrder
+    families = ["mock"]
+
+    def process(self, instance):
+        self.log.info("Extracting {}".format(instance.name))
+        # Let other threads log in the meantime
+        time.sleep(0.05)
+        self.log.debug("Extracted {}".format(instance.name))
+
+
+class ExtractFail(pyblish_api.InstancePlugin):
+    order = pyblish_api.ExtractorOrder + 0.1
+    families = ["mock"]
+
+    def process(self, instance):
+        if instance.name == "b":
+            raise ValueError("Failed {}".format(instance.name))
+        self.log.info("Passed {}".format(instance.name))
+
+
+def _publish(max_workers):
+    context = pyblish_api.Context()
+    results = list(parallel_publish.publish_iter_parallel(
+        context,
+        [CollectInstances, ExtractLog, ExtractFail],
+        max_workers=max_workers,
+    ))
+    return context, results
+
+
+def _get_results(results, plugin):
+    return {
+        result["instance"].name: result
+        for result in results
+        if result["plugin"] is plugin
+    }
+
+
+def test_plugins_are_batched():
+    batches = parallel_publish.get_plugin_batches(
+        [CollectInstances, ExtractLog, ExtractFail]
+    )
+    assert batches == [
+        (False, [CollectInstances]),
+        (True, [ExtractLog, ExtractFail]),
+    ]
+
+
+def test_result_matches_pyblish_process():
+    context = pyblish_api.Context()
+    instance = context.create_instance("a")
+    expected = pyblish_plugin.process(ExtractLog, context, instance)
+
+    _, results = _publish(3)
+    result = _get_results(results, ExtractLog)["a"]
+
+    assert set(expected) <= set(result)
+    assert result["success"]
+    assert [record.getMessage() for record in result["records"]] == [
+        record.getMessage() for record in expected["records"]
+    ]
+
+
+def test_records_are_separated_by_instance():
+    _, results = _publish(3)
+    for name, result in _get_results(results, ExtractLog).items():
+        assert [record.getMessage() for record in result["records"]] == [
+            "Extracting {}".format(name),
+            "Extracted {}".format(name),
+        ]
+
+
+def test_error_is_captured(caplog):
+    with caplog.at_level(logging.DEBUG):
+        context, results = _publish(3)
+
+    result = _get_results(results, ExtractFail)["b"]
+    assert not result["success"]
+    error = result["error"]
+    assert isinstance(error, ValueError)
+    assert "Failed b" in error.formatted_traceback
+    assert error.traceback
+
+    # Exception is logged same as by 'pyblish.plugin.process'
+    assert any(
+        record.levelno == logging.ERROR and record.name == "pyblish.plugin"
+        for record in result["records"]
+    )
+    assert any(
+        record.name == "pyblish.plugin"
+        and "Failed b" in record.getMessage()
+        for record in caplog.records
+    )
+
+    assert _get_results(results, ExtractFail)["a"]["success"]
+    assert len(context.data["results"]) == len(results)
+
+
+def test_sequential_and_parallel_results_match():
+    _, sequential = _publish(1)
+    _, parallel = _publish(3)
+
+    def _summary(results):
+        return sorted(
+            (
+                result["plugin"].__name__,
+                getattr(result["instance"], "name", None),
+                result["success"],
+            )
+            for result in results
+        )
+
+    assert _summary(sequential) == _summary(parallel)
+
+
+class ExtractAddReview(pyblish_api.InstancePlugin):
+    order = pyblish_api.ExtractorOrder
+    families = ["mock"]
+
+    def process(self, instance):
+        if instance.name == "b":
+            instance.data["families"].append("review")
+
+
+class ExtractReview(pyblish_api.InstancePlugin):
+    order = pyblish_api.ExtractorOrder + 0.1
+    families = ["review"]
+
+    def process(self, instance):
+        self.log.info("Review {}".format(instance.name))
+
+
+class CollectReview(pyblish_api.InstancePlugin):
+    order = pyblish_api.CollectorOrder + 0.1
+    families = ["mock"]
+
+    def process(self, instance):
+        if instance.name == "a":
+            instance.data["families"].append("review")
+
+
+def test_families_added_in_batch_are_respected():
+    plugins = [
+        CollectInstances, CollectReview, ExtractAddReview, ExtractReview
+    ]
+    expected = sorted(
+        result["instance"].name
+        for result in pyblish_util.publish_iter(
+            pyblish_api.Context(), plugins
+        )
+        if result["plugin"] is ExtractReview
+    )
+
+    results = parallel_publish.publish_iter_parallel(
+        pyblish_api.Context(), plugins, max_workers=2
+    )
+    processed = sorted(
+        result["instance"].name
+        for result in results
+        if result["plugin"] is ExtractReview
+    )
+    assert expected == ["a", "b"]
+    assert processed == expected
@@ -0,0 +1,103 @@
+import copy
+
+import pytest
+
+from ayon_core.tools.adobe_webserver.metadata_mirror import MetadataMirror
+
+
+class FakeDocument:
+    """Stand-in for metadata storage of an Adobe document."""
+
+    def __init__(self, items):
+        self.items = items
+        self.reads = 0
+        self.writes = 0
+
+    def read(self):
+        self.reads += 1
+        return copy.deepcopy(self.items)
+
+    def write(self, items):
+        self.writes += 1
+        self.items = copy.deepcopy(items)
+
+
+@pytest.fixture
+def document():
+    return FakeDocument([
+        {"members": ["1"], "instance_id": "a", "productName": "imageA"},
+        {"members": ["2"], "instance_id": "b", "productName": "imageB"},
+    ])
+
+
+@pytest.fixture
+def mirror(document):
+    return MetadataMirror(document.read, document.write)
+
+
+def test_transaction_reads_and_writes_once(document, mirror):
+    with mirror.transaction():
+        assert mirror.is_active
+        for idx in range(10):
+            mirror.imprint("1", {"variant": str(idx)})
+            mirror.imprint("b", {"variant": str(idx)})
+
+    assert not mirror.is_active
+    assert document.reads == 1
+    assert document.writes == 1
+    assert [item["variant"] for item in document.items] == ["9", "9"]
+
+
+def test_nested_transaction_writes_on_outermost_exit(document, mirror):
+    with mirror.transaction():
+        with mirror.transaction():
+            mirror.imprint("3", {"members": ["3"], "instance_id": "c"})
+        assert document.writes == 0
+    assert document.writes == 1
+    assert len(document.items) == 3
+
+
+def test_transaction_without_changes_does_not_write(document, mirror):
+    with mirror.transaction():
+        mirror.get_items()
+    assert document.reads == 1
+    assert document.writes == 0
+
+
+def test_changes_are_written_on_exception(document, mirror):
+    with pytest.raises(RuntimeError):
+        with mirror.transaction():
+            mirror.remove_instance("a")
+            raise RuntimeError("Failed")
+    assert document.writes == 1
+    assert [item["instance_id"] for item in document.items] == ["b"]
+
+
+def test_empty_data_removes_item(document, mirror):
+    with mirror.transaction():
+        mirror.imprint("1", {})
+    assert [item["instance_id"] for item in document.items] == ["b"]
+
+
+def test_find_member_item_returns_copy(mirror):
+    with mirror.transaction():
+        assert mirror.find_member_item("1") is None
+        mirror.get_items()
+
+        item = mirror.find_member_item(1)
+        assert item["instance_id"] == "a"
+        item["productName"] = "changed"
+        assert mirror.find_member_item("1")["productName"] == "imageA"
+
+
+def test_reindex_after_instance_id_change(document, mirror):
+    with mirror.transaction():
+        mirror.imprint("1", {"instance_id": "z"})
+        mirror.imprint("z", {"variant": "Main"})
+        mirror.remove_instance("b")
+    assert document.items == [{
+        "members": ["1"],
+        "instance_id": "z",
+        "productName": "imageA",
+        "variant": "Main",
+    }]